@@ -1220,6 +1220,7 @@ export default function DraftPage() {
 
       <PlayerDetailModal
         player={selectedPlayer}
+        season={STATS_YEAR}
         onClose={() => setSelectedPlayer(null)}
         onDraft={draftPlayer}
         isDrafted={drafted.some(p => p.id === selectedPlayer?.id)}
@@ -664,6 +664,7 @@ const PlayersPage = () => {
 
       <PlayerDetailModal
         player={selectedPlayer}
+        season={season}
         onClose={() => setSelectedPlayer(null)}
       />
       </div>
@@ -1,21 +1,40 @@
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Request, Response
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Annotated, Any, Dict, List, Optional
 from pydantic import BaseModel, Field
+import anyio
+import asyncio
+import contextlib
+import contextvars
 import httpx
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 import json
 import os
 import logging
-logging.basicConfig(level=logging.INFO)
+from urllib.parse import urlsplit
 logger = logging.getLogger(__name__)
 from uuid import uuid4
+from app.services import cache, cpu_pool, defense, draft_recs, gamelog, metrics, player_rows, profiling, projections, schedule, trending, upstream, waivers
+from app.core.config import settings
+from app.services.roster_utils import starter_slots
+from app.services.scoring import resolve_profile
+
+if TYPE_CHECKING:
+    # Analytics and GM subsystems are imported on first use so cold boot only loads what serving needs
+    from app.services import answer_cache, player_search, warehouse, win_prob
 
 router = APIRouter()
-_players_cache: Dict[str, Dict[str, Any]] = {}
+# { "season:scoring:on_team_only": {"data", "timestamp"} }
+_players_cache = cache.namespace("players", ttl=300, max_entries=32, max_bytes=64 * 1024 * 1024, shared=True)
+# Defense-vs-position multipliers, rebuilt with every stats refresh: { "stats_year": {"data", "ts"} }
+_dvp_cache = cache.namespace("defense_vs_position", ttl=24 * 3600, max_entries=8, shared=True)
 
-# In-memory draft picks store: { draft_id: { "picks": [Pick, ...], "updated": timestamp } }
-_draft_picks_store: dict[str, dict[str, Any]] = {}
+# Draft picks: { draft_id: { "picks": [Pick, ...], "updated": timestamp } }. User data, so
+# never evicted; kept in the shared store only, so every worker sees every write.
+_draft_picks_store = cache.DurableStore("draft_picks")
 
 # -----------------------------
 # Teams & Favorites (file-persisted)
@@ -40,7 +59,18 @@ def _save_teams(store: dict[str, Any]):
     except Exception as e:
         logger.warning(f"Failed to save teams file: {e}")
 
-_teams_store: dict[str, Any] = _load_teams()
+_teams_store: Optional[dict[str, Any]] = None
+_teams_lock = threading.Lock()
+
+
+def _teams() -> dict[str, Any]:
+    """Teams store, read from disk on first use."""
+    global _teams_store
+    if _teams_store is None:
+        with _teams_lock:
+            if _teams_store is None:
+                _teams_store = _load_teams()
+    return _teams_store
 
 _favorites_store: dict[str, Any] = {
     "player_ids": []
@@ -57,51 +87,57 @@ class TeamCreate(BaseModel):
 
 @router.get("/teams", response_model=List[Team])
 def list_teams():
-    return _teams_store["list"]
+    store = _teams()
+    return store["list"]
 
 @router.get("/teams/active", response_model=Optional[Team])
 def get_active_team():
-    active = _teams_store.get("active_id")
-    for t in _teams_store["list"]:
+    store = _teams()
+    active = store.get("active_id")
+    for t in store["list"]:
         if t["id"] == active:
             return t
     return None
 
 @router.post("/teams", response_model=Team)
 def create_team(payload: TeamCreate):
+    store = _teams()
     new_team = {"id": str(uuid4()), "name": payload.name, "picks": payload.picks}
-    _teams_store["list"].append(new_team)
-    if not _teams_store.get("active_id"):
-        _teams_store["active_id"] = new_team["id"]
-    _save_teams(_teams_store)
+    store["list"].append(new_team)
+    if not store.get("active_id"):
+        store["active_id"] = new_team["id"]
+    _save_teams(store)
     return new_team
 
 @router.put("/teams/{team_id}")
 def update_team(team_id: str, payload: TeamCreate):
-    for i, t in enumerate(_teams_store["list"]):
+    store = _teams()
+    for i, t in enumerate(store["list"]):
         if t["id"] == team_id:
-            _teams_store["list"][i] = {"id": team_id, "name": payload.name, "picks": payload.picks}
-            _save_teams(_teams_store)
-            return {"ok": True, "team": _teams_store["list"][i]}
+            store["list"][i] = {"id": team_id, "name": payload.name, "picks": payload.picks}
+            _save_teams(store)
+            return {"ok": True, "team": store["list"][i]}
     raise HTTPException(status_code=404, detail="team not found")
 
 @router.delete("/teams/{team_id}")
 def delete_team(team_id: str):
-    for i, t in enumerate(_teams_store["list"]):
+    store = _teams()
+    for i, t in enumerate(store["list"]):
         if t["id"] == team_id:
-            _teams_store["list"].pop(i)
-            if _teams_store.get("active_id") == team_id:
-                _teams_store["active_id"] = _teams_store["list"][0]["id"] if _teams_store["list"] else None
-            _save_teams(_teams_store)
+            store["list"].pop(i)
+            if store.get("active_id") == team_id:
+                store["active_id"] = store["list"][0]["id"] if store["list"] else None
+            _save_teams(store)
             return {"ok": True}
     raise HTTPException(status_code=404, detail="team not found")
 
 @router.post("/teams/active")
 def set_active_team_by_id(team_id: str = Query(...)):
-    for t in _teams_store["list"]:
+    store = _teams()
+    for t in store["list"]:
         if t["id"] == team_id:
-            _teams_store["active_id"] = team_id
-            _save_teams(_teams_store)
+            store["active_id"] = team_id
+            _save_teams(store)
             return {"ok": True}
     raise HTTPException(status_code=404, detail="team not found")
 
@@ -129,17 +165,222 @@ class Pick(BaseModel):
     slot: Optional[str] = Field(default=None, description="QB/RB/WR/TE/FLEX/BN etc")
     timestamp: float
 
-def _safe_get_json(url: str, timeout: float = 30.0):
+# How long a caller may queue for a rate-limit token before giving up (stale or None)
+_UPSTREAM_WAIT = {upstream.HIGH: 5.0, upstream.LOW: 30.0}
+
+# One pooled client for every upstream GET (keep-alive across calls). Benchmarks swap
+# in a client with a mock transport.
+_http = httpx.Client()
+
+
+def _safe_get_json(url: str, timeout: float = 30.0, raw: bool = False):
+    """
+    GET an upstream JSON document through the per-host limiter and circuit breaker.
+    Returns None on failure, or the last good response for the URL when one exists.
+    With `raw`, returns the undecoded body bytes (for builders that decode in the CPU pool).
+    """
+    parts = urlsplit(url)
+    stale_key = f"{url}#raw" if raw else url
+    guard = upstream.guard_for(parts.hostname or "")
+    endpoint = metrics.endpoint_template(parts.path)
+    if not guard.breaker.allow():
+        guard.counters["rejected"] += 1
+        logger.info(f"GET {url} skipped: circuit open for {guard.host}")
+        return _upstream_stale(guard, stale_key)
+    priority = upstream.current_priority()
+    if not guard.limiter.acquire(priority, timeout=_UPSTREAM_WAIT[priority]):
+        # No call went out: hand back a half-open probe slot or the breaker never closes again
+        guard.breaker.release_probe()
+        guard.counters["throttled"] += 1
+        logger.info(f"GET {url} throttled ({priority} lane)")
+        return _upstream_stale(guard, stale_key)
+    started = time.perf_counter()
     try:
-        r = httpx.get(url, timeout=timeout)
+        with profiling.span("fetch"):
+            r = _http.get(url, timeout=timeout)
+        metrics.UPSTREAM_BYTES.observe(len(r.content), host=guard.host, endpoint=endpoint)
         if r.status_code == 200:
-            return r.json()
+            if raw:
+                data = r.content
+            else:
+                with profiling.span("parse"):
+                    data = r.json()
+            metrics.UPSTREAM_LATENCY.observe(time.perf_counter() - started, host=guard.host, endpoint=endpoint, outcome="ok")
+            guard.breaker.record(True)
+            guard.counters["ok"] += 1
+            guard.remember(stale_key, data)
+            return data
         logger.info(f"GET {url} -> {r.status_code}")
+        # 429/5xx count against the host; 404 and friends are normal answers.
+        failed = r.status_code == 429 or r.status_code >= 500
+        metrics.UPSTREAM_LATENCY.observe(
+            time.perf_counter() - started, host=guard.host, endpoint=endpoint, outcome=str(r.status_code)
+        )
+        guard.breaker.record(not failed)
+        if failed:
+            guard.counters["error"] += 1
+            return _upstream_stale(guard, stale_key)
         return None
     except Exception as e:
         logger.info(f"GET {url} failed: {e}")
+        metrics.UPSTREAM_LATENCY.observe(time.perf_counter() - started, host=guard.host, endpoint=endpoint, outcome="error")
+        guard.breaker.record(False)
+        guard.counters["error"] += 1
+        return _upstream_stale(guard, stale_key)
+
+
+def _upstream_stale(guard: upstream.HostGuard, url: str):
+    data = guard.stale(url)
+    metrics.cache_event("upstream_last_good", "stale" if data is not None else "miss")
+    return data
+
+
+def _background_get_json(url: str):
+    """`_safe_get_json` in the low-priority lane, for scheduled refreshes."""
+    with upstream.background():
+        return _safe_get_json(url)
+
+
+def _fetch_many(urls: List[str], max_workers: int = 8) -> List[Any]:
+    """Fetch several upstream URLs concurrently. Results line up with `urls` (None on failure)."""
+    if not urls:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as pool:
+        # copy_context keeps the caller's upstream priority lane in the worker threads
+        futures = [pool.submit(contextvars.copy_context().run, _safe_get_json, url) for url in urls]
+        return [f.result() for f in futures]
+
+
+def _disconnected(request: Optional[Request]):
+    """Check for a sync route: True once the HTTP client has gone away (None without a request)."""
+    if request is None:
         return None
 
+    def check() -> bool:
+        try:
+            return anyio.from_thread.run(request.is_disconnected)
+        except RuntimeError:  # not on an AnyIO worker thread
+            return False
+
+    return check
+
+
+@router.get("/cache/stats")
+def cache_stats():
+    """Entries, approximate bytes, bounds and evictions per cache namespace."""
+    return cache.snapshot()
+
+
+@router.get("/upstream/status")
+def upstream_status():
+    """Per-host breaker state, error rate, rate-limit queue depth and call counters."""
+    return upstream.snapshot()
+
+
+metrics.Gauge(
+    "upstream_breaker_open",
+    "1 while a host's circuit breaker is open or half-open",
+    ("host",),
+    fn=lambda: {(h,): float(v["breaker"] != "closed") for h, v in upstream.snapshot().items()},
+)
+metrics.Gauge(
+    "upstream_queue_depth",
+    "Callers waiting for a rate-limit token",
+    ("host", "lane"),
+    fn=lambda: {(h, lane): float(n) for h, v in upstream.snapshot().items() for lane, n in v["queue_depth"].items()},
+)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics_endpoint():
+    """Prometheus text exposition of route, upstream, cache, Socket.IO and OpenAI metrics."""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
+@router.get("/healthz")
+def healthz():
+    """Liveness: the process is up and serving. Never touches upstream or caches."""
+    return {"status": "ok"}
+
+
+def _readiness() -> dict[str, bool]:
+    """Which warm caches are loaded (checked without fetching anything)."""
+    return {
+        "nfl_state": bool(_nfl_state_cache.get("data")),
+        "sleeper_players": bool((_sleeper_players_cache.get("nfl") or {}).get("data")),
+    }
+
+
+@router.get("/readyz")
+def readyz():
+    """
+    Readiness: 200 once NFL state and the Sleeper player feed are cached, 503 until
+    then. While not ready it (re)starts the background warmup if none is running.
+    """
+    checks = _readiness()
+    ready = all(checks.values())
+    if not ready:
+        start_warmup()
+    return JSONResponse({"status": "ready" if ready else "warming", "checks": checks}, status_code=200 if ready else 503)
+
+
+def warm_caches() -> dict[str, bool]:
+    """Load the caches `/readyz` waits on (one attempt)."""
+    started = time.perf_counter()
+    _get_nfl_state()
+    _get_sleeper_players()
+    checks = _readiness()
+    logger.info(f"Warm caches {checks} in {time.perf_counter() - started:.2f}s")
+    return checks
+
+
+_WARM_CACHES = os.environ.get("WARM_CACHES", "1").lower() not in ("0", "false", "no")
+# Backoff between warmup attempts while upstream is down: 5s, 10s, 20s, ... capped at 5 minutes
+_WARM_RETRY_FIRST = 5.0
+_WARM_RETRY_MAX = 300.0
+_warmup_lock = threading.Lock()
+_warmup_thread: Optional[threading.Thread] = None
+
+
+def _warm_until_ready() -> None:
+    delay = _WARM_RETRY_FIRST
+    while True:
+        try:
+            checks = warm_caches()
+        except Exception as e:
+            logger.warning(f"Cache warmup failed: {e}")
+            checks = {}
+        if checks and all(checks.values()):
+            return
+        logger.warning(f"Caches not warm ({checks}); retrying in {delay:.0f}s")
+        time.sleep(delay)
+        delay = min(delay * 2, _WARM_RETRY_MAX)
+
+
+def start_warmup() -> bool:
+    """Warm the `/readyz` caches on a background thread, retrying with backoff. False if disabled or already running."""
+    global _warmup_thread
+    if not _WARM_CACHES:
+        return False
+    with _warmup_lock:
+        if _warmup_thread is not None and _warmup_thread.is_alive():
+            return False
+        _warmup_thread = threading.Thread(target=_warm_until_ready, name="cache-warmup", daemon=True)
+        _warmup_thread.start()
+        return True
+
+
+@router.get("/profiles/{profile_id}")
+def get_profile(profile_id: str, token: str = Query(default="")):
+    """Speedscope JSON of a profiled request (see `X-Profile-Id`). Needs PROFILE_TOKEN."""
+    if not profiling.authorized(token):
+        raise HTTPException(status_code=403, detail="Profiling is disabled or the token is wrong")
+    path = profiling.profile_path(_DATA_DIR, profile_id)
+    if not os.path.exists(path):
+        raise HTTPException(status_code=404, detail="Profile not found")
+    with open(path, "r") as f:
+        return json.load(f)
+
 
 # Minimal built-in fallback dataset to ensure API remains usable offline
 _DEMO_PLAYERS = [
@@ -150,62 +391,95 @@ _DEMO_PLAYERS = [
 ]
 
 
+_PLAYERS_MAX_PAGE = 5000
+
+
 @router.get("/players")
+@profiling.span("build")
 def get_players(
     position: str = Query("ALL"),
     # `season` is the draft season (e.g., 2025). We'll pull last year's stats (2024) but current season ADP (2025).
     season: int = Query(datetime.now().year),
     on_team_only: bool = Query(True),
     scoring: str = Query("ppr"),  # "ppr", "half_ppr", "standard"
+    fields: Optional[str] = None,
+    sort: Optional[str] = None,
+    order: Optional[str] = None,
+    # Annotated so the other routes' direct calls keep plain defaults
+    limit: Annotated[Optional[int], Query(ge=1, le=_PLAYERS_MAX_PAGE)] = None,
+    offset: Annotated[int, Query(ge=0)] = 0,
+    request: Request = None,  # set when served over HTTP; lets a disconnect cancel the build
+    response: Response = None,
 ):
-    # Small helpers to read nested fields and coalesce values
-    def _get_path(obj: dict, path: str):
-        if not isinstance(obj, dict) or not path:
-            return None
-        cur = obj
-        for k in path.split("."):
-            if isinstance(cur, dict) and k in cur:
-                cur = cur[k]
-            else:
-                return None
-        return cur
-
-    def _coalesce(*vals):
-        for v in vals:
-            if v is not None:
-                return v
-        return None
-
-    def _to_int(v: Any, default: int = 0) -> int:
-        try:
-            if v is None:
-                return default
-            if isinstance(v, bool):
-                return int(v)
-            if isinstance(v, (int, float)):
-                return int(v)
-            s = str(v).strip()
-            if s == "" or s.lower() == "na" or s == "-":
-                return default
-            return int(float(s))
-        except Exception:
-            return default
-
-    def _to_opt_int(v: Any):
-        try:
-            if v is None:
-                return None
-            if isinstance(v, bool):
-                return int(v)
-            if isinstance(v, (int, float)):
-                return int(v)
-            s = str(v).strip()
-            if s == "" or s.lower() == "na" or s == "-":
-                return None
-            return int(float(s))
-        except Exception:
-            return None
-
+    """
+    Draftboard rows for every eligible player. With none of the view parameters this
+    is the full list with every field. `fields=id,name,...` trims each row (id is always
+    kept); `sort=fantasyPoints|adp|<stat>` orders rows, missing values last (`order`
+    defaults to asc for adp/rank, desc otherwise); `limit`/`offset` return one page and
+    the row count before paging goes in `X-Total-Count`.
+    """
+    players, built = _player_rows(season, on_team_only, scoring, request)
+    if fields is None and sort is None and order is None and limit is None and not offset:
+        if position == "ALL":
+            return players
+        return [p for p in players if p["position"] == position]
+
+    wanted = [f.strip() for f in (fields or "").split(",") if f.strip()]
+    unknown = [f for f in wanted if f not in player_rows.FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    if sort is not None and sort not in player_rows.SORT_FIELDS:
+        raise HTTPException(status_code=400, detail=f"sort must be one of: {', '.join(player_rows.SORT_FIELDS)}")
+    if order not in (None, "asc", "desc"):
+        raise HTTPException(status_code=400, detail="order must be asc or desc")
+
+    descending = (order or ("asc" if sort in player_rows.ASCENDING_FIELDS else "desc")) == "desc"
+    cache_key = f"{season}:{scoring}:{int(bool(on_team_only))}"
+    rows = _player_view(cache_key, built, players, position, sort, descending)
+    if response is not None:
+        response.headers["X-Total-Count"] = str(len(rows))
+    page = rows[offset : offset + limit] if limit is not None else rows[offset:]
+    if not wanted:
+        return page
+    keys = ["id"] + [f for f in wanted if f != "id"]
+    return [{k: p[k] for k in keys if k in p} for p in page]
+
+
+# Pre-sorted row lists per players-cache entry: { cache_key: {"built", "views": {(position, sort, desc): rows}} }.
+# Dropped together when the underlying rows are rebuilt, so a page is a slice, not a sort.
+# The views share their rows with the players cache, so entries are bounded by count.
+_player_views = cache.namespace("player_views", ttl=3600, max_entries=32)
+_player_views_lock = threading.Lock()
+
+
+def _player_view(cache_key: str, built: float, players: list, position: str, sort: Optional[str], descending: bool) -> list:
+    """Rows of one position in one sort order, built once per rebuild of the rows."""
+    view_key = (position, sort, descending)
+    with _player_views_lock:
+        entry = _player_views.get(cache_key)
+        if entry is None or entry["built"] != built:
+            entry = _player_views[cache_key] = {"built": built, "views": {}}
+        rows = entry["views"].get(view_key)
+    if rows is not None:
+        metrics.cache_event("player_views", "hit")
+        return rows
+    metrics.cache_event("player_views", "miss")
+    rows = players if position == "ALL" else [p for p in players if p["position"] == position]
+    if sort:
+        def has_value(p: dict) -> bool:
+            v = p.get(sort)
+            return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+        ranked = sorted((p for p in rows if has_value(p)), key=lambda p: p[sort], reverse=descending)
+        rows = ranked + [p for p in rows if not has_value(p)]
+    with _player_views_lock:
+        if _player_views.get(cache_key) is entry:
+            entry["views"][view_key] = rows
+    return rows
+
+
+def _player_rows(season: int, on_team_only: bool, scoring: str, request: Optional[Request] = None) -> tuple[list, float]:
+    """(`/players` rows for a season/scoring/on_team_only, when they were built); cached for 5 minutes."""
     # Compute seasons for different data sources
     adp_year = season
     stats_year = season - 1  # show last year's production on the draftboard
@@ -216,27 +490,23 @@ def get_players(
     cache_key = f"{season}:{scoring}:{int(bool(on_team_only))}"
     cache_bucket = _players_cache.get(cache_key, {})
     if "data" in cache_bucket and current_time - cache_bucket.get("timestamp", 0) < 300:
-        cached_players = cache_bucket["data"]
-        if position == "ALL":
-            return cached_players
-        return [p for p in cached_players if p["position"] == position]
+        metrics.cache_event("players", "hit")
+        return cache_bucket["data"], cache_bucket["timestamp"]
+    metrics.cache_event("players", "miss")
 
     # Sleeper endpoints
     url_players = "https://api.sleeper.app/v1/players/nfl"
     url_stats = f"https://api.sleeper.app/v1/stats/nfl/regular/{stats_year}"
     url_adp = f"https://api.sleeper.app/v1/adp/nfl/{adp_year}?type=ppr"
 
-    # Fetch base player info (tolerant)
+    # Player and stats feeds stay undecoded: the CPU pool worker parses them (tolerant)
     logger.info(f"Fetching player data from {url_players}")
-    data_players = _safe_get_json(url_players)
-    if not isinstance(data_players, dict):
-        # Convert demo list to Sleeper-like dict shape
-        data_players = {p["id"]: p for p in _DEMO_PLAYERS}
+    raw_players = _safe_get_json(url_players, raw=True)
+    if raw_players is None:
         logger.info("Using built-in demo players: remote player feed unavailable")
 
-    # Fetch season stats (last year) tolerant
     logger.info(f"Fetching stats from {url_stats} for year {stats_year}")
-    data_stats = _safe_get_json(url_stats) or {}
+    raw_stats = _safe_get_json(url_stats, raw=True)
 
     # Fetch ADP for current draft season (Sleeper first, then FFC fallback)
     adp_dict: dict[str, float] = {}
@@ -259,162 +529,29 @@ def get_players(
     if not adp_dict:
         logger.info("Using Sleeper search_rank as ADP (Sleeper ADP endpoint unavailable)")
 
-    # Stats can be dict keyed by player_id or a list of rows with `player_id`
-    if isinstance(data_stats, dict):
-        stats_dict = {str(player_id): stat for player_id, stat in data_stats.items()}
-    else:
-        stats_dict = {
-            str(stat.get("player_id")): stat
-            for stat in data_stats
-            if isinstance(stat, dict) and stat.get("player_id") is not None
-        }
-
-    valid_positions = ["QB", "RB", "WR", "TE", "K", "DEF"]
-    players: list[dict] = []
-
-    for player_id, player_data in data_players.items():
-        team_code = (player_data.get("team") or "").strip()
-        years_exp = player_data.get("years_exp")
-        is_rookie = years_exp == 0  # explicit rookies only (pre-NFL-draft prospects)
-        status = (player_data.get("status") or "").strip().lower()
-        # Always drop "Sleeper-active but team-less veterans" — these are retired/free agent
-        # placeholders (e.g. Tom Brady, Drew Brees) that have player records but no real team.
-        # Rookies (years_exp == 0) are kept even without a team.
-        if not team_code:
-            if not is_rookie:
-                continue
-        # Status-based exclusions (Sleeper marks retired players in a few flavors)
-        if status in ("inactive", "retired"):
-            continue
-        if on_team_only and player_data.get("active") is False:
-            continue
-
-        pos = player_data.get("position")
-        if pos not in valid_positions:
-            continue
-
-        stat = stats_dict.get(str(player_id), {}) or {}
-
-        # Coerce numeric fields to sane types (ints) and default zeros
-        passYds = int(stat.get("pass_yd", 0) or 0)
-        passTD = int(stat.get("pass_td", 0) or 0)
-        rushYds = int(stat.get("rush_yd", 0) or 0)
-        rushTD = int(stat.get("rush_td", 0) or 0)
-        recYds = int(stat.get("rec_yd", 0) or 0)
-        recTD = int(stat.get("rec_td", 0) or 0)
-        receptions = int(stat.get("rec", 0) or 0)
-        # receiving targets from one of: rec_tgt, targets, or nested paths
-        targets_val = _to_opt_int(
-            _coalesce(
-                stat.get("rec_tgt"),
-                stat.get("targets"),
-                _get_path(stat, "receiving.targets"),
-            )
-        )
-        fumbles = int(stat.get("fum", 0) or 0)
-        interceptions = int(stat.get("int", 0) or 0)
-        sacks = int(stat.get("sack", 0) or 0)
-
-        # New: attempts & completions (use multiple possible keys for safety)
-        rushAtt = int(
-            stat.get("rush_att", 0)
-            or stat.get("rushing_att", 0)
-            or stat.get("rush_attempts", 0)
-            or 0
-        )
-
-        # passing attempts from one of: pass_att, att, attempts, or nested paths
-        pass_att = _to_opt_int(
-            _coalesce(
-                stat.get("pass_att"),
-                stat.get("att"),
-                stat.get("attempts"),
-                _get_path(stat, "passing.att"),
-                _get_path(stat, "passing.attempts"),
-                _get_path(stat, "pass.att"),
-            )
-        )
-
-        # passing completions from one of: pass_cmp, cmp, completions, or nested paths
-        pass_cmp = _to_opt_int(
-            _coalesce(
-                stat.get("pass_cmp"),
-                stat.get("cmp"),
-                stat.get("completions"),
-                _get_path(stat, "passing.cmp"),
-                _get_path(stat, "passing.completions"),
-                _get_path(stat, "pass.cmp"),
-            )
-        )
-
-        rec_multiplier = {"ppr": 1.0, "half_ppr": 0.5, "standard": 0.0}.get(scoring, 1.0)
-        fantasyPoints = round(
-            passTD * 4
-            + passYds / 25
-            - interceptions * 2
-            + rushTD * 6
-            + rushYds / 10
-            + recTD * 6
-            + recYds / 10
-            + receptions * rec_multiplier,
-            1,
+    # Row building is pure Python over the whole feed: run it off the serving process
+    try:
+        players, multipliers = cpu_pool.run(
+            "players",
+            player_rows.build_players,
+            raw_players,
+            raw_stats,
+            adp_dict,
+            scoring,
+            on_team_only,
+            {p["id"]: p for p in _DEMO_PLAYERS},
+            cancelled=_disconnected(request),
         )
-        full_name = f"{player_data.get('first_name', '')} {player_data.get('last_name', '')}".strip()
-        # Prefer Sleeper ADP by id, then search_rank as fallback
-        adp_value = adp_dict.get(str(player_id))
-        if adp_value is None:
-            sr = player_data.get("search_rank")
-            if sr is not None and isinstance(sr, (int, float)):
-                adp_value = float(sr)
-
-        player: dict[str, Any] = {
-            "id": str(player_id),
-            "name": full_name,
-            "team": team_code,
-            "position": pos,
-            "rank": 0,
-            "fantasyPoints": fantasyPoints,
-            "rushYds": rushYds,
-            "rushTD": rushTD,
-            "rushAtt": rushAtt,
-            "recYds": recYds,
-            "recTD": recTD,
-            "passYds": passYds,
-            "passTD": passTD,
-            "receptions": receptions,
-            "fumbles": fumbles,
-            "interceptions": interceptions,
-            "sacks": sacks,
-            "adp": adp_value if isinstance(adp_value, (int, float)) else None,
-            # Bio/metadata from Sleeper
-            "age": player_data.get("age"),
-            "height": player_data.get("height"),
-            "weight": player_data.get("weight"),
-            "college": player_data.get("college"),
-            "years_exp": player_data.get("years_exp"),
-            "number": player_data.get("number"),
-            "injury_status": player_data.get("injury_status"),
-        }
-
-        # Conditionally include requested flat keys only when valid numbers
-        if pass_att is not None:
-            player["pass_att"] = pass_att
-            # Optional camelCase for compatibility
-            player["passAtt"] = pass_att
-        if pass_cmp is not None:
-            player["pass_cmp"] = pass_cmp
-            player["passCmp"] = pass_cmp
-        if targets_val is not None:
-            player["targets"] = targets_val
-        players.append(player)
+    except cpu_pool.Cancelled:
+        raise HTTPException(status_code=499, detail="Client closed request")
+    if multipliers is not None:
+        _dvp_cache[str(stats_year)] = {"data": multipliers, "ts": current_time}
 
     # Save per-season cache (key by desired draft season)
     _players_cache[cache_key] = {"data": players, "timestamp": current_time}
 
-    logger.info(f"Returning {len(players)} players for position {position}")
-    if position == "ALL":
-        return players
-    return [p for p in players if p["position"] == position]
+    logger.info(f"Built {len(players)} players for {cache_key}")
+    return players, current_time
 
 @router.get("/drafts/{draft_id}/picks", response_model=List[Pick])
 def get_picks(draft_id: str):
@@ -434,6 +571,10 @@ def upsert_picks(draft_id: str, picks: List[Pick]):
         "picks": picks,
         "updated": time.time(),
     }
+    room = draft_recs.get_room(draft_id)
+    if room:
+        with room.lock:
+            room.reset(p.player_id for p in picks)
     return picks
 
 @router.delete("/drafts/{draft_id}/picks", response_model=dict)
@@ -442,8 +583,150 @@ def clear_picks(draft_id: str):
     Clear all picks for the draftboard.
     """
     _draft_picks_store[draft_id] = {"picks": [], "updated": time.time()}
+    room = draft_recs.get_room(draft_id)
+    if room:
+        with room.lock:
+            room.reset([])
     return {"ok": True}
 
+
+def _open_draft_room(
+    draft_id: str,
+    season: Optional[int] = None,
+    scoring: str = "ppr",
+    roster_slots: Optional[List[str]] = None,
+    league_size: int = 12,
+) -> draft_recs.DraftRoom:
+    """Build a draft room's recommendation heaps from the cached `/players` payload."""
+    players = get_players(
+        position="ALL",
+        season=season or datetime.now().year,
+        on_team_only=True,
+        scoring=scoring,
+    )
+    drafted = [p.player_id for p in _draft_picks_store.get(draft_id, {}).get("picks", [])]
+    return draft_recs.open_room(draft_id, players, roster_slots, league_size, drafted)
+
+
+@router.get("/drafts/{draft_id}/suggestions")
+def get_draft_suggestions(
+    draft_id: str,
+    limit: int = Query(default=10, ge=1, le=100),
+    position: Optional[str] = Query(default=None),
+    season: Optional[int] = Query(default=None),
+    scoring: str = Query("ppr"),
+    teams: int = Query(default=12, ge=1, le=32),
+    slots: Optional[str] = Query(default=None, description="Comma-separated roster slots, e.g. QB,RB,RB,WR,WR,TE,FLEX,K,DEF"),
+):
+    """
+    Best-available suggestions for a draftboard, ranked by VORP (then ADP) and weighted
+    by remaining roster need. The room is kept current by the Socket.IO pick events.
+    """
+    room = draft_recs.get_room(draft_id)
+    if room is None:
+        roster_slots = [x.strip().upper() for x in slots.split(",")] if slots else None
+        room = _open_draft_room(draft_id, season, scoring, roster_slots, teams)
+    with room.lock:
+        return {
+            "draft_id": draft_id,
+            "suggestions": room.suggestions(limit, position),
+            "needs": room.needs(),
+            "drafted_count": len(room.drafted),
+        }
+
+
+# Completed drafts never change, so their grades are kept for a year: { draft_id: result }
+_draft_grades_cache = cache.namespace(
+    "draft_grades", ttl=365 * 24 * 3600, max_entries=20000, max_bytes=128 * 1024 * 1024, shared=True
+)
+_MAX_GRADE_BATCH = 100
+# A smaller /players universe means the Sleeper feed was down and the demo players were used
+_MIN_GRADE_UNIVERSE = 100
+
+
+def _draft_grade_values(season: int, scoring: str) -> tuple[dict[str, dict[str, Any]], str]:
+    """
+    `/players` rows keyed by id with `value` = full-season projection, and where the
+    values came from: "projections", "last_season" (no projections stored) or "demo".
+    """
+    universe = get_players(position="ALL", season=season, on_team_only=False, scoring=scoring)
+    store = _projection_store(season)
+    with store.lock:
+        projected = store.totals(resolve_profile(scoring))
+    if len(universe) < _MIN_GRADE_UNIVERSE:
+        source = "demo"
+    elif not projected:
+        source = "last_season"
+    else:
+        return {p["id"]: {**p, "value": projected.get(p["id"], 0.0)} for p in universe}, "projections"
+    return {p["id"]: {**p, "value": p.get("fantasyPoints") or 0} for p in universe}, source
+
+
+def _grade_drafts(draft_ids: List[str]) -> dict[str, Any]:
+    """
+    Grades for many drafts; uncached drafts and their picks are fetched in one concurrent
+    batch. Only completed drafts graded on real projections are cached, so a grade built
+    while a feed was down is redone on the next request.
+    """
+    from app.services import draft_grades
+
+    results: dict[str, Any] = {}
+    pending = []
+    for draft_id in dict.fromkeys(draft_ids):
+        hit = _draft_grades_cache.get(draft_id)
+        if hit is not None:
+            metrics.cache_event("draft_grades", "hit")
+            results[draft_id] = hit
+        else:
+            metrics.cache_event("draft_grades", "miss")
+            pending.append(draft_id)
+
+    urls = []
+    for draft_id in pending:
+        urls += [f"https://api.sleeper.app/v1/draft/{draft_id}", f"https://api.sleeper.app/v1/draft/{draft_id}/picks"]
+    fetched = _fetch_many(urls, max_workers=16)
+    pools: dict[tuple[int, str], tuple[dict[str, dict[str, Any]], str]] = {}
+    for i, draft_id in enumerate(pending):
+        draft, picks = fetched[2 * i], fetched[2 * i + 1]
+        if not isinstance(draft, dict):
+            results[draft_id] = {"draft_id": draft_id, "error": "Sleeper draft not found"}
+            continue
+        season = int(draft.get("season") or _state_season())
+        scoring = draft_grades.scoring_name(draft)
+        if (season, scoring) not in pools:
+            pools[(season, scoring)] = _draft_grade_values(season, scoring)
+        values, source = pools[(season, scoring)]
+        result = draft_grades.grade_draft(draft, picks if isinstance(picks, list) else [], values, "value")
+        result["value_source"] = source
+        results[draft_id] = result
+        if draft.get("status") == "complete" and result["teams"] and source == "projections":
+            _draft_grades_cache[draft_id] = result
+    return {draft_id: results[draft_id] for draft_id in dict.fromkeys(draft_ids)}
+
+
+@router.get("/drafts/grades")
+def get_draft_grades(ids: str = Query(..., description="Comma-separated Sleeper draft ids")):
+    """
+    Grade every team in each draft on ADP value, positional scarcity (VORP) and
+    projected starters. Completed drafts are graded once and cached.
+    """
+    draft_ids = [x.strip() for x in ids.split(",") if x.strip()]
+    if not draft_ids:
+        raise HTTPException(status_code=400, detail="Pass at least one draft id")
+    if len(draft_ids) > _MAX_GRADE_BATCH:
+        raise HTTPException(status_code=400, detail=f"At most {_MAX_GRADE_BATCH} drafts per request")
+    return _grade_drafts(draft_ids)
+
+
+@router.get("/sleeper/draft/{draft_id}/grades")
+def sleeper_draft_grades(draft_id: str):
+    """Team grades for a single Sleeper draft."""
+    result = _grade_drafts([draft_id])[draft_id]
+    if result.get("error"):
+        raise HTTPException(status_code=404, detail=result["error"])
+    return result
+
+
 @router.get("/adp/{season}")
 def get_adp(season: int):
     """
@@ -629,45 +912,98 @@ def espn_league(league_id: str, season: int = Query(default=2025), view: str = Q
 # Sleeper Trending Data
 # -------------------------------------------
 
-@router.get("/sleeper/trending/add")
-def sleeper_trending_add(lookback_hours: int = Query(default=24), limit: int = Query(default=50)):
-    """Get trending add players from Sleeper."""
-    url = f"https://api.sleeper.app/v1/players/nfl/trending/add?lookback_hours={lookback_hours}&limit={limit}"
+_trending_poller = trending.TrendingPoller(
+    lambda url: _background_get_json(url),
+    interval=float(os.environ.get("TRENDING_POLL_SECONDS", 900)),
+)
+
+
+def _get_trending() -> trending.TrendingPoller:
+    """Shared trending poller (started on first use)."""
+    _trending_poller.ensure_fresh()
+    return _trending_poller
+
+
+def _trending_rows(kind: str, lookback_hours: int, limit: int) -> list:
+    # The poller covers the default 24h window; other windows still go upstream.
+    if lookback_hours == trending.POLL_LOOKBACK_HOURS and limit <= trending.POLL_LIMIT:
+        return _get_trending().top(kind, limit)
+    url = f"https://api.sleeper.app/v1/players/nfl/trending/{kind}?lookback_hours={lookback_hours}&limit={limit}"
     data = _safe_get_json(url)
     if data is None:
         return []
     return data
 
 
+@router.get("/sleeper/trending/add")
+def sleeper_trending_add(lookback_hours: int = Query(default=24), limit: int = Query(default=50)):
+    """Get trending add players from Sleeper (served from the shared poller for 24h lookbacks)."""
+    return _trending_rows("add", lookback_hours, limit)
+
+
 @router.get("/sleeper/trending/drop")
 def sleeper_trending_drop(lookback_hours: int = Query(default=24), limit: int = Query(default=50)):
-    """Get trending drop players from Sleeper."""
-    url = f"https://api.sleeper.app/v1/players/nfl/trending/drop?lookback_hours={lookback_hours}&limit={limit}"
-    data = _safe_get_json(url)
-    if data is None:
-        return []
-    return data
+    """Get trending drop players from Sleeper (served from the shared poller for 24h lookbacks)."""
+    return _trending_rows("drop", lookback_hours, limit)
+
+
+@router.get("/sleeper/trending/{kind}/movers")
+def sleeper_trending_movers(
+    kind: str,
+    window_minutes: int = Query(default=60, ge=1, le=24 * 60),
+    limit: int = Query(default=25, ge=1, le=200),
+):
+    """
+    Players whose trending count is rising fastest: velocity is the count change per hour
+    over the window, acceleration the change in velocity versus the window before it.
+    """
+    if kind not in trending.KINDS:
+        raise HTTPException(status_code=404, detail="kind must be add or drop")
+    poller = _get_trending()
+    with poller.lock:
+        movers = poller.series[kind].movers(window_minutes * 60, limit)
+    players_meta = _get_sleeper_players()
+    for m in movers:
+        meta = players_meta.get(m["player_id"]) if isinstance(players_meta, dict) else None
+        if isinstance(meta, dict):
+            slim = _slim_player(m["player_id"], meta)
+            m.update(name=slim["name"], position=slim["position"], team=slim["team"])
+    return movers
+
+
+@router.get("/sleeper/trending/{kind}/history/{player_id}")
+def sleeper_trending_history(kind: str, player_id: str):
+    """Polled trending counts for one player, oldest first."""
+    if kind not in trending.KINDS:
+        raise HTTPException(status_code=404, detail="kind must be add or drop")
+    poller = _get_trending()
+    with poller.lock:
+        return poller.series[kind].history(player_id)
 
 
 # -------------------------------------------
 # Sleeper Player Metadata (cached)
 # -------------------------------------------
 
-_sleeper_players_cache: dict[str, Any] = {"data": None, "ts": 0.0}
 _SLEEPER_PLAYERS_TTL = 60 * 60 * 6  # 6h
+# Single entry {"data", "ts"}; kept for a day so a failed refresh can fall back to it.
+_sleeper_players_cache = cache.namespace("sleeper_players", ttl=_SLEEPER_PLAYERS_TTL * 4, max_entries=1, shared=True)
 
 
 def _get_sleeper_players() -> dict[str, Any]:
     """Return Sleeper's full NFL player metadata, cached locally."""
     now = time.time()
-    cached = _sleeper_players_cache.get("data")
-    if cached and now - _sleeper_players_cache.get("ts", 0) < _SLEEPER_PLAYERS_TTL:
+    entry = _sleeper_players_cache.get("nfl") or {}
+    cached = entry.get("data")
+    if cached and now - entry.get("ts", 0) < _SLEEPER_PLAYERS_TTL:
+        metrics.cache_event("sleeper_players", "hit")
         return cached
     fresh = _safe_get_json("https://api.sleeper.app/v1/players/nfl")
     if isinstance(fresh, dict):
-        _sleeper_players_cache["data"] = fresh
-        _sleeper_players_cache["ts"] = now
+        metrics.cache_event("sleeper_players", "miss")
+        _sleeper_players_cache["nfl"] = {"data": fresh, "ts": now}
         return fresh
+    metrics.cache_event("sleeper_players", "stale" if cached else "miss")
     return cached or {}
 
 
@@ -709,31 +1045,1082 @@ def sleeper_players_slim(ids: Optional[str] = Query(default=None)):
     }
 
 
+# -------------------------------------------
+# Player name search (index rebuilt per Sleeper feed refresh)
+# -------------------------------------------
+
+_search_index: dict[str, Any] = {"feed": None, "index": None}
+_search_index_lock = threading.Lock()
+
+
+def _get_player_index() -> "player_search.PlayerIndex":
+    """Name index over the current Sleeper feed; rebuilt only when the feed object changes."""
+    from app.services import player_search
+
+    feed = _get_sleeper_players()
+    index = _search_index.get("index")
+    if index is not None and _search_index.get("feed") is feed:
+        metrics.cache_event("player_search", "hit")
+        return index
+    with _search_index_lock:
+        if _search_index.get("index") is None or _search_index.get("feed") is not feed:
+            metrics.cache_event("player_search", "miss")
+            started = time.perf_counter()
+            _search_index["index"] = player_search.PlayerIndex(feed)
+            _search_index["feed"] = feed
+            logger.info(f"Built player search index: {len(_search_index['index'])} players in {time.perf_counter() - started:.2f}s")
+        return _search_index["index"]
+
+
+@router.get("/players/search")
+def search_players(
+    q: str = Query(..., min_length=1, max_length=64),
+    limit: int = Query(10, ge=1, le=50),
+    position: Optional[str] = Query(None),
+):
+    """Ranked player matches for a partial or misspelled name, nickname or team."""
+    pos = position.upper() if position and position.upper() != "ALL" else None
+    return {"query": q, "results": _get_player_index().search(q, limit=limit, position=pos)}
+
+
+def _mentioned_players(text: str) -> str:
+    """GM context line resolving player names in the question to Sleeper ids."""
+    if not text:
+        return ""
+    found = _get_player_index().mentions(text)
+    if not found:
+        return ""
+    return "Players mentioned: " + ", ".join(f"{p['name']} ({p['position']} {p['team'] or 'FA'}, id {p['id']})" for p in found)
+
+
+# -------------------------------------------
+# NFL State (cached)
+# -------------------------------------------
+
+_nfl_state_cache: dict[str, Any] = {"data": None, "ts": 0.0}
+_NFL_STATE_TTL = 60 * 10  # 10m
+
+
+def _get_nfl_state() -> dict[str, Any]:
+    """Return Sleeper's NFL state (season, week), cached locally."""
+    now = time.time()
+    cached = _nfl_state_cache.get("data")
+    if cached and now - _nfl_state_cache.get("ts", 0) < _NFL_STATE_TTL:
+        metrics.cache_event("nfl_state", "hit")
+        return cached
+    fresh = _safe_get_json("https://api.sleeper.app/v1/state/nfl")
+    if isinstance(fresh, dict):
+        metrics.cache_event("nfl_state", "miss")
+        _nfl_state_cache["data"] = fresh
+        _nfl_state_cache["ts"] = now
+        return fresh
+    metrics.cache_event("nfl_state", "stale" if cached else "miss")
+    return cached or {}
+
+
+def _state_season() -> int:
+    """Season Sleeper currently reports (calendar year when unknown)."""
+    try:
+        return int(_get_nfl_state().get("season") or datetime.now().year)
+    except (TypeError, ValueError):
+        return datetime.now().year
+
+
+def _current_week(season: int) -> int:
+    """First week of `season` that is not yet final (past seasons → past the last week)."""
+    state = _get_nfl_state()
+    state_season = _state_season()
+    if season < state_season:
+        return projections.REGULAR_SEASON_WEEKS + 1
+    if season > state_season:
+        return 1
+    return max(int(state.get("week") or 1), 1)
+
+
+# -------------------------------------------
+# Projections (season-wide store)
+# -------------------------------------------
+
+def _scoring_weights(scoring: str = "ppr", league_id: Optional[str] = None) -> dict[str, float]:
+    """Stat weights for a named profile, or a Sleeper league's own scoring_settings."""
+    if league_id:
+        league = _safe_get_json(f"https://api.sleeper.app/v1/league/{league_id}") or {}
+        custom = league.get("scoring_settings") if isinstance(league, dict) else None
+        if custom:
+            return resolve_profile(custom=custom)
+    return resolve_profile(scoring)
+
+
+# Sleeper's first NFL season; nothing upstream predates it
+_FIRST_SLEEPER_SEASON = 2017
+
+
+def _projection_store(season: int) -> projections.ProjectionStore:
+    """
+    Season store with stale weeks (never fetched, or current/future past TTL) refreshed.
+    Each season keeps a store (and an .npz file), so only Sleeper's seasons through
+    next year's are accepted.
+    """
+    latest = _state_season() + 1
+    if not _FIRST_SLEEPER_SEASON <= season <= latest:
+        raise HTTPException(
+            status_code=400, detail=f"Projections cover seasons {_FIRST_SLEEPER_SEASON}-{latest}"
+        )
+    store = projections.get_store(season, _DATA_DIR)
+    updated = store.refresh(_fetch_many, _current_week(season))
+    if updated:
+        logger.info(f"Refreshed {season} projections for weeks {updated}")
+    return store
+
+
+@router.get("/projections/{season}/ros")
+def projections_rest_of_season(
+    season: int,
+    scoring: str = Query("ppr"),
+    league_id: Optional[str] = Query(default=None),
+    from_week: Optional[int] = Query(default=None, ge=1, le=projections.REGULAR_SEASON_WEEKS),
+    position: str = Query("ALL"),
+    limit: int = Query(default=200, ge=1, le=5000),
+):
+    """
+    Rest-of-season projected points per player (defaults to the current week onward).
+    Pass `league_id` to score with that league's Sleeper scoring settings.
+    """
+    weights = _scoring_weights(scoring, league_id)
+    store = _projection_store(season)
+    start = from_week or min(_current_week(season), projections.REGULAR_SEASON_WEEKS)
+    with store.lock:
+        totals = store.totals(weights, from_week=start)
+    players_meta = _get_sleeper_players()
+    rows = []
+    for pid, pts in totals.items():
+        meta = players_meta.get(pid) if isinstance(players_meta, dict) else None
+        slim = _slim_player(pid, meta) if isinstance(meta, dict) else {"id": pid, "name": pid, "position": "", "team": ""}
+        if position != "ALL" and slim["position"] != position:
+            continue
+        rows.append({"id": pid, "name": slim["name"], "position": slim["position"], "team": slim["team"], "points": pts})
+    rows.sort(key=lambda r: r["points"], reverse=True)
+    return {"season": season, "from_week": start, "players": rows[:limit]}
+
+
+@router.get("/projections/{season}/weeks/{week}")
+def projections_week_totals(
+    season: int,
+    week: int,
+    scoring: str = Query("ppr"),
+    league_id: Optional[str] = Query(default=None),
+):
+    """Projected points for every player in a single week: { player_id: points }."""
+    if week < 1 or week > projections.REGULAR_SEASON_WEEKS:
+        raise HTTPException(status_code=400, detail="week out of range")
+    weights = _scoring_weights(scoring, league_id)
+    store = _projection_store(season)
+    with store.lock:
+        return store.totals(weights, from_week=week, to_week=week)
+
+
+@router.get("/projections/{season}/players/{player_id}")
+def projections_player_weeks(
+    season: int,
+    player_id: str,
+    scoring: str = Query("ppr"),
+    league_id: Optional[str] = Query(default=None),
+):
+    """Per-week projected points for one player (index 0 = week 1)."""
+    weights = _scoring_weights(scoring, league_id)
+    store = _projection_store(season)
+    with store.lock:
+        weeks = store.player_weeks(player_id, weights)
+    if weeks is None:
+        raise HTTPException(status_code=404, detail="no projections for player")
+    return {"player_id": player_id, "season": season, "weeks": weeks, "total": round(sum(weeks), 2)}
+
+
+# -------------------------------------------
+# Weekly game logs (week-level stats, indexed by player)
+# -------------------------------------------
+
+_WEEK_STATS_URL = "https://api.sleeper.app/v1/stats/nfl/regular/{season}/{week}"
+# { "season:week": {"data", "ts", "final"} }. Final weeks are kept for a year; live ones refetched after _LIVE_WEEK_TTL.
+# A week's payload is 1-2 MB, so the byte bound is what holds (about three seasons of weeks).
+_week_stats_cache = cache.namespace(
+    "week_stats", ttl=365 * 24 * 3600, max_entries=64, max_bytes=128 * 1024 * 1024, shared=True
+)
+_LIVE_WEEK_TTL = 60 * 10
+# Game logs cover the current season and this many before it; each season is ~18 upstream calls cold
+_GAMELOG_HISTORY = int(os.environ.get("GAMELOG_SEASONS", 2))
+# Per-process player index per season: { "season": {"index", "ts", "final"} }; rebuilt when a live week is due
+_gamelog_indexes = cache.namespace("gamelog", ttl=7 * 24 * 3600, max_entries=8, max_bytes=256 * 1024 * 1024)
+_gamelog_lock = threading.Lock()
+
+
+def _season_week_stats(season: int) -> tuple[dict[int, Any], bool]:
+    """({week: stats payload} for every played week of `season`, whether all of them are final)."""
+    state_season = _state_season()
+    if season > state_season:
+        return {}, False
+    state_week = _current_week(season)
+    weeks: dict[int, Any] = {}
+    missing = []
+    now = time.time()
+    for week in range(1, min(state_week, projections.REGULAR_SEASON_WEEKS) + 1):
+        hit = _week_stats_cache.get(f"{season}:{week}")
+        if hit is not None and (hit["final"] or now - hit["ts"] < _LIVE_WEEK_TTL):
+            weeks[week] = hit["data"]
+        else:
+            missing.append(week)
+    # Every missing or due week in one concurrent batch
+    fetched = _fetch_many([_WEEK_STATS_URL.format(season=season, week=w) for w in missing])
+    failed = False
+    for week, payload in zip(missing, fetched):
+        if isinstance(payload, (dict, list)):
+            final = projections.week_is_final(season, week, state_season, state_week)
+            _week_stats_cache[f"{season}:{week}"] = {"data": payload, "ts": now, "final": final}
+            weeks[week] = payload
+            continue
+        failed = True
+        # Upstream down: an expired live copy beats a gap in the log
+        stale = _week_stats_cache.get(f"{season}:{week}")
+        if stale is not None:
+            weeks[week] = stale["data"]
+    return weeks, season < state_season and not failed
+
+
+def _gamelog_index(season: int) -> gamelog.GameLogIndex:
+    """Player index over the season's week stats; weeks are only fetched when missing or live and due."""
+    entry = _gamelog_indexes.get(str(season))
+    if entry is not None and (entry["final"] or time.time() - entry["ts"] < _LIVE_WEEK_TTL):
+        metrics.cache_event("gamelog", "hit")
+        return entry["index"]
+    with _gamelog_lock:
+        entry = _gamelog_indexes.get(str(season))
+        if entry is not None and (entry["final"] or time.time() - entry["ts"] < _LIVE_WEEK_TTL):
+            metrics.cache_event("gamelog", "hit")
+            return entry["index"]
+        metrics.cache_event("gamelog", "miss")
+        weeks, final = _season_week_stats(season)
+        started = time.perf_counter()
+        index = gamelog.GameLogIndex(weeks)
+        logger.info(
+            f"Built {season} game log index: {len(index)} players over weeks {list(index.weeks)} "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+        _gamelog_indexes[str(season)] = {"index": index, "ts": time.time(), "final": final}
+        return index
+
+
+@router.get("/players/{player_id}/gamelog")
+def player_gamelog(
+    player_id: str,
+    season: Optional[int] = Query(default=None),
+    scoring: str = Query("ppr"),
+    league_id: Optional[str] = Query(default=None),
+):
+    """
+    Week-by-week stats and fantasy points for one player (defaults to the current season;
+    older seasons than GAMELOG_SEASONS back are served by the warehouse instead).
+    Weeks the player did not appear in (byes, inactive) are left out.
+    """
+    state_season = _state_season()
+    season = season or state_season
+    if not state_season - _GAMELOG_HISTORY <= season <= state_season:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Game logs cover seasons {state_season - _GAMELOG_HISTORY}-{state_season}; see /warehouse for older ones",
+        )
+    weights = _scoring_weights(scoring, league_id)
+    index = _gamelog_index(season)
+    weeks = index.player(player_id, weights)
+    if weeks is None:
+        raise HTTPException(status_code=404, detail="no game log for player")
+    return {
+        "player_id": player_id,
+        "season": season,
+        "weeks": weeks,
+        "total": round(sum(w["points"] for w in weeks), 2),
+    }
+
+
+# -------------------------------------------
+# Stats Warehouse (multi-season history in DB_URL)
+# -------------------------------------------
+
+# Seasons loaded when no range is given: the current one and this many before it
+_WAREHOUSE_HISTORY = int(os.environ.get("WAREHOUSE_SEASONS", 3))
+
+
+def _warehouse() -> "warehouse.StatsWarehouse":
+    from app.services import warehouse
+
+    return warehouse.get_warehouse(settings.DB_URL, _DATA_DIR)
+
+
+def _parse_seasons(raw: Optional[str]) -> List[int]:
+    """Seasons from "2021-2024" or "2022,2024"; None means the recent seasons."""
+    if not raw:
+        current = _state_season()
+        return list(range(current - _WAREHOUSE_HISTORY, current + 1))
+    seasons: set[int] = set()
+    try:
+        for part in raw.split(","):
+            part = part.strip()
+            if "-" in part:
+                lo, hi = (int(x) for x in part.split("-", 1))
+                seasons.update(range(min(lo, hi), max(lo, hi) + 1))
+            elif part:
+                seasons.add(int(part))
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid seasons: {raw}")
+    if len(seasons) > 20:
+        raise HTTPException(status_code=400, detail="At most 20 seasons per request")
+    if min(seasons, default=_FIRST_SLEEPER_SEASON) < _FIRST_SLEEPER_SEASON:
+        raise HTTPException(status_code=400, detail=f"Sleeper stats start in {_FIRST_SLEEPER_SEASON}")
+    return sorted(seasons)
+
+
+def _warehouse_refresh(seasons: List[int]) -> dict[int, list[int]]:
+    """Load pending weeks of `seasons` through the low-priority upstream lane."""
+    state_season = _state_season()
+    with upstream.background():
+        updated = _warehouse().refresh(
+            _fetch_many, seasons, state_season, _current_week(state_season), _get_sleeper_players()
+        )
+    if updated:
+        logger.info(f"Warehouse loaded {sum(len(w) for w in updated.values())} season/week slices: {sorted(updated)}")
+    return updated
+
+
+def _start_warehouse_refresh(seasons: List[int]) -> bool:
+    """Run `_warehouse_refresh` on a background thread unless an ingest is already running."""
+    if _warehouse().ingest_lock.locked():
+        return False
+    threading.Thread(target=_warehouse_refresh, args=(seasons,), name="warehouse-ingest", daemon=True).start()
+    return True
+
+
+def _pending_seasons(seasons: List[int]) -> Optional[JSONResponse]:
+    """
+    202 when a requested season has never been loaded. Loading one takes ~19
+    upstream calls, so it runs in the background instead of inside the request.
+    503 while every pending week of those seasons is backing off after a failed fetch.
+    """
+    store = _warehouse()
+    known = set(store.seasons())
+    state_season = _state_season()
+    missing = [s for s in seasons if s not in known and s <= state_season]
+    if not missing:
+        return None
+    state_week = _current_week(state_season)
+    if not any(store.pending(s, state_season, state_week) for s in missing):
+        retry = min((store.retry_at(s) or 0.0) for s in missing)
+        wait = max(int(retry - time.time()) + 1, 1)
+        raise HTTPException(
+            status_code=503,
+            detail=f"Sleeper stats for {missing} could not be loaded; retrying in {wait}s",
+            headers={"Retry-After": str(wait)},
+        )
+    started = _start_warehouse_refresh(missing)
+    return JSONResponse(
+        {"seasons": missing, "started": started, "detail": "Loading these seasons into the warehouse; retry shortly"},
+        status_code=202,
+    )
+
+
+@router.post("/warehouse/ingest")
+def warehouse_ingest(seasons: Optional[str] = Query(default=None), wait: bool = Query(False)):
+    """
+    Load Sleeper season and weekly stats into the warehouse. Finalized weeks are
+    skipped; pass `wait=true` to block until done, otherwise it runs in the background.
+    """
+    wanted = _parse_seasons(seasons)
+    if wait:
+        return {"seasons": wanted, "updated": _warehouse_refresh(wanted)}
+    if not _start_warehouse_refresh(wanted):
+        return {"seasons": wanted, "started": False, "detail": "An ingest is already running"}
+    return {"seasons": wanted, "started": True}
+
+
+@router.get("/warehouse/status")
+def warehouse_status():
+    """Stored seasons, weeks, row counts and database size."""
+    return _warehouse().status()
+
+
+@router.get("/warehouse/players/{player_id}/trend")
+def warehouse_player_trend(
+    player_id: str,
+    seasons: Optional[str] = Query(default=None),
+    scoring: str = Query("ppr"),
+):
+    """
+    Per-season points, points per game, year-over-year change and weekly scores for
+    one player. Returns 202 while a season it has never seen is loaded.
+    """
+    wanted = _parse_seasons(seasons)
+    pending = _pending_seasons(wanted)
+    if pending is not None:
+        return pending
+    trend = _warehouse().player_trend(player_id, wanted, scoring)
+    if not trend["seasons"]:
+        raise HTTPException(status_code=404, detail="No stats stored for this player in those seasons")
+    return trend
+
+
+@router.get("/warehouse/positions/{position}")
+def warehouse_positional(
+    position: str,
+    season: int = Query(..., ge=_FIRST_SLEEPER_SEASON),
+    week: int = Query(0, ge=0, le=projections.REGULAR_SEASON_WEEKS, description="0 = season totals"),
+    scoring: str = Query("ppr"),
+    stat: Optional[str] = Query(default=None, description="Aggregate a raw Sleeper stat key instead of points"),
+    min_gp: float = Query(0, ge=0),
+    limit: int = Query(24, ge=1, le=200),
+):
+    """
+    Mean, quartiles, tier cut-offs and leaders for a position in one season or week.
+    Returns 202 while the season is loaded.
+    """
+    pending = _pending_seasons([season])
+    if pending is not None:
+        return pending
+    try:
+        return _warehouse().positional(season, position.upper(), scoring, stat, week, min_gp, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+# -------------------------------------------
+# Schedule & Matchup-Adjusted Projections
+# -------------------------------------------
+
+_SCHEDULE_TTL = 60 * 60 * 24  # 24h
+# { "season": {"data": ScheduleIndex, "ts"} }; kept a week past the TTL as a fallback
+_schedule_cache = cache.namespace("schedule", ttl=_SCHEDULE_TTL * 7, max_entries=16)
+_MATCHUP_TTL = 300  # seconds, same as /players
+# { "season:week:scoring:league": {"data": rows, "ts"} }
+_matchup_cache = cache.namespace(
+    "matchup_adjusted", ttl=_MATCHUP_TTL, max_entries=256, max_bytes=64 * 1024 * 1024, shared=True
+)
+
+
+def _get_schedule(season: int) -> Optional[schedule.ScheduleIndex]:
+    """(team, week) → opponent index from Sleeper's schedule feed, or the bundled table."""
+    now = time.time()
+    hit = _schedule_cache.get(str(season))
+    if hit and now - hit.get("ts", 0) < _SCHEDULE_TTL:
+        metrics.cache_event("schedule", "hit")
+        return hit["data"]
+    rows = _safe_get_json(f"https://api.sleeper.app/schedule/nfl/regular/{season}")
+    index = schedule.from_sleeper(season, rows) or schedule.fallback(season)
+    if index is None:
+        metrics.cache_event("schedule", "stale" if hit else "miss")
+        return hit["data"] if hit else None
+    metrics.cache_event("schedule", "miss")
+    _schedule_cache[str(season)] = {"data": index, "ts": now}
+    return index
+
+
+def _defense_table(season: int) -> dict[str, dict[str, float]]:
+    """Multipliers for a draft/game season (built from the prior season's stats like /players)."""
+    stats_year = season - 1
+    hit = _dvp_cache.get(str(stats_year))
+    if not hit or time.time() - hit.get("ts", 0) >= 300:
+        metrics.cache_event("defense_vs_position", "miss")
+        get_players(position="ALL", season=season, on_team_only=True, scoring="ppr")
+        hit = _dvp_cache.get(str(stats_year))
+    else:
+        metrics.cache_event("defense_vs_position", "hit")
+    return hit["data"] if hit else {}
+
+
+@router.get("/schedule/{season}")
+def get_schedule(
+    season: int,
+    team: Optional[str] = Query(default=None),
+    week: Optional[int] = Query(default=None, ge=1, le=projections.REGULAR_SEASON_WEEKS),
+):
+    """
+    Schedule index. Without filters returns { team: [opponent per week] } ("@" = away,
+    null = bye); with team+week returns that single opponent.
+    """
+    index = _get_schedule(season)
+    if index is None:
+        raise HTTPException(status_code=404, detail="schedule not available for season")
+    if team and week:
+        return {"team": schedule.normalize_team(team), "week": week, "opponent": index.opponent(team, week), "home": index.is_home(team, week)}
+    if team:
+        code = schedule.normalize_team(team)
+        return {"team": code, "weeks": index.games.get(code, []), "bye_week": index.bye_week(code)}
+    return index.as_dict()
+
+
+@router.get("/defense/vs-position/{season}")
+def get_defense_vs_position(season: int):
+    """Opponent-defense multipliers per team and position (>1 = easier matchup)."""
+    return _defense_table(season)
+
+
+@router.get("/projections/{season}/weeks/{week}/matchup-adjusted")
+def projections_matchup_adjusted(
+    season: int,
+    week: int,
+    scoring: str = Query("ppr"),
+    league_id: Optional[str] = Query(default=None),
+    position: str = Query("ALL"),
+    limit: int = Query(default=300, ge=1, le=5000),
+):
+    """
+    Weekly projections scaled by the opponent's defense-vs-position multiplier (0 on byes).
+    Falls back to last season's per-game average when the week has no projections yet.
+    """
+    if week < 1 or week > projections.REGULAR_SEASON_WEEKS:
+        raise HTTPException(status_code=400, detail="week out of range")
+    cache_key = f"{season}:{week}:{scoring}:{league_id or ''}"
+    now = time.time()
+    hit = _matchup_cache.get(cache_key)
+    if hit and now - hit.get("ts", 0) < _MATCHUP_TTL:
+        metrics.cache_event("matchup_adjusted", "hit")
+        rows = hit["data"]
+    else:
+        metrics.cache_event("matchup_adjusted", "miss")
+        index = _get_schedule(season)
+        if index is None:
+            raise HTTPException(status_code=404, detail="schedule not available for season")
+        table = _defense_table(season)
+        store = _projection_store(season)
+        weights = _scoring_weights(scoring, league_id)
+        with store.lock:
+            base = store.totals(weights, from_week=week, to_week=week)
+        basis = "projection"
+        if not base:
+            basis = "season_avg"
+            season_players = get_players(position="ALL", season=season, on_team_only=True, scoring=scoring)
+            base = {p["id"]: round((p.get("fantasyPoints") or 0) / 17, 2) for p in season_players}
+        players_meta = _get_sleeper_players()
+        rows = []
+        for pid, pts in base.items():
+            meta = players_meta.get(pid) if isinstance(players_meta, dict) else None
+            if not isinstance(meta, dict):
+                continue
+            pos = meta.get("position") or ""
+            team_code = meta.get("team") or ""
+            if pos not in defense.ADJUSTED_POSITIONS and pos != "DEF":
+                continue
+            mult = defense.matchup_multiplier(team_code, pos, week, index, table)
+            rows.append(
+                {
+                    "id": pid,
+                    "name": _slim_player(pid, meta)["name"],
+                    "position": pos,
+                    "team": team_code,
+                    "opponent": index.opponent(team_code, week),
+                    "base": pts,
+                    "multiplier": mult,
+                    "points": round(pts * mult, 2),
+                    "basis": basis,
+                }
+            )
+        rows.sort(key=lambda r: r["points"], reverse=True)
+        _matchup_cache[cache_key] = {"data": rows, "ts": now}
+    if position != "ALL":
+        rows = [r for r in rows if r["position"] == position]
+    return rows[:limit]
+
+
+# -------------------------------------------
+# Waiver Wire (per-league free-agent pools)
+# -------------------------------------------
+
+_ROSTERED_TTL = 60  # seconds
+# { league_id: {"data": (rostered_set, by_roster), "ts": timestamp} }; kept a day as a fallback
+_rostered_cache = cache.namespace("rostered", ttl=24 * 3600, max_entries=2048, max_bytes=32 * 1024 * 1024, shared=True)
+_WAIVER_TTL = 300  # seconds, same as /players
+# { "league:season:roster": {"data": {position: [rows]}, "rostered_ts": ts, "ts": ts} }
+_waiver_cache = cache.namespace(
+    "waivers", ttl=_WAIVER_TTL, max_entries=1024, max_bytes=128 * 1024 * 1024, shared=True
+)
+
+
+def _league_rostered(league_id: str) -> dict[str, Any]:
+    """Cached rostered set for a league, refreshed from `/rosters` every minute."""
+    now = time.time()
+    hit = _rostered_cache.get(league_id)
+    if hit and now - hit.get("ts", 0) < _ROSTERED_TTL:
+        metrics.cache_event("rostered", "hit")
+        return hit
+    rosters = _safe_get_json(f"https://api.sleeper.app/v1/league/{league_id}/rosters")
+    if not isinstance(rosters, list):
+        if hit:
+            metrics.cache_event("rostered", "stale")
+            return hit
+        raise HTTPException(status_code=404, detail="Sleeper league rosters not found")
+    metrics.cache_event("rostered", "miss")
+    entry = {"data": waivers.rostered_ids(rosters), "ts": now}
+    _rostered_cache[league_id] = entry
+    return entry
+
+
+def _scoring_name(scoring_settings: Optional[dict[str, Any]]) -> str:
+    """Closest named profile for a league's reception scoring."""
+    rec = (scoring_settings or {}).get("rec")
+    if rec == 0.5:
+        return "half_ppr"
+    if rec == 0:
+        return "standard"
+    return "ppr"
+
+
+def _trending_add_counts() -> dict[str, int]:
+    rows = _get_trending().top("add", trending.POLL_LIMIT)
+    return {str(r["player_id"]): int(r.get("count") or 0) for r in rows if isinstance(r, dict) and r.get("player_id")}
+
+
+@router.get("/league/{league_id}/waivers")
+def league_waivers(
+    league_id: str,
+    season: int = Query(datetime.now().year),
+    roster_id: Optional[int] = Query(default=None, description="Weight rankings by this roster's positional needs"),
+    position: str = Query("ALL"),
+    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=50, ge=1, le=500),
+):
+    """
+    Ranked free agents for a league: every unrostered player scored by rest-of-season
+    projection (last season's points when there are none), trending adds and roster need.
+    Rankings are cached per league and rebuilt when the rostered set refreshes.
+    """
+    rostered_entry = _league_rostered(league_id)
+    rostered, by_roster = rostered_entry["data"]
+    cache_key = f"{league_id}:{season}:{roster_id or ''}"
+    now = time.time()
+    hit = _waiver_cache.get(cache_key)
+    if hit and hit.get("rostered_ts") == rostered_entry["ts"] and now - hit.get("ts", 0) < _WAIVER_TTL:
+        metrics.cache_event("waivers", "hit")
+        views = hit["data"]
+    else:
+        metrics.cache_event("waivers", "miss")
+        league = _safe_get_json(f"https://api.sleeper.app/v1/league/{league_id}") or {}
+        scoring_settings = league.get("scoring_settings") if isinstance(league, dict) else None
+        universe = get_players(position="ALL", season=season, on_team_only=True, scoring=_scoring_name(scoring_settings))
+
+        store = _projection_store(season)
+        weights = resolve_profile(custom=scoring_settings) if scoring_settings else resolve_profile("ppr")
+        with store.lock:
+            projected = store.totals(weights, from_week=min(_current_week(season), projections.REGULAR_SEASON_WEEKS))
+
+        needs = None
+        if roster_id is not None and roster_id in by_roster:
+            positions_by_id = {p["id"]: p["position"] for p in universe}
+            mine = [positions_by_id.get(pid, "") for pid in by_roster[roster_id]]
+            slots = league.get("roster_positions") if isinstance(league, dict) else None
+            needs = waivers.need_weights(mine, starter_slots(slots))
+
+        ranked = waivers.rank_free_agents(universe, rostered, projected, _trending_add_counts(), needs)
+        views = waivers.by_position(ranked)
+        _waiver_cache[cache_key] = {"data": views, "rostered_ts": rostered_entry["ts"], "ts": now}
+
+    rows = views.get(position, [])
+    return {
+        "league_id": league_id,
+        "position": position,
+        "total": len(rows),
+        "offset": offset,
+        "limit": limit,
+        "players": rows[offset : offset + limit],
+    }
+
+
+# -------------------------------------------
+# League Analytics (standings, all-play, depth grades)
+# -------------------------------------------
+
+# { league_id: {"data", "completed", "checked"} }; rebuilt only when a new week finalizes
+_analytics_cache = cache.namespace("league_analytics", ttl=7 * 24 * 3600, max_entries=512, shared=True)
+# Finalized weeks never change: { "league:week": [matchups] }
+_final_matchups_cache = cache.namespace("final_matchups", ttl=30 * 24 * 3600, max_entries=8192, shared=True)
+_ANALYTICS_CHECK = 60  # seconds between /rosters checks for a newly finalized week
+# { league_id: [lock, holders + waiters] }; an entry lives only while someone uses it
+_analytics_locks: dict[str, list] = {}
+_analytics_locks_guard = threading.Lock()
+
+
+@contextlib.contextmanager
+def _analytics_lock(league_id: str):
+    with _analytics_locks_guard:
+        entry = _analytics_locks.setdefault(league_id, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            yield
+    finally:
+        with _analytics_locks_guard:
+            entry[1] -= 1
+            if not entry[1]:
+                del _analytics_locks[league_id]
+
+
+def _build_league_analytics(league_id: str, rosters: list, completed: int) -> dict[str, Any]:
+    from app.services import league_analytics
+
+    base = f"https://api.sleeper.app/v1/league/{league_id}"
+    weekly: dict[int, list] = {}
+    missing = []
+    for week in range(1, completed + 1):
+        hit = _final_matchups_cache.get(f"{league_id}:{week}")
+        if hit is not None:
+            weekly[week] = hit
+        else:
+            missing.append(week)
+    # League, users and every not-yet-cached finalized week in one concurrent batch
+    fetched = _fetch_many([base, f"{base}/users"] + [f"{base}/matchups/{w}" for w in missing])
+    league = fetched[0] if isinstance(fetched[0], dict) else {}
+    users = fetched[1] if isinstance(fetched[1], list) else []
+    failed = []
+    for week, matchups in zip(missing, fetched[2:]):
+        if isinstance(matchups, list):
+            weekly[week] = matchups
+            _final_matchups_cache[f"{league_id}:{week}"] = matchups
+        else:
+            failed.append(week)
+
+    user_names = {u.get("user_id"): (u.get("display_name") or u.get("username")) for u in users if isinstance(u, dict)}
+    names = {r["roster_id"]: user_names.get(r.get("owner_id")) for r in rosters if isinstance(r, dict) and "roster_id" in r}
+
+    season = int(league.get("season") or datetime.now().year)
+    scoring_settings = league.get("scoring_settings")
+    universe = get_players(position="ALL", season=season, on_team_only=False, scoring=_scoring_name(scoring_settings))
+    positions_by_id = {p["id"]: p["position"] for p in universe}
+    store = _projection_store(season)
+    weights = resolve_profile(custom=scoring_settings) if scoring_settings else resolve_profile("ppr")
+    with store.lock:
+        values = store.totals(weights, from_week=min(_current_week(season), projections.REGULAR_SEASON_WEEKS))
+    value_source = "ros_projection"
+    if not values:
+        values = {p["id"]: float(p.get("fantasyPoints") or 0) for p in universe}
+        value_source = "last_season_points"
+
+    return {
+        "league_id": league_id,
+        "season": season,
+        "completed_weeks": completed,
+        # Finalized weeks whose matchups could not be fetched; retried on the next check
+        "missing_weeks": failed,
+        "standings": league_analytics.standings(rosters, names, weekly),
+        "depth": league_analytics.depth_grades(rosters, positions_by_id, values, starter_slots(league.get("roster_positions"))),
+        "depth_values": value_source,
+        "generated_at": time.time(),
+    }
+
+
+@router.get("/league/{league_id}/analytics")
+def league_analytics_summary(league_id: str):
+    """
+    Precomputed standings (with tiebreakers), all-play records, expected wins and
+    positional depth grades for a league. Rebuilt only when Sleeper finalizes a new
+    week; finalized weeks' matchups are fetched once and kept.
+    """
+    from app.services import league_analytics
+
+    now = time.time()
+    entry = _analytics_cache.get(league_id)
+    if entry and now - entry["checked"] < _ANALYTICS_CHECK:
+        metrics.cache_event("league_analytics", "hit")
+        return entry["data"]
+    # One rebuild per league at a time; concurrent callers wait and reuse it.
+    with _analytics_lock(league_id):
+        entry = _analytics_cache.get(league_id)
+        if entry and time.time() - entry["checked"] < _ANALYTICS_CHECK:
+            metrics.cache_event("league_analytics", "hit")
+            return entry["data"]
+        rosters = _safe_get_json(f"https://api.sleeper.app/v1/league/{league_id}/rosters")
+        if not isinstance(rosters, list):
+            if entry:
+                metrics.cache_event("league_analytics", "stale")
+                return entry["data"]
+            raise HTTPException(status_code=404, detail="Sleeper league rosters not found")
+        completed = league_analytics.completed_weeks(rosters)
+        if entry and entry["completed"] == completed:
+            metrics.cache_event("league_analytics", "hit")
+            data = entry["data"]
+        else:
+            metrics.cache_event("league_analytics", "miss")
+            data = _build_league_analytics(league_id, rosters, completed)
+        # A build missing finalized weeks is served but not pinned: `completed` None makes
+        # the next check (one minute on) rebuild instead of keeping it until another week ends
+        complete = not data.get("missing_weeks")
+        _analytics_cache[league_id] = {"data": data, "completed": completed if complete else None, "checked": time.time()}
+        return data
+
+
+# -------------------------------------------
+# Win Probability (Monte Carlo per league week)
+# -------------------------------------------
+
+_WIN_PROB_TTL = 60  # seconds; cheap to recompute, so refreshed every minute on game days
+_win_prob_cache = cache.namespace("win_prob", ttl=_WIN_PROB_TTL, max_entries=1024)
+# Simulation state (fixed draws + simulated finals) reused across refreshes of the same week
+_win_prob_sims = cache.namespace("win_prob_sims", ttl=3 * 24 * 3600, max_entries=128, max_bytes=256 * 1024 * 1024)
+_win_prob_guard = threading.Lock()
+
+
+# Same as win_prob.DEFAULT_SIMS; kept here so registering the route does not import win_prob
+_WIN_PROB_SIMS = 10000
+
+
+def _win_prob_sim(key: str, sims: int) -> "win_prob.LeagueWeekSimulation":
+    from app.services import win_prob
+
+    with _win_prob_guard:
+        sim = _win_prob_sims.get(key)
+        if sim is None:
+            sim = win_prob.LeagueWeekSimulation(sims=sims)
+            _win_prob_sims[key] = sim
+        return sim
+
+
+@router.get("/league/{league_id}/win-probability")
+def league_win_probability(
+    league_id: str,
+    week: Optional[int] = Query(default=None, ge=1, le=projections.REGULAR_SEASON_WEEKS),
+    sims: int = Query(default=_WIN_PROB_SIMS, ge=1000, le=50000),
+):
+    """
+    Win probability and score distribution for every matchup in a league week, from
+    Monte Carlo simulation of each starter around their projection. During games only
+    players whose points changed are resimulated; the same draws are reused.
+    """
+    week = week or min(_current_week(_state_season()), projections.REGULAR_SEASON_WEEKS)
+    cache_key = f"{league_id}:{week}:{sims}"
+    now = time.time()
+    hit = _win_prob_cache.get(cache_key)
+    if hit and now - hit.get("ts", 0) < _WIN_PROB_TTL:
+        metrics.cache_event("win_prob", "hit")
+        return hit["data"]
+    metrics.cache_event("win_prob", "miss")
+
+    base = f"https://api.sleeper.app/v1/league/{league_id}"
+    league, users, rosters, matchups = _fetch_many([base, f"{base}/users", f"{base}/rosters", f"{base}/matchups/{week}"])
+    if not isinstance(matchups, list):
+        raise HTTPException(status_code=404, detail="Sleeper matchups not found")
+    league = league if isinstance(league, dict) else {}
+    season = int(league.get("season") or _state_season())
+    scoring_settings = league.get("scoring_settings")
+    weights = resolve_profile(custom=scoring_settings) if scoring_settings else resolve_profile("ppr")
+    store = _projection_store(season)
+    with store.lock:
+        projected = store.totals(weights, from_week=week, to_week=week)
+    players_meta = _get_sleeper_players()
+
+    lineups: dict[int, list[str]] = {}
+    points: dict[str, float] = {}
+    pairs: dict[Any, list[int]] = {}
+    actual: dict[int, float] = {}
+    for m in matchups:
+        if not isinstance(m, dict) or m.get("roster_id") is None:
+            continue
+        rid = m["roster_id"]
+        lineups[rid] = [str(p) for p in (m.get("starters") or []) if p and p != "0"]
+        points.update({str(k): float(v or 0) for k, v in (m.get("players_points") or {}).items()})
+        actual[rid] = float(m.get("points") or 0)
+        if m.get("matchup_id") is not None:
+            pairs.setdefault(m["matchup_id"], []).append(rid)
+    positions = {
+        pid: (players_meta.get(pid) or {}).get("position") or ""
+        for starters in lineups.values()
+        for pid in starters
+        if isinstance(players_meta, dict)
+    }
+
+    sim_key = f"{league_id}:{week}:{sims}"
+    sim = _win_prob_sim(sim_key, sims)
+    started = time.perf_counter()
+    redrawn = sim.update(lineups, points, projected, positions)
+    # Re-store so the cache measures the arrays update() just grew (empty at insert)
+    _win_prob_sims[sim_key] = sim
+    with sim.lock:
+        results = sim.matchups(pairs)
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+
+    owners = {u.get("user_id"): (u.get("display_name") or u.get("username")) for u in users or [] if isinstance(u, dict)}
+    roster_owner = {r.get("roster_id"): owners.get(r.get("owner_id")) for r in rosters or [] if isinstance(r, dict)}
+    for matchup in results:
+        for team in matchup["teams"]:
+            rid = team["roster_id"]
+            team["owner"] = roster_owner.get(rid)
+            team["points"] = actual.get(rid, 0.0)
+            team["projected"] = round(sum(projected.get(pid, 0.0) for pid in lineups.get(rid, [])), 2)
+
+    payload = {
+        "league_id": league_id,
+        "week": week,
+        "sims": sims,
+        "redrawn_players": redrawn,
+        "simulation_ms": elapsed_ms,
+        "generated_at": now,
+        "matchups": results,
+    }
+    _win_prob_cache[cache_key] = {"data": payload, "ts": now}
+    return payload
+
+
+# -------------------------------------------
+# Trade Finder (win-win trades across the league)
+# -------------------------------------------
+
+_TRADE_FINDER_TTL = 300  # seconds, same as /players
+_trade_finder_cache = cache.namespace("trade_finder", ttl=_TRADE_FINDER_TTL, max_entries=512)
+
+
+@router.get("/league/{league_id}/trade-finder")
+def league_trade_finder(
+    league_id: str,
+    roster_id: Optional[int] = Query(default=None),
+    user_id: Optional[str] = Query(default=None),
+    top_k: int = Query(default=10, ge=1, le=50),
+    max_players: int = Query(default=2, ge=1, le=2, description="Most players per side"),
+    min_gain: float = Query(default=0.0, ge=0, description="Minimum rest-of-season gain for both sides"),
+):
+    """
+    Trades between one roster and every other roster that improve both starting
+    lineups (1-for-1 up to 2-for-2), ranked by the smaller side's gain. Players are
+    valued by rest-of-season projections in the league's scoring.
+    """
+    from app.services import trade_finder
+
+    if roster_id is None and not user_id:
+        raise HTTPException(status_code=400, detail="Pass roster_id or user_id")
+    cache_key = f"{league_id}:{roster_id}:{user_id}:{top_k}:{max_players}:{min_gain}"
+    now = time.time()
+    hit = _trade_finder_cache.get(cache_key)
+    if hit and now - hit.get("ts", 0) < _TRADE_FINDER_TTL:
+        metrics.cache_event("trade_finder", "hit")
+        return hit["data"]
+    metrics.cache_event("trade_finder", "miss")
+
+    base = f"https://api.sleeper.app/v1/league/{league_id}"
+    league, users, rosters = _fetch_many([base, f"{base}/users", f"{base}/rosters"])
+    if not isinstance(rosters, list):
+        raise HTTPException(status_code=404, detail="Sleeper league rosters not found")
+    league = league if isinstance(league, dict) else {}
+    rosters = [r for r in rosters if isinstance(r, dict) and r.get("roster_id") is not None]
+    mine = next(
+        (r for r in rosters if r.get("roster_id") == roster_id or (user_id and r.get("owner_id") == user_id)), None
+    )
+    if mine is None:
+        raise HTTPException(status_code=404, detail="Roster not found in league")
+
+    season = int(league.get("season") or _state_season())
+    scoring_settings = league.get("scoring_settings")
+    weights = resolve_profile(custom=scoring_settings) if scoring_settings else resolve_profile("ppr")
+    from_week = min(_current_week(season), projections.REGULAR_SEASON_WEEKS)
+    store = _projection_store(season)
+    with store.lock:
+        values = store.totals(weights, from_week=from_week)
+    weeks_left = projections.REGULAR_SEASON_WEEKS - from_week + 1
+    value_source = "ros_projection"
+    if not values:
+        universe = get_players(position="ALL", season=season, on_team_only=False, scoring=_scoring_name(scoring_settings))
+        values = {p["id"]: float(p.get("fantasyPoints") or 0) for p in universe}
+        value_source, weeks_left = "last_season_points", 17
+    players_meta = _get_sleeper_players()
+
+    def roster_values(r: dict[str, Any]) -> dict[str, tuple[str, float]]:
+        out = {}
+        for pid in r.get("players") or []:
+            meta = players_meta.get(str(pid)) if isinstance(players_meta, dict) else None
+            if isinstance(meta, dict) and meta.get("position"):
+                out[str(pid)] = (meta["position"], float(values.get(str(pid), 0.0)))
+        return out
+
+    others = {r["roster_id"]: roster_values(r) for r in rosters if r is not mine}
+    started = time.perf_counter()
+    try:
+        found = trade_finder.find_trades(
+            roster_values(mine), others, starter_slots(league.get("roster_positions")), top_k, max_players, min_gain
+        )
+    except cpu_pool.Timeout:
+        raise HTTPException(status_code=504, detail="Trade search timed out")
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+
+    owners = {u.get("user_id"): (u.get("display_name") or u.get("username")) for u in users or [] if isinstance(u, dict)}
+    owner_of = {r["roster_id"]: owners.get(r.get("owner_id")) for r in rosters}
+
+    def describe(pid: str) -> dict[str, Any]:
+        meta = players_meta.get(pid) if isinstance(players_meta, dict) else None
+        slim = _slim_player(pid, meta) if isinstance(meta, dict) else {"name": pid, "position": "", "team": ""}
+        return {
+            "id": pid,
+            "name": slim["name"],
+            "position": slim["position"],
+            "team": slim["team"],
+            "value": round(values.get(pid, 0.0), 1),
+        }
+
+    trades = [
+        {
+            "roster_id": rid,
+            "owner": owner_of.get(rid),
+            "give": [describe(pid) for pid in give],
+            "get": [describe(pid) for pid in get],
+            "my_gain": round(my_gain, 1),
+            "their_gain": round(their_gain, 1),
+            "my_gain_per_week": round(my_gain / weeks_left, 2) if weeks_left else 0.0,
+            "their_gain_per_week": round(their_gain / weeks_left, 2) if weeks_left else 0.0,
+        }
+        for rid, (_, my_gain, their_gain, give, get) in found
+    ]
+    payload = {
+        "league_id": league_id,
+        "roster_id": mine["roster_id"],
+        "values": value_source,
+        "search_ms": elapsed_ms,
+        "trades": trades,
+    }
+    _trade_finder_cache[cache_key] = {"data": payload, "ts": now}
+    return payload
+
+
 # -------------------------------------------
 # League Pulse (aggregated activity feed)
 # -------------------------------------------
 
-_pulse_cache: dict[str, dict[str, Any]] = {}
 _PULSE_TTL = 30  # seconds
+_PULSE_MAX_ITEMS = 200
+# The home page's look-back; the dashboard reuses its cached feed
+_PULSE_WEEKS_BACK = 2
+# Keyed by league:week:weeks_back and holding the feed up to _PULSE_MAX_ITEMS, so every
+# `limit` is a slice of one entry.
+_pulse_cache = cache.namespace("pulse", ttl=_PULSE_TTL, max_entries=512, max_bytes=32 * 1024 * 1024, shared=True)
 
 
 @router.get("/league/{league_id}/pulse")
+@profiling.span("build")
 def league_pulse(
     league_id: str,
     week: int = Query(...),
-    weeks_back: int = Query(default=2, ge=1, le=8),
-    limit: int = Query(default=40, ge=1, le=200),
+    weeks_back: int = Query(default=_PULSE_WEEKS_BACK, ge=1, le=8),
+    limit: int = Query(default=40, ge=1, le=_PULSE_MAX_ITEMS),
 ):
     """
     Aggregated league pulse feed.
     Combines recent transactions (trades / waivers / drops), trending players,
     and roster injuries into a single normalized feed sorted newest-first.
     """
+    payload = _pulse_feed(league_id, week, weeks_back)
+    return {**payload, "items": payload["items"][:limit]}
+
+
+def _pulse_feed(
+    league_id: str, week: int, weeks_back: int, rosters: Optional[list[dict[str, Any]]] = None
+) -> dict[str, Any]:
+    """The cached pulse feed, newest first. Callers that already hold the league's rosters pass them in."""
     cache_key = f"{league_id}:{week}:{weeks_back}"
     now = time.time()
     hit = _pulse_cache.get(cache_key)
     if hit and now - hit.get("ts", 0) < _PULSE_TTL:
+        metrics.cache_event("pulse", "hit")
         return hit["data"]
+    metrics.cache_event("pulse", "miss")
 
     feed: list[dict[str, Any]] = []
     players_meta = _get_sleeper_players()
@@ -820,9 +2207,7 @@ def league_pulse(
             )
 
     # ---- trending adds ----
-    trending_add = (
-        _safe_get_json("https://api.sleeper.app/v1/players/nfl/trending/add?lookback_hours=24&limit=10") or []
-    )
+    trending_add = _get_trending().top("add", 10)
     if isinstance(trending_add, list):
         for entry in trending_add[:8]:
             if not isinstance(entry, dict):
@@ -841,7 +2226,8 @@ def league_pulse(
             )
 
     # ---- roster injuries ----
-    rosters = _safe_get_json(f"https://api.sleeper.app/v1/league/{league_id}/rosters") or []
+    if rosters is None:
+        rosters = _safe_get_json(f"https://api.sleeper.app/v1/league/{league_id}/rosters") or []
     if isinstance(rosters, list) and isinstance(players_meta, dict):
         seen_injuries: set[str] = set()
         for r in rosters:
@@ -873,12 +2259,173 @@ def league_pulse(
                     )
 
     feed.sort(key=lambda x: x.get("ts") or 0, reverse=True)
-    feed = feed[:limit]
+    feed = feed[:_PULSE_MAX_ITEMS]
     payload = {"items": feed, "generated_at": now, "week": week}
     _pulse_cache[cache_key] = {"data": payload, "ts": now}
     return payload
 
 
+# -------------------------------------------
+# User Dashboard (every league in one call)
+# -------------------------------------------
+
+_DASHBOARD_TTL = 30
+_DASHBOARD_LEAGUE_WORKERS = 6
+_dashboard_cache = cache.namespace("dashboard", ttl=_DASHBOARD_TTL, max_entries=1024, max_bytes=16 * 1024 * 1024)
+_INJURY_STATUSES = ("Out", "IR", "Questionable", "Doubtful", "PUP", "Sus")
+
+
+def _league_summary(league: dict[str, Any], user_id: str, week: int, players_meta: dict[str, Any]) -> dict[str, Any]:
+    """Record, this week's score, roster injuries, pending trades and recent pulse for one league."""
+    league_id = str(league.get("league_id"))
+    base = f"https://api.sleeper.app/v1/league/{league_id}"
+    rosters, users, matchups, txns = _fetch_many(
+        [f"{base}/rosters", f"{base}/users", f"{base}/matchups/{week}", f"{base}/transactions/{week}"]
+    )
+    rosters = [r for r in rosters or [] if isinstance(r, dict)]
+    user_map = {
+        u.get("user_id"): (u.get("display_name") or u.get("username") or "Unknown")
+        for u in users or []
+        if isinstance(u, dict)
+    }
+    mine = next(
+        (r for r in rosters if r.get("owner_id") == user_id or user_id in (r.get("co_owners") or [])),
+        None,
+    )
+    summary: dict[str, Any] = {
+        "league_id": league_id,
+        "name": league.get("name"),
+        "avatar": league.get("avatar"),
+        "status": league.get("status"),
+        "total_rosters": league.get("total_rosters") or len(rosters),
+        "roster_id": mine.get("roster_id") if mine else None,
+        "record": None,
+        "matchup": None,
+        "injuries": [],
+        "pending_trades": [],
+        "pulse": [],
+    }
+    if mine is None:
+        return summary
+    my_id = mine.get("roster_id")
+
+    def points(r: dict[str, Any]) -> float:
+        st = r.get("settings") or {}
+        return round(float(st.get("fpts") or 0) + float(st.get("fpts_decimal") or 0) / 100, 2)
+
+    def wins(r: dict[str, Any]) -> int:
+        return int((r.get("settings") or {}).get("wins") or 0)
+
+    settings = mine.get("settings") or {}
+    order = sorted(rosters, key=lambda r: (wins(r), points(r)), reverse=True)
+    summary["record"] = {
+        "wins": wins(mine),
+        "losses": int(settings.get("losses") or 0),
+        "ties": int(settings.get("ties") or 0),
+        "pf": points(mine),
+        "rank": next((i for i, r in enumerate(order, start=1) if r.get("roster_id") == my_id), None),
+    }
+
+    if isinstance(matchups, list):
+        me = next((m for m in matchups if isinstance(m, dict) and m.get("roster_id") == my_id), None)
+        if me:
+            opp = next(
+                (
+                    m
+                    for m in matchups
+                    if isinstance(m, dict)
+                    and m.get("matchup_id") is not None
+                    and m.get("matchup_id") == me.get("matchup_id")
+                    and m.get("roster_id") != my_id
+                ),
+                None,
+            )
+            opp_roster = next((r for r in rosters if opp and r.get("roster_id") == opp.get("roster_id")), None)
+            summary["matchup"] = {
+                "week": week,
+                "points": me.get("points") or 0,
+                "opponent_roster_id": opp.get("roster_id") if opp else None,
+                "opponent": user_map.get(opp_roster.get("owner_id")) if opp_roster else None,
+                "opponent_points": (opp.get("points") or 0) if opp else None,
+            }
+
+    starters = set(mine.get("starters") or [])
+    for pid in mine.get("players") or []:
+        p = players_meta.get(str(pid)) if isinstance(players_meta, dict) else None
+        if isinstance(p, dict) and p.get("injury_status") in _INJURY_STATUSES:
+            summary["injuries"].append(
+                {
+                    "id": str(pid),
+                    "name": (p.get("full_name") or f"{p.get('first_name', '')} {p.get('last_name', '')}").strip(),
+                    "position": p.get("position") or "",
+                    "status": p.get("injury_status"),
+                    "starter": pid in starters,
+                }
+            )
+
+    for txn in txns or []:
+        if (
+            isinstance(txn, dict)
+            and txn.get("type") == "trade"
+            and txn.get("status") == "pending"
+            and my_id in (txn.get("roster_ids") or [])
+        ):
+            summary["pending_trades"].append(
+                {
+                    "transaction_id": txn.get("transaction_id"),
+                    "roster_ids": txn.get("roster_ids") or [],
+                    "adds": txn.get("adds") or {},
+                    "drops": txn.get("drops") or {},
+                    "draft_picks": txn.get("draft_picks") or [],
+                    "created": txn.get("created"),
+                }
+            )
+
+    summary["pulse"] = _pulse_feed(league_id, week, _PULSE_WEEKS_BACK, rosters)["items"][:5]
+    return summary
+
+
+@router.get("/sleeper/user/{user_id}/dashboard/{season}")
+def sleeper_user_dashboard(
+    user_id: str,
+    season: int,
+    week: Optional[int] = Query(default=None, ge=1, le=projections.REGULAR_SEASON_WEEKS),
+):
+    """
+    One summary per league for a Sleeper user: record, this week's score, injuries
+    on the roster, pending trades and the latest pulse items. Leagues are loaded
+    concurrently; one failing league does not fail the rest.
+    """
+    week = week or min(_current_week(season), projections.REGULAR_SEASON_WEEKS)
+    cache_key = f"{user_id}:{season}:{week}"
+    now = time.time()
+    hit = _dashboard_cache.get(cache_key)
+    if hit and now - hit.get("ts", 0) < _DASHBOARD_TTL:
+        metrics.cache_event("dashboard", "hit")
+        return hit["data"]
+    metrics.cache_event("dashboard", "miss")
+
+    leagues = _safe_get_json(f"https://api.sleeper.app/v1/user/{user_id}/leagues/nfl/{season}") or []
+    leagues = [lg for lg in leagues if isinstance(lg, dict) and lg.get("league_id")]
+    players_meta = _get_sleeper_players()
+
+    def summarize(league: dict[str, Any]) -> dict[str, Any]:
+        try:
+            return _league_summary(league, user_id, week, players_meta)
+        except Exception as e:
+            logger.warning(f"Dashboard summary failed for league {league.get('league_id')}: {e}")
+            return {"league_id": str(league.get("league_id")), "name": league.get("name"), "error": "unavailable"}
+
+    summaries: list[dict[str, Any]] = []
+    if leagues:
+        with ThreadPoolExecutor(max_workers=min(_DASHBOARD_LEAGUE_WORKERS, len(leagues))) as pool:
+            futures = [pool.submit(contextvars.copy_context().run, summarize, lg) for lg in leagues]
+            summaries = [f.result() for f in futures]
+    payload = {"user_id": user_id, "season": season, "week": week, "generated_at": now, "leagues": summaries}
+    _dashboard_cache[cache_key] = {"data": payload, "ts": now}
+    return payload
+
+
 # -------------------------------------------
 # Ask the GM (OpenAI-backed chat)
 # -------------------------------------------
@@ -902,12 +2449,14 @@ class GmChatResponse(BaseModel):
     model: str
     latency_ms: int
     used_context: bool
+    cache_hit: Optional[str] = None  # "exact" | "semantic" when served from the answer cache
 
 
 def _build_gm_context(req: GmChatRequest) -> str:
     """Fetch roster + matchup + recent transactions and serialize to a compact string."""
+    mentioned = _mentioned_players(req.question)
     if not req.league_id:
-        return ""
+        return mentioned
     parts: list[str] = []
     players_meta = _get_sleeper_players()
 
@@ -925,9 +2474,16 @@ def _build_gm_context(req: GmChatRequest) -> str:
         p = players_meta.get(pid) if isinstance(players_meta, dict) else None
         return (p.get("team") if isinstance(p, dict) else "") or ""
 
-    league = _safe_get_json(f"https://api.sleeper.app/v1/league/{req.league_id}") or {}
-    rosters = _safe_get_json(f"https://api.sleeper.app/v1/league/{req.league_id}/rosters") or []
-    users = _safe_get_json(f"https://api.sleeper.app/v1/league/{req.league_id}/users") or []
+    # League, rosters, users and the week's matchups are independent; fetch them together.
+    base = f"https://api.sleeper.app/v1/league/{req.league_id}"
+    urls = [base, f"{base}/rosters", f"{base}/users"]
+    if req.week:
+        urls.append(f"{base}/matchups/{req.week}")
+    fetched = _fetch_many(urls)
+    league = fetched[0] or {}
+    rosters = fetched[1] or []
+    users = fetched[2] or []
+    week_matchups = (fetched[3] if req.week else None) or []
     user_map = {u.get("user_id"): (u.get("display_name") or u.get("username") or "Unknown") for u in users if isinstance(u, dict)}
 
     if isinstance(league, dict) and league.get("name"):
@@ -961,7 +2517,7 @@ def _build_gm_context(req: GmChatRequest) -> str:
             parts.append("Bench: " + ", ".join(f"{name(p)} ({pos(p)} {team(p)})" for p in bench[:10] if p and p != "0"))
 
     if req.week:
-        matchups = _safe_get_json(f"https://api.sleeper.app/v1/league/{req.league_id}/matchups/{req.week}") or []
+        matchups = week_matchups
         if isinstance(matchups, list) and my_roster:
             mine = next((m for m in matchups if isinstance(m, dict) and m.get("roster_id") == my_roster.get("roster_id")), None)
             if mine:
@@ -984,6 +2540,8 @@ def _build_gm_context(req: GmChatRequest) -> str:
                     f"Week {req.week} matchup: you {mine.get('points', 0)} vs {opp_owner} {opp.get('points', 0) if opp else '—'}"
                 )
 
+    if mentioned:
+        parts.append(mentioned)
     return "\n".join(parts)
 
 
@@ -1072,21 +2630,98 @@ def _strip_dashes(text: str) -> str:
     return text.replace(" — ", ", ").replace("—", ", ").replace(" – ", ", ").replace("–", ", ")
 
 
-@router.post("/gm/chat", response_model=GmChatResponse)
-def gm_chat(req: GmChatRequest):
+class _DashStripper:
+    """
+    Incremental `_strip_dashes` for streamed tokens. A " — " can arrive split across
+    chunks, so any trailing run of spaces/dashes is held back until the next chunk
+    (or `flush`) shows what follows it. Output matches stripping the whole text.
+    """
+
+    _RUN = (" ", "—", "–")
+
+    def __init__(self):
+        self._pending = ""
+
+    def feed(self, chunk: str) -> str:
+        text = self._pending + chunk
+        cut = len(text)
+        while cut > 0 and text[cut - 1] in self._RUN:
+            cut -= 1
+        self._pending = text[cut:]
+        return _strip_dashes(text[:cut])
+
+    def flush(self) -> str:
+        out, self._pending = _strip_dashes(self._pending), ""
+        return out
+
+
+# Answer cache: keyed by question + history + league context + model (see answer_cache.py)
+_gm_answer_cache: Optional["answer_cache.AnswerCache"] = None
+_gm_answer_cache_lock = threading.Lock()
+
+
+def _gm_cache() -> "answer_cache.AnswerCache":
+    """GM answer cache, created on the first GM request."""
+    global _gm_answer_cache
+    with _gm_answer_cache_lock:
+        if _gm_answer_cache is None:
+            from app.services import answer_cache
+
+            _gm_answer_cache = answer_cache.AnswerCache(
+                max_entries=int(os.environ.get("GM_CACHE_SIZE", 512)),
+                ttl=float(os.environ.get("GM_CACHE_TTL", 900)),
+                semantic=os.environ.get("GM_CACHE_SEMANTIC", "").lower() in ("1", "true", "yes"),
+                similarity=float(os.environ.get("GM_CACHE_SIMILARITY", 0.88)),
+            )
+        return _gm_answer_cache
+
+
+def _gm_cache_args(req: GmChatRequest) -> tuple[list[str], str, tuple[str, ...]]:
+    """(history strings, scope, mentioned player ids in order) used to key a request in the answer cache."""
+    history = [f"{h.role}:{h.content}" for h in req.history[-8:]]
+    scope = f"{req.league_id}:{req.roster_id or req.user_id or ''}" if req.league_id else ""
+    # Only the semantic tier compares players; skip the name scan otherwise
+    entities = tuple(p["id"] for p in _get_player_index().mentions(req.question)) if _gm_cache().semantic else ()
+    return history, scope, entities
+
+
+_openai_clients: dict[tuple[str, str, str], Any] = {}
+
+
+def _openai_client(api_key: str, use_async: bool = False):
+    """One OpenAI client per (key, base URL, sync/async), reused across requests."""
+    base_url = os.environ.get("OPENAI_BASE_URL") or ""
+    key = (api_key, base_url, "async" if use_async else "sync")
+    client = _openai_clients.get(key)
+    if client is None:
+        try:
+            from openai import AsyncOpenAI, OpenAI
+        except ImportError as e:
+            raise HTTPException(status_code=503, detail=f"openai package not installed: {e}") from e
+        cls = AsyncOpenAI if use_async else OpenAI
+        client = cls(api_key=api_key, base_url=base_url or None)
+        _openai_clients[key] = client
+    return client
+
+
+def _openai_api_key() -> str:
     api_key = os.environ.get("OPENAI_API_KEY")
     if not api_key:
         raise HTTPException(
             status_code=503,
             detail="OPENAI_API_KEY not configured on the backend. Set it in the backend env to enable Ask the GM.",
         )
+    return api_key
 
-    try:
-        from openai import OpenAI
-    except ImportError as e:
-        raise HTTPException(status_code=503, detail=f"openai package not installed: {e}") from e
 
-    context = _build_gm_context(req)
+def _record_openai_usage(model: str, mode: str, seconds: float, usage: Any) -> None:
+    metrics.OPENAI_LATENCY.observe(seconds, model=model, mode=mode)
+    if usage is not None:
+        metrics.OPENAI_TOKENS.inc(getattr(usage, "prompt_tokens", 0) or 0, model=model, type="prompt")
+        metrics.OPENAI_TOKENS.inc(getattr(usage, "completion_tokens", 0) or 0, model=model, type="completion")
+
+
+def _gm_messages(req: GmChatRequest, context: str) -> list[dict[str, str]]:
     messages: list[dict[str, str]] = [{"role": "system", "content": _GM_SYSTEM_PROMPT}]
     if context:
         messages.append({"role": "system", "content": f"League context for this conversation:\n{context}"})
@@ -1094,11 +2729,27 @@ def gm_chat(req: GmChatRequest):
         if h.role in ("user", "assistant") and h.content:
             messages.append({"role": h.role, "content": h.content})
     messages.append({"role": "user", "content": req.question})
+    return messages
 
-    model = os.environ.get("OPENAI_MODEL", "gpt-4o-mini")
-    client = OpenAI(api_key=api_key)
+
+@router.post("/gm/chat", response_model=GmChatResponse)
+def gm_chat(req: GmChatRequest):
+    api_key = _openai_api_key()
+    client = _openai_client(api_key)
 
     started = time.time()
+    context = _build_gm_context(req)
+    model = os.environ.get("OPENAI_MODEL", "gpt-4o-mini")
+    history, scope, entities = _gm_cache_args(req)
+    hit = _gm_cache().get(req.question, history, context, model, scope, entities)
+    metrics.cache_event("gm_answers", "hit" if hit else "miss")
+    if hit:
+        answer, kind = hit
+        elapsed = int((time.time() - started) * 1000)
+        return GmChatResponse(answer=answer, model=model, latency_ms=elapsed, used_context=bool(context), cache_hit=kind)
+
+    messages = _gm_messages(req, context)
+    llm_started = time.time()
     try:
         completion = client.chat.completions.create(
             model=model,
@@ -1111,5 +2762,107 @@ def gm_chat(req: GmChatRequest):
         raise HTTPException(status_code=502, detail=f"OpenAI request failed: {e}") from e
 
     elapsed = int((time.time() - started) * 1000)
+    _record_openai_usage(model, "sync", time.time() - llm_started, getattr(completion, "usage", None))
     answer = _strip_dashes((completion.choices[0].message.content or "").strip())
-    return GmChatResponse(answer=answer, model=model, latency_ms=elapsed, used_context=bool(context))
\ No newline at end of file
+    if answer:
+        _gm_cache().put(req.question, history, context, model, answer, scope, entities)
+    return GmChatResponse(answer=answer, model=model, latency_ms=elapsed, used_context=bool(context))
+
+
+def _sse(event: Optional[str], data: dict[str, Any]) -> str:
+    head = f"event: {event}\n" if event else ""
+    return f"{head}data: {json.dumps(data)}\n\n"
+
+
+@router.post("/gm/chat/stream")
+async def gm_chat_stream(req: GmChatRequest):
+    """
+    Streaming variant of /gm/chat as Server-Sent Events. Each token batch arrives as
+    `data: {"delta": "..."}`; the last event is `event: done` with model, latency_ms,
+    ttft_ms, used_context and cache_hit (or `event: error` with a detail message).
+    """
+    api_key = _openai_api_key()
+    started = time.time()
+    # League context fetches run in a worker thread while the client is prepared.
+    context_task = asyncio.create_task(asyncio.to_thread(_build_gm_context, req))
+    try:
+        client = _openai_client(api_key, use_async=True)
+    except HTTPException:
+        context_task.cancel()
+        raise
+    model = os.environ.get("OPENAI_MODEL", "gpt-4o-mini")
+
+    async def events():
+        try:
+            context = await context_task
+            history, scope, entities = await asyncio.to_thread(_gm_cache_args, req)
+        except Exception as e:
+            logger.exception("Building GM context failed")
+            yield _sse("error", {"detail": f"Could not load league context: {e}"})
+            return
+        hit = _gm_cache().get(req.question, history, context, model, scope, entities)
+        metrics.cache_event("gm_answers", "hit" if hit else "miss")
+        if hit:
+            answer, kind = hit
+            elapsed = int((time.time() - started) * 1000)
+            yield _sse(None, {"delta": answer})
+            yield _sse(
+                "done",
+                {"model": model, "latency_ms": elapsed, "ttft_ms": elapsed, "used_context": bool(context), "cache_hit": kind},
+            )
+            return
+
+        messages = _gm_messages(req, context)
+        stripper = _DashStripper()
+        ttft_ms = None
+        parts: list[str] = []
+        llm_started = time.time()
+        usage = None
+        try:
+            stream = await client.chat.completions.create(
+                model=model,
+                messages=messages,  # type: ignore[arg-type]
+                temperature=0.6,
+                max_tokens=600,
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            async for chunk in stream:
+                usage = getattr(chunk, "usage", None) or usage
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content or ""
+                text = stripper.feed(delta)
+                if text:
+                    if ttft_ms is None:
+                        ttft_ms = int((time.time() - started) * 1000)
+                    parts.append(text)
+                    yield _sse(None, {"delta": text})
+            tail = stripper.flush()
+            if tail:
+                parts.append(tail)
+                yield _sse(None, {"delta": tail})
+        except Exception as e:
+            logger.exception("OpenAI streaming request failed")
+            yield _sse("error", {"detail": f"OpenAI request failed: {e}"})
+            return
+        _record_openai_usage(model, "stream", time.time() - llm_started, usage)
+        answer = "".join(parts).strip()
+        if answer:
+            _gm_cache().put(req.question, history, context, model, answer, scope, entities)
+        yield _sse(
+            "done",
+            {
+                "model": model,
+                "latency_ms": int((time.time() - started) * 1000),
+                "ttft_ms": ttft_ms,
+                "used_context": bool(context),
+                "cache_hit": None,
+            },
+        )
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
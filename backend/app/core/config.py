@@ -6,7 +6,8 @@ load_dotenv()
 class Settings:
     PROJECT_NAME: str = "FantasyTool"
     API_VERSION: str = "v1"
-    DB_URL: str = os.getenv("DATABASE_URL", "sqlite:///./test.db")
+    # Unset keeps the stats warehouse in backend/data/warehouse.db
+    DB_URL: str = os.getenv("DATABASE_URL")
 
     # ESPN OAuth credentials
     ESPN_CLIENT_ID: str = os.getenv("ESPN_CLIENT_ID")
@@ -0,0 +1,187 @@
+"""
+Response cache for Ask the GM.
+
+Exact tier: key = hash(normalized question, recent history, league context, model).
+The context string already embeds the roster, record and matchup points, so any
+roster or score change produces a new key. When a scope (league + team) shows a
+new context hash, its older entries are dropped right away instead of waiting
+for the TTL.
+
+Semantic tier (optional): paraphrases of a cached question are matched by cosine
+similarity of a local feature-hashed embedding (word unigrams + character
+trigrams). Only entries with the same context, history and model are compared.
+The embedding ignores word order, so "trade A for B" and "trade B for A" look
+alike; a semantic hit therefore also needs the same players in the same order
+(ids resolved by the caller), the same decision words (start/sit, buy/sell, ...),
+and the words both questions share in the same relative order.
+"""
+import hashlib
+import re
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+_EMBED_DIM = 512
+_WORD_RE = re.compile(r"[a-z0-9']+")
+# Words that flip the advice; two questions must use the same ones to share an answer
+_DECISION_WORDS = frozenset(
+    "start starting sit sitting bench play flex trade buy sell add drop cut keep hold claim stream accept decline reject".split()
+)
+_FILLER_WORDS = frozenset(
+    "a an the i my me should would could do does is it or and to this week who which what vs versus over than "
+    "for with on in of be get".split()
+)
+
+
+def normalize_question(text: str) -> str:
+    return " ".join(_WORD_RE.findall((text or "").lower()))
+
+
+def _digest(*parts: str) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for p in parts:
+        h.update(p.encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+def _order_words(text: str) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+    """(content words in order, decision words) of a question."""
+    words = [w for w in normalize_question(text).split() if w not in _FILLER_WORDS]
+    return tuple(words), frozenset(w for w in words if w in _DECISION_WORDS)
+
+
+def same_order(a: Tuple[str, ...], b: Tuple[str, ...]) -> bool:
+    """True when the words `a` and `b` share appear in the same relative order in both."""
+    common = set(a) & set(b)
+    return [w for w in a if w in common] == [w for w in b if w in common]
+
+
+def embed(text: str) -> np.ndarray:
+    """Feature-hashed bag of words + char trigrams, L2-normalized."""
+    vec = np.zeros(_EMBED_DIM, dtype=np.float32)
+    norm = normalize_question(text)
+    for word in norm.split():
+        vec[zlib.crc32(word.encode()) % _EMBED_DIM] += 2.0
+    padded = f" {norm} "
+    for i in range(len(padded) - 2):
+        vec[zlib.crc32(padded[i : i + 3].encode()) % _EMBED_DIM] += 1.0
+    n = float(np.linalg.norm(vec))
+    return vec / n if n else vec
+
+
+class AnswerCache:
+    def __init__(self, max_entries: int = 512, ttl: float = 900, semantic: bool = False, similarity: float = 0.88):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.semantic = semantic
+        self.similarity = similarity
+        self.lock = threading.Lock()
+        # key -> {"answer", "ts", "scope", "group", "vec", "entities", "words", "decisions"}
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # scope -> context digest, least recently seen first. Forgetting a scope is safe:
+        # its entries are keyed by context, so they just wait for LRU/TTL instead.
+        self._scope_context: "OrderedDict[str, str]" = OrderedDict()
+        self.hits = {"exact": 0, "semantic": 0}
+        self.misses = 0
+
+    @staticmethod
+    def _keys(question: str, history: Iterable[str], context: str, model: str) -> Tuple[str, str]:
+        """(exact key, group key); the group is everything except the question."""
+        group = _digest(model, _digest(context), *(normalize_question(h) for h in history))
+        return _digest(group, normalize_question(question)), group
+
+    def _observe_context(self, scope: str, context: str) -> None:
+        """Drop a scope's entries as soon as its league context changes."""
+        if not scope:
+            return
+        ctx = _digest(context)
+        if self._scope_context.get(scope) == ctx:
+            self._scope_context.move_to_end(scope)
+            return
+        self._scope_context[scope] = ctx
+        self._scope_context.move_to_end(scope)
+        while len(self._scope_context) > max(self.max_entries, 1):
+            self._scope_context.popitem(last=False)
+        stale = [k for k, e in self._entries.items() if e["scope"] == scope]
+        for k in stale:
+            del self._entries[k]
+
+    def get(
+        self,
+        question: str,
+        history: Iterable[str],
+        context: str,
+        model: str,
+        scope: str = "",
+        entities: Sequence[str] = (),
+    ) -> Optional[Tuple[str, str]]:
+        """
+        (answer, "exact" | "semantic") on a hit, else None. `entities` are the ids of
+        the players the question names, in the order it names them.
+        """
+        history = list(history)
+        key, group = self._keys(question, history, context, model)
+        now = time.time()
+        with self.lock:
+            self._observe_context(scope, context)
+            entry = self._entries.get(key)
+            if entry and now - entry["ts"] < self.ttl:
+                self._entries.move_to_end(key)
+                self.hits["exact"] += 1
+                return entry["answer"], "exact"
+            if self.semantic:
+                vec = embed(question)
+                entities = tuple(entities)
+                words, decisions = _order_words(question)
+                best_key, best_sim = None, self.similarity
+                for k, e in self._entries.items():
+                    if e["group"] != group or now - e["ts"] >= self.ttl:
+                        continue
+                    if e["entities"] != entities or e["decisions"] != decisions or not same_order(words, e["words"]):
+                        continue
+                    sim = float(vec @ e["vec"])
+                    if sim >= best_sim:
+                        best_key, best_sim = k, sim
+                if best_key is not None:
+                    self._entries.move_to_end(best_key)
+                    self.hits["semantic"] += 1
+                    return self._entries[best_key]["answer"], "semantic"
+            self.misses += 1
+        return None
+
+    def put(
+        self,
+        question: str,
+        history: Iterable[str],
+        context: str,
+        model: str,
+        answer: str,
+        scope: str = "",
+        entities: Sequence[str] = (),
+    ) -> None:
+        key, group = self._keys(question, list(history), context, model)
+        words, decisions = _order_words(question)
+        with self.lock:
+            self._observe_context(scope, context)
+            self._entries[key] = {
+                "answer": answer,
+                "ts": time.time(),
+                "scope": scope,
+                "group": group,
+                "vec": embed(question) if self.semantic else None,
+                "entities": tuple(entities),
+                "words": words,
+                "decisions": decisions,
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {"entries": len(self._entries), "hits": dict(self.hits), "misses": self.misses}
@@ -0,0 +1,342 @@
+"""
+Bounded in-process caches with an optional shared backend.
+
+`LRUCache` is a drop-in for the module-level `{key: {"data", "ts"}}` dicts: it
+keeps the mapping interface (`get`, `[]`, `in`, `clear`) but evicts least
+recently used entries past `max_entries` or `max_bytes`, and drops anything older
+than the namespace's `ttl`. Callers keep their own freshness checks; `ttl` is the
+hard upper bound (set it above the freshness window where a stale value is still
+served as a fallback).
+
+Byte sizes are estimates: containers are sampled and extrapolated, so sizing a
+5MB feed costs microseconds instead of a full walk.
+
+With `shared=True` and a shared store configured, writes also go to a Redis-style
+store (pickled, with the same TTL) and local misses read through it, so workers
+share warm data. `DurableStore` is the counterpart for records that must not be
+evicted (draft picks): shared-store only, no local tier. `REDIS_URL` selects a real Redis (needs the `redis` package);
+`CACHE_SHARED=fake` selects the in-process `FakeRedis`, which is also what tests
+should use.
+"""
+import logging
+import os
+import pickle
+import sys
+import threading
+import time
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from app.services import metrics
+
+logger = logging.getLogger(__name__)
+
+_SAMPLE = 32
+
+
+def approx_size(obj: Any, depth: int = 0) -> int:
+    """Rough deep size in bytes; large containers are sampled and extrapolated."""
+    size = sys.getsizeof(obj)
+    if depth > 6:
+        return size
+    if isinstance(obj, dict):
+        n = len(obj)
+        if not n:
+            return size
+        sample = list(islice(obj.items(), _SAMPLE))
+        inner = sum(approx_size(k, depth + 1) + approx_size(v, depth + 1) for k, v in sample)
+        return size + inner * n // len(sample)
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        n = len(obj)
+        if not n:
+            return size
+        sample = list(islice(obj, _SAMPLE))
+        return size + sum(approx_size(v, depth + 1) for v in sample) * n // len(sample)
+    if hasattr(obj, "__dict__"):
+        return size + approx_size(vars(obj), depth + 1)
+    return size
+
+
+class FakeRedis:
+    """In-process stand-in for the subset of redis-py the caches use."""
+
+    def __init__(self) -> None:
+        self._data: Dict[str, Tuple[bytes, Optional[float]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            item = self._data.get(name)
+            if item is None:
+                return None
+            value, expires = item
+            if expires is not None and time.time() >= expires:
+                del self._data[name]
+                return None
+            return value
+
+    def set(self, name: str, value: bytes, ex: Optional[float] = None) -> bool:
+        with self._lock:
+            self._data[name] = (value, time.time() + ex if ex else None)
+        return True
+
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            return sum(1 for n in names if self._data.pop(n, None) is not None)
+
+    def scan_iter(self, match: str = "*") -> Iterator[str]:
+        prefix = match[:-1] if match.endswith("*") else match
+        with self._lock:
+            keys = [k for k in self._data if k.startswith(prefix)]
+        return iter(keys)
+
+
+_shared: Any = None
+_shared_resolved = False
+_shared_lock = threading.Lock()
+
+
+def shared_store() -> Any:
+    """The configured shared store, or None when caches are process-local."""
+    global _shared, _shared_resolved
+    with _shared_lock:
+        if _shared_resolved:
+            return _shared
+        _shared_resolved = True
+        if os.environ.get("CACHE_SHARED", "").lower() == "fake":
+            _shared = FakeRedis()
+        elif os.environ.get("REDIS_URL"):
+            try:
+                import redis
+
+                _shared = redis.Redis.from_url(os.environ["REDIS_URL"])
+            except ImportError:
+                logger.warning("REDIS_URL is set but the redis package is not installed; caches stay local")
+        return _shared
+
+
+def set_shared_store(store: Any) -> None:
+    """Swap the shared store (e.g. a fresh FakeRedis in tests)."""
+    global _shared, _shared_resolved
+    with _shared_lock:
+        _shared, _shared_resolved = store, True
+
+
+class LRUCache:
+    def __init__(
+        self,
+        namespace: str,
+        ttl: float,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = None,
+        shared: bool = False,
+    ):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.shared = shared
+        self.lock = threading.Lock()
+        # key -> (value, inserted at, approx bytes)
+        self._entries: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self.bytes = 0
+        self.evictions = 0
+
+    # ---- shared tier ----
+
+    def _store(self) -> Any:
+        return shared_store() if self.shared else None
+
+    def _shared_key(self, key: str) -> str:
+        return f"wfantasy:{self.namespace}:{key}"
+
+    def _read_shared(self, key: str) -> Optional[Any]:
+        store = self._store()
+        if store is None:
+            return None
+        try:
+            blob = store.get(self._shared_key(key))
+            return pickle.loads(blob) if blob is not None else None
+        except Exception as e:
+            logger.info(f"Shared cache read failed for {self.namespace}:{key}: {e}")
+            return None
+
+    def _write_shared(self, key: str, value: Any) -> Optional[int]:
+        store = self._store()
+        if store is None:
+            return None
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            store.set(self._shared_key(key), blob, ex=max(int(self.ttl), 1))
+            return len(blob)
+        except Exception as e:
+            logger.info(f"Shared cache write failed for {self.namespace}:{key}: {e}")
+            return None
+
+    # ---- local tier ----
+
+    def _insert(self, key: str, value: Any, size: int, ts: float) -> None:
+        with self.lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[2]
+            self._entries[key] = (value, ts, size)
+            self.bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries or (self.max_bytes is not None and self.bytes > self.max_bytes)
+            ):
+                if len(self._entries) == 1 and len(self._entries) <= self.max_entries:
+                    break  # a single oversized entry is kept rather than thrashing
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+                metrics.cache_event(self.namespace, "evict")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        now = time.time()
+        with self.lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now - entry[1] < self.ttl:
+                    self._entries.move_to_end(key)
+                    return entry[0]
+                del self._entries[key]
+                self.bytes -= entry[2]
+        value = self._read_shared(key)
+        if value is None:
+            return default
+        self._insert(key, value, approx_size(value), now)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        size = self._write_shared(key, value)
+        self._insert(key, value, size if size is not None else approx_size(value), time.time())
+
+    def delete(self, key: str) -> None:
+        with self.lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.bytes -= entry[2]
+        store = self._store()
+        if store is not None:
+            try:
+                store.delete(self._shared_key(key))
+            except Exception as e:
+                logger.info(f"Shared cache delete failed for {self.namespace}:{key}: {e}")
+
+    def clear(self) -> None:
+        """Drop local entries (the shared tier is left to its TTL)."""
+        with self.lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.set(key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "evictions": self.evictions,
+                "shared": bool(self._store()),
+            }
+
+
+_caches: List[LRUCache] = []
+
+
+class DurableStore:
+    """
+    Mapping for user-owned records (not a cache): nothing expires or is evicted. With
+    a shared store configured every read and write goes straight to it, with no local
+    copy, so each worker sees the others' writes at once; otherwise records live in
+    a plain in-process dict. Shared-store errors propagate instead of dropping data.
+    """
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+        self._local: Dict[str, Any] = {}
+        self.lock = threading.Lock()
+
+    def _shared_key(self, key: str) -> str:
+        return f"wfantasy:{self.namespace}:{key}"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        store = shared_store()
+        if store is None:
+            with self.lock:
+                return self._local.get(key, default)
+        blob = store.get(self._shared_key(key))
+        return pickle.loads(blob) if blob is not None else default
+
+    def set(self, key: str, value: Any) -> None:
+        store = shared_store()
+        if store is None:
+            with self.lock:
+                self._local[key] = value
+            return
+        store.set(self._shared_key(key), pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def delete(self, key: str) -> None:
+        store = shared_store()
+        if store is None:
+            with self.lock:
+                self._local.pop(key, None)
+            return
+        store.delete(self._shared_key(key))
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.set(key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+
+def namespace(
+    name: str, ttl: float, max_entries: int = 1024, max_bytes: Optional[int] = None, shared: bool = False
+) -> LRUCache:
+    """Create a registered cache; `CACHE_TTL_<NAME>` / `CACHE_MAX_MB_<NAME>` override the defaults."""
+    env = name.upper()
+    ttl = float(os.environ.get(f"CACHE_TTL_{env}", ttl))
+    if os.environ.get(f"CACHE_MAX_MB_{env}"):
+        max_bytes = int(float(os.environ[f"CACHE_MAX_MB_{env}"]) * 1024 * 1024)
+    cache = LRUCache(name, ttl, max_entries, max_bytes, shared)
+    _caches.append(cache)
+    return cache
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    return {c.namespace: c.stats() for c in _caches}
+
+
+metrics.Gauge(
+    "cache_bytes", "Approximate bytes held per cache namespace", ("cache",),
+    fn=lambda: {(c.namespace,): float(c.bytes) for c in _caches},
+)
+metrics.Gauge(
+    "cache_entries", "Entries held per cache namespace", ("cache",),
+    fn=lambda: {(c.namespace,): float(len(c)) for c in _caches},
+)
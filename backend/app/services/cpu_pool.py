@@ -0,0 +1,201 @@
+"""
+Process pool for CPU-bound builders.
+
+Pure-Python loops over thousands of records hold the GIL, so running them on a
+request thread still stalls the event loop, and Socket.IO traffic with it. Tasks
+submitted here run in worker processes instead:
+
+- tasks are top-level functions in light service modules (workers never import
+  the routes), fed compact inputs such as raw upstream JSON bytes; pickling bytes
+  is a copy, pickling a parsed feed costs about as much as building from it;
+- at most `CPU_POOL_QUEUE` tasks are queued or running. Callers beyond that wait
+  up to `CPU_POOL_WAIT` seconds for a slot and then run the task inline;
+- `run(..., cancelled=fn)` polls `fn` while waiting for a slot or a result. A
+  task that has not started is dropped and `Cancelled` raised; one already
+  running finishes in its worker and the result is discarded;
+- `run_many` gives the whole batch `CPU_POOL_TIMEOUT` seconds; past that the
+  unstarted tasks are dropped and `Timeout` raised;
+- a broken pool (worker killed, fork unavailable) is reset and the task runs
+  inline. `CPU_POOL_WORKERS=0` always runs inline.
+
+Workers start from a forkserver (spawn where that is unavailable, or as set by
+`CPU_POOL_START`): forking the threaded server process directly can copy a lock
+some other thread holds into the child, which then hangs on it.
+"""
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+from app.services import metrics
+
+logger = logging.getLogger(__name__)
+
+WORKERS = int(os.environ.get("CPU_POOL_WORKERS", min(os.cpu_count() or 1, 4)))
+MAX_PENDING = int(os.environ.get("CPU_POOL_QUEUE", max(WORKERS, 1) * 4))
+SLOT_WAIT = float(os.environ.get("CPU_POOL_WAIT", 2.0))
+BATCH_TIMEOUT = float(os.environ.get("CPU_POOL_TIMEOUT", 30.0))
+START_METHOD = os.environ.get("CPU_POOL_START") or (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+# How often a waiting caller checks `cancelled`
+_POLL = 0.1
+
+TASKS = metrics.Counter(
+    "cpu_pool_tasks_total", "CPU pool tasks by outcome (ok/inline/error/cancelled/timeout)", ("task", "outcome")
+)
+TASK_LATENCY = metrics.Histogram("cpu_pool_task_duration_seconds", "CPU pool task latency, queue wait included", ("task",))
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+_slots = threading.BoundedSemaphore(max(MAX_PENDING, 1))
+# Separate from _pool_lock: shutting the pool down runs done-callbacks, which update this
+_pending_lock = threading.Lock()
+_pending = 0
+
+metrics.Gauge("cpu_pool_pending", "CPU pool tasks queued or running", fn=lambda: {(): float(_pending)})
+
+
+class Cancelled(Exception):
+    """The caller went away before its task started."""
+
+
+class Timeout(Exception):
+    """A `run_many` batch did not finish within its deadline."""
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=WORKERS, mp_context=multiprocessing.get_context(START_METHOD))
+        return _pool
+
+
+def _reset_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def _track(delta: int) -> None:
+    global _pending
+    with _pending_lock:
+        _pending += delta
+
+
+def _release(_: Future) -> None:
+    _slots.release()
+    _track(-1)
+
+
+def _acquire(task: str, cancelled: Optional[Callable[[], bool]]) -> bool:
+    """Wait up to SLOT_WAIT for a queue slot, checking `cancelled` meanwhile."""
+    deadline = time.monotonic() + SLOT_WAIT
+    while True:
+        remaining = deadline - time.monotonic()
+        if _slots.acquire(timeout=min(_POLL, remaining) if cancelled else max(remaining, 0)):
+            return True
+        if cancelled and cancelled():
+            TASKS.inc(task=task, outcome="cancelled")
+            raise Cancelled(task)
+        if remaining <= 0:
+            return False
+
+
+def _submit(
+    task: str, fn: Callable[..., Any], args: Tuple[Any, ...], cancelled: Optional[Callable[[], bool]] = None
+) -> Optional[Future]:
+    """Future for `fn(*args)` on the pool, or None when the caller should run it inline."""
+    if WORKERS <= 0 or not _acquire(task, cancelled):
+        return None
+    _track(1)
+    try:
+        future = _get_pool().submit(fn, *args)
+    except Exception as e:  # pool shut down or broken before the submit
+        logger.warning(f"CPU pool unavailable ({e}); running inline")
+        _reset_pool()
+        _slots.release()
+        _track(-1)
+        return None
+    future.add_done_callback(_release)
+    return future
+
+
+def _result(
+    task: str,
+    future: Optional[Future],
+    fn: Callable[..., Any],
+    args: Tuple[Any, ...],
+    started: float,
+    cancelled: Optional[Callable[[], bool]] = None,
+    deadline: Optional[float] = None,
+) -> Any:
+    if future is None:
+        TASKS.inc(task=task, outcome="inline")
+        result = fn(*args)
+        TASK_LATENCY.observe(time.perf_counter() - started, task=task)
+        return result
+    try:
+        while True:
+            wait = _POLL if cancelled else None
+            if deadline is not None:
+                remaining = max(deadline - time.monotonic(), 0)
+                wait = remaining if wait is None else min(wait, remaining)
+            try:
+                result = future.result(timeout=wait)
+                break
+            except FutureTimeout:
+                if deadline is not None and time.monotonic() >= deadline:
+                    future.cancel()
+                    TASKS.inc(task=task, outcome="timeout")
+                    raise Timeout(task)
+                if cancelled and cancelled():
+                    future.cancel()
+                    TASKS.inc(task=task, outcome="cancelled")
+                    raise Cancelled(task)
+    except (BrokenProcessPool, CancelledError):  # pool broke, or another caller reset it
+        logger.warning(f"CPU pool broke running {task}; running inline")
+        _reset_pool()
+        return _result(task, None, fn, args, started)
+    except (Cancelled, Timeout):
+        raise
+    except Exception:
+        TASKS.inc(task=task, outcome="error")
+        raise
+    TASKS.inc(task=task, outcome="ok")
+    TASK_LATENCY.observe(time.perf_counter() - started, task=task)
+    return result
+
+
+def run(task: str, fn: Callable[..., Any], *args: Any, cancelled: Optional[Callable[[], bool]] = None) -> Any:
+    """`fn(*args)` in a worker process; `task` labels the metrics."""
+    started = time.perf_counter()
+    return _result(task, _submit(task, fn, args, cancelled), fn, args, started, cancelled)
+
+
+def run_many(
+    task: str, fn: Callable[..., Any], items: Iterable[Any], timeout: Optional[float] = None
+) -> List[Any]:
+    """
+    [fn(item) for item in items], spread over the workers; results keep the input order.
+    Raises `Timeout` when the batch takes longer than `timeout` (default BATCH_TIMEOUT)
+    seconds; tasks that have not started by then are dropped.
+    """
+    started = time.perf_counter()
+    deadline = time.monotonic() + (BATCH_TIMEOUT if timeout is None else timeout)
+    submitted = [(item, _submit(task, fn, (item,))) for item in items]
+    try:
+        return [_result(task, future, fn, (item,), started, deadline=deadline) for item, future in submitted]
+    except Timeout:
+        for _, future in submitted:
+            if future is not None:
+                future.cancel()
+        raise
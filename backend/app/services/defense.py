@@ -0,0 +1,78 @@
+"""
+Defense-vs-position matchup multipliers.
+
+Computed once per stats refresh from the DEF rows of the season stats feed that
+`get_players` already downloads, replacing `computeDefenseMultipliers` in
+`lib/player-utils.ts`. Values > 1.0 mean a soft defense (easier matchup), < 1.0 a
+tough one, clamped to the same 0.7–1.3 band the frontend used.
+"""
+from typing import Any, Dict, Optional
+
+from app.services.schedule import ScheduleIndex, normalize_team
+
+MULT_MIN, MULT_MAX = 0.7, 1.3
+ADJUSTED_POSITIONS = ("QB", "RB", "WR", "TE", "K")
+
+# Defensive scoring used only when the feed carries no points/yards allowed
+_DEF_SCORING = {"sack": 1.0, "int": 2.0, "fum_rec": 2.0, "def_td": 6.0, "safe": 2.0}
+
+
+def _clamp(x: float) -> float:
+    return max(MULT_MIN, min(MULT_MAX, x))
+
+
+def _per_game(stat: Dict[str, Any], key: str) -> Optional[float]:
+    v = stat.get(key)
+    if not isinstance(v, (int, float)):
+        return None
+    gp = stat.get("gp")
+    return float(v) / gp if isinstance(gp, (int, float)) and gp > 0 else float(v)
+
+
+def build_multipliers(stats_dict: Dict[str, Dict[str, Any]], players_meta: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    """
+    team -> {position: multiplier}. Prefers points allowed per game, then yards allowed;
+    falls back to inverting a simple defensive fantasy score (as the client did).
+    """
+    allowed: Dict[str, float] = {}
+    yards: Dict[str, float] = {}
+    def_pts: Dict[str, float] = {}
+    for pid, p in players_meta.items():
+        if not isinstance(p, dict) or p.get("position") != "DEF":
+            continue
+        stat = stats_dict.get(str(pid)) or {}
+        team = normalize_team(p.get("team") or pid)
+        pa = _per_game(stat, "pts_allow")
+        if pa is not None:
+            allowed[team] = pa
+        ya = _per_game(stat, "yds_allow")
+        if ya is not None:
+            yards[team] = ya
+        score = sum(float(stat.get(k) or 0) * w for k, w in _DEF_SCORING.items())
+        if score > 0:
+            def_pts[team] = score
+
+    ratios: Dict[str, float] = {}
+    for source, invert in ((allowed, False), (yards, False), (def_pts, True)):
+        values = [v for v in source.values() if v > 0]
+        if len(values) < 2:
+            continue
+        avg = sum(values) / len(values)
+        ratios = {t: (avg / v if invert else v / avg) for t, v in source.items() if v > 0}
+        break
+
+    return {team: {pos: round(_clamp(r), 3) for pos in ADJUSTED_POSITIONS} for team, r in ratios.items()}
+
+
+def matchup_multiplier(
+    team: str,
+    position: str,
+    week: int,
+    schedule: ScheduleIndex,
+    table: Dict[str, Dict[str, float]],
+) -> float:
+    """Multiplier for a player's opponent that week; 0.0 on a bye (same contract as getMatchupMultiplier)."""
+    opp = schedule.opponent(team, week)
+    if not opp:
+        return 0.0
+    return table.get(opp, {}).get(position, 1.0)
@@ -0,0 +1,222 @@
+"""
+Draft grades for completed (or in-progress) Sleeper drafts.
+
+Every team is scored on three things, each standardized across the teams in the
+draft so grades are relative to that room:
+
+- ADP value: how far after their ADP the team's players were taken (capped per
+  pick so one late-round flier does not dominate);
+- scarcity: value over replacement of the drafted players, with replacement
+  levels from the league's starter demand, so an early elite TE counts for more
+  than a WR with the same points;
+- projected starters: points of the best starting lineup the picks can field.
+
+The weighted z-score maps to a letter grade. Grades only depend on the picks and
+the player values passed in, so the same engine serves the API and offline
+batch runs over historical drafts:
+
+    cd backend
+    python -m app.services.draft_grades --ids-file drafts.txt --out grades.jsonl
+"""
+import argparse
+import json
+import logging
+import statistics
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.services.roster_utils import DEFAULT_ROSTER_SLOTS, lineup_points, replacement_levels
+
+WEIGHTS = {"adp_value": 0.3, "scarcity": 0.3, "starters": 0.4}
+# Most a single pick can count for (or against) in ADP value, in picks
+ADP_CAP = 24.0
+_LETTERS = [
+    (1.5, "A+"), (1.0, "A"), (0.6, "A-"), (0.3, "B+"), (0.0, "B"),
+    (-0.3, "B-"), (-0.6, "C+"), (-1.0, "C"), (-1.5, "D"), (float("-inf"), "F"),
+]
+# Sleeper draft `settings` slot counts -> roster slot names
+_SETTINGS_SLOTS = [
+    ("slots_qb", "QB"), ("slots_rb", "RB"), ("slots_wr", "WR"), ("slots_te", "TE"),
+    ("slots_flex", "FLEX"), ("slots_wrrb_flex", "WRRB_FLEX"), ("slots_rec_flex", "REC_FLEX"),
+    ("slots_super_flex", "SUPER_FLEX"), ("slots_k", "K"), ("slots_def", "DEF"),
+]
+
+
+def letter(z: float) -> str:
+    return next(grade for cutoff, grade in _LETTERS if z >= cutoff)
+
+
+def draft_slots(settings: Optional[Dict[str, Any]]) -> List[str]:
+    """Starting roster slots from a Sleeper draft's `settings` (default lineup when absent)."""
+    slots: List[str] = []
+    for key, slot in _SETTINGS_SLOTS:
+        slots.extend([slot] * int((settings or {}).get(key) or 0))
+    return slots or list(DEFAULT_ROSTER_SLOTS)
+
+
+def scoring_name(draft: Dict[str, Any]) -> str:
+    """Named scoring profile for a draft's `metadata.scoring_type` (dynasty_ppr, 2qb, std...)."""
+    kind = str((draft.get("metadata") or {}).get("scoring_type") or "ppr").lower()
+    if "half" in kind:
+        return "half_ppr"
+    if "std" in kind or "standard" in kind:
+        return "standard"
+    return "ppr"
+
+
+def _standardize(values: Dict[Any, float]) -> Dict[Any, float]:
+    if len(values) < 2:
+        return {k: 0.0 for k in values}
+    mean = statistics.fmean(values.values())
+    sd = statistics.pstdev(values.values())
+    return {k: (v - mean) / sd if sd else 0.0 for k, v in values.items()}
+
+
+def grade_draft(
+    draft: Dict[str, Any],
+    picks: Iterable[Dict[str, Any]],
+    players: Dict[str, Dict[str, Any]],
+    points_key: str = "fantasyPoints",
+) -> Dict[str, Any]:
+    """
+    Grade every team in one draft. `players` maps player id to a `/players` row
+    (position, adp and `points_key`); unknown players count as zero-value reaches.
+    A pick's `value_vs_adp` is positive when the player went later than their ADP.
+    """
+    settings = draft.get("settings") or {}
+    slots = draft_slots(settings)
+    teams = int(settings.get("teams") or 0) or 12
+    pool = list(players.values())
+    levels = replacement_levels(pool, slots, teams, points_key)
+
+    by_team: Dict[Any, List[Dict[str, Any]]] = {}
+    for pick in picks:
+        if not isinstance(pick, dict) or not pick.get("player_id"):
+            continue
+        team = pick.get("roster_id") or pick.get("draft_slot")
+        by_team.setdefault(team, []).append(pick)
+    if not by_team:
+        return {"draft_id": draft.get("draft_id"), "status": draft.get("status"), "teams": []}
+
+    rows: Dict[Any, Dict[str, Any]] = {}
+    for team, team_picks in by_team.items():
+        team_picks.sort(key=lambda p: p.get("pick_no") or 0)
+        graded: List[Dict[str, Any]] = []
+        roster: List[Dict[str, Any]] = []
+        adp_value = scarcity = 0.0
+        for pick in team_picks:
+            pid = str(pick["player_id"])
+            meta = pick.get("metadata") or {}
+            row = players.get(pid) or {}
+            pos = row.get("position") or meta.get("position") or ""
+            pick_no = int(pick.get("pick_no") or 0)
+            adp = row.get("adp")
+            # Players with no ADP count as a full-cap reach
+            value = max(-ADP_CAP, min(ADP_CAP, pick_no - float(adp))) if isinstance(adp, (int, float)) else -ADP_CAP
+            points = float(row.get(points_key) or 0)
+            vorp = max(points - levels.get(pos, 0.0), 0.0)
+            adp_value += value
+            scarcity += vorp
+            roster.append({"id": pid, "position": pos, points_key: points})
+            graded.append(
+                {
+                    "pick_no": pick_no,
+                    "round": pick.get("round"),
+                    "player_id": pid,
+                    "name": row.get("name") or f"{meta.get('first_name', '')} {meta.get('last_name', '')}".strip() or pid,
+                    "position": pos,
+                    "adp": adp if isinstance(adp, (int, float)) else None,
+                    "value_vs_adp": round(value, 1),
+                    "vorp": round(vorp, 1),
+                }
+            )
+        rows[team] = {
+            "team": team,
+            "picked_by": team_picks[0].get("picked_by"),
+            "picks": graded,
+            "adp_value": round(adp_value, 1),
+            "scarcity": round(scarcity, 1),
+            "starters": round(lineup_points(roster, slots, points_key), 1),
+        }
+
+    z = {key: _standardize({t: r[key] for t, r in rows.items()}) for key in WEIGHTS}
+    for team, row in rows.items():
+        score = sum(w * z[key][team] for key, w in WEIGHTS.items())
+        row["score"] = round(score, 3)
+        row["grade"] = letter(score)
+        picks_sorted = sorted(row["picks"], key=lambda p: p["value_vs_adp"])
+        row["best_value"] = picks_sorted[-1] if picks_sorted and picks_sorted[-1]["value_vs_adp"] > 0 else None
+        row["biggest_reach"] = picks_sorted[0] if picks_sorted and picks_sorted[0]["value_vs_adp"] < 0 else None
+    ranked = sorted(rows.values(), key=lambda r: r["score"], reverse=True)
+    for i, row in enumerate(ranked, start=1):
+        row["rank"] = i
+    return {
+        "draft_id": draft.get("draft_id"),
+        "status": draft.get("status"),
+        "season": draft.get("season"),
+        "slots": slots,
+        "teams": ranked,
+    }
+
+
+def summarize(results: Iterable[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+    """Grade distribution and average pick value across many graded drafts (offline runs)."""
+    grades: Dict[str, int] = {}
+    reaches = values = 0
+    drafts = teams = 0
+    for _, result in results:
+        if not result.get("teams"):
+            continue
+        drafts += 1
+        for team in result["teams"]:
+            teams += 1
+            grades[team["grade"]] = grades.get(team["grade"], 0) + 1
+            for pick in team["picks"]:
+                if pick["value_vs_adp"] < 0:
+                    reaches += 1
+                else:
+                    values += 1
+    order = [g for _, g in _LETTERS]
+    return {
+        "drafts": drafts,
+        "teams": teams,
+        "grades": {g: grades[g] for g in order if g in grades},
+        "value_pick_share": round(values / (values + reaches), 3) if values + reaches else None,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Grade many Sleeper drafts offline")
+    parser.add_argument("ids", nargs="*", help="Draft ids")
+    parser.add_argument("--ids-file", help="File with one draft id per line")
+    parser.add_argument("--out", help="Write one JSON result per line here (default: stdout)")
+    parser.add_argument("--batch", type=int, default=50, help="Drafts fetched concurrently per batch")
+    args = parser.parse_args(argv)
+
+    ids = list(args.ids)
+    if args.ids_file:
+        with open(args.ids_file) as f:
+            ids += [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    if not ids:
+        parser.error("no draft ids given")
+    logging.disable(logging.INFO)
+
+    # Same fetch, cache and player-value path as the API
+    from app.api.routes import _grade_drafts
+
+    out = open(args.out, "w") if args.out else sys.stdout
+    results: List[Tuple[str, Dict[str, Any]]] = []
+    try:
+        for start in range(0, len(ids), args.batch):
+            for draft_id, result in _grade_drafts(ids[start : start + args.batch]).items():
+                results.append((draft_id, result))
+                out.write(json.dumps(result) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(json.dumps(summarize(results), indent=2), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
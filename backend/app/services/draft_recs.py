@@ -0,0 +1,196 @@
+"""
+Best-available draft recommendations, maintained incrementally per draft room.
+
+Each room keeps one max-heap per position keyed by (VORP desc, ADP asc). Drafted
+players are removed lazily: they stay in the heap but are skipped (and popped) when
+they surface, so `draft_pick` / `remove_pick` cost O(log n) instead of a re-sort of
+the whole player pool. Roster need is applied per position at read time, which
+works because `draft_targets` weights every player at a position equally.
+"""
+import heapq
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.services.roster_utils import POSITIONS, draft_targets, replacement_levels, starter_slots
+
+_INF = float("inf")
+
+# Heap entry: (-vorp, adp, player_id)
+_Entry = Tuple[float, float, str]
+
+
+def _need_weight(target: int, have: int) -> float:
+    """Full weight while a position is below its draft target, halved per extra body."""
+    if have < target:
+        return 1.0
+    return 0.5 ** (have - target + 1)
+
+
+class DraftRoom:
+    def __init__(
+        self,
+        players: Iterable[Dict[str, Any]],
+        roster_slots: Optional[Iterable[str]] = None,
+        league_size: int = 12,
+    ):
+        self.slots = starter_slots(roster_slots)
+        self.league_size = max(int(league_size or 12), 1)
+        self.targets = draft_targets(self.slots)
+        self.lock = threading.Lock()
+        self.updated = time.time()
+
+        pool = [p for p in players if p.get("position") in POSITIONS and p.get("id") is not None]
+        levels = replacement_levels(pool, self.slots, self.league_size)
+        self.players: Dict[str, Dict[str, Any]] = {}
+        self._entries: Dict[str, _Entry] = {}
+        self._heaps: Dict[str, List[_Entry]] = {pos: [] for pos in POSITIONS}
+        for p in pool:
+            pid = str(p["id"])
+            vorp = round(max((p.get("fantasyPoints") or 0) - levels.get(p["position"], 0), 0), 1)
+            adp = p.get("adp")
+            entry = (-vorp, float(adp) if isinstance(adp, (int, float)) else _INF, pid)
+            self.players[pid] = p
+            self._entries[pid] = entry
+            self._heaps[p["position"]].append(entry)
+        for heap in self._heaps.values():
+            heapq.heapify(heap)
+
+        self.drafted: set[str] = set()
+        self.drafted_by_pos: Dict[str, int] = {pos: 0 for pos in POSITIONS}
+
+    # ---- mutations (O(log n) amortized) ----
+
+    def pick(self, player_id: Any) -> bool:
+        pid = str(player_id)
+        if pid in self.drafted or pid not in self.players:
+            return False
+        self.drafted.add(pid)
+        self.drafted_by_pos[self.players[pid]["position"]] += 1
+        self.updated = time.time()
+        return True
+
+    def unpick(self, player_id: Any) -> bool:
+        pid = str(player_id)
+        if pid not in self.drafted:
+            return False
+        self.drafted.discard(pid)
+        pos = self.players[pid]["position"]
+        self.drafted_by_pos[pos] -= 1
+        # The entry may already have been popped as stale; push it back.
+        heapq.heappush(self._heaps[pos], self._entries[pid])
+        self.updated = time.time()
+        return True
+
+    def reset(self, player_ids: Iterable[Any]) -> None:
+        """Replace the drafted set wholesale (used when the client PUTs the full pick list)."""
+        wanted = {str(pid) for pid in player_ids if str(pid) in self.players}
+        for pid in list(self.drafted - wanted):
+            self.unpick(pid)
+        for pid in wanted - self.drafted:
+            self.pick(pid)
+
+    # ---- reads ----
+
+    def _top(self, pos: str, n: int) -> List[_Entry]:
+        """Top-n undrafted entries for a position, discarding stale heads on the way."""
+        heap = self._heaps[pos]
+        taken: List[_Entry] = []
+        seen: set[str] = set()
+        while heap and len(taken) < n:
+            entry = heapq.heappop(heap)
+            pid = entry[2]
+            if pid in self.drafted or pid in seen:
+                continue
+            seen.add(pid)
+            taken.append(entry)
+        for entry in taken:
+            heapq.heappush(heap, entry)
+        return taken
+
+    def needs(self) -> Dict[str, int]:
+        return {pos: max(self.targets.get(pos, 0) - self.drafted_by_pos[pos], 0) for pos in POSITIONS}
+
+    def suggestions(self, limit: int = 10, position: Optional[str] = None) -> List[Dict[str, Any]]:
+        positions = [position] if position in POSITIONS else POSITIONS
+        candidates: List[Tuple[float, float, str, float]] = []
+        for pos in positions:
+            weight = _need_weight(self.targets.get(pos, 0), self.drafted_by_pos[pos])
+            for neg_vorp, adp, pid in self._top(pos, limit):
+                candidates.append((neg_vorp * weight, adp, pid, weight))
+        candidates.sort()
+        out: List[Dict[str, Any]] = []
+        for score, adp, pid, weight in candidates[:limit]:
+            p = self.players[pid]
+            out.append(
+                {
+                    "id": pid,
+                    "name": p.get("name"),
+                    "position": p.get("position"),
+                    "team": p.get("team"),
+                    "adp": None if adp == _INF else adp,
+                    "fantasyPoints": p.get("fantasyPoints"),
+                    "vorp": -self._entries[pid][0],
+                    "need_weight": weight,
+                    "score": round(-score, 1),
+                }
+            )
+        return out
+
+    def snapshot(self, limit: int = 10) -> Dict[str, Any]:
+        return {
+            "suggestions": self.suggestions(limit),
+            "needs": self.needs(),
+            "drafted_count": len(self.drafted),
+            "updated": self.updated,
+        }
+
+
+# ---- room registry ----
+
+# Rooms nobody has read or updated for this long are dropped. Socket rooms are also
+# closed when their last client leaves; REST-only rooms have no disconnect to rely on.
+ROOM_IDLE_TTL = float(os.environ.get("DRAFT_ROOM_IDLE_TTL", 6 * 3600))
+
+_rooms: Dict[str, DraftRoom] = {}
+_last_used: Dict[str, float] = {}
+_rooms_lock = threading.Lock()
+
+
+def _sweep(now: float) -> None:
+    """Drop idle rooms; caller holds `_rooms_lock`."""
+    for draft_id in [d for d, ts in _last_used.items() if now - ts > ROOM_IDLE_TTL]:
+        _rooms.pop(draft_id, None)
+        _last_used.pop(draft_id, None)
+
+
+def get_room(draft_id: str) -> Optional[DraftRoom]:
+    room = _rooms.get(draft_id)
+    if room is not None:
+        _last_used[draft_id] = time.time()
+    return room
+
+
+def open_room(
+    draft_id: str,
+    players: Iterable[Dict[str, Any]],
+    roster_slots: Optional[Iterable[str]] = None,
+    league_size: int = 12,
+    drafted_ids: Iterable[Any] = (),
+) -> DraftRoom:
+    """Build (or rebuild) a room's heaps from a `/players` payload and replay known picks."""
+    room = DraftRoom(players, roster_slots, league_size)
+    room.reset(drafted_ids)
+    now = time.time()
+    with _rooms_lock:
+        _sweep(now)
+        _rooms[draft_id] = room
+        _last_used[draft_id] = now
+    return room
+
+
+def close_room(draft_id: str) -> None:
+    with _rooms_lock:
+        _rooms.pop(draft_id, None)
+        _last_used.pop(draft_id, None)
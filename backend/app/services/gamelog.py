@@ -0,0 +1,45 @@
+"""
+Per-player weekly game logs over a season's week-level stat feeds.
+
+Sleeper serves week stats as one payload per week keyed by player, so a single
+player's splits would otherwise mean one upstream call per week. `GameLogIndex`
+inverts the fetched weeks once into {player_id: {week: stats}}; a player's log is
+then one dictionary lookup plus scoring the handful of weeks they played.
+"""
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from app.services import stat_schema
+from app.services.projections import stat_rows
+from app.services.scoring import score_stats
+
+
+class GameLogIndex:
+    """Week stat payloads of one season, indexed by player."""
+
+    def __init__(self, weeks: Mapping[int, Any]):
+        self.weeks: Tuple[int, ...] = tuple(sorted(w for w, payload in weeks.items() if payload is not None))
+        self._by_player: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        for week in self.weeks:
+            for pid, stats in stat_rows(weeks[week]):
+                if stats:
+                    self._by_player.setdefault(pid, {})[week] = stats
+        # One extractor for the whole season: every week comes from the same provider
+        self._extract = stat_schema.compile_extractor(
+            stats for by_week in self._by_player.values() for stats in by_week.values()
+        )
+
+    def __len__(self) -> int:
+        return len(self._by_player)
+
+    def __contains__(self, player_id: str) -> bool:
+        return player_id in self._by_player
+
+    def player(self, player_id: str, weights: Dict[str, float]) -> Optional[List[Dict[str, Any]]]:
+        """[{"week", "points", <canonical stat fields>}] in week order; None when the player never appears."""
+        by_week = self._by_player.get(player_id)
+        if by_week is None:
+            return None
+        return [
+            {"week": week, "points": score_stats(stats, weights), **self._extract(stats)}
+            for week, stats in sorted(by_week.items())
+        ]
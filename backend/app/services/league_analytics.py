@@ -0,0 +1,194 @@
+"""
+League standings and roster-strength analytics.
+
+Computed once per finalized week from Sleeper `/rosters`, `/users` and every
+completed week's `/matchups`:
+
+- standings ranked by win percentage, then head-to-head record among the tied
+  teams, then points for, then all-play percentage;
+- all-play records (each week, a team's score against every other team's score),
+  expected wins and luck (actual minus expected wins), plus the current streak;
+- positional depth grades: each roster's starters at a position (flex slots
+  split fractionally) plus a share of its best backups, ranked across the league.
+"""
+import math
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Tuple
+
+from app.services.roster_utils import POSITIONS, starter_demand
+
+# Share of a backup's value that counts towards positional strength
+BACKUP_WEIGHT = 0.25
+BACKUPS_COUNTED = 2
+_GRADES = [(0.2, "A"), (0.4, "B"), (0.6, "C"), (0.8, "D"), (1.01, "F")]
+
+
+def _points(settings: Dict[str, Any], whole: str, decimal: str) -> float:
+    return round(float(settings.get(whole) or 0) + float(settings.get(decimal) or 0) / 100, 2)
+
+
+def completed_weeks(rosters: Iterable[Any]) -> int:
+    """Weeks Sleeper has finalized: the most games any roster has on its record."""
+    done = 0
+    for r in rosters or []:
+        s = (r.get("settings") or {}) if isinstance(r, dict) else {}
+        done = max(done, int(s.get("wins") or 0) + int(s.get("losses") or 0) + int(s.get("ties") or 0))
+    return done
+
+
+def _week_results(matchups: Iterable[Any]) -> Tuple[Dict[int, float], List[Tuple[int, int, float, float]]]:
+    """(roster_id -> points, head-to-head pairs) for one week."""
+    points: Dict[int, float] = {}
+    by_matchup: Dict[Any, List[Tuple[int, float]]] = {}
+    for m in matchups or []:
+        if not isinstance(m, dict) or m.get("roster_id") is None:
+            continue
+        rid, pts = m["roster_id"], float(m.get("points") or 0)
+        points[rid] = pts
+        if m.get("matchup_id") is not None:
+            by_matchup.setdefault(m["matchup_id"], []).append((rid, pts))
+    pairs = []
+    for teams in by_matchup.values():
+        if len(teams) == 2:
+            (a, pa), (b, pb) = teams
+            pairs.append((a, b, pa, pb))
+    return points, pairs
+
+
+def standings(
+    rosters: List[Dict[str, Any]], names: Dict[int, str], weekly: Dict[int, List[Any]]
+) -> List[Dict[str, Any]]:
+    """Ranked standings rows with all-play, expected wins and streak."""
+    rows: Dict[int, Dict[str, Any]] = {}
+    for r in rosters:
+        if not isinstance(r, dict) or r.get("roster_id") is None:
+            continue
+        s = r.get("settings") or {}
+        rid = r["roster_id"]
+        rows[rid] = {
+            "roster_id": rid,
+            "owner_id": r.get("owner_id"),
+            "name": names.get(rid) or f"Team {rid}",
+            "wins": int(s.get("wins") or 0),
+            "losses": int(s.get("losses") or 0),
+            "ties": int(s.get("ties") or 0),
+            "pf": _points(s, "fpts", "fpts_decimal"),
+            "pa": _points(s, "fpts_against", "fpts_against_decimal"),
+            "all_play": {"wins": 0, "losses": 0, "ties": 0},
+            "results": [],
+        }
+
+    h2h: Dict[Tuple[int, int], List[int]] = {}  # (a, b) -> [a wins, games]
+    for week in sorted(weekly):
+        points, pairs = _week_results(weekly[week])
+        scores = sorted(points.values())
+        for rid, pts in points.items():
+            row = rows.get(rid)
+            if row is None:
+                continue
+            below = bisect_left(scores, pts)
+            equal = bisect_right(scores, pts) - below
+            row["all_play"]["wins"] += below
+            row["all_play"]["ties"] += equal - 1
+            row["all_play"]["losses"] += len(scores) - below - equal
+        for a, b, pa, pb in pairs:
+            for me, them, mine, theirs in ((a, b, pa, pb), (b, a, pb, pa)):
+                rec = h2h.setdefault((me, them), [0, 0])
+                rec[1] += 1
+                rec[0] += 1 if mine > theirs else 0
+                if me in rows:
+                    rows[me]["results"].append("W" if mine > theirs else "L" if mine < theirs else "T")
+
+    for row in rows.values():
+        games = row["wins"] + row["losses"] + row["ties"]
+        row["win_pct"] = round((row["wins"] + 0.5 * row["ties"]) / games, 3) if games else 0.0
+        ap = row["all_play"]
+        ap_games = ap["wins"] + ap["losses"] + ap["ties"]
+        ap["pct"] = round((ap["wins"] + 0.5 * ap["ties"]) / ap_games, 3) if ap_games else 0.0
+        row["expected_wins"] = round(ap["pct"] * len(row["results"]), 2)
+        row["luck"] = round(row["wins"] - row["expected_wins"], 2) if row["results"] else 0.0
+        row["streak"] = _streak(row.pop("results"))
+
+    ranked = _rank(list(rows.values()), h2h)
+    for i, row in enumerate(ranked, start=1):
+        row["rank"] = i
+    return ranked
+
+
+def _streak(results: List[str]) -> str:
+    if not results:
+        return ""
+    last = results[-1]
+    n = 0
+    for r in reversed(results):
+        if r != last:
+            break
+        n += 1
+    return f"{last}{n}"
+
+
+def _rank(rows: List[Dict[str, Any]], h2h: Dict[Tuple[int, int], List[int]]) -> List[Dict[str, Any]]:
+    """Win % first; teams level on win % are split by head-to-head among themselves, then PF, then all-play."""
+    rows.sort(key=lambda r: r["win_pct"], reverse=True)
+    out: List[Dict[str, Any]] = []
+    i = 0
+    while i < len(rows):
+        j = i
+        while j < len(rows) and rows[j]["win_pct"] == rows[i]["win_pct"]:
+            j += 1
+        group = rows[i:j]
+        ids = {r["roster_id"] for r in group}
+
+        def h2h_pct(row: Dict[str, Any]) -> float:
+            wins = games = 0
+            for other in ids - {row["roster_id"]}:
+                w, g = h2h.get((row["roster_id"], other), [0, 0])
+                wins, games = wins + w, games + g
+            return wins / games if games else 0.5
+
+        group.sort(key=lambda r: (h2h_pct(r), r["pf"], r["all_play"]["pct"], -r["roster_id"]), reverse=True)
+        out.extend(group)
+        i = j
+    return out
+
+
+def _grade(rank: int, teams: int) -> str:
+    share = (rank - 1) / max(teams, 1)
+    return next(letter for cutoff, letter in _GRADES if share < cutoff)
+
+
+def depth_grades(
+    rosters: List[Dict[str, Any]],
+    positions_by_id: Dict[str, str],
+    values: Dict[str, float],
+    slots: List[str],
+) -> Dict[int, Dict[str, Any]]:
+    """Per roster: {position: {"points", "rank", "grade"}, "overall": {...}}."""
+    per_team = starter_demand(slots, 1)
+    strength: Dict[int, Dict[str, float]] = {}
+    for r in rosters:
+        if not isinstance(r, dict) or r.get("roster_id") is None:
+            continue
+        by_pos: Dict[str, List[float]] = {pos: [] for pos in POSITIONS}
+        for pid in r.get("players") or []:
+            pos = positions_by_id.get(str(pid))
+            if pos in by_pos:
+                by_pos[pos].append(float(values.get(str(pid), 0.0)))
+        team: Dict[str, float] = {}
+        for pos, pts in by_pos.items():
+            pts.sort(reverse=True)
+            need = per_team.get(pos, 0.0)
+            full = int(math.floor(need))
+            starters = sum(pts[:full]) + (need - full) * (pts[full] if len(pts) > full else 0.0)
+            first_backup = full + (1 if need > full else 0)
+            backups = sum(pts[first_backup : first_backup + BACKUPS_COUNTED])
+            team[pos] = round(starters + BACKUP_WEIGHT * backups, 1)
+        team["overall"] = round(sum(team.values()), 1)
+        strength[r["roster_id"]] = team
+
+    out: Dict[int, Dict[str, Any]] = {rid: {} for rid in strength}
+    for key in POSITIONS + ["overall"]:
+        order = sorted(strength, key=lambda rid: strength[rid][key], reverse=True)
+        for rank, rid in enumerate(order, start=1):
+            out[rid][key] = {"points": strength[rid][key], "rank": rank, "grade": _grade(rank, len(order))}
+    return out
@@ -0,0 +1,202 @@
+"""
+Minimal Prometheus-style metrics (counters, gauges, histograms) rendered in the
+text exposition format on `/metrics`. Metrics are process-local and thread-safe.
+"""
+import re
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+_registry: List["_Metric"] = []
+_registry_lock = threading.Lock()
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+BYTES_BUCKETS = (1e3, 1e4, 1e5, 1e6, 5e6, 1e7)
+
+
+def _escape(v: str) -> str:
+    return str(v).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _fmt_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _fmt_value(v: float) -> str:
+    if v == float("inf"):
+        return "+Inf"
+    return repr(float(v)) if not float(v).is_integer() else str(int(v))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self.lock = threading.Lock()
+        with _registry_lock:
+            _registry.append(self)
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(n, "")) for n in self.label_names)
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"] + self._samples()
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        super().__init__(name, help, labels)
+        self.values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0.0) + amount
+
+    def _samples(self) -> List[str]:
+        with self.lock:
+            items = list(self.values.items())
+        return [f"{self.name}{_fmt_labels(self.label_names, k)} {_fmt_value(v)}" for k, v in items]
+
+
+class Gauge(_Metric):
+    """Set directly, or give `fn` returning {label values: value} to sample at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        fn: Optional[Callable[[], Dict[LabelValues, float]]] = None,
+    ):
+        super().__init__(name, help, labels)
+        self.values: Dict[LabelValues, float] = {}
+        self.fn = fn
+
+    def set(self, value: float, **labels: str) -> None:
+        with self.lock:
+            self.values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def _samples(self) -> List[str]:
+        if self.fn is not None:
+            try:
+                items = list(self.fn().items())
+            except Exception:
+                items = []
+        else:
+            with self.lock:
+                items = list(self.values.items())
+        return [f"{self.name}{_fmt_labels(self.label_names, k)} {_fmt_value(v)}" for k, v in items]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        # label values -> [bucket counts..., sum, count]
+        self.values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self.lock:
+            row = self.values.get(key)
+            if row is None:
+                row = self.values[key] = [0.0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    row[i] += 1
+            row[-2] += value
+            row[-1] += 1
+
+    def _samples(self) -> List[str]:
+        with self.lock:
+            items = [(k, list(v)) for k, v in self.values.items()]
+        out = []
+        for key, row in items:
+            for bound, count in zip(self.buckets, row):
+                le = f'le="{_fmt_value(bound)}"'
+                out.append(f"{self.name}_bucket{_fmt_labels(self.label_names, key, le)} {_fmt_value(count)}")
+            out.append(f"{self.name}_sum{_fmt_labels(self.label_names, key)} {_fmt_value(row[-2])}")
+            out.append(f"{self.name}_count{_fmt_labels(self.label_names, key)} {_fmt_value(row[-1])}")
+        return out
+
+
+def render() -> str:
+    with _registry_lock:
+        metrics = list(_registry)
+    lines: List[str] = []
+    for m in metrics:
+        lines.extend(m.render())
+    return "\n".join(lines) + "\n"
+
+
+# ---- URL templating for upstream labels ----
+
+_ID_AFTER = {"user", "league", "draft", "leagues"}
+_NUMERIC = re.compile(r"^\d+$")
+
+
+def endpoint_template(path: str) -> str:
+    """Collapse ids in an upstream path so label cardinality stays bounded.
+
+    /v1/league/123/matchups/4 -> /v1/league/{id}/matchups/{n}
+    """
+    segments = path.split("/")
+    out = []
+    for i, seg in enumerate(segments):
+        prev = segments[i - 1] if i else ""
+        if prev in _ID_AFTER and seg and seg != "nfl":
+            out.append("{id}")
+        elif _NUMERIC.match(seg):
+            out.append("{n}")
+        else:
+            out.append(seg)
+    return "/".join(out)
+
+
+# ---- shared metric definitions ----
+
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds", "Latency of backend HTTP routes", ("method", "route", "status")
+)
+UPSTREAM_LATENCY = Histogram(
+    "upstream_request_duration_seconds", "Latency of upstream GETs", ("host", "endpoint", "outcome")
+)
+UPSTREAM_BYTES = Histogram(
+    "upstream_response_bytes", "Size of upstream response bodies", ("host", "endpoint"), buckets=BYTES_BUCKETS
+)
+CACHE_EVENTS = Counter("cache_events_total", "Cache lookups by cache and result (hit/miss/stale)", ("cache", "result"))
+OPENAI_LATENCY = Histogram("openai_request_duration_seconds", "OpenAI completion latency", ("model", "mode"))
+OPENAI_TOKENS = Counter("openai_tokens_total", "OpenAI tokens used", ("model", "type"))
+SOCKET_CONNECTIONS = Gauge("socketio_connections", "Connected Socket.IO clients")
+SOCKET_CONNECTIONS.set(0)
+SOCKET_ROOMS = Gauge("socketio_draft_rooms", "Draft rooms with at least one client")
+SOCKET_EVENTS = Counter("socketio_events_total", "Socket.IO events received", ("event",))
+
+
+def cache_event(cache: str, result: str) -> None:
+    CACHE_EVENTS.inc(cache=cache, result=result)
@@ -0,0 +1,174 @@
+"""
+Row builder behind `/players`: one draftboard row per fantasy-relevant player,
+joining Sleeper's player feed with last season's stats and ADP.
+
+This is pure Python over every player in the feed, so the API runs it in the CPU
+pool (see cpu_pool.py) rather than in the serving process. Feeds may be passed
+as the raw JSON bytes from upstream, which are cheap to send to a worker; the
+worker decodes them itself.
+"""
+import json
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from app.services import defense, stat_schema
+
+VALID_POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF"]
+
+# Numeric row fields `/players?sort=` accepts; adp (and rank) read best-first ascending
+SORT_FIELDS = (
+    "fantasyPoints", "adp", "rank", "passYds", "passTD", "pass_att", "passAtt", "pass_cmp", "passCmp",
+    "interceptions", "rushYds", "rushTD", "rushAtt", "recYds", "recTD", "receptions", "targets",
+    "fumbles", "sacks", "age", "years_exp",
+)
+ASCENDING_FIELDS = ("adp", "rank")
+# Every key a row can carry (the optional ones only when the stat is present)
+FIELDS = SORT_FIELDS + (
+    "id", "name", "team", "position", "height", "weight", "college", "number", "injury_status",
+)
+
+Feed = Union[bytes, Dict[str, Any], List[Any], None]
+
+
+def _decode(feed: Feed) -> Any:
+    if isinstance(feed, (bytes, bytearray)):
+        try:
+            return json.loads(feed)
+        except ValueError:
+            return None
+    return feed
+
+
+def build_players(
+    players_feed: Feed,
+    stats_feed: Feed,
+    adp_dict: Dict[str, float],
+    scoring: str = "ppr",
+    on_team_only: bool = True,
+    fallback_players: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Dict[str, float]]]]:
+    """
+    (rows, defense-vs-position multipliers or None without stats). `fallback_players`
+    stands in for the player feed when it is missing or not a dict.
+    """
+    data_players = _decode(players_feed)
+    if not isinstance(data_players, dict):
+        data_players = fallback_players or {}
+    data_stats = _decode(stats_feed) or {}
+
+    # Stats can be dict keyed by player_id or a list of rows with `player_id`
+    if isinstance(data_stats, dict):
+        stats_dict = {str(player_id): stat for player_id, stat in data_stats.items()}
+    else:
+        stats_dict = {
+            str(stat.get("player_id")): stat
+            for stat in data_stats
+            if isinstance(stat, dict) and stat.get("player_id") is not None
+        }
+    multipliers = defense.build_multipliers(stats_dict, data_players) if stats_dict else None
+    # Key layout detected once per feed (Sleeper, ESPN stat ids, legacy dumps)
+    extract = stat_schema.compile_extractor(stats_dict.values())
+
+    players: list[dict] = []
+
+    for player_id, player_data in data_players.items():
+        team_code = (player_data.get("team") or "").strip()
+        years_exp = player_data.get("years_exp")
+        is_rookie = years_exp == 0  # explicit rookies only (pre-NFL-draft prospects)
+        status = (player_data.get("status") or "").strip().lower()
+        # Always drop "Sleeper-active but team-less veterans" — these are retired/free agent
+        # placeholders (e.g. Tom Brady, Drew Brees) that have player records but no real team.
+        # Rookies (years_exp == 0) are kept even without a team.
+        if not team_code:
+            if not is_rookie:
+                continue
+        # Status-based exclusions (Sleeper marks retired players in a few flavors)
+        if status in ("inactive", "retired"):
+            continue
+        if on_team_only and player_data.get("active") is False:
+            continue
+
+        pos = player_data.get("position")
+        if pos not in VALID_POSITIONS:
+            continue
+
+        stat = stats_dict.get(str(player_id), {}) or {}
+
+        # Numeric fields as ints (zero when absent; the optional ones None), read through
+        # the paths this feed actually uses
+        norm = extract(stat)
+        passYds = norm["passYds"]
+        passTD = norm["passTD"]
+        rushYds = norm["rushYds"]
+        rushTD = norm["rushTD"]
+        recYds = norm["recYds"]
+        recTD = norm["recTD"]
+        receptions = norm["receptions"]
+        targets_val = norm["targets"]
+        fumbles = norm["fumbles"]
+        interceptions = norm["interceptions"]
+        sacks = norm["sacks"]
+        rushAtt = norm["rushAtt"]
+        pass_att = norm["pass_att"]
+        pass_cmp = norm["pass_cmp"]
+
+        rec_multiplier = {"ppr": 1.0, "half_ppr": 0.5, "standard": 0.0}.get(scoring, 1.0)
+        fantasyPoints = round(
+            passTD * 4
+            + passYds / 25
+            - interceptions * 2
+            + rushTD * 6
+            + rushYds / 10
+            + recTD * 6
+            + recYds / 10
+            + receptions * rec_multiplier,
+            1,
+        )
+        full_name = f"{player_data.get('first_name', '')} {player_data.get('last_name', '')}".strip()
+        # Prefer Sleeper ADP by id, then search_rank as fallback
+        adp_value = adp_dict.get(str(player_id))
+        if adp_value is None:
+            sr = player_data.get("search_rank")
+            if sr is not None and isinstance(sr, (int, float)):
+                adp_value = float(sr)
+
+        player: dict[str, Any] = {
+            "id": str(player_id),
+            "name": full_name,
+            "team": team_code,
+            "position": pos,
+            "rank": 0,
+            "fantasyPoints": fantasyPoints,
+            "rushYds": rushYds,
+            "rushTD": rushTD,
+            "rushAtt": rushAtt,
+            "recYds": recYds,
+            "recTD": recTD,
+            "passYds": passYds,
+            "passTD": passTD,
+            "receptions": receptions,
+            "fumbles": fumbles,
+            "interceptions": interceptions,
+            "sacks": sacks,
+            "adp": adp_value if isinstance(adp_value, (int, float)) else None,
+            # Bio/metadata from Sleeper
+            "age": player_data.get("age"),
+            "height": player_data.get("height"),
+            "weight": player_data.get("weight"),
+            "college": player_data.get("college"),
+            "years_exp": player_data.get("years_exp"),
+            "number": player_data.get("number"),
+            "injury_status": player_data.get("injury_status"),
+        }
+
+        # Conditionally include requested flat keys only when valid numbers
+        if pass_att is not None:
+            player["pass_att"] = pass_att
+            # Optional camelCase for compatibility
+            player["passAtt"] = pass_att
+        if pass_cmp is not None:
+            player["pass_cmp"] = pass_cmp
+            player["passCmp"] = pass_cmp
+        if targets_val is not None:
+            player["targets"] = targets_val
+        players.append(player)
+    return players, multipliers
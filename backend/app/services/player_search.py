@@ -0,0 +1,214 @@
+"""
+In-memory fuzzy search over Sleeper player names.
+
+Built once per Sleeper players feed refresh. Each fantasy-relevant player gets
+normalized name tokens (first, last, full, nickname, team code and team
+nickname). Lookups go through two indexes:
+
+- a prefix index (token prefix -> player slots), so "ja cha" finds Ja'Marr Chase;
+- a trigram index over the joined name, for typo tolerance ("patrik mahomes").
+
+Trigram overlap only picks fuzzy candidates: one swapped letter in a short word
+costs a third of its trigrams, so the closest candidates are scored by edit
+similarity instead. Results are ranked by match quality, then Sleeper's search_rank.
+"""
+import heapq
+import re
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional, Set
+
+SEARCH_POSITIONS = {"QB", "RB", "WR", "TE", "K", "DEF"}
+_MAX_PREFIX = 10
+_FUZZY_MIN = 0.35
+_MENTION_MIN = 0.75
+_MENTION_GRAMS = 0.5  # trigram floor for mention candidates, scanned once per window of the question
+_RESCORE = 20  # fuzzy candidates re-scored by edit similarity
+
+_STRIP = re.compile(r"[.'`’\-]")
+_WORD = re.compile(r"[a-z0-9]+")
+
+# Team code -> nickname, so "chiefs" finds KC players and the KC defense
+TEAM_NAMES = {
+    "ARI": "cardinals", "ATL": "falcons", "BAL": "ravens", "BUF": "bills", "CAR": "panthers", "CHI": "bears",
+    "CIN": "bengals", "CLE": "browns", "DAL": "cowboys", "DEN": "broncos", "DET": "lions", "GB": "packers",
+    "HOU": "texans", "IND": "colts", "JAX": "jaguars", "KC": "chiefs", "LAC": "chargers", "LAR": "rams",
+    "LV": "raiders", "MIA": "dolphins", "MIN": "vikings", "NE": "patriots", "NO": "saints", "NYG": "giants",
+    "NYJ": "jets", "PHI": "eagles", "PIT": "steelers", "SEA": "seahawks", "SF": "49ers", "TB": "buccaneers",
+    "TEN": "titans", "WAS": "commanders",
+}
+
+
+def normalize(text: str) -> List[str]:
+    """Lowercase word tokens with apostrophes/dots/hyphens folded in (Ja'Marr -> jamarr)."""
+    return _WORD.findall(_STRIP.sub("", (text or "").lower()))
+
+
+def _trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerIndex:
+    def __init__(self, players: Dict[str, Any]):
+        self.ids: List[str] = []
+        self.rows: List[Dict[str, Any]] = []
+        self.names: List[str] = []  # normalized "first last"
+        self.rank: List[int] = []
+        self.prefixes: Dict[str, Set[int]] = {}
+        self.trigrams: Dict[str, List[int]] = {}
+        self.gram_counts: List[int] = []
+        self.by_full: Dict[str, List[int]] = {}
+        # Single name tokens, so a one-word typo ("mahomse") is compared against surnames, not full names
+        self.words: List[str] = []
+        self.word_slots: List[int] = []
+        self.word_grams: Dict[str, List[int]] = {}
+        self.word_gram_counts: List[int] = []
+
+        for pid, p in (players or {}).items():
+            if not isinstance(p, dict) or p.get("position") not in SEARCH_POSITIONS:
+                continue
+            first = p.get("first_name") or ""
+            last = p.get("last_name") or ""
+            full = p.get("full_name") or f"{first} {last}"
+            team = (p.get("team") or "").upper()
+            name_tokens = normalize(full)
+            if not name_tokens:
+                continue
+            slot = len(self.ids)
+            self.ids.append(str(pid))
+            self.rows.append(
+                {
+                    "id": str(pid),
+                    "name": " ".join(full.split()),
+                    "position": p.get("position"),
+                    "team": team or None,
+                    "injury_status": p.get("injury_status"),
+                }
+            )
+            joined = " ".join(name_tokens)
+            self.names.append(joined)
+            rank = p.get("search_rank")
+            self.rank.append(int(rank) if isinstance(rank, (int, float)) else 10**7)
+            self.by_full.setdefault(joined, []).append(slot)
+
+            tokens = set(name_tokens) | {"".join(name_tokens)}
+            tokens.update(normalize(p.get("nickname") or (p.get("metadata") or {}).get("nickname") or ""))
+            if team:
+                tokens.add(team.lower())
+                if team in TEAM_NAMES:
+                    tokens.add(TEAM_NAMES[team])
+            for tok in tokens:
+                for n in range(1, min(len(tok), _MAX_PREFIX) + 1):
+                    self.prefixes.setdefault(tok[:n], set()).add(slot)
+
+            grams = _trigrams(joined)
+            self.gram_counts.append(len(grams))
+            for g in grams:
+                self.trigrams.setdefault(g, []).append(slot)
+            for word in set(name_tokens):
+                if len(word) < 3:
+                    continue
+                word_grams = _trigrams(word)
+                self.word_gram_counts.append(len(word_grams))
+                for g in word_grams:
+                    self.word_grams.setdefault(g, []).append(len(self.word_slots))
+                self.words.append(word)
+                self.word_slots.append(slot)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _prefix_hits(self, tokens: List[str]) -> Set[int]:
+        hits: Optional[Set[int]] = None
+        for tok in tokens:
+            found = self.prefixes.get(tok[:_MAX_PREFIX], set())
+            if len(tok) > _MAX_PREFIX:
+                found = {s for s in found if tok in self.names[s].replace(" ", "") or tok in self.names[s].split()}
+            hits = set(found) if hits is None else hits & found
+            if not hits:
+                return set()
+        return hits or set()
+
+    @staticmethod
+    def _dice(grams: Set[str], index: Dict[str, List[int]], counts: List[int], minimum: float) -> Dict[int, float]:
+        overlap: Dict[int, int] = {}
+        for g in grams:
+            for key in index.get(g, ()):
+                overlap[key] = overlap.get(key, 0) + 1
+        out = {}
+        for key, common in overlap.items():
+            score = 2 * common / (len(grams) + counts[key])
+            if score >= minimum:
+                out[key] = score
+        return out
+
+    def _fuzzy(self, joined: str, minimum: float, grams_min: float = _FUZZY_MIN) -> Dict[int, float]:
+        """slot -> edit similarity; one-word queries are matched against single name words."""
+        grams = _trigrams(joined)
+        if " " in joined:
+            texts, slots = self.names, None
+            candidates = self._dice(grams, self.trigrams, self.gram_counts, grams_min)
+        else:
+            texts, slots = self.words, self.word_slots
+            candidates = self._dice(grams, self.word_grams, self.word_gram_counts, grams_min)
+        out: Dict[int, float] = {}
+        for key in heapq.nlargest(_RESCORE, candidates, key=candidates.__getitem__):
+            score = SequenceMatcher(None, joined, texts[key], autojunk=False).ratio()
+            if score < minimum:
+                continue
+            slot = key if slots is None else slots[key]
+            out[slot] = max(out.get(slot, 0.0), score)
+        return out
+
+    def search(self, query: str, limit: int = 10, position: Optional[str] = None) -> List[Dict[str, Any]]:
+        tokens = normalize(query)
+        if not tokens:
+            return []
+        joined = " ".join(tokens)
+        scored: Dict[int, float] = {}
+        for slot in self.by_full.get(joined, ()):
+            scored[slot] = 3.0
+        for slot in self._prefix_hits(tokens):
+            scored.setdefault(slot, 2.0 + (0.5 if self.names[slot].startswith(joined) else 0.0))
+        if len(scored) < limit:
+            for slot, sim in self._fuzzy(joined, _FUZZY_MIN).items():
+                scored.setdefault(slot, sim)
+        if position:
+            scored = {s: v for s, v in scored.items() if self.rows[s]["position"] == position}
+        best = heapq.nsmallest(limit, scored, key=lambda s: (-scored[s], self.rank[s]))
+        return [{**self.rows[s], "score": round(scored[s], 3)} for s in best]
+
+    def resolve(self, name: str) -> Optional[Dict[str, Any]]:
+        """Best single match for a free-text player name, or None when nothing is close."""
+        hits = self.search(name, limit=1)
+        if hits and hits[0]["score"] >= _MENTION_MIN:
+            return hits[0]
+        return None
+
+    def mentions(self, text: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """Players whose full names (allowing small typos) appear in free text, in text order."""
+        words = normalize(text)
+        found: Dict[str, Dict[str, Any]] = {}
+        at: Dict[str, int] = {}
+        used: Set[int] = set()
+        for size in (3, 2):
+            for i in range(len(words) - size + 1):
+                if any(j in used for j in range(i, i + size)):
+                    continue
+                window = " ".join(words[i : i + size])
+                slots = self.by_full.get(window)
+                if slots:
+                    best = min(slots, key=lambda s: self.rank[s])
+                else:
+                    fuzzy = self._fuzzy(window, _MENTION_MIN, _MENTION_GRAMS)
+                    if not fuzzy:
+                        continue
+                    best = max(fuzzy, key=lambda s: (fuzzy[s], -self.rank[s]))
+                found.setdefault(self.ids[best], self.rows[best])
+                at.setdefault(self.ids[best], i)
+                used.update(range(i, i + size))
+                if len(found) >= limit:
+                    break
+            if len(found) >= limit:
+                break
+        return [found[pid] for pid in sorted(found, key=at.__getitem__)]
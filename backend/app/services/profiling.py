@@ -0,0 +1,275 @@
+"""
+Opt-in, request-scoped profiling.
+
+A request is profiled only when `PROFILE_TOKEN` is set and the request carries the
+same value in an `X-Profile` header or a `?profile=` query parameter. Otherwise
+the middleware passes straight through, and `span()` costs one context-variable
+lookup.
+
+A profiled request gets:
+
+- a sampled CPU profile of the threads that ran its code (the event loop thread
+  plus every thread that entered a span). Nothing else running on those threads
+  at the same time is filtered out, so profile on a quiet server;
+- a phase breakdown: `fetch` (upstream I/O), `parse` (JSON decode), `build`
+  (handler code, excluding nested spans on the same thread) and `serialize`
+  (from the handler returning to the response headers going out).
+
+The breakdown is returned as a `Server-Timing` header, and the full profile is
+written to `data/profiles/<id>.speedscope.json` (open it at speedscope.app). Its
+id is in `X-Profile-Id`.
+"""
+import contextlib
+import contextvars
+import hmac
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+PHASES = ("fetch", "parse", "build", "serialize")
+MAX_STORED = 50
+
+_current: contextvars.ContextVar[Optional["Profile"]] = contextvars.ContextVar("request_profile", default=None)
+
+
+def _token() -> str:
+    return os.environ.get("PROFILE_TOKEN", "")
+
+
+def authorized(supplied: Optional[str]) -> bool:
+    token = _token()
+    return bool(token) and bool(supplied) and hmac.compare_digest(token, supplied or "")
+
+
+class Profile:
+    def __init__(self, name: str, interval: float):
+        self.id = f"{int(time.time())}-{uuid4().hex[:8]}"
+        self.name = name
+        self.interval = interval
+        self.started = time.perf_counter()
+        self.response_start: Optional[float] = None
+        self.lock = threading.Lock()
+        self.threads = {threading.get_ident()}
+        # Finished spans: (name, thread, start, end, exclusive seconds, depth)
+        self.spans: List[Tuple[str, int, float, float, float, int]] = []
+        self._open: Dict[int, List[List[Any]]] = {}
+        # Sampler output: thread -> [(elapsed, stack of frame indexes)]
+        self.samples: Dict[int, List[Tuple[float, List[int]]]] = {}
+        self.frames: List[Dict[str, Any]] = []
+        self._frame_index: Dict[Tuple[str, str, int], int] = {}
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._sample_loop, name=f"profiler-{self.id}", daemon=True)
+
+    # ---- spans ----
+
+    def enter(self, name: str) -> None:
+        tid = threading.get_ident()
+        with self.lock:
+            self.threads.add(tid)
+            self._open.setdefault(tid, []).append([name, time.perf_counter(), 0.0])
+
+    def exit(self) -> None:
+        tid = threading.get_ident()
+        end = time.perf_counter()
+        with self.lock:
+            stack = self._open[tid]
+            name, start, child = stack.pop()
+            duration = end - start
+            if stack:
+                stack[-1][2] += duration
+            self.spans.append((name, tid, start, end, duration - child, len(stack)))
+
+    # ---- sampling ----
+
+    def start(self) -> None:
+        self._sampler.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._sampler.join(timeout=1)
+
+    def _frame(self, code: Any, line: int) -> int:
+        key = (code.co_name, code.co_filename, code.co_firstlineno)
+        idx = self._frame_index.get(key)
+        if idx is None:
+            idx = self._frame_index[key] = len(self.frames)
+            self.frames.append({"name": code.co_name, "file": code.co_filename, "line": line})
+        return idx
+
+    def _sample_loop(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter() - self.started
+            frames = sys._current_frames()
+            with self.lock:
+                threads = list(self.threads)
+            for tid in threads:
+                frame = frames.get(tid)
+                if frame is None or tid == own:
+                    continue
+                stack: List[int] = []
+                while frame is not None:
+                    stack.append(self._frame(frame.f_code, frame.f_lineno))
+                    frame = frame.f_back
+                stack.reverse()
+                self.samples.setdefault(tid, []).append((now, stack))
+
+    # ---- results ----
+
+    def breakdown(self) -> Dict[str, float]:
+        totals = {phase: 0.0 for phase in PHASES}
+        handler_end = None
+        for name, _tid, _start, end, exclusive, depth in self.spans:
+            if name in totals:
+                totals[name] += exclusive
+            if name == "build" and depth == 0:
+                handler_end = max(end, handler_end or end)
+        finished = self.response_start or time.perf_counter()
+        if handler_end is not None:
+            totals["serialize"] = max(finished - handler_end, 0.0)
+        totals["total"] = finished - self.started
+        return {k: round(v * 1000, 2) for k, v in totals.items()}
+
+    def server_timing(self) -> str:
+        return ", ".join(f"{k};dur={v}" for k, v in self.breakdown().items())
+
+    def speedscope(self) -> Dict[str, Any]:
+        frames = list(self.frames)
+        span_frames: Dict[str, int] = {}
+
+        def span_frame(name: str) -> int:
+            if name not in span_frames:
+                span_frames[name] = len(frames)
+                frames.append({"name": f"span:{name}"})
+            return span_frames[name]
+
+        end_value = (self.response_start or time.perf_counter()) - self.started
+        profiles: List[Dict[str, Any]] = []
+        for tid, rows in self.samples.items():
+            weights = [t - prev for prev, t in zip([0.0] + [r[0] for r in rows], [r[0] for r in rows])]
+            profiles.append(
+                {
+                    "type": "sampled",
+                    "name": f"cpu thread {tid}",
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": end_value,
+                    "samples": [stack for _t, stack in rows],
+                    "weights": weights,
+                }
+            )
+        by_thread: Dict[int, List[Tuple[str, float, float, int]]] = {}
+        for name, tid, start, end, _exclusive, depth in self.spans:
+            by_thread.setdefault(tid, []).append((name, start - self.started, end - self.started, depth))
+        for tid, spans in by_thread.items():
+            # Spans on one thread nest, so opens sort outer-first and closes inner-first on ties
+            ordered = []
+            for name, start, end, depth in spans:
+                frame = span_frame(name)
+                ordered.append((start, 1, depth, "O", frame))
+                ordered.append((end, 0, -depth, "C", frame))
+            ordered.sort()
+            events = [{"type": kind, "frame": frame, "at": at} for at, _, _, kind, frame in ordered]
+            profiles.append(
+                {
+                    "type": "evented",
+                    "name": f"spans thread {tid}",
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": end_value,
+                    "events": events,
+                }
+            )
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": self.name,
+            "exporter": "wfantasy-backend",
+            "shared": {"frames": frames},
+            "profiles": profiles,
+            "breakdown_ms": self.breakdown(),
+        }
+
+
+@contextlib.contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time a phase of the current profiled request. Also usable as a decorator."""
+    prof = _current.get()
+    if prof is None:
+        yield
+        return
+    prof.enter(name)
+    try:
+        yield
+    finally:
+        prof.exit()
+
+
+def profile_path(data_dir: str, profile_id: str) -> str:
+    return os.path.join(data_dir, "profiles", f"{os.path.basename(profile_id)}.speedscope.json")
+
+
+def _save(prof: Profile, data_dir: str) -> None:
+    folder = os.path.join(data_dir, "profiles")
+    try:
+        os.makedirs(folder, exist_ok=True)
+        with open(profile_path(data_dir, prof.id), "w") as f:
+            json.dump(prof.speedscope(), f)
+        stored = sorted(os.listdir(folder))
+        for old in stored[: max(len(stored) - MAX_STORED, 0)]:
+            os.remove(os.path.join(folder, old))
+    except Exception as e:
+        logger.warning(f"Failed to save profile {prof.id}: {e}")
+
+
+def _requested(scope: Dict[str, Any]) -> bool:
+    if not _token():
+        return False
+    for key, value in scope.get("headers") or []:
+        if key == b"x-profile":
+            return authorized(value.decode("latin-1"))
+    query = scope.get("query_string") or b""
+    if b"profile=" not in query:
+        return False
+    return authorized((parse_qs(query.decode("latin-1")).get("profile") or [""])[0])
+
+
+class ProfilingMiddleware:
+    """ASGI middleware that profiles requests carrying the profiling token."""
+
+    def __init__(self, app: Any, data_dir: str, interval: Optional[float] = None):
+        self.app = app
+        self.data_dir = data_dir
+        self.interval = interval or float(os.environ.get("PROFILE_INTERVAL_MS", "2")) / 1000.0
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http" or not _requested(scope):
+            await self.app(scope, receive, send)
+            return
+        prof = Profile(f"{scope.get('method', 'GET')} {scope.get('path', '')}", self.interval)
+        reset = _current.set(prof)
+        prof.start()
+
+        async def send_with_timing(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start" and prof.response_start is None:
+                prof.response_start = time.perf_counter()
+                headers = list(message.get("headers") or [])
+                headers.append((b"server-timing", prof.server_timing().encode("latin-1")))
+                headers.append((b"x-profile-id", prof.id.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(reset)
+            prof.stop()
+            _save(prof, self.data_dir)
+            logger.info(f"Profiled {prof.name} as {prof.id}: {prof.breakdown()}")
@@ -0,0 +1,217 @@
+"""
+Season-wide weekly projections store.
+
+All weeks of a season live in one dense float32 array shaped (player, week, stat),
+so rest-of-season and per-week totals under any scoring profile are a single
+tensor contraction instead of 18 upstream calls. The store is persisted to
+`data/projections_{season}.npz`; completed weeks are never refetched, while the
+current and future weeks are refreshed on a TTL.
+
+Upstream fetches run outside `lock`, so readers keep answering from the loaded
+weeks while a refresh is in flight; a week whose fetch failed is retried with
+backoff instead of on every request.
+"""
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+REGULAR_SEASON_WEEKS = 18
+_OPEN_WEEK_TTL = 60 * 60  # 1h for current/future weeks
+# Retry delay after a failed week fetch: 1 minute, doubling up to the open-week TTL
+_RETRY_FIRST = 60.0
+
+_PROJECTIONS_URL = "https://api.sleeper.app/v1/projections/nfl/{season}/{week}?season_type=regular"
+
+FetchMany = Callable[[List[str]], List[Any]]
+
+
+def stat_rows(payload: Any) -> Iterable[Tuple[str, Dict[str, Any]]]:
+    """Yield (player_id, stats) from either Sleeper stats/projection shape (dict keyed by id, or list of rows)."""
+    if isinstance(payload, dict):
+        for pid, stats in payload.items():
+            if isinstance(stats, dict):
+                yield str(pid), stats
+    elif isinstance(payload, list):
+        for row in payload:
+            if not isinstance(row, dict) or row.get("player_id") is None:
+                continue
+            stats = row.get("stats") if isinstance(row.get("stats"), dict) else row
+            yield str(row["player_id"]), stats
+
+
+def week_is_final(season: int, week: int, state_season: int, state_week: int) -> bool:
+    """
+    Past seasons are final; this season's weeks wait one more week for stat
+    corrections, and its season totals (week 0) are never final.
+    """
+    if season < state_season:
+        return True
+    return week != 0 and week < state_week - 1
+
+
+class ProjectionStore:
+    def __init__(self, season: int, data_dir: str, weeks: int = REGULAR_SEASON_WEEKS):
+        self.season = season
+        self.weeks = weeks
+        self.path = os.path.join(data_dir, f"projections_{season}.npz")
+        self.lock = threading.Lock()
+        # One refresh at a time; held across the upstream fetch, unlike `lock`
+        self._refresh_lock = threading.Lock()
+        # week -> (failed attempts, unix time of the next retry); not persisted
+        self._failed: Dict[int, Tuple[int, float]] = {}
+        self.player_ids: List[str] = []
+        self.stat_keys: List[str] = []
+        self._pidx: Dict[str, int] = {}
+        self._sidx: Dict[str, int] = {}
+        self.values = np.zeros((0, weeks, 0), dtype=np.float32)
+        # Unix time each week was last fetched (0 = never)
+        self.fetched = np.zeros(weeks, dtype=np.float64)
+        self._load()
+
+    # ---- persistence ----
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with np.load(self.path, allow_pickle=False) as f:
+                self.values = f["values"].astype(np.float32)
+                self.player_ids = [str(x) for x in f["player_ids"]]
+                self.stat_keys = [str(x) for x in f["stat_keys"]]
+                self.fetched = f["fetched"].astype(np.float64)
+        except Exception as e:
+            logger.warning(f"Failed to load projections store {self.path}: {e}")
+            return
+        self._pidx = {pid: i for i, pid in enumerate(self.player_ids)}
+        self._sidx = {k: i for i, k in enumerate(self.stat_keys)}
+
+    def _save(self, arrays: Dict[str, np.ndarray]) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = self.path + ".tmp.npz"
+            np.savez_compressed(tmp, **arrays)
+            os.replace(tmp, self.path)
+        except Exception as e:
+            logger.warning(f"Failed to save projections store {self.path}: {e}")
+
+    # ---- ingestion ----
+
+    def stale_weeks(self, current_week: int, now: Optional[float] = None) -> List[int]:
+        """Weeks never fetched, plus current/future weeks whose TTL has lapsed (minus failed weeks backing off)."""
+        now = now or time.time()
+        out = []
+        for w in range(1, self.weeks + 1):
+            ts = self.fetched[w - 1]
+            if ts == 0 or (w >= current_week and now - ts > _OPEN_WEEK_TTL):
+                failed = self._failed.get(w)
+                if failed is None or now >= failed[1]:
+                    out.append(w)
+        return out
+
+    def _grow(self, n_players: int, n_stats: int) -> None:
+        p, w, s = self.values.shape
+        if n_players <= p and n_stats <= s:
+            return
+        grown = np.zeros((max(n_players, p), w, max(n_stats, s)), dtype=np.float32)
+        grown[:p, :, :s] = self.values
+        self.values = grown
+
+    def ingest(self, week: int, payload: Any, now: Optional[float] = None) -> None:
+        rows = list(stat_rows(payload))
+        for pid, stats in rows:
+            if pid not in self._pidx:
+                self._pidx[pid] = len(self.player_ids)
+                self.player_ids.append(pid)
+            for k, v in stats.items():
+                if k not in self._sidx and isinstance(v, (int, float)) and not isinstance(v, bool):
+                    self._sidx[k] = len(self.stat_keys)
+                    self.stat_keys.append(k)
+        self._grow(len(self.player_ids), len(self.stat_keys))
+
+        col = self.values[:, week - 1, :]
+        col[:] = 0.0
+        for pid, stats in rows:
+            i = self._pidx[pid]
+            for k, v in stats.items():
+                j = self._sidx.get(k)
+                if j is not None and isinstance(v, (int, float)) and not isinstance(v, bool):
+                    col[i, j] = v
+        self.fetched[week - 1] = now or time.time()
+
+    def refresh(self, fetch_many: FetchMany, current_week: int) -> List[int]:
+        """Concurrently (re)load stale weeks. Returns the weeks that were updated."""
+        with self._refresh_lock:
+            weeks = self.stale_weeks(current_week)
+            if not weeks:
+                return []
+            urls = [_PROJECTIONS_URL.format(season=self.season, week=w) for w in weeks]
+            payloads = fetch_many(urls)
+            updated = []
+            now = time.time()
+            with self.lock:
+                for w, payload in zip(weeks, payloads):
+                    if payload is None:
+                        attempts = self._failed.get(w, (0, 0.0))[0] + 1
+                        delay = min(_RETRY_FIRST * 2 ** (attempts - 1), _OPEN_WEEK_TTL)
+                        self._failed[w] = (attempts, now + delay)
+                        continue
+                    self._failed.pop(w, None)
+                    self.ingest(w, payload, now)
+                    updated.append(w)
+                if not updated:
+                    return []
+                arrays = {
+                    "values": self.values.copy(),
+                    "player_ids": np.array(self.player_ids, dtype=str),
+                    "stat_keys": np.array(self.stat_keys, dtype=str),
+                    "fetched": self.fetched.copy(),
+                }
+            self._save(arrays)
+            return updated
+
+    # ---- queries ----
+
+    def _weight_vector(self, weights: Dict[str, float]) -> np.ndarray:
+        vec = np.zeros(len(self.stat_keys), dtype=np.float32)
+        for k, w in weights.items():
+            j = self._sidx.get(k)
+            if j is not None:
+                vec[j] = w
+        return vec
+
+    def weekly_points(self, weights: Dict[str, float]) -> np.ndarray:
+        """(player, week) fantasy points under the given stat weights."""
+        if not self.stat_keys:
+            return np.zeros((len(self.player_ids), self.weeks), dtype=np.float32)
+        return self.values @ self._weight_vector(weights)
+
+    def totals(self, weights: Dict[str, float], from_week: int = 1, to_week: Optional[int] = None) -> Dict[str, float]:
+        """Per-player total points for weeks [from_week, to_week]."""
+        to_week = min(to_week or self.weeks, self.weeks)
+        pts = self.weekly_points(weights)[:, max(from_week, 1) - 1 : to_week].sum(axis=1)
+        return {pid: round(float(pts[i]), 2) for i, pid in enumerate(self.player_ids) if pts[i]}
+
+    def player_weeks(self, player_id: str, weights: Dict[str, float]) -> Optional[List[float]]:
+        i = self._pidx.get(str(player_id))
+        if i is None:
+            return None
+        row = self.values[i] @ self._weight_vector(weights) if self.stat_keys else np.zeros(self.weeks)
+        return [round(float(x), 2) for x in row]
+
+
+_stores: Dict[int, ProjectionStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(season: int, data_dir: str) -> ProjectionStore:
+    with _stores_lock:
+        store = _stores.get(season)
+        if store is None:
+            store = _stores[season] = ProjectionStore(season, data_dir)
+        return store
@@ -0,0 +1,144 @@
+"""
+Roster slot helpers shared by the backend engines.
+
+Mirrors `lib/roster-utils.ts` and the VORP helpers in `lib/trade-values.ts` so
+server-side rankings agree with what the frontend shows.
+"""
+from typing import Any, Dict, Iterable, List, Optional
+
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF"]
+
+# Which player positions can fill each slot type
+SLOT_ELIGIBLE: Dict[str, List[str]] = {
+    "QB": ["QB"],
+    "RB": ["RB"],
+    "WR": ["WR"],
+    "TE": ["TE"],
+    "FLEX": ["RB", "WR", "TE"],
+    "SUPER_FLEX": ["QB", "RB", "WR", "TE"],
+    "REC_FLEX": ["WR", "TE"],
+    "WRRB_FLEX": ["WR", "RB"],
+    "K": ["K"],
+    "DEF": ["DEF"],
+}
+
+# Slot fill priority — more restrictive slots should be filled first
+SLOT_PRIORITY: Dict[str, int] = {
+    "QB": 0,
+    "RB": 0,
+    "WR": 0,
+    "TE": 0,
+    "K": 0,
+    "DEF": 0,
+    "REC_FLEX": 1,
+    "WRRB_FLEX": 1,
+    "FLEX": 2,
+    "SUPER_FLEX": 3,
+}
+
+# Typical usage split of flex slots (see getFlexWeights in lib/trade-values.ts)
+_FLEX_WEIGHTS: Dict[str, Dict[str, float]] = {
+    "SUPER_FLEX": {"QB": 0.60, "RB": 0.15, "WR": 0.15, "TE": 0.10},
+    "FLEX": {"RB": 0.45, "WR": 0.40, "TE": 0.15},
+    "REC_FLEX": {"WR": 0.65, "TE": 0.35},
+    "WRRB_FLEX": {"WR": 0.55, "RB": 0.45},
+}
+
+DEFAULT_ROSTER_SLOTS = ["QB", "RB", "RB", "WR", "WR", "TE", "FLEX", "K", "DEF"]
+
+
+def starter_slots(roster_positions: Optional[Iterable[str]]) -> List[str]:
+    """Drop bench/IR/taxi entries from a Sleeper `roster_positions` list."""
+    slots = [s for s in (roster_positions or []) if s in SLOT_ELIGIBLE]
+    return slots or list(DEFAULT_ROSTER_SLOTS)
+
+
+def count_slots(slots: Iterable[str]) -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+    for slot in slots:
+        counts[slot] = counts.get(slot, 0) + 1
+    return counts
+
+
+def draft_targets(slots: Iterable[str]) -> Dict[str, int]:
+    """Recommended number of players to draft per position (same rule as `draftTargets`)."""
+    counts = count_slots(slots)
+    flex = counts.get("FLEX", 0)
+    return {
+        "QB": counts.get("QB", 0) + (1 if counts.get("SUPER_FLEX") else 0) + 1,
+        "RB": counts.get("RB", 0) + (flex + 1) // 2 + 1,
+        "WR": counts.get("WR", 0) + (flex + 1) // 2 + 1,
+        "TE": counts.get("TE", 0) + 1,
+        "K": counts.get("K", 0) or 1,
+        "DEF": counts.get("DEF", 0) or 1,
+    }
+
+
+def starter_demand(slots: Iterable[str], league_size: int) -> Dict[str, float]:
+    """Total starters per position across the league; flex slots split fractionally."""
+    demand: Dict[str, float] = {pos: 0.0 for pos in POSITIONS}
+    for slot in slots:
+        eligible = SLOT_ELIGIBLE.get(slot)
+        if not eligible:
+            continue
+        if len(eligible) == 1:
+            demand[eligible[0]] += league_size
+            continue
+        weights = _FLEX_WEIGHTS.get(slot, {})
+        for pos in eligible:
+            demand[pos] += league_size * weights.get(pos, 1 / len(eligible))
+    return demand
+
+
+def replacement_levels(
+    players: Iterable[Dict[str, Any]],
+    slots: Iterable[str],
+    league_size: int,
+    points_key: str = "fantasyPoints",
+) -> Dict[str, float]:
+    """Points scored by the first player outside each position's league-wide starter pool."""
+    demand = starter_demand(list(slots), league_size)
+    by_pos: Dict[str, List[float]] = {pos: [] for pos in POSITIONS}
+    for p in players:
+        pts = p.get(points_key)
+        if p.get("position") in by_pos and isinstance(pts, (int, float)):
+            by_pos[p["position"]].append(float(pts))
+    levels: Dict[str, float] = {}
+    for pos, pts in by_pos.items():
+        pts.sort(reverse=True)
+        idx = min(int(round(demand.get(pos, 0))), len(pts) - 1)
+        levels[pos] = pts[idx] if idx >= 0 else 0.0
+    return levels
+
+
+def optimal_lineup(
+    players: Iterable[Dict[str, Any]],
+    slots: Iterable[str],
+    points_key: str = "fantasyPoints",
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Greedy best lineup: restrictive slots first, each takes the highest scorer still
+    available (same as `buildOptimalLineup`). Returns one entry per slot, in slot order.
+    """
+    slots = list(slots)
+    ranked = sorted(players, key=lambda p: p.get(points_key) or 0, reverse=True)
+    filled: List[Optional[Dict[str, Any]]] = [None] * len(slots)
+    used: set[str] = set()
+    order = sorted(range(len(slots)), key=lambda i: SLOT_PRIORITY.get(slots[i], 0))
+    for i in order:
+        eligible = SLOT_ELIGIBLE.get(slots[i], [])
+        for p in ranked:
+            pid = str(p.get("id"))
+            if pid not in used and p.get("position") in eligible:
+                used.add(pid)
+                filled[i] = p
+                break
+    return filled
+
+
+def lineup_points(
+    players: Iterable[Dict[str, Any]],
+    slots: Iterable[str],
+    points_key: str = "fantasyPoints",
+) -> float:
+    return sum((p.get(points_key) or 0) for p in optimal_lineup(players, slots, points_key) if p)
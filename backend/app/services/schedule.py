@@ -0,0 +1,118 @@
+"""
+NFL schedule index: (team, week) -> opponent.
+
+Built from Sleeper's season schedule feed when it is reachable, otherwise from the
+built-in 2025 table (the same one `lib/player-utils.ts` ships as NFL_SCHEDULE_2025).
+Team codes are normalized to Sleeper's (WAS, not WSH).
+"""
+from typing import Any, Dict, List, Optional
+
+_ALIASES = {"WSH": "WAS", "JAC": "JAX", "LA": "LAR", "OAK": "LV", "SD": "LAC"}
+
+# team -> space-separated opponents for weeks 1..18 ("@" = away, BYE = bye week)
+_FALLBACK_2025: Dict[str, str] = {
+    "ARI": "@NO CAR @SF SEA TEN @IND GB BYE @DAL @SEA SF JAX @TB LAR @HOU ATL @CIN @LAR",
+    "ATL": "TB @MIN @CAR WSH BYE BUF @SF MIA @NE @IND CAR @NO @NYJ SEA @TB @ARI LAR NO",
+    "BAL": "@BUF CLE DET @KC HOU LAR BYE CHI @MIA @MIN @CLE NYJ CIN PIT @CIN NE @GB @PIT",
+    "BUF": "BAL @NYJ MIA NO NE @ATL BYE @CAR KC @MIA TB @HOU @PIT CIN @NE @CLE PHI NYJ",
+    "CAR": "@JAX @ARI ATL @NE MIA DAL @NYJ BUF @GB NO @ATL @SF LAR BYE @NO TB SEA @TB",
+    "CHI": "MIN @DET DAL @LV BYE @WSH NO @BAL @CIN NYG @MIN PIT @PHI @GB CLE GB @SF DET",
+    "CIN": "@CLE JAX @MIN @DEN DET @GB PIT NYJ CHI BYE @PIT NE @BAL @BUF BAL @MIA ARI CLE",
+    "CLE": "CIN @BAL GB @DET MIN @PIT MIA @NE BYE @NYJ BAL @LV SF TEN @CHI BUF PIT @CIN",
+    "DAL": "@PHI NYG @CHI GB @NYJ @CAR WSH @DEN ARI BYE @LV PHI KC @DET MIN LAC @WSH @NYG",
+    "DEN": "TEN @IND @LAC CIN @PHI @NYJ NYG DAL @HOU LV KC BYE @WSH @LV GB JAX @KC LAC",
+    "DET": "@GB CHI @BAL CLE @CIN @KC TB BYE MIN @WSH @PHI NYG GB DAL @LAR PIT @MIN @CHI",
+    "GB": "DET WSH @CLE @DAL BYE CIN @ARI @PIT CAR PHI @NYG MIN @DET CHI @DEN @CHI BAL @MIN",
+    "HOU": "@LAR TB @JAX TEN @BAL BYE @SEA SF DEN JAX @TEN BUF @IND @KC ARI LV @LAC IND",
+    "IND": "MIA DEN @TEN @LAR LV ARI @LAC TEN @PIT ATL BYE @KC HOU @JAX @SEA SF JAX @HOU",
+    "JAX": "CAR @CIN HOU @SF KC SEA LAR BYE @LV @HOU LAC @ARI @TEN IND NYJ @DEN @IND TEN",
+    "KC": "@LAC PHI @NYG BAL @JAX DET LV WSH @BUF BYE @DEN IND @DAL HOU LAC @TEN DEN @LV",
+    "LV": "@NE LAC @WSH CHI @IND TEN @KC BYE JAX @DEN DAL CLE @LAC DEN @PHI @HOU NYG KC",
+    "LAR": "HOU @TEN @PHI IND SF @BAL @JAX BYE NO @SF SEA TB @CAR @ARI DET @SEA @ATL ARI",
+    "LAC": "KC @LV DEN @NYG WSH @MIA IND MIN @TEN PIT @JAX BYE LV PHI @KC @DAL HOU @DEN",
+    "MIA": "@IND NE @BUF NYJ @CAR LAC @CLE @ATL BAL BUF WSH BYE NO @NYJ @PIT CIN TB @NE",
+    "MIN": "@CHI ATL CIN @PIT @CLE BYE PHI @LAC @DET BAL CHI @GB @SEA WSH @DAL @NYG DET GB",
+    "NE": "LV @MIA PIT CAR @BUF @NO @TEN CLE ATL @TB NYJ @CIN NYG BYE BUF @BAL @NYJ MIA",
+    "NO": "ARI SF @SEA @BUF NYG NE @CHI TB @LAR @CAR BYE ATL @MIA @TB CAR NYJ @TEN @ATL",
+    "NYG": "@WSH @DAL KC LAC @NO PHI @DEN @PHI SF @CHI GB @DET @NE BYE WSH MIN @LV DAL",
+    "NYJ": "PIT BUF @TB @MIA DAL DEN CAR @CIN BYE CLE @NE @BAL ATL MIA @JAX @NO NE @BUF",
+    "PHI": "DAL @KC LAR @TB DEN @NYG @MIN NYG BYE @GB DET @DAL CHI @LAC LV @WSH @BUF WSH",
+    "PIT": "@NYJ SEA @NE MIN BYE CLE @CIN GB IND @LAC CIN @CHI BUF @BAL MIA @DET @CLE BAL",
+    "SF": "@SEA @NO ARI JAX @LAR @TB ATL @HOU @NYG LAR @ARI CAR @CLE BYE TEN @IND CHI SEA",
+    "SEA": "SF @PIT NO @ARI TB @JAX HOU BYE @WSH ARI @LAR @TEN MIN @ATL IND LAR @CAR @SF",
+    "TB": "@ATL @HOU NYJ PHI @SEA SF @DET @NO BYE NE @BUF @LAR ARI NO ATL @CAR @MIA CAR",
+    "TEN": "@DEN LAR IND @HOU @ARI @LV NE @IND LAC BYE HOU SEA JAX @CLE @SF KC NO @JAX",
+    "WAS": "NYG @GB LV @ATL @LAC CHI @DAL @KC SEA DET @MIA BYE DEN @MIN @NYG PHI DAL @PHI",
+}
+
+
+def normalize_team(code: Optional[str]) -> str:
+    code = (code or "").strip().upper()
+    return _ALIASES.get(code, code)
+
+
+class ScheduleIndex:
+    """Opponent and home/away lookup for every (team, week) of one season."""
+
+    def __init__(self, season: int, games: Dict[str, List[Optional[str]]]):
+        self.season = season
+        # team -> list indexed by week-1 of "OPP" / "@OPP" / None (bye)
+        self.games = games
+
+    def opponent(self, team: str, week: int) -> Optional[str]:
+        """Opponent code for `team` in `week`, or None on a bye / unknown team."""
+        slot = self._slot(team, week)
+        return slot.lstrip("@") if slot else None
+
+    def is_home(self, team: str, week: int) -> Optional[bool]:
+        slot = self._slot(team, week)
+        return None if slot is None else not slot.startswith("@")
+
+    def bye_week(self, team: str) -> Optional[int]:
+        weeks = self.games.get(normalize_team(team)) or []
+        for i, slot in enumerate(weeks):
+            if slot is None:
+                return i + 1
+        return None
+
+    def _slot(self, team: str, week: int) -> Optional[str]:
+        weeks = self.games.get(normalize_team(team))
+        if not weeks or week < 1 or week > len(weeks):
+            return None
+        return weeks[week - 1]
+
+    def as_dict(self) -> Dict[str, List[Optional[str]]]:
+        return {team: list(weeks) for team, weeks in self.games.items()}
+
+
+def from_sleeper(season: int, rows: Any, weeks: int = 18) -> Optional[ScheduleIndex]:
+    """Build from Sleeper's `schedule/nfl/regular/{season}` rows ({week, home, away})."""
+    if not isinstance(rows, list) or not rows:
+        return None
+    games: Dict[str, List[Optional[str]]] = {}
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        try:
+            week = int(row.get("week"))
+        except (TypeError, ValueError):
+            continue
+        home, away = normalize_team(row.get("home")), normalize_team(row.get("away"))
+        if not home or not away or week < 1 or week > weeks:
+            continue
+        games.setdefault(home, [None] * weeks)[week - 1] = away
+        games.setdefault(away, [None] * weeks)[week - 1] = f"@{home}"
+    return ScheduleIndex(season, games) if games else None
+
+
+def fallback(season: int) -> Optional[ScheduleIndex]:
+    """Built-in table; only the 2025 season is bundled."""
+    if season != 2025:
+        return None
+    games: Dict[str, List[Optional[str]]] = {}
+    for team, opps in _FALLBACK_2025.items():
+        games[normalize_team(team)] = [
+            None if o == "BYE" else ("@" if o.startswith("@") else "") + normalize_team(o.lstrip("@"))
+            for o in opps.split()
+        ]
+    return ScheduleIndex(season, games)
@@ -0,0 +1,53 @@
+"""
+Fantasy scoring profiles expressed as weights over Sleeper stat keys.
+
+Named profiles are standard Sleeper-style scoring: besides yardage, touchdowns and
+receptions they count interceptions, lost fumbles, two-point conversions and
+kicking. A league's Sleeper `scoring_settings` dict uses the same stat keys, so it
+can be passed straight through as a custom profile.
+
+These weights drive the projection, game log and analytics endpoints. `/players`
+(`player_rows.build_players`) keeps its own season-summary formula: whole-number
+stat counts, no fumble, two-point or kicker terms, rounded to one decimal. The
+two can differ by a few points for the same stat line.
+"""
+from typing import Any, Dict, Optional
+
+_BASE: Dict[str, float] = {
+    "pass_yd": 0.04,
+    "pass_td": 4.0,
+    "pass_int": -2.0,
+    "pass_2pt": 2.0,
+    "rush_yd": 0.1,
+    "rush_td": 6.0,
+    "rush_2pt": 2.0,
+    "rec_yd": 0.1,
+    "rec_td": 6.0,
+    "rec_2pt": 2.0,
+    "fum_lost": -2.0,
+    "fgm": 3.0,
+    "xpm": 1.0,
+}
+
+SCORING_PROFILES: Dict[str, Dict[str, float]] = {
+    "ppr": {**_BASE, "rec": 1.0},
+    "half_ppr": {**_BASE, "rec": 0.5},
+    "standard": {**_BASE, "rec": 0.0},
+}
+
+
+def resolve_profile(scoring: str = "ppr", custom: Optional[Dict[str, Any]] = None) -> Dict[str, float]:
+    """Return stat weights for a named profile, or the numeric entries of a custom dict."""
+    if custom:
+        return {k: float(v) for k, v in custom.items() if isinstance(v, (int, float)) and not isinstance(v, bool)}
+    return SCORING_PROFILES.get(scoring, SCORING_PROFILES["ppr"])
+
+
+def score_stats(stats: Dict[str, Any], weights: Dict[str, float]) -> float:
+    """Fantasy points for one stat line under `weights`."""
+    total = 0.0
+    for key, w in weights.items():
+        v = stats.get(key)
+        if isinstance(v, (int, float)):
+            total += v * w
+    return round(total, 2)
@@ -0,0 +1,151 @@
+"""
+Declarative stat-field mapping for upstream season stat feeds.
+
+Providers name the same stat differently: Sleeper uses `pass_att`, older dumps
+`att` or a nested `passing.att`, and ESPN numeric stat ids such as "0". Each
+canonical field below lists its candidate paths by provider, in priority order.
+
+`compile_extractor` looks at a fetched feed once, keeps only the paths that feed
+actually carries and generates one function that reads every field straight
+from them. Per-player cost then no longer grows with the number of declared
+alternatives, and a new provider is another column of paths rather than another
+fallback chain in the row builder.
+"""
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+# Field kinds: a COUNT is the first truthy value as int (0 when absent); an
+# OPTIONAL is the first non-null value as int, or None when no path has one.
+COUNT = "count"
+OPTIONAL = "optional"
+
+# Priority when a feed carries several layouts at once
+PROVIDERS = ("sleeper", "legacy", "espn")
+
+
+class StatField(NamedTuple):
+    name: str
+    kind: str
+    sleeper: Tuple[str, ...] = ()
+    legacy: Tuple[str, ...] = ()
+    # ESPN fantasy stat ids (as the string keys of a player's `stats` map)
+    espn: Tuple[str, ...] = ()
+
+    @property
+    def paths(self) -> Tuple[str, ...]:
+        return tuple(p for provider in PROVIDERS for p in getattr(self, provider))
+
+
+STAT_FIELDS: Tuple[StatField, ...] = (
+    StatField("passYds", COUNT, sleeper=("pass_yd",), espn=("3",)),
+    StatField("passTD", COUNT, sleeper=("pass_td",), espn=("4",)),
+    StatField("rushYds", COUNT, sleeper=("rush_yd",), espn=("24",)),
+    StatField("rushTD", COUNT, sleeper=("rush_td",), espn=("25",)),
+    StatField("recYds", COUNT, sleeper=("rec_yd",), espn=("42",)),
+    StatField("recTD", COUNT, sleeper=("rec_td",), espn=("43",)),
+    StatField("receptions", COUNT, sleeper=("rec",), espn=("53",)),
+    StatField("targets", OPTIONAL, sleeper=("rec_tgt",), legacy=("targets", "receiving.targets"), espn=("58",)),
+    StatField("fumbles", COUNT, sleeper=("fum",), espn=("68",)),
+    StatField("interceptions", COUNT, sleeper=("int",), espn=("20",)),
+    StatField("sacks", COUNT, sleeper=("sack",), espn=("99",)),
+    StatField("rushAtt", COUNT, sleeper=("rush_att",), legacy=("rushing_att", "rush_attempts"), espn=("23",)),
+    StatField(
+        "pass_att",
+        OPTIONAL,
+        sleeper=("pass_att",),
+        legacy=("att", "attempts", "passing.att", "passing.attempts", "pass.att"),
+        espn=("0",),
+    ),
+    StatField(
+        "pass_cmp",
+        OPTIONAL,
+        sleeper=("pass_cmp",),
+        legacy=("cmp", "completions", "passing.cmp", "passing.completions", "pass.cmp"),
+        espn=("1",),
+    ),
+)
+
+
+def to_opt_int(v: Any) -> Optional[int]:
+    try:
+        if v is None:
+            return None
+        if isinstance(v, bool):
+            return int(v)
+        if isinstance(v, (int, float)):
+            return int(v)
+        s = str(v).strip()
+        if s == "" or s.lower() == "na" or s == "-":
+            return None
+        return int(float(s))
+    except Exception:
+        return None
+
+
+def _coalesce(*vals: Any) -> Any:
+    for v in vals:
+        if v is not None:
+            return v
+    return None
+
+
+def _path(obj: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    cur: Any = obj
+    for k in keys:
+        if not isinstance(cur, dict):
+            return None
+        cur = cur.get(k)
+    return cur
+
+
+def detect_layout(rows: Iterable[Any], fields: Iterable[StatField] = STAT_FIELDS) -> Set[str]:
+    """Every declared path that at least one row of the feed carries."""
+    fields = list(fields)
+    parents = {p.split(".", 1)[0] for f in fields for p in f.paths if "." in p}
+    present: Set[str] = set()
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        present.update(row)
+        for parent in parents.intersection(row):
+            sub = row[parent]
+            if isinstance(sub, dict):
+                present.update(f"{parent}.{k}" for k in sub)
+    return {p for f in fields for p in f.paths if p in present}
+
+
+def _read(path: str) -> str:
+    if "." not in path:
+        return f"get({path!r})"
+    return f"_path(stat, {tuple(path.split('.'))!r})"
+
+
+def compile_extractor(
+    rows: Iterable[Any], fields: Iterable[StatField] = STAT_FIELDS
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Extractor for this feed: stat row -> {field name: value}. Paths the feed never
+    carries are dropped up front, which does not change any result: a missing path
+    is null, and nulls are skipped either way.
+    """
+    fields = list(fields)
+    layout = detect_layout(rows, fields)
+    used: Dict[str, List[str]] = {}
+    lines = ["def extract(stat):", "    get = stat.get", "    return {"]
+    for f in fields:
+        paths = [p for p in f.paths if p in layout]
+        used[f.name] = paths
+        reads = [_read(p) for p in paths]
+        if f.kind == COUNT:
+            expr = f"int({' or '.join(reads + ['0'])})" if reads else "0"
+        elif len(reads) == 1:
+            expr = f"to_opt_int({reads[0]})"
+        else:
+            expr = f"to_opt_int(_coalesce({', '.join(reads)}))" if reads else "None"
+        lines.append(f"        {f.name!r}: {expr},")
+    lines.append("    }")
+    # Generated once per feed; the paths are declared above and quoted with repr()
+    namespace: Dict[str, Any] = {"to_opt_int": to_opt_int, "_coalesce": _coalesce, "_path": _path}
+    exec("\n".join(lines), namespace)
+    extract = namespace["extract"]
+    extract.paths = used
+    return extract
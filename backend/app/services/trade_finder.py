@@ -0,0 +1,163 @@
+"""
+League-wide trade finder.
+
+Enumerates 1-for-1, 2-for-1, 1-for-2 and 2-for-2 trades between one roster and
+every other roster, scores each side by the change in its optimal starting
+lineup (same greedy fill as `optimal_lineup` / `calculateLineupDelta`) and keeps
+the top-K trades that improve both lineups.
+
+Search is branch-and-bound on a maximin score, min(my gain, their gain):
+
+- adding players can only raise a lineup and removing can only lower it, so what
+  a side gains from a trade is at most what it would gain from receiving the
+  incoming players for free;
+- incoming sets are visited in descending order of that free gain, so once it
+  drops to the current K-th best score the rest of the loop is skipped.
+
+Each opponent is searched in its own task on the CPU pool (cpu_pool.py); workers
+only get (position, value) pairs, so task payloads stay small.
+"""
+import heapq
+from itertools import combinations
+from typing import Any, Dict, List, Sequence, Tuple
+
+from app.services import cpu_pool
+from app.services.roster_utils import SLOT_ELIGIBLE, SLOT_PRIORITY
+
+TRADE_POSITIONS = ("QB", "RB", "WR", "TE")
+# Trade candidates per roster (by value); deep bench players never move a lineup
+MAX_CANDIDATES = 14
+
+Roster = Dict[str, Tuple[str, float]]  # player_id -> (position, value)
+Trade = Tuple[float, float, float, Tuple[str, ...], Tuple[str, ...]]  # (score, mine, theirs, give, get)
+
+
+def _slot_plan(slots: Sequence[str]) -> List[Tuple[str, ...]]:
+    """Eligible positions per starter slot, most restrictive first."""
+    ordered = sorted((s for s in slots if s in SLOT_ELIGIBLE), key=lambda s: SLOT_PRIORITY.get(s, 0))
+    return [tuple(SLOT_ELIGIBLE[s]) for s in ordered]
+
+
+def _by_position(roster: Roster) -> Dict[str, List[float]]:
+    out: Dict[str, List[float]] = {}
+    for pos, value in roster.values():
+        out.setdefault(pos, []).append(value)
+    for values in out.values():
+        values.sort(reverse=True)
+    return out
+
+
+def lineup_value(by_pos: Dict[str, List[float]], plan: List[Tuple[str, ...]]) -> float:
+    """Greedy lineup total: each slot takes the best remaining eligible player."""
+    taken: Dict[str, int] = {}
+    total = 0.0
+    for eligible in plan:
+        best_pos, best = None, 0.0
+        for pos in eligible:
+            values = by_pos.get(pos)
+            i = taken.get(pos, 0)
+            if values and i < len(values) and (best_pos is None or values[i] > best):
+                best_pos, best = pos, values[i]
+        if best_pos is not None:
+            total += best
+            taken[best_pos] = taken.get(best_pos, 0) + 1
+    return total
+
+
+def _apply(
+    by_pos: Dict[str, List[float]], out: Sequence[Tuple[str, float]], incoming: Sequence[Tuple[str, float]]
+) -> Dict[str, List[float]]:
+    """Copy of `by_pos` with `out` removed and `incoming` added (only touched positions are copied)."""
+    changed = dict(by_pos)
+    for pos in {p for p, _ in out} | {p for p, _ in incoming}:
+        values = list(by_pos.get(pos, ()))
+        for p, v in out:
+            if p == pos:
+                values.remove(v)
+        values.extend(v for p, v in incoming if p == pos)
+        values.sort(reverse=True)
+        changed[pos] = values
+    return changed
+
+
+def _candidates(roster: Roster) -> List[str]:
+    ids = [pid for pid, (pos, value) in roster.items() if pos in TRADE_POSITIONS and value > 0]
+    ids.sort(key=lambda pid: roster[pid][1], reverse=True)
+    return ids[:MAX_CANDIDATES]
+
+
+def _groups(ids: List[str], max_size: int) -> List[Tuple[str, ...]]:
+    out: List[Tuple[str, ...]] = []
+    for size in range(1, max_size + 1):
+        out.extend(combinations(ids, size))
+    return out
+
+
+def search_pair(
+    mine: Roster, theirs: Roster, slots: Sequence[str], top_k: int = 10, max_size: int = 2, min_gain: float = 0.0
+) -> List[Trade]:
+    """Top-K win-win trades between two rosters, best first."""
+    plan = _slot_plan(slots)
+    my_pos, their_pos = _by_position(mine), _by_position(theirs)
+    my_base, their_base = lineup_value(my_pos, plan), lineup_value(their_pos, plan)
+
+    def free_gain(by_pos: Dict[str, List[float]], base: float, roster: Roster, ids: Tuple[str, ...]) -> float:
+        return lineup_value(_apply(by_pos, (), [roster[pid] for pid in ids]), plan) - base
+
+    # What each side would gain from the other's players for nothing: the upper bound.
+    gets = [(free_gain(my_pos, my_base, theirs, g), g) for g in _groups(_candidates(theirs), max_size)]
+    gives = [(free_gain(their_pos, their_base, mine, g), g) for g in _groups(_candidates(mine), max_size)]
+    gets = sorted((x for x in gets if x[0] > min_gain), reverse=True)
+    gives = sorted((x for x in gives if x[0] > min_gain), reverse=True)
+
+    heap: List[Trade] = []  # min-heap on score, size <= top_k
+    for give_bound, give in gives:
+        floor = heap[0][0] if len(heap) >= top_k else min_gain
+        if give_bound <= floor:
+            break
+        give_players = [mine[pid] for pid in give]
+        my_after_give = _apply(my_pos, give_players, ())
+        their_after_get = _apply(their_pos, (), give_players)
+        for get_bound, get in gets:
+            floor = heap[0][0] if len(heap) >= top_k else min_gain
+            if get_bound <= floor:
+                break
+            get_players = [theirs[pid] for pid in get]
+            my_gain = lineup_value(_apply(my_after_give, (), get_players), plan) - my_base
+            if my_gain <= floor:
+                continue
+            their_gain = lineup_value(_apply(their_after_get, get_players, ()), plan) - their_base
+            score = min(my_gain, their_gain)
+            if score <= floor:
+                continue
+            trade = (score, my_gain, their_gain, give, get)
+            if len(heap) < top_k:
+                heapq.heappush(heap, trade)
+            else:
+                heapq.heapreplace(heap, trade)
+    return sorted(heap, reverse=True)
+
+
+def _search_task(args: Tuple[Any, ...]) -> Tuple[Any, List[Trade]]:
+    roster_id, mine, theirs, slots, top_k, max_size, min_gain = args
+    return roster_id, search_pair(mine, theirs, slots, top_k, max_size, min_gain)
+
+
+def find_trades(
+    mine: Roster,
+    others: Dict[Any, Roster],
+    slots: Sequence[str],
+    top_k: int = 10,
+    max_size: int = 2,
+    min_gain: float = 0.0,
+    parallel: bool = True,
+) -> List[Tuple[Any, Trade]]:
+    """Best win-win trades with every other roster: [(roster_id, trade)], best first."""
+    tasks = [(rid, mine, theirs, list(slots), top_k, max_size, min_gain) for rid, theirs in others.items()]
+    if parallel and len(tasks) > 1:
+        results = cpu_pool.run_many("trade_finder", _search_task, tasks)
+    else:
+        results = [_search_task(t) for t in tasks]
+    merged = [(rid, trade) for rid, trades in results for trade in trades]
+    merged.sort(key=lambda x: (x[1][0], x[1][1]), reverse=True)
+    return merged[:top_k]
@@ -0,0 +1,162 @@
+"""
+Shared Sleeper trending add/drop data.
+
+One background poller fetches trending adds and drops on a fixed interval. Each
+poll's per-player counts go into a ring buffer (player x sample) per kind, so
+`/sleeper/trending/*` is served from memory and every caller shares the same
+upstream request. The same buffer yields velocity and acceleration of a
+player's count, which is the "rising fast" signal.
+"""
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+KINDS = ("add", "drop")
+POLL_LOOKBACK_HOURS = 24
+POLL_LIMIT = 200
+
+_TRENDING_URL = "https://api.sleeper.app/v1/players/nfl/trending/{kind}?lookback_hours={lookback}&limit={limit}"
+
+Fetch = Callable[[str], Any]
+
+
+class TrendingSeries:
+    """Ring buffer of trending counts: rows are players, columns are poll samples."""
+
+    def __init__(self, samples: int = 96):
+        self.samples = samples
+        self.counts = np.zeros((0, samples), dtype=np.int32)
+        self.ts = np.zeros(samples, dtype=np.float64)
+        self.head = 0  # next column to write
+        self.filled = 0
+        self.player_ids: List[str] = []
+        self._idx: Dict[str, int] = {}
+        self.latest: List[Dict[str, Any]] = []  # last raw payload, in Sleeper's order
+
+    def record(self, rows: List[Dict[str, Any]], now: Optional[float] = None) -> None:
+        for r in rows:
+            pid = str(r.get("player_id"))
+            if pid not in self._idx:
+                self._idx[pid] = len(self.player_ids)
+                self.player_ids.append(pid)
+        if len(self.player_ids) > self.counts.shape[0]:
+            grown = np.zeros((max(len(self.player_ids), self.counts.shape[0] * 2), self.samples), dtype=np.int32)
+            grown[: self.counts.shape[0]] = self.counts
+            self.counts = grown
+        col = self.counts[:, self.head]
+        col[:] = 0
+        for r in rows:
+            col[self._idx[str(r.get("player_id"))]] = int(r.get("count") or 0)
+        self.ts[self.head] = now or time.time()
+        self.head = (self.head + 1) % self.samples
+        self.filled = min(self.filled + 1, self.samples)
+        self.latest = rows
+
+    def _column_back(self, steps: int) -> int:
+        """Column index `steps` polls before the most recent one."""
+        return (self.head - 1 - steps) % self.samples
+
+    def _steps_for(self, seconds: float) -> int:
+        """How many samples back to reach at least `seconds` before the latest sample."""
+        if self.filled < 2:
+            return 0
+        newest = self.ts[self._column_back(0)]
+        for steps in range(1, self.filled):
+            if newest - self.ts[self._column_back(steps)] >= seconds:
+                return steps
+        return self.filled - 1
+
+    def history(self, player_id: str) -> List[Dict[str, Any]]:
+        i = self._idx.get(str(player_id))
+        out = []
+        for steps in range(self.filled - 1, -1, -1):
+            col = self._column_back(steps)
+            out.append({"ts": float(self.ts[col]), "count": int(self.counts[i, col]) if i is not None else 0})
+        return out
+
+    def movers(self, window_seconds: float = 3600, limit: int = 25) -> List[Dict[str, Any]]:
+        """
+        Players ranked by velocity (count change per hour over the window), with
+        acceleration (velocity change per hour versus the previous window).
+        """
+        n = len(self.player_ids)
+        steps = self._steps_for(window_seconds)
+        if n == 0 or steps == 0:
+            return []
+        c0, c1 = self._column_back(0), self._column_back(steps)
+        hours = max((self.ts[c0] - self.ts[c1]) / 3600.0, 1e-9)
+        now_counts = self.counts[:n, c0].astype(np.float64)
+        velocity = (now_counts - self.counts[:n, c1]) / hours
+        acceleration = np.zeros(n)
+        if 2 * steps < self.filled:
+            c2 = self._column_back(2 * steps)
+            prev_hours = max((self.ts[c1] - self.ts[c2]) / 3600.0, 1e-9)
+            prev_velocity = (self.counts[:n, c1].astype(np.float64) - self.counts[:n, c2]) / prev_hours
+            acceleration = (velocity - prev_velocity) / hours
+        order = np.argsort(-velocity)[:limit]
+        return [
+            {
+                "player_id": self.player_ids[i],
+                "count": int(now_counts[i]),
+                "velocity": round(float(velocity[i]), 2),
+                "acceleration": round(float(acceleration[i]), 2),
+            }
+            for i in order
+            if velocity[i] > 0
+        ]
+
+
+class TrendingPoller:
+    """Polls Sleeper trending adds/drops on a daemon thread and owns one series per kind."""
+
+    def __init__(self, fetch: Fetch, interval: float = 900, samples: int = 96):
+        self.fetch = fetch
+        self.interval = interval
+        self.series = {kind: TrendingSeries(samples) for kind in KINDS}
+        self.last_poll = 0.0
+        self.lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def poll(self) -> None:
+        now = time.time()
+        for kind in KINDS:
+            url = _TRENDING_URL.format(kind=kind, lookback=POLL_LOOKBACK_HOURS, limit=POLL_LIMIT)
+            rows = self.fetch(url)
+            if not isinstance(rows, list):
+                continue
+            rows = [r for r in rows if isinstance(r, dict) and r.get("player_id")]
+            with self.lock:
+                self.series[kind].record(rows, now)
+        self.last_poll = now
+
+    def ensure_fresh(self) -> None:
+        """Start the poller on first use; poll inline if data is missing or overdue."""
+        with self._poll_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="trending-poller", daemon=True)
+                self._thread.start()
+            # Concurrent first callers wait here and reuse the one inline poll.
+            if time.time() - self.last_poll > self.interval * 2:
+                self.poll()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                with self._poll_lock:
+                    self.poll()
+            except Exception as e:
+                logger.warning(f"Trending poll failed: {e}")
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def top(self, kind: str, limit: int) -> List[Dict[str, Any]]:
+        with self.lock:
+            return list(self.series[kind].latest[:limit])
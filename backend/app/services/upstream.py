@@ -0,0 +1,228 @@
+"""
+Upstream traffic control for Sleeper/ESPN calls.
+
+Every outbound GET passes through a per-host `HostGuard`:
+
+- a token bucket shared by all workers in the process, with two lanes: user-facing
+  requests always take a free token before background refreshes do;
+- a circuit breaker that opens when the error rate over the recent call window
+  crosses a threshold, so callers fail fast instead of each waiting out the full
+  timeout. After a cool-down it lets a single probe through (half-open);
+- a last-good-response store, bounded by entries and approximate bytes, so an
+  open breaker or a failed call can still answer with stale data.
+"""
+import contextlib
+import contextvars
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple
+
+from app.services.cache import approx_size
+
+HIGH, LOW = "high", "low"
+
+_priority: contextvars.ContextVar[str] = contextvars.ContextVar("upstream_priority", default=HIGH)
+
+
+@contextlib.contextmanager
+def background() -> Iterator[None]:
+    """Mark upstream calls made inside the block as background (low-priority lane)."""
+    token = _priority.set(LOW)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> str:
+    return _priority.get()
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.cond = threading.Condition()
+        self.waiting = {HIGH: 0, LOW: 0}
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, priority: str = HIGH, timeout: float = 5.0) -> bool:
+        """Take one token, waiting up to `timeout`. Low priority yields to any waiting high."""
+        deadline = time.monotonic() + timeout
+        with self.cond:
+            self.waiting[priority] += 1
+            try:
+                while True:
+                    self._refill()
+                    if self.tokens >= 1 and (priority == HIGH or self.waiting[HIGH] == 0):
+                        self.tokens -= 1
+                        return True
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    wait = (1 - self.tokens) / self.rate if self.tokens < 1 else 0.01
+                    self.cond.wait(min(max(wait, 0.001), remaining))
+            finally:
+                self.waiting[priority] -= 1
+                self.cond.notify_all()
+
+
+class CircuitBreaker:
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, window: int = 20, min_calls: int = 8, failure_ratio: float = 0.5, cooldown: float = 30.0):
+        self.window = window
+        self.min_calls = min_calls
+        self.failure_ratio = failure_ratio
+        self.cooldown = cooldown
+        self.results: Deque[bool] = deque(maxlen=window)
+        self.state = self.CLOSED
+        self.opened_at = 0.0
+        self.opens = 0
+        self.lock = threading.Lock()
+        self._probe_in_flight = False
+        self._probe_started = 0.0
+
+    def allow(self) -> bool:
+        """
+        True when a call may go out. Half-open lets one probe through; its caller must
+        end it with `record()` or, when it never made the call, `release_probe()`.
+        """
+        with self.lock:
+            if self.state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            if self.state == self.OPEN and now - self.opened_at >= self.cooldown:
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            # A probe that never reported back (caller died mid-call) stops blocking after a cool-down
+            if self.state == self.HALF_OPEN and self._probe_in_flight and now - self._probe_started >= self.cooldown:
+                self._probe_in_flight = False
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                self._probe_started = now
+                return True
+            return False
+
+    def release_probe(self) -> None:
+        """Give back a half-open probe slot that was granted but not used (e.g. throttled)."""
+        with self.lock:
+            if self.state == self.HALF_OPEN:
+                self._probe_in_flight = False
+
+    def record(self, ok: bool) -> None:
+        with self.lock:
+            if self.state == self.HALF_OPEN:
+                self._probe_in_flight = False
+                if ok:
+                    self.state = self.CLOSED
+                    self.results.clear()
+                else:
+                    self._open()
+                return
+            self.results.append(ok)
+            failures = self.results.count(False)
+            if len(self.results) >= self.min_calls and failures / len(self.results) >= self.failure_ratio:
+                self._open()
+
+    def _open(self) -> None:
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+        self.opens += 1
+        self.results.clear()
+
+    def error_rate(self) -> float:
+        with self.lock:
+            return self.results.count(False) / len(self.results) if self.results else 0.0
+
+
+# Last-good bytes kept per host; the Sleeper players feed alone is tens of MB parsed
+_STALE_MAX_BYTES = int(float(os.environ.get("UPSTREAM_STALE_MB", 128)) * 1024 * 1024)
+
+
+class HostGuard:
+    def __init__(
+        self, host: str, rate: float, burst: int, stale_entries: int = 256, stale_bytes: int = _STALE_MAX_BYTES
+    ):
+        self.host = host
+        self.limiter = TokenBucket(rate, burst)
+        self.breaker = CircuitBreaker()
+        self.stale_entries = stale_entries
+        self.stale_bytes = stale_bytes
+        # url -> (data, approximate bytes), least recently stored first
+        self._stale: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._stale_size = 0
+        self._stale_lock = threading.Lock()
+        self.counters = {"ok": 0, "error": 0, "rejected": 0, "throttled": 0, "stale_served": 0}
+
+    def remember(self, url: str, data: Any) -> None:
+        size = len(data) if isinstance(data, (bytes, bytearray)) else approx_size(data)
+        with self._stale_lock:
+            old = self._stale.pop(url, None)
+            if old is not None:
+                self._stale_size -= old[1]
+            if size > self.stale_bytes:
+                return
+            self._stale[url] = (data, size)
+            self._stale_size += size
+            while len(self._stale) > self.stale_entries or self._stale_size > self.stale_bytes:
+                self._stale_size -= self._stale.popitem(last=False)[1][1]
+
+    def forget_all(self) -> None:
+        with self._stale_lock:
+            self._stale.clear()
+            self._stale_size = 0
+
+    def stale(self, url: str) -> Optional[Any]:
+        with self._stale_lock:
+            entry = self._stale.get(url)
+        data = entry[0] if entry is not None else None
+        if data is not None:
+            self.counters["stale_served"] += 1
+        return data
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "breaker": self.breaker.state,
+            "breaker_opens": self.breaker.opens,
+            "error_rate": round(self.breaker.error_rate(), 3),
+            "queue_depth": dict(self.limiter.waiting),
+            "tokens": round(self.limiter.tokens, 2),
+            "stale_entries": len(self._stale),
+            "stale_bytes": self._stale_size,
+            **self.counters,
+        }
+
+
+# Requests/second and burst per host. Sleeper asks clients to stay under 1000 calls/minute.
+_HOST_LIMITS = {
+    "api.sleeper.app": (15.0, 30),
+    "lm-api-reads.fantasy.espn.com": (5.0, 10),
+}
+_DEFAULT_LIMIT = (10.0, 20)
+
+_guards: Dict[str, HostGuard] = {}
+_guards_lock = threading.Lock()
+
+
+def guard_for(host: str, rate: Optional[float] = None, burst: Optional[int] = None) -> HostGuard:
+    with _guards_lock:
+        guard = _guards.get(host)
+        if guard is None:
+            default_rate, default_burst = _HOST_LIMITS.get(host, _DEFAULT_LIMIT)
+            guard = _guards[host] = HostGuard(host, rate or default_rate, burst or default_burst)
+        return guard
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    with _guards_lock:
+        guards = list(_guards.values())
+    return {g.host: g.snapshot() for g in guards}
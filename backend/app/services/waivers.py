@@ -0,0 +1,87 @@
+"""
+Free-agent pools and waiver rankings per league.
+
+A league's rostered set is the union of every roster's `players` (plus taxi/reserve);
+the free-agent pool is its complement against the `/players` payload. Ranking
+blends projected points, Sleeper trending-add volume and the requesting roster's
+positional need, and the result is kept pre-sorted so a page is a slice.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.services.roster_utils import POSITIONS, draft_targets
+
+# Share of a player's projected points added at the league's hottest trending level
+TRENDING_BOOST = 0.5
+NEED_WEIGHT = 1.25
+
+
+def rostered_ids(rosters: Iterable[Any]) -> Tuple[set, Dict[int, List[str]]]:
+    """(every rostered player id, roster_id -> player ids) from Sleeper `/rosters`."""
+    rostered: set[str] = set()
+    by_roster: Dict[int, List[str]] = {}
+    for r in rosters or []:
+        if not isinstance(r, dict):
+            continue
+        ids: List[str] = []
+        for key in ("players", "taxi", "reserve"):
+            ids.extend(str(pid) for pid in (r.get(key) or []) if pid and pid != "0")
+        rostered.update(ids)
+        if r.get("roster_id") is not None:
+            by_roster[r["roster_id"]] = ids
+    return rostered, by_roster
+
+
+def need_weights(roster_positions: Iterable[str], slots: Iterable[str]) -> Dict[str, float]:
+    """Boost positions where a roster holds fewer players than `draft_targets` recommends."""
+    targets = draft_targets(slots)
+    have: Dict[str, int] = {pos: 0 for pos in POSITIONS}
+    for pos in roster_positions:
+        if pos in have:
+            have[pos] += 1
+    return {pos: NEED_WEIGHT if have[pos] < targets.get(pos, 0) else 1.0 for pos in POSITIONS}
+
+
+def rank_free_agents(
+    players: Iterable[Dict[str, Any]],
+    rostered: set,
+    projected: Dict[str, float],
+    trending: Dict[str, int],
+    needs: Optional[Dict[str, float]] = None,
+) -> List[Dict[str, Any]]:
+    """Score and sort every unrostered player (descending). `projected` may be empty."""
+    max_trend = max(trending.values(), default=0) or 1
+    rows: List[Dict[str, Any]] = []
+    for p in players:
+        pid = str(p.get("id"))
+        if pid in rostered:
+            continue
+        pos = p.get("position") or ""
+        # Without any projections loaded, fall back to last season's points for everyone
+        proj = projected.get(pid, 0.0) if projected else (p.get("fantasyPoints") or 0.0)
+        adds = trending.get(pid, 0)
+        weight = (needs or {}).get(pos, 1.0)
+        score = proj * weight * (1 + TRENDING_BOOST * adds / max_trend)
+        rows.append(
+            {
+                "id": pid,
+                "name": p.get("name"),
+                "position": pos,
+                "team": p.get("team"),
+                "injury_status": p.get("injury_status"),
+                "adp": p.get("adp"),
+                "projected": round(proj, 1),
+                "trending_adds": adds,
+                "need_weight": weight,
+                "score": round(score, 1),
+            }
+        )
+    rows.sort(key=lambda r: r["score"], reverse=True)
+    return rows
+
+
+def by_position(rows: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Per-position views of an already-sorted ranking (order is preserved)."""
+    views: Dict[str, List[Dict[str, Any]]] = {"ALL": rows}
+    for r in rows:
+        views.setdefault(r["position"], []).append(r)
+    return views
@@ -0,0 +1,395 @@
+"""
+Multi-season stats warehouse.
+
+Sleeper season totals and weekly stat lines are loaded into an indexed SQLite
+database (`settings.DB_URL`) so historical questions (a player's multi-year
+trend, positional distributions for a past season) are answered locally instead
+of through several 30s upstream calls.
+
+One row per (season, week, player); week 0 holds season totals. The raw stat
+line is kept as JSON next to precomputed points for the named scoring profiles,
+so any stat can be aggregated with `json_extract`. Finalized weeks are ingested
+once; the current season's open weeks are refetched on every run. A week whose
+fetch fails is retried with backoff instead of on every run.
+
+Seasons the API has never seen are loaded in the background (the request gets a
+202 meanwhile); to load them ahead of time:
+
+    python -m app.services.warehouse ingest --season 2023 --season 2024
+
+An optional Parquet export (needs `pyarrow`) writes one file per season:
+
+    python -m app.services.warehouse export --out exports/
+"""
+import argparse
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from app.services.projections import REGULAR_SEASON_WEEKS, stat_rows, week_is_final
+from app.services.scoring import SCORING_PROFILES, score_stats
+
+logger = logging.getLogger(__name__)
+
+SEASON_TOTALS = 0
+_STATS_URL = "https://api.sleeper.app/v1/stats/nfl/regular/{season}"
+_WEEK_STATS_URL = "https://api.sleeper.app/v1/stats/nfl/regular/{season}/{week}"
+_POSITIONS = ("QB", "RB", "WR", "TE", "K", "DEF")
+_STAT_KEY = re.compile(r"^[a-z0-9_]+$")
+# Retry delay after a failed week fetch: 1 minute, doubling up to 6 hours
+_RETRY_FIRST = 60.0
+_RETRY_MAX = 6 * 60 * 60.0
+
+FetchMany = Callable[[List[str]], List[Any]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS player_stats (
+    season INTEGER NOT NULL,
+    week INTEGER NOT NULL,
+    player_id TEXT NOT NULL,
+    position TEXT,
+    team TEXT,
+    gp REAL NOT NULL DEFAULT 0,
+    pts_ppr REAL NOT NULL DEFAULT 0,
+    pts_half_ppr REAL NOT NULL DEFAULT 0,
+    pts_standard REAL NOT NULL DEFAULT 0,
+    stats TEXT NOT NULL,
+    PRIMARY KEY (season, week, player_id)
+);
+CREATE INDEX IF NOT EXISTS player_stats_player ON player_stats (player_id, season, week);
+CREATE INDEX IF NOT EXISTS player_stats_position ON player_stats (season, week, position);
+CREATE TABLE IF NOT EXISTS ingested (
+    season INTEGER NOT NULL,
+    week INTEGER NOT NULL,
+    rows INTEGER NOT NULL,
+    final INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (season, week)
+);
+"""
+
+
+def sqlite_path(db_url: str, fallback: str) -> str:
+    """Filesystem path for a `sqlite:///` URL; no URL or another scheme falls back to a local file."""
+    if not db_url:
+        return fallback
+    parts = urlsplit(db_url)
+    if parts.scheme != "sqlite":
+        logger.warning(f"Stats warehouse needs a sqlite:/// DB_URL (got {parts.scheme or 'none'}); using {fallback}")
+        return fallback
+    path = db_url[len("sqlite:///"):] if db_url.startswith("sqlite:///") else parts.path
+    return path or fallback
+
+
+def _parse_stats(blob: str) -> Dict[str, Any]:
+    try:
+        return json.loads(blob)
+    except ValueError:
+        return {}
+
+
+def _quantile(ordered: List[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+class StatsWarehouse:
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self.ingest_lock = threading.Lock()
+        # (season, week) -> (failed attempts, retry at)
+        self._failed: Dict[Tuple[int, int], Tuple[int, float]] = {}
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._write_lock:
+            conn = self._conn()
+            conn.executescript(_SCHEMA)
+            conn.commit()
+
+    def _conn(self) -> sqlite3.Connection:
+        """One connection per thread; WAL lets readers run while an ingest writes."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # ---- ingestion ----
+
+    def ingested(self) -> Dict[Tuple[int, int], Dict[str, Any]]:
+        rows = self._conn().execute("SELECT season, week, rows, final, fetched_at FROM ingested").fetchall()
+        return {(r["season"], r["week"]): dict(r) for r in rows}
+
+    def pending(self, season: int, state_season: int, state_week: int, now: Optional[float] = None) -> List[int]:
+        """Weeks (0 = season totals) not yet stored as final; unplayed and backing-off weeks are skipped."""
+        if season > state_season:
+            return []
+        now = now or time.time()
+        done = self.ingested()
+        weeks = []
+        for w in range(SEASON_TOTALS, REGULAR_SEASON_WEEKS + 1):
+            if (done.get((season, w)) or {}).get("final"):
+                continue
+            if season == state_season and w != SEASON_TOTALS and w >= state_week:
+                continue
+            failed = self._failed.get((season, w))
+            if failed is not None and now < failed[1]:
+                continue
+            weeks.append(w)
+        return weeks
+
+    def retry_at(self, season: int) -> Optional[float]:
+        """When the next failed week of `season` is due again, or None if none failed."""
+        due = [at for (s, _), (_, at) in list(self._failed.items()) if s == season]
+        return min(due) if due else None
+
+    def ingest(
+        self, season: int, week: int, payload: Any, players_meta: Dict[str, Any], final: bool, now: Optional[float] = None
+    ) -> int:
+        """Replace one (season, week) slice. Only fantasy positions are stored."""
+        records = []
+        for pid, stats in stat_rows(payload):
+            meta = players_meta.get(pid) if isinstance(players_meta, dict) else None
+            pos = (meta.get("position") if isinstance(meta, dict) else None) or ("DEF" if pid.isalpha() else None)
+            if pos not in _POSITIONS:
+                continue
+            numeric = {k: v for k, v in stats.items() if isinstance(v, (int, float)) and not isinstance(v, bool)}
+            if not numeric:
+                continue
+            records.append(
+                (
+                    season,
+                    week,
+                    pid,
+                    pos,
+                    (meta.get("team") if isinstance(meta, dict) else None) or (pid if pos == "DEF" else None),
+                    float(numeric.get("gp") or (1 if week else 0)),
+                    score_stats(numeric, SCORING_PROFILES["ppr"]),
+                    score_stats(numeric, SCORING_PROFILES["half_ppr"]),
+                    score_stats(numeric, SCORING_PROFILES["standard"]),
+                    json.dumps(numeric, separators=(",", ":")),
+                )
+            )
+        with self._write_lock:
+            conn = self._conn()
+            with conn:
+                conn.execute("DELETE FROM player_stats WHERE season = ? AND week = ?", (season, week))
+                conn.executemany("INSERT INTO player_stats VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", records)
+                conn.execute(
+                    "INSERT OR REPLACE INTO ingested VALUES (?, ?, ?, ?, ?)",
+                    (season, week, len(records), int(final), now or time.time()),
+                )
+        return len(records)
+
+    def refresh(
+        self,
+        fetch_many: FetchMany,
+        seasons: Iterable[int],
+        state_season: int,
+        state_week: int,
+        players_meta: Dict[str, Any],
+    ) -> Dict[int, List[int]]:
+        """Fetch and store every pending week of `seasons`. Returns {season: weeks stored}."""
+        updated: Dict[int, List[int]] = {}
+        with self.ingest_lock:
+            for season in sorted(set(seasons)):
+                weeks = self.pending(season, state_season, state_week)
+                if not weeks:
+                    continue
+                urls = [
+                    _STATS_URL.format(season=season) if w == SEASON_TOTALS else _WEEK_STATS_URL.format(season=season, week=w)
+                    for w in weeks
+                ]
+                now = time.time()
+                for week, payload in zip(weeks, fetch_many(urls)):
+                    if payload is None:
+                        attempts = self._failed.get((season, week), (0, 0.0))[0] + 1
+                        delay = min(_RETRY_FIRST * 2 ** (attempts - 1), _RETRY_MAX)
+                        self._failed[(season, week)] = (attempts, now + delay)
+                        continue
+                    self._failed.pop((season, week), None)
+                    final = week_is_final(season, week, state_season, state_week)
+                    self.ingest(season, week, payload, players_meta, final, now)
+                    updated.setdefault(season, []).append(week)
+        return updated
+
+    # ---- queries ----
+
+    def seasons(self) -> List[int]:
+        rows = self._conn().execute("SELECT DISTINCT season FROM ingested ORDER BY season").fetchall()
+        return [r["season"] for r in rows]
+
+    def player_trend(self, player_id: str, seasons: Optional[List[int]] = None, scoring: str = "ppr") -> Dict[str, Any]:
+        """Per-season totals, points per game and weekly points for one player."""
+        column = f"pts_{scoring}" if scoring in SCORING_PROFILES else "pts_ppr"
+        sql = f"SELECT season, week, position, team, gp, {column} AS pts, stats FROM player_stats WHERE player_id = ?"
+        params: List[Any] = [str(player_id)]
+        if seasons:
+            sql += f" AND season IN ({','.join('?' * len(seasons))})"
+            params += seasons
+        sql += " ORDER BY season, week"
+        by_season: Dict[int, Dict[str, Any]] = {}
+        position = team = None
+        for r in self._conn().execute(sql, params):
+            row = by_season.setdefault(r["season"], {"season": r["season"], "weekly": {}, "totals": None})
+            position, team = r["position"] or position, r["team"] or team
+            if r["week"] == SEASON_TOTALS:
+                row["totals"] = {"gp": r["gp"], "points": round(r["pts"], 2), "stats": _parse_stats(r["stats"])}
+            else:
+                row["weekly"][r["week"]] = round(r["pts"], 2)
+        out = []
+        for season in sorted(by_season):
+            row = by_season[season]
+            weekly = row["weekly"]
+            totals = row["totals"] or {"gp": float(len(weekly)), "points": round(sum(weekly.values()), 2), "stats": {}}
+            gp = totals["gp"] or len(weekly)
+            out.append(
+                {
+                    "season": season,
+                    "gp": gp,
+                    "points": totals["points"],
+                    "ppg": round(totals["points"] / gp, 2) if gp else 0.0,
+                    "best_week": max(weekly.values()) if weekly else None,
+                    "weekly": [weekly.get(w) for w in range(1, REGULAR_SEASON_WEEKS + 1)] if weekly else [],
+                    "stats": totals["stats"],
+                }
+            )
+        for prev, cur in zip(out, out[1:]):
+            cur["ppg_change"] = round(cur["ppg"] - prev["ppg"], 2)
+        return {"player_id": str(player_id), "position": position, "team": team, "scoring": column[4:], "seasons": out}
+
+    def positional(
+        self,
+        season: int,
+        position: str,
+        scoring: str = "ppr",
+        stat: Optional[str] = None,
+        week: int = SEASON_TOTALS,
+        min_gp: float = 0,
+        limit: int = 24,
+    ) -> Dict[str, Any]:
+        """Distribution of fantasy points (or one raw stat) across a position for a season or week."""
+        if stat is not None and not _STAT_KEY.match(stat):
+            raise ValueError(f"Invalid stat key: {stat}")
+        column = f"pts_{scoring}" if scoring in SCORING_PROFILES else "pts_ppr"
+        value = f"COALESCE(json_extract(stats, '$.{stat}'), 0)" if stat else column
+        rows = self._conn().execute(
+            f"SELECT player_id, team, gp, {value} AS value FROM player_stats"
+            " WHERE season = ? AND week = ? AND position = ? AND gp >= ? ORDER BY value DESC",
+            (season, week, position, min_gp),
+        ).fetchall()
+        values = sorted((float(r["value"]) for r in rows), reverse=True)
+        ascending = values[::-1]
+        return {
+            "season": season,
+            "week": week or None,
+            "position": position,
+            "metric": stat or column,
+            "players": len(values),
+            "mean": round(sum(values) / len(values), 2) if values else 0.0,
+            "p25": round(_quantile(ascending, 0.25), 2),
+            "median": round(_quantile(ascending, 0.5), 2),
+            "p75": round(_quantile(ascending, 0.75), 2),
+            "max": round(values[0], 2) if values else 0.0,
+            # Points of the Nth-best player, the usual replacement-level markers
+            "tiers": {f"top{n}": round(values[n - 1], 2) for n in (12, 24, 36) if len(values) >= n},
+            "leaders": [
+                {"player_id": r["player_id"], "team": r["team"], "gp": r["gp"], "value": round(float(r["value"]), 2)}
+                for r in rows[:limit]
+            ],
+        }
+
+    def status(self) -> Dict[str, Any]:
+        done = self.ingested()
+        seasons: Dict[int, Dict[str, Any]] = {}
+        for (season, week), info in sorted(done.items()):
+            row = seasons.setdefault(season, {"weeks": [], "totals": False, "rows": 0, "final": True})
+            if week == SEASON_TOTALS:
+                row["totals"] = True
+            else:
+                row["weeks"].append(week)
+            row["rows"] += info["rows"]
+            row["final"] = row["final"] and bool(info["final"])
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        return {"path": self.path, "bytes": size, "seasons": seasons}
+
+    # ---- export ----
+
+    def export_parquet(self, out_dir: str, seasons: Optional[List[int]] = None) -> List[str]:
+        """One Parquet file per season (stat keys become columns). Needs `pyarrow`."""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError("Parquet export needs the pyarrow package (pip install pyarrow)") from e
+        os.makedirs(out_dir, exist_ok=True)
+        written = []
+        for season in seasons or self.seasons():
+            rows = self._conn().execute(
+                "SELECT * FROM player_stats WHERE season = ? ORDER BY week, player_id", (season,)
+            ).fetchall()
+            if not rows:
+                continue
+            records = []
+            for r in rows:
+                record = {k: r[k] for k in r.keys() if k != "stats"}
+                record.update({f"stat_{k}": v for k, v in _parse_stats(r["stats"]).items()})
+                records.append(record)
+            path = os.path.join(out_dir, f"player_stats_{season}.parquet")
+            pq.write_table(pa.Table.from_pylist(records), path)
+            written.append(path)
+        return written
+
+
+_warehouse: Optional[StatsWarehouse] = None
+_warehouse_lock = threading.Lock()
+
+
+def get_warehouse(db_url: str, data_dir: str) -> StatsWarehouse:
+    global _warehouse
+    with _warehouse_lock:
+        if _warehouse is None:
+            _warehouse = StatsWarehouse(sqlite_path(db_url, os.path.join(data_dir, "warehouse.db")))
+        return _warehouse
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from app.core.config import settings
+
+    parser = argparse.ArgumentParser(description="Stats warehouse utilities")
+    sub = parser.add_subparsers(dest="command", required=True)
+    export = sub.add_parser("export", help="Write one Parquet file per season")
+    export.add_argument("--out", required=True)
+    export.add_argument("--season", type=int, action="append", help="Season to export (repeatable; default all)")
+    ingest = sub.add_parser("ingest", help="Load pending weeks from Sleeper")
+    ingest.add_argument("--season", type=int, action="append", help="Season to load (repeatable; default recent)")
+    args = parser.parse_args(argv)
+
+    if args.command == "ingest":
+        from app.api import routes
+
+        updated = routes._warehouse_refresh(args.season or routes._parse_seasons(None))
+        for season, weeks in sorted(updated.items()):
+            print(f"{season}: {len(weeks)} slices")
+        return 0
+    data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data")
+    store = get_warehouse(settings.DB_URL, data_dir)
+    for path in store.export_parquet(args.out, args.season):
+        print(path)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
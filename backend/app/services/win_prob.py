@@ -0,0 +1,148 @@
+"""
+Monte Carlo win probabilities for every matchup in a league week.
+
+Each starter's final score is `current + remaining`, where `remaining` is drawn
+from a normal distribution around what is left of the player's projection:
+
+    mean = max(projection - current, 0)
+    sd   = CV[position] * projection * sqrt(mean / projection)
+
+so a player who has already produced most of their projection contributes little
+remaining variance. Sleeper's matchup feed carries no game clock, so progress is
+read off the points themselves (the projection is treated as the target).
+
+All starters of all teams are simulated together as one (player, simulation)
+array. The standard-normal draws are fixed per league/week, so a refresh during
+games only recomputes the rows of players whose points or projection changed and
+patches team totals by the difference. Reusing the draws also keeps the odds from
+jittering between refreshes when nothing has changed.
+"""
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Coefficient of variation of weekly fantasy points by position
+POSITION_CV: Dict[str, float] = {"QB": 0.35, "RB": 0.5, "WR": 0.55, "TE": 0.6, "K": 0.45, "DEF": 0.6}
+_DEFAULT_CV = 0.5
+# Floor on the sd so zero-projection starters still carry a little uncertainty
+_MIN_SD = 1.0
+# How far below zero a player's remaining points may go (fumbles, interceptions)
+_MIN_REMAINING = -3.0
+DEFAULT_SIMS = 10000
+
+
+def _params(projection: float, current: float, position: str) -> Tuple[float, float]:
+    projection = max(float(projection), 0.0)
+    remaining = max(projection - current, 0.0)
+    if projection <= 0:
+        return 0.0, 0.0 if current else _MIN_SD
+    sd = POSITION_CV.get(position, _DEFAULT_CV) * projection * float(np.sqrt(remaining / projection))
+    return remaining, sd
+
+
+class LeagueWeekSimulation:
+    """Simulated finals for one league week, updated in place as points come in."""
+
+    def __init__(self, sims: int = DEFAULT_SIMS, seed: Optional[int] = None):
+        self.sims = sims
+        self.rng = np.random.default_rng(seed)
+        self.lock = threading.Lock()
+        self.player_ids: List[str] = []
+        self._row: Dict[str, int] = {}
+        self.z = np.zeros((0, sims), dtype=np.float32)
+        self.finals = np.zeros((0, sims), dtype=np.float32)
+        # per row: (current, mean, sd), to detect what changed
+        self.inputs: List[Tuple[float, float, float]] = []
+        self.lineups: Dict[int, Tuple[int, ...]] = {}
+        self.totals: Dict[int, np.ndarray] = {}
+        self.redrawn = 0
+
+    def _rows_for(self, pids: List[str]) -> None:
+        new = [pid for pid in pids if pid not in self._row]
+        if not new:
+            return
+        for pid in new:
+            self._row[pid] = len(self.player_ids)
+            self.player_ids.append(pid)
+            self.inputs.append((float("nan"), 0.0, 0.0))
+        z = self.rng.standard_normal((len(new), self.sims), dtype=np.float32)
+        self.z = np.vstack([self.z, z])
+        self.finals = np.vstack([self.finals, np.zeros_like(z)])
+
+    def update(
+        self,
+        lineups: Dict[int, List[str]],
+        points: Dict[str, float],
+        projections: Dict[str, float],
+        positions: Dict[str, str],
+    ) -> int:
+        """Apply the latest starters and points; returns how many player rows were redrawn."""
+        with self.lock:
+            self._rows_for([pid for starters in lineups.values() for pid in starters])
+            rows: List[int] = []
+            params: List[Tuple[float, float, float]] = []
+            for pid in {pid for starters in lineups.values() for pid in starters}:
+                i = self._row[pid]
+                current = float(points.get(pid) or 0.0)
+                mean, sd = _params(projections.get(pid) or 0.0, current, positions.get(pid) or "")
+                if self.inputs[i] != (current, mean, sd):
+                    rows.append(i)
+                    params.append((current, mean, sd))
+                    self.inputs[i] = (current, mean, sd)
+            changed: Dict[int, np.ndarray] = {}
+            if rows:
+                cur, mean, sd = (np.array(col, dtype=np.float32)[:, None] for col in zip(*params))
+                new = cur + np.maximum(mean + sd * self.z[rows], _MIN_REMAINING)
+                delta = new - self.finals[rows]
+                self.finals[rows] = new
+                changed = dict(zip(rows, delta))
+
+            for roster_id, starters in lineups.items():
+                lineup = tuple(self._row[pid] for pid in starters)
+                if self.lineups.get(roster_id) != lineup or roster_id not in self.totals:
+                    # lineup changed (or first run): sum the rows from scratch
+                    self.totals[roster_id] = (
+                        self.finals[list(lineup)].sum(axis=0) if lineup else np.zeros(self.sims, dtype=np.float32)
+                    )
+                    self.lineups[roster_id] = lineup
+                    continue
+                for i in lineup:
+                    delta = changed.get(i)
+                    if delta is not None:
+                        self.totals[roster_id] += delta
+            self.redrawn = len(changed)
+            return self.redrawn
+
+    def team_summary(self, roster_id: int) -> Dict[str, float]:
+        totals = self.totals.get(roster_id)
+        if totals is None:
+            return {}
+        p10, p50, p90 = np.percentile(totals, [10, 50, 90])
+        return {
+            "mean": round(float(totals.mean()), 2),
+            "p10": round(float(p10), 2),
+            "p50": round(float(p50), 2),
+            "p90": round(float(p90), 2),
+        }
+
+    def win_probability(self, a: int, b: int) -> Tuple[float, float]:
+        """(P(a beats b), P(tie)) over the simulations."""
+        ta, tb = self.totals.get(a), self.totals.get(b)
+        if ta is None or tb is None:
+            return 0.5, 0.0
+        return float(np.mean(ta > tb)), float(np.mean(ta == tb))
+
+    def matchups(self, pairs: Dict[Any, List[int]]) -> List[Dict[str, Any]]:
+        """Per matchup: each team's simulated distribution and win probability."""
+        out = []
+        for matchup_id, roster_ids in pairs.items():
+            teams = [{"roster_id": rid, **self.team_summary(rid)} for rid in roster_ids]
+            if len(roster_ids) == 2:
+                p, tie = self.win_probability(roster_ids[0], roster_ids[1])
+                teams[0]["win_prob"] = round(p, 4)
+                teams[1]["win_prob"] = round(1.0 - p - tie, 4)
+                out.append({"matchup_id": matchup_id, "tie_prob": round(tie, 4), "teams": teams})
+            else:
+                out.append({"matchup_id": matchup_id, "tie_prob": None, "teams": teams})
+        return out
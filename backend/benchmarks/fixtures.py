@@ -0,0 +1,291 @@
+"""
+Sleeper response fixtures for the benchmarks.
+
+A fixture set maps an upstream URL to its raw response body. Bodies stay as bytes,
+so the benchmarks pay the same JSON parse cost as production. Sets are either
+synthetic (seeded, sized like the real feeds) or recorded from the live API with
+`python -m benchmarks.fixtures record ...`.
+
+On disk a set is a directory holding `index.json` (url -> file name, plus the
+league ids/season it covers) and one file per body.
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+from typing import Dict, List, Optional
+
+import httpx
+
+SLEEPER = "https://api.sleeper.app"
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF"]
+# Share of the feed per position; the real feed is mostly IDP/OL players we filter out.
+_POSITION_MIX = ["QB"] * 6 + ["RB"] * 10 + ["WR"] * 14 + ["TE"] * 7 + ["K"] * 3 + ["OL"] * 25 + ["DL"] * 15 + ["LB"] * 10 + ["DB"] * 15
+TEAMS = [
+    "ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE", "DAL", "DEN", "DET", "GB", "HOU", "IND", "JAX", "KC",
+    "LAC", "LAR", "LV", "MIA", "MIN", "NE", "NO", "NYG", "NYJ", "PHI", "PIT", "SEA", "SF", "TB", "TEN", "WAS",
+]
+LEAGUE_SIZES = (12, 16, 24, 32)
+ROSTER_SIZE = 20
+BENCH_WEEK = 6
+
+
+class FixtureSet:
+    def __init__(self, season: int, league_ids: List[str], bodies: Optional[Dict[str, bytes]] = None, source: str = "synthetic"):
+        self.season = season
+        self.league_ids = league_ids
+        self.bodies: Dict[str, bytes] = bodies or {}
+        self.source = source
+
+    def add(self, url: str, payload) -> None:
+        self.bodies[url] = json.dumps(payload, separators=(",", ":")).encode()
+
+    def get(self, url: str) -> Optional[bytes]:
+        return self.bodies.get(url)
+
+    def size_of(self, url: str) -> int:
+        return len(self.bodies.get(url) or b"")
+
+    def save(self, folder: str) -> None:
+        os.makedirs(folder, exist_ok=True)
+        files = {}
+        for url, body in self.bodies.items():
+            name = hashlib.sha1(url.encode()).hexdigest()[:16] + ".json"
+            with open(os.path.join(folder, name), "wb") as f:
+                f.write(body)
+            files[url] = name
+        with open(os.path.join(folder, "index.json"), "w") as f:
+            json.dump({"season": self.season, "league_ids": self.league_ids, "files": files}, f, indent=1)
+
+    @classmethod
+    def load(cls, folder: str) -> "FixtureSet":
+        with open(os.path.join(folder, "index.json")) as f:
+            index = json.load(f)
+        bodies = {}
+        for url, name in index["files"].items():
+            with open(os.path.join(folder, name), "rb") as fh:
+                bodies[url] = fh.read()
+        return cls(index["season"], index["league_ids"], bodies, source=os.path.abspath(folder))
+
+
+# -------------------------------------------
+# Synthetic data
+# -------------------------------------------
+
+def _player(rng: random.Random, pid: str, rank: int) -> dict:
+    pos = rng.choice(_POSITION_MIX)
+    first, last = f"First{pid}", f"Last{pid}"
+    team = rng.choice(TEAMS) if rng.random() < 0.7 else None
+    years = rng.randint(0, 14)
+    return {
+        "player_id": pid,
+        "first_name": first,
+        "last_name": last,
+        "full_name": f"{first} {last}",
+        "search_first_name": first.lower(),
+        "search_last_name": last.lower(),
+        "search_full_name": f"{first}{last}".lower(),
+        "position": pos,
+        "fantasy_positions": [pos],
+        "team": team,
+        "team_abbr": None,
+        "number": rng.randint(1, 99),
+        "depth_chart_position": pos,
+        "depth_chart_order": rng.randint(1, 4),
+        "status": rng.choice(["Active"] * 8 + ["Inactive", "Injured Reserve"]),
+        "active": rng.random() < 0.85,
+        "injury_status": rng.choice([None] * 8 + ["Questionable", "Out"]),
+        "injury_body_part": None,
+        "injury_start_date": None,
+        "practice_participation": None,
+        "years_exp": years,
+        "age": 21 + years + rng.randint(0, 2),
+        "birth_date": f"{1995 + rng.randint(0, 9)}-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}",
+        "height": str(rng.randint(68, 79)),
+        "weight": str(rng.randint(180, 330)),
+        "college": f"College {rng.randint(1, 130)}",
+        "high_school": f"High School {rng.randint(1, 5000)}",
+        "hashtag": f"#{first}{last}-NFL-{team or 'FA'}-{rng.randint(1, 99)}",
+        "search_rank": rank,
+        "sport": "nfl",
+        "espn_id": rng.randint(10_000, 5_000_000),
+        "yahoo_id": rng.randint(10_000, 40_000),
+        "rotowire_id": rng.randint(1_000, 20_000),
+        "sportradar_id": hashlib.md5(pid.encode()).hexdigest(),
+        "stats_id": rng.randint(100_000, 999_999),
+        "gsis_id": f"00-00{rng.randint(10_000, 99_999)}",
+        "metadata": {"channel_id": str(rng.randint(10**17, 10**18)), "rookie_year": str(2025 - years)},
+    }
+
+
+def _season_stats(rng: random.Random, pos: str) -> dict:
+    gp = rng.randint(1, 17)
+    s = {"gp": gp, "gs": rng.randint(0, gp), "off_snp": rng.randint(0, 1100), "tm_off_snp": 1100}
+    if pos == "QB":
+        att = rng.randint(50, 650)
+        s.update(pass_att=att, pass_cmp=int(att * 0.65), pass_yd=att * 7, pass_td=rng.randint(0, 40), pass_int=rng.randint(0, 18))
+    if pos in ("QB", "RB", "WR"):
+        s.update(rush_att=rng.randint(0, 320), rush_yd=rng.randint(0, 1600), rush_td=rng.randint(0, 16))
+    if pos in ("RB", "WR", "TE"):
+        tgt = rng.randint(0, 170)
+        s.update(rec_tgt=tgt, rec=int(tgt * 0.66), rec_yd=tgt * 8, rec_td=rng.randint(0, 14), rec_fd=int(tgt * 0.3))
+    if pos == "K":
+        s.update(fgm=rng.randint(10, 38), fga=40, xpm=rng.randint(20, 55), xpa=56)
+    if pos == "DEF":
+        s.update(pts_allow=rng.randint(250, 480), yds_allow=rng.randint(4500, 6500), sack=rng.randint(20, 60), int=rng.randint(5, 20))
+    # Sleeper ships dozens of derived rank/pts fields per player
+    for key in ("pts_std", "pts_half_ppr", "pts_ppr", "pos_rank_std", "pos_rank_half_ppr", "pos_rank_ppr", "rank_std", "rank_ppr"):
+        s[key] = round(rng.uniform(0, 400), 2)
+    return s
+
+
+def _league(fx: FixtureSet, rng: random.Random, league_id: str, size: int, fantasy_ids: List[str]) -> None:
+    base = f"{SLEEPER}/v1/league/{league_id}"
+    pool = rng.sample(fantasy_ids, min(len(fantasy_ids), size * ROSTER_SIZE))
+    rosters, users, matchups = [], [], []
+    for r in range(1, size + 1):
+        players = pool[(r - 1) * ROSTER_SIZE : r * ROSTER_SIZE]
+        owner = f"{league_id}-u{r}"
+        wins = rng.randint(0, BENCH_WEEK - 1)
+        rosters.append(
+            {
+                "roster_id": r,
+                "owner_id": owner,
+                "players": players,
+                "starters": players[:9],
+                "reserve": [],
+                "taxi": [],
+                "settings": {"wins": wins, "losses": BENCH_WEEK - 1 - wins, "ties": 0, "fpts": rng.randint(400, 800), "fpts_decimal": rng.randint(0, 99)},
+            }
+        )
+        users.append({"user_id": owner, "display_name": f"Manager {r}", "username": f"mgr{league_id}{r}"})
+        matchups.append(
+            {
+                "roster_id": r,
+                "matchup_id": (r + 1) // 2,
+                "points": round(rng.uniform(70, 160), 2),
+                "starters": players[:9],
+                "players": players,
+                "players_points": {p: round(rng.uniform(0, 30), 2) for p in players},
+            }
+        )
+    fx.add(base, {
+        "league_id": league_id,
+        "name": f"Bench League {size}",
+        "season": str(fx.season),
+        "total_rosters": size,
+        "roster_positions": ["QB", "RB", "RB", "WR", "WR", "TE", "FLEX", "K", "DEF"] + ["BN"] * 11,
+        "scoring_settings": {"rec": 1.0, "pass_td": 4.0, "rush_td": 6.0, "rec_td": 6.0},
+    })
+    fx.add(f"{base}/rosters", rosters)
+    fx.add(f"{base}/users", users)
+    for week in range(1, BENCH_WEEK + 1):
+        fx.add(f"{base}/matchups/{week}", matchups)
+    for week in range(0, BENCH_WEEK + 1):
+        txns = []
+        for t in range(rng.randint(10, 40)):
+            kind = rng.choice(["waiver", "free_agent", "free_agent", "trade"])
+            adds = {rng.choice(fantasy_ids): rng.randint(1, size)}
+            drops = {rng.choice(fantasy_ids): rng.randint(1, size)}
+            txns.append(
+                {
+                    "transaction_id": f"{league_id}-{week}-{t}",
+                    "type": kind,
+                    "status": "complete",
+                    "created": 1_760_000_000_000 + t * 60_000,
+                    "status_updated": 1_760_000_000_000 + t * 60_000,
+                    "roster_ids": list({*adds.values(), *drops.values()}),
+                    "adds": adds,
+                    "drops": drops,
+                    "draft_picks": [],
+                    "waiver_budget": [],
+                    "settings": {"waiver_bid": rng.randint(0, 40)} if kind == "waiver" else None,
+                }
+            )
+        fx.add(f"{base}/transactions/{week}", txns)
+
+
+def synthetic(season: int = 2025, players_bytes: int = 5_000_000, seed: int = 7) -> FixtureSet:
+    """Seeded fixture set: ~5MB players feed, a full stats season, ADP, trending and 12-32 team leagues."""
+    rng = random.Random(seed)
+    league_ids = [f"bench-{size}" for size in LEAGUE_SIZES]
+    fx = FixtureSet(season, league_ids)
+
+    players: Dict[str, dict] = {}
+    approx = 0
+    while approx < players_bytes:
+        pid = str(1000 + len(players))
+        players[pid] = _player(rng, pid, len(players) + 1)
+        approx += 900  # average encoded size of one record
+    for team in TEAMS:
+        players[team] = {"player_id": team, "first_name": team, "last_name": "Defense", "position": "DEF",
+                         "fantasy_positions": ["DEF"], "team": team, "active": True, "status": "Active", "search_rank": 300}
+    fx.add(f"{SLEEPER}/v1/players/nfl", players)
+
+    fantasy_ids = [pid for pid, p in players.items() if p["position"] in POSITIONS and p.get("team")]
+    stats = {pid: _season_stats(rng, players[pid]["position"]) for pid in fantasy_ids}
+    fx.add(f"{SLEEPER}/v1/stats/nfl/regular/{season - 1}", stats)
+    ranked = sorted(fantasy_ids, key=lambda pid: players[pid]["search_rank"])
+    fx.add(f"{SLEEPER}/v1/adp/nfl/{season}?type=ppr", [{"player_id": pid, "adp": i + 1.0} for i, pid in enumerate(ranked[:400])])
+    fx.add(f"{SLEEPER}/v1/state/nfl", {"season": str(season), "week": BENCH_WEEK, "season_type": "regular", "display_week": BENCH_WEEK})
+    for kind in ("add", "drop"):
+        rows = [{"player_id": pid, "count": 5000 - i * 20} for i, pid in enumerate(rng.sample(fantasy_ids, 200))]
+        fx.add(f"{SLEEPER}/v1/players/nfl/trending/{kind}?lookback_hours=24&limit=200", rows)
+
+    for size, league_id in zip(LEAGUE_SIZES, league_ids):
+        _league(fx, rng, league_id, size, fantasy_ids)
+    return fx
+
+
+# -------------------------------------------
+# Recording from the live API
+# -------------------------------------------
+
+def urls_for(season: int, league_ids: List[str], week: int = BENCH_WEEK) -> List[str]:
+    urls = [
+        f"{SLEEPER}/v1/players/nfl",
+        f"{SLEEPER}/v1/stats/nfl/regular/{season - 1}",
+        f"{SLEEPER}/v1/adp/nfl/{season}?type=ppr",
+        f"{SLEEPER}/v1/state/nfl",
+        f"{SLEEPER}/v1/players/nfl/trending/add?lookback_hours=24&limit=200",
+        f"{SLEEPER}/v1/players/nfl/trending/drop?lookback_hours=24&limit=200",
+    ]
+    for league_id in league_ids:
+        base = f"{SLEEPER}/v1/league/{league_id}"
+        urls += [base, f"{base}/rosters", f"{base}/users", f"{base}/matchups/{week}"]
+        urls += [f"{base}/transactions/{w}" for w in range(0, week + 1)]
+    return urls
+
+
+def record(season: int, league_ids: List[str], folder: str) -> FixtureSet:
+    fx = FixtureSet(season, league_ids, source="recorded")
+    with httpx.Client(timeout=60) as client:
+        for url in urls_for(season, league_ids):
+            r = client.get(url)
+            if r.status_code == 200:
+                fx.bodies[url] = r.content
+            print(f"{r.status_code} {len(r.content):>9} {url}")
+    fx.save(folder)
+    return fx
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Record or generate Sleeper fixtures for the benchmarks")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    rec = sub.add_parser("record", help="Fetch live Sleeper responses for the given leagues")
+    rec.add_argument("--season", type=int, required=True)
+    rec.add_argument("--league", action="append", required=True, help="Sleeper league id (repeatable)")
+    rec.add_argument("--out", required=True)
+    gen = sub.add_parser("synthetic", help="Write the synthetic set to a folder")
+    gen.add_argument("--season", type=int, default=2025)
+    gen.add_argument("--out", required=True)
+    args = parser.parse_args()
+    if args.cmd == "record":
+        record(args.season, args.league, args.out)
+    else:
+        synthetic(args.season).save(args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,351 @@
+"""
+Load generator for concurrent draft rooms.
+
+Spins up N simulated drafts with M Socket.IO clients each against a local backend.
+Every client joins its draft; one client at a time emits `draft_pick` (and now and
+then `remove_pick`) at a jittered cadence, while a REST loop per draft interleaves
+`PUT /drafts/{id}/picks` and `GET /players`. Reports:
+
+- fan-out latency percentiles (pick emitted -> `player_drafted` received by each client);
+- dropped events (expected deliveries that never arrived);
+- REST latency and errors;
+- server CPU and resident memory (sampled from /proc, so Linux only).
+
+By default the backend is started in a child process with the synthetic benchmark
+fixtures, so the run is offline:
+
+    cd backend
+    python -m benchmarks.load --drafts 20 --clients 12 --duration 60
+    python -m benchmarks.load --url http://127.0.0.1:8004 --server-pid 1234  # existing instance
+
+Needs the Socket.IO asyncio client: `pip install "python-socketio[asyncio_client]"`.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+_BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _percentiles(values: List[float]) -> Dict[str, Optional[float]]:
+    if not values:
+        return {"count": 0, "p50_ms": None, "p95_ms": None, "p99_ms": None, "max_ms": None}
+    ordered = sorted(values)
+
+    def at(pct: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(round(pct * (len(ordered) - 1))))] * 1000, 2)
+
+    return {"count": len(ordered), "p50_ms": at(0.5), "p95_ms": at(0.95), "p99_ms": at(0.99), "max_ms": round(ordered[-1] * 1000, 2)}
+
+
+class Stats:
+    def __init__(self) -> None:
+        self.fanout: List[float] = []
+        self.expected = 0
+        self.received = 0
+        self.sent: Dict[Tuple[str, str], float] = {}  # (draft, player id) -> remove sent at
+        self.suggestions = 0
+        self.connect_errors = 0
+        self.rest: Dict[str, List[float]] = {"put_picks": [], "get_players": []}
+        self.rest_errors: Dict[str, int] = {"put_picks": 0, "get_players": 0}
+        self.loop_lag: List[float] = []
+
+
+class ServerSampler:
+    """CPU% and RSS of a process from /proc, sampled once a second."""
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        self.cpu: List[float] = []
+        self.rss_kb: List[int] = []
+        self._ticks = os.sysconf("SC_CLK_TCK")
+
+    def _read(self) -> Tuple[float, int]:
+        with open(f"/proc/{self.pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        cpu = (int(fields[11]) + int(fields[12])) / self._ticks  # utime + stime
+        rss = 0
+        with open(f"/proc/{self.pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    rss = int(line.split()[1])
+        return cpu, rss
+
+    async def run(self, stop: asyncio.Event) -> None:
+        try:
+            last_cpu, _ = self._read()
+        except OSError:
+            return
+        last = time.monotonic()
+        while not stop.is_set():
+            await asyncio.sleep(1)
+            try:
+                cpu, rss = self._read()
+            except OSError:
+                return
+            now = time.monotonic()
+            self.cpu.append((cpu - last_cpu) / (now - last) * 100)
+            self.rss_kb.append(rss)
+            last_cpu, last = cpu, now
+
+    def summary(self) -> Dict[str, Any]:
+        if not self.cpu:
+            return {}
+        return {
+            "cpu_avg_pct": round(sum(self.cpu) / len(self.cpu), 1),
+            "cpu_max_pct": round(max(self.cpu), 1),
+            "rss_start_mb": round(self.rss_kb[0] / 1024, 1),
+            "rss_peak_mb": round(max(self.rss_kb) / 1024, 1),
+        }
+
+
+async def _connect_client(url: str, draft_id: str, stats: Stats, sem: asyncio.Semaphore):
+    import socketio
+
+    sio = socketio.AsyncClient(reconnection=False)
+
+    @sio.on("player_drafted")
+    async def on_drafted(data):
+        if isinstance(data, dict) and "_sent" in data:
+            stats.received += 1
+            stats.fanout.append(time.perf_counter() - data["_sent"])
+
+    @sio.on("player_removed")
+    async def on_removed(player_id):
+        sent = stats.sent.get((draft_id, str(player_id)))
+        if sent is not None:
+            stats.received += 1
+            stats.fanout.append(time.perf_counter() - sent)
+
+    @sio.on("draft_suggestions")
+    async def on_suggestions(data):
+        stats.suggestions += 1
+
+    async with sem:
+        try:
+            await sio.connect(url, transports=["websocket"], socketio_path="socket.io")
+            await sio.emit("join_draft", {"draft_id": draft_id})
+        except Exception:
+            stats.connect_errors += 1
+            return None
+    return sio
+
+
+async def _draft(
+    url: str,
+    http: httpx.AsyncClient,
+    index: int,
+    clients: int,
+    players: List[Dict[str, Any]],
+    args: argparse.Namespace,
+    stats: Stats,
+    sem: asyncio.Semaphore,
+    deadline: float,
+) -> None:
+    draft_id = f"load-{index}"
+    rng = random.Random(index)
+    sios = [s for s in await asyncio.gather(*(_connect_client(url, draft_id, stats, sem) for _ in range(clients))) if s]
+    if not sios:
+        return
+    pool = rng.sample(players, min(len(players), 400))
+    picks: List[Dict[str, Any]] = []
+
+    async def rest_loop() -> None:
+        while time.monotonic() < deadline:
+            await asyncio.sleep(args.rest_interval * rng.uniform(0.5, 1.5))
+            body = [
+                {
+                    "id": f"{draft_id}-{n}",
+                    "player_id": p["id"],
+                    "player_name": p.get("name") or p["id"],
+                    "position": p.get("position") or "",
+                    "team": p.get("team") or "",
+                    "round": n // 12 + 1,
+                    "overall": n + 1,
+                    "timestamp": time.time(),
+                }
+                for n, p in enumerate(picks)
+            ]
+            for name, request in (
+                ("put_picks", lambda: http.put(f"{url}/drafts/{draft_id}/picks", json=body)),
+                ("get_players", lambda: http.get(f"{url}/players", params={"position": "ALL"})),
+            ):
+                started = time.perf_counter()
+                try:
+                    r = await request()
+                    r.raise_for_status()
+                    stats.rest[name].append(time.perf_counter() - started)
+                except Exception:
+                    stats.rest_errors[name] += 1
+
+    rest = asyncio.create_task(rest_loop())
+    seq = 0
+    while time.monotonic() < deadline and pool:
+        await asyncio.sleep(args.pick_interval * rng.uniform(0.5, 1.5))
+        sender = sios[seq % len(sios)]
+        seq += 1
+        if picks and rng.random() < args.undo_rate:
+            undone = picks.pop()
+            stats.sent[(draft_id, undone["id"])] = time.perf_counter()
+            stats.expected += len(sios)
+            await sender.emit("remove_pick", {"draft_id": draft_id, "player_id": undone["id"]})
+            pool.append(undone)
+            continue
+        player = pool.pop()
+        picks.append(player)
+        stats.expected += len(sios)
+        await sender.emit("draft_pick", {"draft_id": draft_id, "player": {**player, "_seq": seq, "_sent": time.perf_counter()}})
+
+    await rest
+    await asyncio.sleep(args.drain)
+    await asyncio.gather(*(s.disconnect() for s in sios), return_exceptions=True)
+
+
+async def _loop_lag(stats: Stats, stop: asyncio.Event) -> None:
+    """How late the harness's own event loop wakes up; high values mean the client is the bottleneck."""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.1)
+        stats.loop_lag.append(time.perf_counter() - started - 0.1)
+
+
+async def run(args: argparse.Namespace, server_pid: Optional[int]) -> Dict[str, Any]:
+    stats = Stats()
+    stop = asyncio.Event()
+    sampler = ServerSampler(server_pid) if server_pid else None
+    limits = httpx.Limits(max_connections=args.drafts * 2, max_keepalive_connections=args.drafts * 2)
+    async with httpx.AsyncClient(timeout=30, limits=limits) as http:
+        players = (await http.get(f"{args.url}/players", params={"position": "ALL"})).json()
+        players = [{k: p.get(k) for k in ("id", "name", "position", "team")} for p in players if p.get("id")]
+        background = [asyncio.create_task(_loop_lag(stats, stop))]
+        if sampler:
+            background.append(asyncio.create_task(sampler.run(stop)))
+        sem = asyncio.Semaphore(args.connect_concurrency)
+        started = time.monotonic()
+        deadline = started + args.duration
+        await asyncio.gather(
+            *(_draft(args.url, http, d, args.clients, players, args, stats, sem, deadline) for d in range(args.drafts))
+        )
+        stop.set()
+        await asyncio.gather(*background)
+    return {
+        "config": {k: v for k, v in vars(args).items() if k not in ("out",)},
+        "elapsed_s": round(time.monotonic() - started, 1),
+        "fanout": _percentiles(stats.fanout),
+        "events": {
+            "expected": stats.expected,
+            "received": stats.received,
+            "dropped": max(stats.expected - stats.received, 0),
+            "suggestion_pushes": stats.suggestions,
+            "connect_errors": stats.connect_errors,
+        },
+        "rest": {name: {**_percentiles(v), "errors": stats.rest_errors[name]} for name, v in stats.rest.items()},
+        "server": sampler.summary() if sampler else {},
+        "client_loop_lag": _percentiles(stats.loop_lag),
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _start_server(port: int) -> subprocess.Popen:
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.load", "serve", "--port", str(port)],
+        cwd=_BACKEND,
+        stdout=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError("backend exited during startup")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/", timeout=1).status_code == 200:
+                return proc
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError("backend did not come up within 60s")
+
+
+def serve(port: int) -> None:
+    """Run the backend against the synthetic fixtures (the default load target)."""
+    import uvicorn
+
+    from benchmarks.fixtures import synthetic
+    from benchmarks.run import _install
+
+    logging.disable(logging.INFO)
+    # Clients call /players and join_draft without a season, which defaults to the current year
+    _install(synthetic(season=datetime.now().year))
+    import main
+
+    uvicorn.run(main.app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["serve"]:
+        p = argparse.ArgumentParser()
+        p.add_argument("cmd")
+        p.add_argument("--port", type=int, required=True)
+        serve(p.parse_args(argv).port)
+        return 0
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="Existing backend (default: start one on the synthetic fixtures)")
+    parser.add_argument("--server-pid", type=int, help="PID to sample CPU/RSS from when using --url")
+    parser.add_argument("--drafts", type=int, default=10)
+    parser.add_argument("--clients", type=int, default=12, help="Socket.IO clients per draft")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds of picking")
+    parser.add_argument("--pick-interval", type=float, default=2.0, help="Mean seconds between picks per draft")
+    parser.add_argument("--undo-rate", type=float, default=0.1, help="Share of actions that undo the last pick")
+    parser.add_argument("--rest-interval", type=float, default=5.0, help="Mean seconds between REST rounds per draft")
+    parser.add_argument("--connect-concurrency", type=int, default=50)
+    parser.add_argument("--drain", type=float, default=2.0, help="Seconds to wait for in-flight events at the end")
+    parser.add_argument("--out", help="Write the report as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        import socketio  # noqa: F401
+        import aiohttp  # noqa: F401
+    except ImportError:
+        print('The load harness needs the Socket.IO asyncio client: pip install "python-socketio[asyncio_client]"')
+        return 2
+
+    proc = None
+    server_pid = args.server_pid
+    if not args.url:
+        port = _free_port()
+        proc = _start_server(port)
+        args.url = f"http://127.0.0.1:{port}"
+        server_pid = proc.pid
+    try:
+        report = asyncio.run(run(args, server_pid))
+    finally:
+        if proc:
+            proc.terminate()
+            proc.wait(timeout=10)
+
+    print(json.dumps(report, indent=2))
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""
+Event-loop lag benchmark for the CPU-bound paths.
+
+Each scenario runs the way FastAPI runs a sync route, on a worker thread, while a
+ticker on the event loop sleeps `--interval` ms and records how late every wake-up
+is. GIL-bound work on the thread delays the ticker (and every Socket.IO message
+with it); work handed to the CPU pool should not. Every scenario runs twice, once
+through the pool and once with `CPU_POOL_WORKERS=0` semantics (inline):
+
+    cd backend
+    python -m benchmarks.loop_lag                   # -> benchmarks/results/loop-lag-<sha>.json
+    python -m benchmarks.loop_lag --compare benchmarks/results/loop-lag-<base>.json
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.fixtures import FixtureSet, synthetic
+from benchmarks.run import RESULTS_DIR, _git_revision, _install, _percentile, _reset_caches
+
+_TRADE_POSITIONS = ("QB", "RB", "RB", "RB", "WR", "WR", "WR", "WR", "TE", "TE")
+_TRADE_SLOTS = ["QB", "RB", "RB", "WR", "WR", "TE", "FLEX", "BN", "BN", "BN", "BN", "BN"]
+
+
+def scenarios(fx: FixtureSet) -> List[Tuple[str, Callable[[], Any], bool]]:
+    """(name, call, cold) for the paths that hand work to the CPU pool."""
+    from app.api import routes
+    from app.services import trade_finder
+
+    rng = random.Random(7)
+    rosters = {
+        rid: {f"{rid}_{i}": (_TRADE_POSITIONS[i % len(_TRADE_POSITIONS)], rng.uniform(1, 25)) for i in range(16)}
+        for rid in range(1, 13)
+    }
+    mine = rosters.pop(1)
+
+    def players():
+        return routes.get_players(position="ALL", season=fx.season, on_team_only=True, scoring="ppr")
+
+    def trades():
+        return trade_finder.find_trades(mine, rosters, _TRADE_SLOTS, top_k=10, max_size=2)
+
+    return [("get_players.cold", players, True), ("trade_finder.find_trades", trades, False)]
+
+
+async def _lag(call: Callable[[], Any], cold: bool, iterations: int, interval: float) -> Dict[str, Any]:
+    """Run `call` on a thread `iterations` times while ticking the loop every `interval` seconds."""
+    loop = asyncio.get_running_loop()
+    lags: List[float] = []
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        while not done.is_set():
+            start = loop.time()
+            await asyncio.sleep(interval)
+            lags.append(max(loop.time() - start - interval, 0.0) * 1000)
+
+    tick = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    for _ in range(iterations):
+        if cold:
+            _reset_caches()
+        await asyncio.to_thread(call)
+    elapsed = time.perf_counter() - started
+    done.set()
+    await tick
+    lags = lags or [0.0]
+    return {
+        "lag_p50_ms": round(_percentile(lags, 0.5), 2),
+        "lag_p99_ms": round(_percentile(lags, 0.99), 2),
+        "lag_max_ms": round(max(lags), 2),
+        "ticks": len(lags),
+        "call_ms": round(elapsed * 1000 / max(iterations, 1), 2),
+    }
+
+
+def measure(call: Callable[[], Any], cold: bool, iterations: int, interval: float, inline: bool) -> Dict[str, Any]:
+    from app.services import cpu_pool
+
+    workers = cpu_pool.WORKERS
+    cpu_pool.WORKERS = 0 if inline else workers
+    try:
+        if cold:
+            _reset_caches()
+        call()  # untimed: starts the pool's workers and imports the task modules there
+        return asyncio.run(_lag(call, cold, iterations, interval))
+    finally:
+        cpu_pool.WORKERS = workers
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> bool:
+    regressed = False
+    print(f"\nvs {baseline['meta'].get('revision')} ({baseline['meta'].get('timestamp')})")
+    for name, row in current["results"].items():
+        base = baseline["results"].get(name)
+        if not base:
+            print(f"  {name:<44} new")
+            continue
+        old, new = base["lag_p99_ms"], row["lag_p99_ms"]
+        change = (new - old) / old if old else 0.0
+        flag = "  REGRESSION" if change > threshold and new - old > 1.0 else ""
+        regressed = regressed or bool(flag)
+        print(f"  {name:<44} lag p99 {old:>8.2f} -> {new:>8.2f} ms ({change:+.0%}){flag}")
+    return regressed
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", help="Recorded fixture folder (default: synthetic)")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--interval", type=float, default=5.0, help="Ticker period in ms")
+    parser.add_argument("--only", help="Run scenarios whose name contains this string")
+    parser.add_argument("--out", help="Result file (default: benchmarks/results/loop-lag-<git sha>.json)")
+    parser.add_argument("--compare", help="Baseline result file to diff against")
+    parser.add_argument("--threshold", type=float, default=0.5, help="p99 lag increase counted as a regression")
+    parser.add_argument("--verbose", action="store_true", help="Keep the backend's INFO logging")
+    args = parser.parse_args(argv)
+
+    if not args.verbose:
+        logging.disable(logging.INFO)
+    fx = FixtureSet.load(args.fixtures) if args.fixtures else synthetic()
+    _install(fx)
+
+    from app.services import cpu_pool
+
+    results: Dict[str, Any] = {}
+    for name, call, cold in scenarios(fx):
+        if args.only and args.only not in name:
+            continue
+        for mode in ("pool", "inline"):
+            r = results[f"{name}.{mode}"] = measure(call, cold, args.iterations, args.interval / 1000, mode == "inline")
+            print(
+                f"{name + '.' + mode:<44} lag p50 {r['lag_p50_ms']:>7.2f} ms  p99 {r['lag_p99_ms']:>7.2f} ms"
+                f"  max {r['lag_max_ms']:>7.2f} ms  call {r['call_ms']:>9.2f} ms"
+            )
+
+    report = {
+        "meta": {
+            "revision": _git_revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "fixtures": fx.source,
+            "workers": cpu_pool.WORKERS,
+            "start_method": cpu_pool.START_METHOD,
+            "iterations": args.iterations,
+            "interval_ms": args.interval,
+        },
+        "results": results,
+    }
+    out = args.out or os.path.join(RESULTS_DIR, f"loop-lag-{report['meta']['revision']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {out}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            if compare(report, json.load(f), args.threshold):
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""
+Per-player stat normalization cost: the probe chains `get_players` used to run for
+every player (`_coalesce`/`_get_path`/`_to_opt_int` over every alternative key)
+against the extractor `stat_schema.compile_extractor` generates once per feed.
+
+Runs over the synthetic Sleeper stats feed and the same rows re-keyed to the
+legacy nested layout and to ESPN stat ids, checks that both paths agree where the
+old chains understood the layout, and prints ns per player:
+
+    cd backend
+    python -m benchmarks.normalize
+    python -m benchmarks.normalize --fixtures recorded/
+"""
+import argparse
+import json
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from app.services import stat_schema
+from benchmarks.fixtures import FixtureSet, synthetic
+
+
+def _get_path(obj: dict, path: str):
+    if not isinstance(obj, dict) or not path:
+        return None
+    cur = obj
+    for k in path.split("."):
+        if isinstance(cur, dict) and k in cur:
+            cur = cur[k]
+        else:
+            return None
+    return cur
+
+
+def _coalesce(*vals):
+    for v in vals:
+        if v is not None:
+            return v
+    return None
+
+
+def legacy(stat: Dict[str, Any]) -> Dict[str, Any]:
+    """The per-player probes from before the schema layer, verbatim."""
+    _to_opt_int = stat_schema.to_opt_int
+    return {
+        "passYds": int(stat.get("pass_yd", 0) or 0),
+        "passTD": int(stat.get("pass_td", 0) or 0),
+        "rushYds": int(stat.get("rush_yd", 0) or 0),
+        "rushTD": int(stat.get("rush_td", 0) or 0),
+        "recYds": int(stat.get("rec_yd", 0) or 0),
+        "recTD": int(stat.get("rec_td", 0) or 0),
+        "receptions": int(stat.get("rec", 0) or 0),
+        "targets": _to_opt_int(
+            _coalesce(stat.get("rec_tgt"), stat.get("targets"), _get_path(stat, "receiving.targets"))
+        ),
+        "fumbles": int(stat.get("fum", 0) or 0),
+        "interceptions": int(stat.get("int", 0) or 0),
+        "sacks": int(stat.get("sack", 0) or 0),
+        "rushAtt": int(stat.get("rush_att", 0) or stat.get("rushing_att", 0) or stat.get("rush_attempts", 0) or 0),
+        "pass_att": _to_opt_int(
+            _coalesce(
+                stat.get("pass_att"),
+                stat.get("att"),
+                stat.get("attempts"),
+                _get_path(stat, "passing.att"),
+                _get_path(stat, "passing.attempts"),
+                _get_path(stat, "pass.att"),
+            )
+        ),
+        "pass_cmp": _to_opt_int(
+            _coalesce(
+                stat.get("pass_cmp"),
+                stat.get("cmp"),
+                stat.get("completions"),
+                _get_path(stat, "passing.cmp"),
+                _get_path(stat, "passing.completions"),
+                _get_path(stat, "pass.cmp"),
+            )
+        ),
+    }
+
+
+def _rekey(rows: List[Dict[str, Any]], provider: str) -> List[Dict[str, Any]]:
+    """The same rows under another provider's paths (for legacy, the last and most nested one)."""
+    out = []
+    for row in rows:
+        new: Dict[str, Any] = {}
+        for f in stat_schema.STAT_FIELDS:
+            value = next((row[p] for p in f.sleeper if p in row), None)
+            paths = getattr(f, provider) or f.sleeper
+            if value is None or not paths:
+                continue
+            head, _, tail = paths[-1 if provider == "legacy" else 0].partition(".")
+            if tail:
+                new.setdefault(head, {})[tail] = value
+            else:
+                new[head] = value
+        out.append(new)
+    return out
+
+
+def _per_player_ns(fn: Callable[[Dict[str, Any]], Any], rows: List[Dict[str, Any]], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for row in rows:
+            fn(row)
+        best = min(best, time.perf_counter() - started)
+    return best / len(rows) * 1e9
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", help="Recorded fixture folder (default: synthetic)")
+    parser.add_argument("--rounds", type=int, default=20, help="Passes over the feed; the fastest counts")
+    args = parser.parse_args(argv)
+
+    fx = FixtureSet.load(args.fixtures) if args.fixtures else synthetic()
+    body = fx.get(f"https://api.sleeper.app/v1/stats/nfl/regular/{fx.season - 1}") or b"{}"
+    sleeper_rows = [r for r in json.loads(body).values() if isinstance(r, dict)]
+    if not sleeper_rows:
+        print("No stats rows in the fixtures", file=sys.stderr)
+        return 1
+
+    mismatched = False
+    print(f"{len(sleeper_rows)} players per feed")
+    for layout, rows in (
+        ("sleeper", sleeper_rows),
+        ("legacy", _rekey(sleeper_rows, "legacy")),
+        ("espn", _rekey(sleeper_rows, "espn")),
+    ):
+        started = time.perf_counter()
+        extract = stat_schema.compile_extractor(rows)
+        compile_ms = (time.perf_counter() - started) * 1000
+        new_ns = _per_player_ns(extract, rows, args.rounds)
+        old_ns = _per_player_ns(legacy, rows, args.rounds)
+        line = f"{layout:<8} probes {old_ns:>7.0f} ns/player  compiled {new_ns:>7.0f} ns/player  ({old_ns / new_ns:.1f}x)"
+        print(f"{line}  compile {compile_ms:.2f} ms")
+        if layout != "espn" and any(legacy(r) != extract(r) for r in rows):
+            print(f"  {layout}: compiled extractor disagrees with the probes", file=sys.stderr)
+            mismatched = True
+        if layout == "espn" and [extract(r) for r in rows] != [stat_schema.compile_extractor(sleeper_rows)(r) for r in sleeper_rows]:
+            print("  espn: ids do not map back to the Sleeper values", file=sys.stderr)
+            mismatched = True
+    return 1 if mismatched else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""
+Offline benchmarks for the backend hot paths.
+
+Every upstream GET is answered from a fixture set through an httpx mock transport,
+so runs are repeatable and never touch Sleeper. Measures latency (p50/p95/mean),
+throughput and peak traced memory for each scenario, and writes the results to
+JSON so commits can be compared:
+
+    cd backend
+    python -m benchmarks.run                        # synthetic fixtures -> benchmarks/results/<sha>.json
+    python -m benchmarks.run --fixtures recorded/   # replay a recorded set
+    python -m benchmarks.run --compare benchmarks/results/<base>.json
+
+Cold scenarios clear every backend cache before each iteration (the reset is not
+timed). Warm scenarios prime once and then measure cache hits.
+"""
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from benchmarks.fixtures import BENCH_WEEK, FixtureSet, synthetic
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(_HERE, "results")
+
+
+def _install(fx: FixtureSet) -> None:
+    """Point the backend's upstream client at the fixtures and lift the per-host rate limits."""
+    from app.api import routes
+    from app.services import upstream
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = fx.get(str(request.url))
+        if body is None:
+            return httpx.Response(404, json={"error": "no fixture"})
+        return httpx.Response(200, content=body, headers={"content-type": "application/json"})
+
+    routes._http = httpx.Client(transport=httpx.MockTransport(handler))
+    upstream._guards.clear()
+    upstream.guard_for("api.sleeper.app", rate=1e9, burst=10**9)
+
+
+def _reset_caches() -> None:
+    from app.api import routes
+    from app.services import upstream
+
+    for cache in (
+        routes._players_cache,
+        routes._dvp_cache,
+        routes._pulse_cache,
+        routes._rostered_cache,
+        routes._waiver_cache,
+        routes._matchup_cache,
+        routes._schedule_cache,
+        routes._sleeper_players_cache,
+    ):
+        cache.clear()
+    routes._nfl_state_cache.update(data=None, ts=0.0)
+    routes._trending_poller.last_poll = 0.0
+    for guard in list(upstream._guards.values()):
+        guard.forget_all()
+
+
+def scenarios(fx: FixtureSet) -> List[Tuple[str, Callable[[], Any], bool]]:
+    """(name, call, cold) for every benchmarked path."""
+    from app.api import routes
+
+    def players():
+        return routes.get_players(position="ALL", season=fx.season, on_team_only=True, scoring="ppr")
+
+    def players_page():
+        return routes.get_players(
+            position="ALL", season=fx.season, on_team_only=True, scoring="ppr",
+            fields="id,name,position,team,fantasyPoints", sort="fantasyPoints", limit=200,
+        )
+
+    out: List[Tuple[str, Callable[[], Any], bool]] = [
+        ("get_players.cold", players, True),
+        ("get_players.warm", players, False),
+        ("get_players.page", players_page, False),
+        ("sleeper_players_slim.cold", lambda: routes.sleeper_players_slim(ids=None), True),
+        ("sleeper_players_slim.warm", lambda: routes.sleeper_players_slim(ids=None), False),
+        ("get_adp", lambda: routes.get_adp(fx.season), False),
+    ]
+    for league_id in fx.league_ids:
+        def pulse(league_id=league_id):
+            return routes.league_pulse(league_id, week=BENCH_WEEK, weeks_back=2, limit=40)
+
+        def gm_context(league_id=league_id):
+            req = routes.GmChatRequest(league_id=league_id, roster_id=1, week=BENCH_WEEK, question="who do I start")
+            return routes._build_gm_context(req)
+
+        out += [
+            (f"league_pulse.cold[{league_id}]", pulse, True),
+            (f"league_pulse.warm[{league_id}]", pulse, False),
+            (f"gm_context[{league_id}]", gm_context, False),
+        ]
+    return out
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct * (len(ordered) - 1))))]
+
+
+def measure(call: Callable[[], Any], cold: bool, iterations: int, warmup: int) -> Dict[str, Any]:
+    for _ in range(warmup):
+        if cold:
+            _reset_caches()
+        call()
+    timings: List[float] = []
+    for _ in range(iterations):
+        if cold:
+            _reset_caches()
+        gc.collect()
+        started = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - started)
+
+    # Peak memory in a separate run; tracemalloc slows everything down, so it is not timed.
+    if cold:
+        _reset_caches()
+    else:
+        call()
+    gc.collect()
+    tracemalloc.start()
+    call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = sum(timings)
+    return {
+        "iterations": iterations,
+        "p50_ms": round(_percentile(timings, 0.5) * 1000, 3),
+        "p95_ms": round(_percentile(timings, 0.95) * 1000, 3),
+        "mean_ms": round(statistics.fmean(timings) * 1000, 3),
+        "min_ms": round(min(timings) * 1000, 3),
+        "ops_per_sec": round(iterations / total, 2) if total else None,
+        "peak_mem_kb": round(peak / 1024, 1),
+    }
+
+
+def _git_revision() -> str:
+    try:
+        sha = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, cwd=_HERE).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--", ".."], capture_output=True, text=True, cwd=_HERE).stdout.strip()
+        return f"{sha}-dirty" if sha and dirty else (sha or "unknown")
+    except Exception:
+        return "unknown"
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> bool:
+    """Print p50 and peak-memory deltas. True when any p50 regressed by more than `threshold`."""
+    regressed = False
+    print(f"\nvs {baseline['meta'].get('revision')} ({baseline['meta'].get('timestamp')})")
+    for name, row in current["results"].items():
+        base = baseline["results"].get(name)
+        if not base:
+            print(f"  {name:<36} new")
+            continue
+        dt = (row["p50_ms"] - base["p50_ms"]) / base["p50_ms"] if base["p50_ms"] else 0.0
+        dm = (row["peak_mem_kb"] - base["peak_mem_kb"]) / base["peak_mem_kb"] if base["peak_mem_kb"] else 0.0
+        flag = "  REGRESSION" if dt > threshold else ""
+        regressed = regressed or bool(flag)
+        print(f"  {name:<36} p50 {base['p50_ms']:>9.2f} -> {row['p50_ms']:>9.2f} ms ({dt:+.0%})  mem {dm:+.0%}{flag}")
+    return regressed
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", help="Recorded fixture folder (default: synthetic)")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--only", help="Run scenarios whose name contains this string")
+    parser.add_argument("--out", help="Result file (default: benchmarks/results/<git sha>.json)")
+    parser.add_argument("--compare", help="Baseline result file to diff against")
+    parser.add_argument("--threshold", type=float, default=0.15, help="p50 slowdown counted as a regression")
+    parser.add_argument("--verbose", action="store_true", help="Keep the backend's INFO logging")
+    args = parser.parse_args(argv)
+
+    if not args.verbose:
+        logging.disable(logging.INFO)
+    fx = FixtureSet.load(args.fixtures) if args.fixtures else synthetic()
+    _install(fx)
+
+    results: Dict[str, Any] = {}
+    for name, call, cold in scenarios(fx):
+        if args.only and args.only not in name:
+            continue
+        results[name] = measure(call, cold, args.iterations, args.warmup)
+        r = results[name]
+        print(f"{name:<36} p50 {r['p50_ms']:>9.2f} ms  p95 {r['p95_ms']:>9.2f} ms  {r['ops_per_sec']:>9} ops/s  peak {r['peak_mem_kb']:>10} KB")
+
+    report = {
+        "meta": {
+            "revision": _git_revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "fixtures": fx.source,
+            "players_feed_bytes": fx.size_of("https://api.sleeper.app/v1/players/nfl"),
+            "iterations": args.iterations,
+        },
+        "results": results,
+    }
+    out = args.out or os.path.join(RESULTS_DIR, f"{report['meta']['revision']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {out}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            if compare(report, json.load(f), args.threshold):
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+Cold-boot import benchmark for the ASGI app.
+
+Each run imports `main` in a fresh interpreter (what a worker does on boot) and
+times it; one extra run under `-X importtime` breaks the time down by module and
+lists which heavy subsystems got imported at boot even though serving does not
+need them yet:
+
+    cd backend
+    python -m benchmarks.startup                   # -> benchmarks/results/startup-<sha>.json
+    python -m benchmarks.startup --compare benchmarks/results/startup-<base>.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from benchmarks.run import RESULTS_DIR, _git_revision
+
+_BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_TIMED = "import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+# Imported on first use; seeing one of these at boot is a regression. (`requests` is
+# not listed: python-socketio's client pulls it in with `import socketio`.)
+LAZY_MODULES = (
+    "bs4",
+    "openai",
+    "scraper",
+    "app.services.answer_cache",
+    "app.services.draft_grades",
+    "app.services.league_analytics",
+    "app.services.player_search",
+    "app.services.trade_finder",
+    "app.services.warehouse",
+    "app.services.win_prob",
+)
+
+
+def _env() -> Dict[str, str]:
+    # No startup warm-up and no shared cache backend: time the imports only
+    env = {**os.environ, "WARM_CACHES": "0"}
+    env.pop("REDIS_URL", None)
+    return env
+
+
+def time_import(module: str) -> float:
+    out = subprocess.run(
+        [sys.executable, "-c", _TIMED.format(module=module)],
+        cwd=_BACKEND, env=_env(), capture_output=True, text=True, check=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def import_breakdown(module: str) -> List[Dict[str, Any]]:
+    """`-X importtime` rows: [{"module", "self_ms", "cumulative_ms"}] in import order."""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=_BACKEND, env=_env(), capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|", 2))
+        rows.append({"module": name, "self_ms": int(self_us) / 1000, "cumulative_ms": int(cumulative_us) / 1000})
+    return rows
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> bool:
+    new, old = report["results"]["p50_ms"], baseline["results"]["p50_ms"]
+    change = (new - old) / old if old else 0.0
+    print(f"\nimport main p50 {old:.1f} ms -> {new:.1f} ms ({change:+.1%})")
+    return change > threshold
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="main", help="Module to import (default: main)")
+    parser.add_argument("--iterations", type=int, default=7)
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to list")
+    parser.add_argument("--out", help="Result file (default: benchmarks/results/startup-<git sha>.json)")
+    parser.add_argument("--compare", help="Baseline result file to diff against")
+    parser.add_argument("--threshold", type=float, default=0.15, help="p50 slowdown counted as a regression")
+    args = parser.parse_args(argv)
+
+    time_import(args.module)  # warm the bytecode cache; the first import compiles
+    samples = [time_import(args.module) * 1000 for _ in range(args.iterations)]
+    rows = import_breakdown(args.module)
+    by_name = {r["module"]: r for r in rows}
+    top = sorted(rows, key=lambda r: r["self_ms"], reverse=True)[: args.top]
+    eager = [m for m in LAZY_MODULES if m in by_name]
+
+    results = {
+        "p50_ms": round(statistics.median(samples), 1),
+        "min_ms": round(min(samples), 1),
+        "max_ms": round(max(samples), 1),
+        "modules": len(rows),
+        "top_self_ms": [{**r, "self_ms": round(r["self_ms"], 1), "cumulative_ms": round(r["cumulative_ms"], 1)} for r in top],
+        "eager_lazy_modules": eager,
+    }
+    print(f"import {args.module}: p50 {results['p50_ms']} ms (min {results['min_ms']}, max {results['max_ms']}), {len(rows)} modules")
+    for r in top:
+        print(f"  {r['module']:<48} self {r['self_ms']:>8.1f} ms  cumulative {r['cumulative_ms']:>8.1f} ms")
+    if eager:
+        print(f"Imported at boot but meant to load on first use: {', '.join(eager)}")
+
+    report = {
+        "meta": {
+            "revision": _git_revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "module": args.module,
+            "iterations": args.iterations,
+        },
+        "results": results,
+    }
+    out = args.out or os.path.join(RESULTS_DIR, f"startup-{report['meta']['revision']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {out}")
+
+    if eager:
+        return 1
+    if args.compare:
+        with open(args.compare) as f:
+            if compare(report, json.load(f), args.threshold):
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
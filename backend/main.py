@@ -1,15 +1,30 @@
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import os
 from app.api import routes
+from app.services import draft_recs, metrics, profiling
 import socketio
-from fastapi.responses import JSONResponse
-from scraper.scraper_runner import run_scraper
+
+# Scrapers (requests/bs4), OpenAI and the analytics services are imported on first use,
+# so a cold boot only loads what serving needs (see benchmarks/startup.py).
+logging.basicConfig(level=logging.INFO)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm the player feed and NFL state in the background (retried with backoff while
+    # upstream is down; WARM_CACHES=0 disables it); /readyz reports 503 until done.
+    routes.start_warmup()
+    yield
+
+
 # Create Socket.IO server
 sio = socketio.AsyncServer(cors_allowed_origins="*", async_mode="asgi")
-fastapi_app = FastAPI()
+fastapi_app = FastAPI(lifespan=lifespan)
 
 origins_env = os.environ.get("CORS_ORIGINS", "").strip()
 regex_env = os.environ.get("CORS_ORIGIN_REGEX", "").strip()
@@ -35,10 +50,53 @@ fastapi_app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
     allow_origin_regex=allow_origin_regex,
+    expose_headers=["X-Total-Count"],  # /players paging
 )
 
 fastapi_app.include_router(routes.router)
 
+
+class LatencyMiddleware:
+    """
+    Route latency histogram. Plain ASGI rather than `@app.middleware("http")`, which
+    hides client disconnects from the routes (see `_disconnected` in routes.py).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # Label by route template (/league/{league_id}/...) so ids don't explode cardinality.
+            route = scope.get("route")
+            metrics.HTTP_LATENCY.observe(
+                time.perf_counter() - started,
+                method=scope.get("method", ""),
+                route=getattr(route, "path", "unmatched"),
+                status=str(status),
+            )
+
+
+fastapi_app.add_middleware(LatencyMiddleware)
+
+
+# Outermost, so a profiled request's breakdown covers every other middleware too.
+fastapi_app.add_middleware(profiling.ProfilingMiddleware, data_dir=routes._DATA_DIR)
+
 @fastapi_app.get("/")
 def root():
     return {"message": "W Fantasy Backend is running"}
@@ -48,47 +106,104 @@ def root():
 # async def scrape_sleeper_route():
 #     from backend.scraper.sleeper import scrape_sleeper
 #     output = scrape_sleeper()
-#     return JSONResponse(content={"output": output})
+#     return {"output": output}
 
 # # ESPN Scraper Route
 # @fastapi_app.get("/scrape/espn")
 # async def scrape_espn_route():
 #     from backend.scraper.espn import scrape_espn
 #     output = scrape_espn()
-#     return JSONResponse(content={"output": output})
+#     return {"output": output}
 
 # # NFL Scraper Route
 # @fastapi_app.get("/scrape/nfl")
 # async def scrape_nfl_route():
 #     from backend.scraper.nfl import scrape_nfl
 #     output = scrape_nfl()
-#     return JSONResponse(content={"output": output})
+#     return {"output": output}
 
 # Socket.IO events
+# draft_id -> connected sids, so the rooms gauge and disconnect cleanup stay cheap
+_draft_members: dict = {}
+metrics.SOCKET_ROOMS.fn = lambda: {(): float(sum(1 for sids in _draft_members.values() if sids))}
+
+
 @sio.event
 async def connect(sid, *args, **kwargs):
+    metrics.SOCKET_EVENTS.inc(event="connect")
+    metrics.SOCKET_CONNECTIONS.inc()
     print("Client connected:", sid)
 
+@sio.event
+async def disconnect(sid, *args, **kwargs):
+    metrics.SOCKET_EVENTS.inc(event="disconnect")
+    metrics.SOCKET_CONNECTIONS.dec()
+    for draft_id in [d for d, sids in _draft_members.items() if sid in sids]:
+        _draft_members[draft_id].discard(sid)
+        if not _draft_members[draft_id]:
+            # Last client left: free the room's heaps (a later join or REST call rebuilds them)
+            del _draft_members[draft_id]
+            draft_recs.close_room(draft_id)
+
+_SUGGESTION_LIMIT = 10
+
+
+async def _emit_suggestions(draft_id, room, to=None):
+    with room.lock:
+        payload = {"draft_id": draft_id, **room.snapshot(_SUGGESTION_LIMIT)}
+    await sio.emit("draft_suggestions", payload, room=to or draft_id)
+
 @sio.event
 async def join_draft(sid, *args, **kwargs):
     data = args[0] if args else {}
     draft_id = data.get("draft_id")
+    metrics.SOCKET_EVENTS.inc(event="join_draft")
     await sio.enter_room(sid, draft_id)
+    _draft_members.setdefault(draft_id, set()).add(sid)
     print(f"Client {sid} joined draft {draft_id}")
+    # Optional league settings: {"season", "scoring", "roster_slots", "teams"}.
+    # Passing settings rebuilds the room; otherwise the first joiner builds it with defaults.
+    settings = data.get("settings") if isinstance(data.get("settings"), dict) else None
+    room = draft_recs.get_room(draft_id)
+    if room is None or settings:
+        settings = settings or {}
+        room = await asyncio.to_thread(
+            routes._open_draft_room,
+            draft_id,
+            settings.get("season"),
+            settings.get("scoring") or "ppr",
+            settings.get("roster_slots"),
+            settings.get("teams") or 12,
+        )
+    await _emit_suggestions(draft_id, room, to=sid)
 
 @sio.event
 async def draft_pick(sid, *args, **kwargs):
     data = args[0] if args else {}
     draft_id = data.get("draft_id")
     player = data.get("player")
+    metrics.SOCKET_EVENTS.inc(event="draft_pick")
     await sio.emit("player_drafted", player, room=draft_id)
+    room = draft_recs.get_room(draft_id)
+    if room and isinstance(player, dict):
+        with room.lock:
+            changed = room.pick(player.get("id"))
+        if changed:
+            await _emit_suggestions(draft_id, room)
 
 @sio.event
 async def remove_pick(sid, *args, **kwargs):
     data = args[0] if args else {}
     draft_id = data.get("draft_id")
     player_id = data.get("player_id")
+    metrics.SOCKET_EVENTS.inc(event="remove_pick")
     await sio.emit("player_removed", player_id, room=draft_id)
+    room = draft_recs.get_room(draft_id)
+    if room:
+        with room.lock:
+            changed = room.unpick(player_id)
+        if changed:
+            await _emit_suggestions(draft_id, room)
 
 # Wrap FastAPI app in Socket.IO ASGI app
 app = socketio.ASGIApp(sio, other_asgi_app=fastapi_app, socketio_path="/socket.io")
\ No newline at end of file
@@ -0,0 +1,38 @@
+import os
+import sys
+
+# Tests import the backend the way uvicorn does (`app.…`, `main`), from any cwd
+_BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _BACKEND not in sys.path:
+    sys.path.insert(0, _BACKEND)
+
+os.environ.setdefault("WARM_CACHES", "0")
+os.environ.pop("REDIS_URL", None)
+
+import pytest
+
+# Bytes of synthetic players feed: enough to fill the 32-team fixture league
+SYNTHETIC_PLAYERS_BYTES = 2_000_000
+
+
+@pytest.fixture(scope="session")
+def fx():
+    from benchmarks.fixtures import synthetic
+
+    return synthetic(players_bytes=SYNTHETIC_PLAYERS_BYTES)
+
+
+@pytest.fixture
+def installed(fx, monkeypatch, tmp_path):
+    """The routes served from the synthetic fixtures (as in the benchmarks), with empty caches."""
+    from app.api import routes
+    from app.services import upstream
+    from benchmarks import run
+
+    monkeypatch.setattr(routes, "_http", routes._http)
+    monkeypatch.setattr(upstream, "_guards", {})
+    monkeypatch.setattr(routes, "_DATA_DIR", str(tmp_path))
+    run._install(fx)
+    run._reset_caches()
+    yield fx
+    run._reset_caches()
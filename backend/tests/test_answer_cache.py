@@ -0,0 +1,96 @@
+import pytest
+
+from app.services import answer_cache
+from app.services.answer_cache import AnswerCache
+
+CTX = "roster: ...; record 3-2"
+MODEL = "gpt-4o-mini"
+
+
+def _cache(**kwargs):
+    return AnswerCache(**{"semantic": True, "similarity": 0.88, **kwargs})
+
+
+def test_exact_hit_ignores_case_and_punctuation():
+    cache = AnswerCache()
+    cache.put("Who should I start?", [], CTX, MODEL, "Start Puka.")
+    assert cache.get("who should i start", [], CTX, MODEL) == ("Start Puka.", "exact")
+
+
+def test_miss_on_other_context_history_or_model():
+    cache = AnswerCache()
+    cache.put("who should i start", [], CTX, MODEL, "Start Puka.")
+    assert cache.get("who should i start", [], CTX + " 4-2", MODEL) is None
+    assert cache.get("who should i start", ["user:hi"], CTX, MODEL) is None
+    assert cache.get("who should i start", [], CTX, "gpt-4o") is None
+
+
+def test_expired_entries_miss():
+    cache = AnswerCache(ttl=0)
+    cache.put("who should i start", [], CTX, MODEL, "Start Puka.")
+    assert cache.get("who should i start", [], CTX, MODEL) is None
+
+
+def test_context_change_drops_scope_entries():
+    cache = AnswerCache()
+    cache.put("who should i start", [], CTX, MODEL, "Start Puka.", scope="L1:3")
+    cache.get("anything", [], CTX + " 4-2", MODEL, scope="L1:3")
+    assert cache.stats()["entries"] == 0
+
+
+def test_scope_tracking_is_bounded():
+    cache = AnswerCache(max_entries=4)
+    for i in range(50):
+        cache.put("q", [], f"ctx{i}", MODEL, "a", scope=f"L{i}")
+    assert len(cache._scope_context) == 4
+    assert cache.stats()["entries"] == 4
+
+
+def test_semantic_hit_on_paraphrase():
+    cache = _cache()
+    cache.put("should i start puka nacua or zay flowers this week", [], CTX, MODEL, "Puka.", entities=("1", "2"))
+    assert cache.get("start puka nacua or zay flowers this week?", [], CTX, MODEL, entities=("1", "2")) == ("Puka.", "semantic")
+
+
+@pytest.mark.parametrize(
+    "cached, asked",
+    [
+        ("trade bijan for chase?", "trade chase for bijan?"),
+        ("start puka nacua or zay flowers", "start zay flowers or puka nacua"),
+    ],
+)
+def test_reversed_question_is_not_a_semantic_hit(cached, asked):
+    # Similar enough for the embedding alone, but the answer is the opposite one
+    assert float(answer_cache.embed(cached) @ answer_cache.embed(asked)) >= 0.88
+    cache = _cache()
+    cache.put(cached, [], CTX, MODEL, "yes")
+    assert cache.get(asked, [], CTX, MODEL) is None
+
+
+def test_players_must_match_in_order():
+    cache = _cache()
+    cache.put("start puka nacua or zay flowers", [], CTX, MODEL, "Puka.", entities=("1", "2"))
+    assert cache.get("start puka nakua or zay flowers", [], CTX, MODEL, entities=("2", "1")) is None
+    assert cache.get("start puka nakua or zay flowers", [], CTX, MODEL, entities=("1", "3")) is None
+    assert cache.get("start puka nakua or zay flowers", [], CTX, MODEL, entities=("1", "2")) == ("Puka.", "semantic")
+
+
+def test_decision_words_must_match():
+    cache = _cache()
+    cache.put("should i start puka nacua this week", [], CTX, MODEL, "Yes.", entities=("1",))
+    assert cache.get("should i sit puka nacua this week", [], CTX, MODEL, entities=("1",)) is None
+
+
+def test_semantic_tier_off_by_default():
+    cache = AnswerCache()
+    cache.put("should i start puka nacua this week", [], CTX, MODEL, "Yes.")
+    assert cache.get("start puka nacua this week?", [], CTX, MODEL) is None
+
+
+def test_lru_bound():
+    cache = AnswerCache(max_entries=3)
+    for i in range(5):
+        cache.put(f"question {i}", [], CTX, MODEL, str(i))
+    assert cache.stats()["entries"] == 3
+    assert cache.get("question 0", [], CTX, MODEL) is None
+    assert cache.get("question 4", [], CTX, MODEL) == ("4", "exact")
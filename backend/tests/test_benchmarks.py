@@ -0,0 +1,54 @@
+"""The offline benchmark suite: fixture sets and every scenario against the synthetic set."""
+import httpx
+
+from app.api import routes
+from benchmarks import run
+from benchmarks.fixtures import FixtureSet, synthetic, urls_for
+from conftest import SYNTHETIC_PLAYERS_BYTES
+
+
+def test_synthetic_is_deterministic(fx):
+    again = synthetic(players_bytes=SYNTHETIC_PLAYERS_BYTES)
+    assert again.bodies == fx.bodies
+    assert synthetic(players_bytes=SYNTHETIC_PLAYERS_BYTES, seed=8).bodies != fx.bodies
+
+
+def test_synthetic_covers_every_recorded_url(fx):
+    missing = [u for u in urls_for(fx.season, fx.league_ids) if fx.get(u) is None]
+    # Transactions for week 0 are not synthesized; everything else the recorder fetches is
+    assert all(u.endswith("/transactions/0") for u in missing)
+
+
+def test_fixture_set_round_trips_through_disk(fx, tmp_path):
+    fx.save(str(tmp_path))
+    loaded = FixtureSet.load(str(tmp_path))
+    assert loaded.season == fx.season
+    assert loaded.league_ids == fx.league_ids
+    assert loaded.bodies == fx.bodies
+
+
+def test_install_serves_fixtures_and_404s_the_rest(installed):
+    assert routes._safe_get_json("https://api.sleeper.app/v1/state/nfl")["season"] == str(installed.season)
+    assert routes._safe_get_json("https://api.sleeper.app/v1/nothing/here") is None
+
+
+def test_every_scenario_runs_offline(installed, monkeypatch):
+    def no_network(*args, **kwargs):
+        raise AssertionError("benchmark reached the network")
+
+    monkeypatch.setattr(httpx.HTTPTransport, "handle_request", no_network)
+    names = []
+    for name, call, cold in run.scenarios(installed):
+        if cold:
+            run._reset_caches()
+        assert call() is not None, name
+        names.append(name)
+    assert "get_players.cold" in names and any(n.startswith("league_pulse") for n in names)
+
+
+def test_compare_flags_p50_regressions(capsys):
+    base = {"meta": {"revision": "a", "timestamp": "t"}, "results": {"x": {"p50_ms": 10.0, "peak_mem_kb": 100.0}}}
+    slower = {"results": {"x": {"p50_ms": 12.0, "peak_mem_kb": 100.0}, "y": {"p50_ms": 1.0, "peak_mem_kb": 1.0}}}
+    assert run.compare(slower, base, threshold=0.15)
+    assert not run.compare(slower, base, threshold=0.25)
+    assert "new" in capsys.readouterr().out
@@ -0,0 +1,129 @@
+import time
+
+import pytest
+
+from app.services import cache
+from app.services.cache import DurableStore, FakeRedis, LRUCache
+
+
+@pytest.fixture
+def shared():
+    store = FakeRedis()
+    cache.set_shared_store(store)
+    yield store
+    cache.set_shared_store(None)
+
+
+@pytest.fixture
+def local():
+    cache.set_shared_store(None)
+    yield
+
+
+def test_evicts_least_recently_used_past_max_entries(local):
+    c = LRUCache("t", ttl=60, max_entries=3)
+    for k in "abc":
+        c[k] = {"data": k}
+    c.get("a")  # a is now the most recent
+    c["d"] = {"data": "d"}
+    assert "b" not in c
+    assert all(k in c for k in "acd")
+    assert c.evictions == 1
+
+
+def test_evicts_past_max_bytes(local):
+    c = LRUCache("t", ttl=60, max_entries=100, max_bytes=50_000)
+    for i in range(20):
+        c[str(i)] = b"x" * 10_000
+    assert c.bytes <= 50_000
+    assert len(c) < 20
+    assert "19" in c and "0" not in c
+
+
+def test_single_oversized_entry_is_kept(local):
+    c = LRUCache("t", ttl=60, max_entries=10, max_bytes=1_000)
+    c["big"] = b"x" * 5_000
+    assert "big" in c
+    c["next"] = b"x" * 10
+    assert "big" not in c
+
+
+def test_replacing_a_key_does_not_double_count(local):
+    c = LRUCache("t", ttl=60, max_entries=10)
+    c["k"] = b"x" * 1_000
+    size = c.bytes
+    for _ in range(5):
+        c["k"] = b"x" * 1_000
+    assert c.bytes == size
+    assert len(c) == 1
+
+
+def test_expired_entries_are_dropped(local):
+    c = LRUCache("t", ttl=0.05, max_entries=10)
+    c["k"] = {"data": 1}
+    assert c.get("k") == {"data": 1}
+    time.sleep(0.06)
+    assert c.get("k") is None
+    assert c.bytes == 0
+
+
+def test_delete_and_clear(local):
+    c = LRUCache("t", ttl=60)
+    c["a"] = 1
+    c["b"] = 2
+    c.delete("a")
+    assert "a" not in c and c.get("b") == 2
+    c.clear()
+    assert len(c) == 0 and c.bytes == 0
+
+
+def test_approx_size_scales_with_content():
+    small = {str(i): {"name": "x" * 10} for i in range(10)}
+    big = {str(i): {"name": "x" * 10} for i in range(1_000)}
+    assert cache.approx_size(big) > 50 * cache.approx_size(small)
+
+
+def test_shared_tier_reads_through_across_instances(shared):
+    a = LRUCache("players", ttl=60, shared=True)
+    b = LRUCache("players", ttl=60, shared=True)  # another worker's view of the namespace
+    a["k"] = {"data": [1, 2, 3]}
+    assert b.get("k") == {"data": [1, 2, 3]}
+
+
+def test_shared_tier_write_uses_ttl(shared):
+    c = LRUCache("players", ttl=600, shared=True)
+    c["k"] = {"data": 1}
+    expires = shared._data["wfantasy:players:k"][1]
+    assert expires is not None and 590 < expires - time.time() <= 600
+
+
+def test_durable_store_without_shared_store_never_evicts(local):
+    store = DurableStore("picks")
+    for i in range(10_000):
+        store[str(i)] = {"picks": [i]}
+    assert store["0"] == {"picks": [0]}
+    store.delete("0")
+    assert "0" not in store
+    assert store.get("0", {"picks": []}) == {"picks": []}
+
+
+def test_durable_store_sees_other_workers_writes(shared):
+    a, b = DurableStore("picks"), DurableStore("picks")
+    a["d1"] = {"picks": [1]}
+    assert b["d1"] == {"picks": [1]}
+    b["d1"] = {"picks": [1, 2]}
+    assert a["d1"] == {"picks": [1, 2]}  # no stale local copy
+    assert shared.get("wfantasy:picks:d1") is not None
+
+
+def test_durable_store_writes_have_no_expiry(shared):
+    DurableStore("picks")["d1"] = {"picks": []}
+    assert shared._data["wfantasy:picks:d1"][1] is None
+
+
+def test_namespace_env_overrides(monkeypatch, local):
+    monkeypatch.setenv("CACHE_TTL_ENVTEST", "12")
+    monkeypatch.setenv("CACHE_MAX_MB_ENVTEST", "2")
+    c = cache.namespace("envtest", ttl=1, max_bytes=1)
+    assert c.ttl == 12.0
+    assert c.max_bytes == 2 * 1024 * 1024
@@ -0,0 +1,99 @@
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from app.services import cpu_pool
+
+
+def _square(x):
+    return x * x
+
+
+def _pid(_=None):
+    return os.getpid()
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def _die_in_worker(x):
+    if multiprocessing.parent_process() is not None:
+        os._exit(1)
+    return x
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(cpu_pool, "WORKERS", 2)
+    cpu_pool._reset_pool()
+    yield cpu_pool
+    cpu_pool._reset_pool()
+
+
+def test_runs_in_worker_processes_from_the_configured_start_method(pool):
+    assert pool.run("test", _pid) != os.getpid()
+    assert pool._get_pool()._mp_context.get_start_method() == pool.START_METHOD
+    assert pool.START_METHOD in ("forkserver", "spawn")
+
+
+def test_run_many_keeps_input_order(pool):
+    assert pool.run_many("test", _square, range(20)) == [x * x for x in range(20)]
+    assert pool._pending == 0
+
+
+def test_run_many_times_out(pool):
+    pool.run("test", _square, 1)  # start the workers outside the timed batch
+    before = pool.TASKS.values.get(("test", "timeout"), 0)
+    started = time.monotonic()
+    with pytest.raises(cpu_pool.Timeout):
+        pool.run_many("test", _sleep, [2.0] * 4, timeout=0.2)
+    assert time.monotonic() - started < 1.5
+    assert pool.TASKS.values.get(("test", "timeout"), 0) == before + 1
+
+
+def test_zero_workers_runs_inline(monkeypatch):
+    monkeypatch.setattr(cpu_pool, "WORKERS", 0)
+    assert cpu_pool.run("test", _pid) == os.getpid()
+    assert cpu_pool.run_many("test", _square, [3, 4]) == [9, 16]
+
+
+def test_broken_pool_falls_back_inline_and_recovers(pool):
+    assert pool.run("test", _die_in_worker, 5) == 5
+    assert pool.run("test", _square, 6) == 36
+
+
+def test_cancelled_caller_is_not_queued(pool, monkeypatch):
+    monkeypatch.setattr(cpu_pool, "_slots", cpu_pool.threading.BoundedSemaphore(1))
+    cpu_pool._slots.acquire()
+    try:
+        with pytest.raises(cpu_pool.Cancelled):
+            pool.run("test", _square, 2, cancelled=lambda: True)
+    finally:
+        cpu_pool._slots.release()
+
+
+class _EarlyTimeout:
+    """A future whose first wait times out before the deadline (timer rounding), then completes."""
+
+    def __init__(self):
+        self.waits = 0
+
+    def result(self, timeout=None):
+        self.waits += 1
+        if self.waits == 1:
+            raise cpu_pool.FutureTimeout()
+        return 42
+
+    def cancel(self):
+        return False
+
+
+def test_early_wakeup_without_cancel_callback_keeps_waiting():
+    future = _EarlyTimeout()
+    deadline = time.monotonic() + 60
+    assert cpu_pool._result("test", future, _square, (1,), time.perf_counter(), deadline=deadline) == 42
+    assert future.waits == 2
@@ -0,0 +1,83 @@
+import pytest
+
+from app.api import routes
+from app.services import draft_grades, projections
+from benchmarks.fixtures import SLEEPER
+
+DRAFT_ID = "900000000000000001"
+
+
+@pytest.fixture
+def draft(installed, monkeypatch):
+    universe = routes.get_players(position="ALL", season=installed.season, on_team_only=False, scoring="ppr")
+    ranked = sorted(universe, key=lambda p: p.get("fantasyPoints") or 0, reverse=True)[:20]
+    picks = [
+        {"player_id": p["id"], "roster_id": 1 + i % 2, "pick_no": i + 1, "round": i // 2 + 1, "metadata": {"position": p["position"]}}
+        for i, p in enumerate(ranked)
+    ]
+    body = {
+        "draft_id": DRAFT_ID,
+        "status": "complete",
+        "season": str(installed.season),
+        "settings": {"teams": 2, "slots_qb": 1, "slots_rb": 2, "slots_wr": 2, "slots_te": 1, "slots_flex": 1},
+        "metadata": {"scoring_type": "ppr"},
+    }
+    installed.add(f"{SLEEPER}/v1/draft/{DRAFT_ID}", body)
+    installed.add(f"{SLEEPER}/v1/draft/{DRAFT_ID}/picks", picks)
+    routes._draft_grades_cache.clear()
+    yield picks
+    routes._draft_grades_cache.clear()
+    installed.bodies.pop(f"{SLEEPER}/v1/draft/{DRAFT_ID}", None)
+    installed.bodies.pop(f"{SLEEPER}/v1/draft/{DRAFT_ID}/picks", None)
+
+
+def test_grades_on_real_projections_are_cached(draft, monkeypatch):
+    projected = {p["player_id"]: 100.0 + i for i, p in enumerate(draft)}
+    monkeypatch.setattr(projections.ProjectionStore, "totals", lambda self, weights, *a, **k: projected)
+    result = routes.sleeper_draft_grades(DRAFT_ID)
+    assert result["value_source"] == "projections"
+    assert routes._draft_grades_cache.get(DRAFT_ID) == result
+
+
+def test_fallback_values_are_not_cached(draft, monkeypatch):
+    monkeypatch.setattr(projections.ProjectionStore, "totals", lambda self, weights, *a, **k: {})
+    result = routes.sleeper_draft_grades(DRAFT_ID)
+    assert result["value_source"] == "last_season"
+    assert result["teams"]
+    assert routes._draft_grades_cache.get(DRAFT_ID) is None
+
+
+def test_demo_universe_is_not_cached(draft, monkeypatch):
+    monkeypatch.setattr(routes, "get_players", lambda **kwargs: routes._DEMO_PLAYERS)
+    result = routes.sleeper_draft_grades(DRAFT_ID)
+    assert result["value_source"] == "demo"
+    assert routes._draft_grades_cache.get(DRAFT_ID) is None
+
+
+def test_adp_value_direction():
+    draft = {"draft_id": "1", "settings": {"teams": 2, "slots_qb": 1, "slots_wr": 1}}
+    players = {
+        "early": {"position": "WR", "adp": 1.0, "fantasyPoints": 300.0},
+        "mid": {"position": "QB", "adp": 4.0, "fantasyPoints": 280.0},
+        "late": {"position": "WR", "adp": 30.0, "fantasyPoints": 120.0},
+        "qb2": {"position": "QB", "adp": 3.0, "fantasyPoints": 250.0},
+        "nobody": {"position": "WR", "fantasyPoints": 10.0},
+    }
+    picks = [
+        {"player_id": "late", "roster_id": 1, "pick_no": 1},
+        {"player_id": "early", "roster_id": 2, "pick_no": 2},
+        {"player_id": "qb2", "roster_id": 2, "pick_no": 3},
+        {"player_id": "mid", "roster_id": 1, "pick_no": 4},
+        {"player_id": "nobody", "roster_id": 2, "pick_no": 5},
+    ]
+    result = draft_grades.grade_draft(draft, picks, players)
+    teams = {t["team"]: t for t in result["teams"]}
+    values = {p["player_id"]: p["value_vs_adp"] for t in teams.values() for p in t["picks"]}
+    assert values == {"late": -draft_grades.ADP_CAP, "early": 1.0, "qb2": 0.0, "mid": 0.0, "nobody": -draft_grades.ADP_CAP}
+
+    # Taking an ADP-30 player first overall is the reach; an ADP-1 player at 2 is the value
+    assert teams[1]["biggest_reach"]["player_id"] == "late"
+    assert teams[1]["best_value"] is None
+    assert teams[2]["best_value"]["player_id"] == "early"
+    assert teams[2]["biggest_reach"]["player_id"] == "nobody"
+    assert (teams[1]["adp_value"], teams[2]["adp_value"]) == (-24.0, -23.0)
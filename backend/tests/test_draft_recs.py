@@ -0,0 +1,115 @@
+import random
+
+import pytest
+
+from app.services import draft_recs
+from app.services.roster_utils import POSITIONS
+
+
+def _players(n=180, seed=3):
+    rng = random.Random(seed)
+    out = []
+    for i in range(n):
+        pos = POSITIONS[i % len(POSITIONS)]
+        out.append(
+            {
+                "id": str(i),
+                "name": f"Player {i}",
+                "position": pos,
+                "team": "KC",
+                "fantasyPoints": round(rng.uniform(20, 350), 1),
+                "adp": float(i + 1) if i % 7 else None,
+            }
+        )
+    return out
+
+
+def _expected(room, limit, position=None):
+    """Suggestions recomputed from scratch over every undrafted player."""
+    rows = []
+    for pid, p in room.players.items():
+        if pid in room.drafted or (position and p["position"] != position):
+            continue
+        neg_vorp, adp, _ = room._entries[pid]
+        weight = draft_recs._need_weight(room.targets.get(p["position"], 0), room.drafted_by_pos[p["position"]])
+        rows.append((neg_vorp * weight, adp, pid))
+    return [pid for _, _, pid in sorted(rows)[:limit]]
+
+
+def _ids(room, limit=15, position=None):
+    return [s["id"] for s in room.suggestions(limit, position)]
+
+
+def test_picks_and_unpicks_keep_suggestions_and_needs_current():
+    room = draft_recs.DraftRoom(_players())
+    rng = random.Random(9)
+    assert _ids(room) == _expected(room, 15)
+    for _ in range(120):
+        if room.drafted and rng.random() < 0.3:
+            assert room.unpick(rng.choice(sorted(room.drafted)))
+        else:
+            # Mostly draft from the top, as a real room does, so stale heads pile up
+            top = _ids(room, 5)
+            room.pick(top[0] if top and rng.random() < 0.8 else str(rng.randrange(180)))
+        assert _ids(room) == _expected(room, 15)
+        assert _ids(room, 5, "RB") == _expected(room, 5, "RB")
+        for pos in POSITIONS:
+            drafted = sum(1 for pid in room.drafted if room.players[pid]["position"] == pos)
+            assert room.drafted_by_pos[pos] == drafted
+            assert room.needs()[pos] == max(room.targets.get(pos, 0) - drafted, 0)
+
+
+def test_pick_and_unpick_are_idempotent():
+    room = draft_recs.DraftRoom(_players())
+    assert room.pick("4")
+    assert not room.pick("4")
+    assert not room.pick("unknown")
+    assert room.unpick("4")
+    assert not room.unpick("4")
+    assert room.drafted == set()
+    assert _ids(room) == _expected(room, 15)
+
+
+def test_reset_replaces_the_drafted_set():
+    room = draft_recs.DraftRoom(_players())
+    for pid in _ids(room, 10):
+        room.pick(pid)
+    room.reset(["1", "2", "3", "unknown"])
+    assert room.drafted == {"1", "2", "3"}
+    assert _ids(room) == _expected(room, 15)
+    room.reset([])
+    assert room.drafted == set()
+    assert all(n == 0 for n in room.drafted_by_pos.values())
+    assert _ids(room) == _expected(room, 15)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(draft_recs, "_rooms", {})
+    monkeypatch.setattr(draft_recs, "_last_used", {})
+    return draft_recs
+
+
+def test_idle_rooms_are_swept_when_another_opens(registry, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(registry.time, "time", lambda: clock[0])
+    monkeypatch.setattr(registry, "ROOM_IDLE_TTL", 60.0)
+    registry.open_room("idle", _players(30))
+    registry.open_room("busy", _players(30), drafted_ids=["0", "1"])
+    assert registry.get_room("busy").drafted == {"0", "1"}
+
+    clock[0] += 45
+    assert registry.get_room("busy") is not None  # reading a room keeps it alive
+    clock[0] += 30
+    registry.open_room("new", _players(30))
+    assert registry.get_room("idle") is None
+    assert registry.get_room("busy") is not None
+    assert set(registry._last_used) == {"busy", "new"}
+
+
+def test_close_room_forgets_it(registry):
+    registry.open_room("d1", _players(30))
+    registry.close_room("d1")
+    registry.close_room("d1")
+    assert registry.get_room("d1") is None
+    assert registry._last_used == {}
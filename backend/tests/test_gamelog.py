@@ -0,0 +1,36 @@
+import json
+
+import pytest
+
+from app.api import routes
+from benchmarks.fixtures import BENCH_WEEK, SLEEPER
+
+
+@pytest.fixture
+def weeks(installed, monkeypatch):
+    """Week stat feeds for the played weeks of the fixture season (one player, one bye)."""
+    for week in range(1, BENCH_WEEK):
+        stats = {} if week == 3 else {"4046": {"rec": week, "rec_yd": 10 * week, "rec_tgt": week + 2}}
+        monkeypatch.setitem(installed.bodies, f"{SLEEPER}/v1/stats/nfl/regular/{installed.season}/{week}", json.dumps(stats).encode())
+    routes._week_stats_cache.clear()
+    routes._gamelog_indexes.clear()
+    yield installed
+    routes._week_stats_cache.clear()
+    routes._gamelog_indexes.clear()
+
+
+def test_gamelog_lists_played_weeks(weeks):
+    log = routes.player_gamelog("4046", season=None, scoring="ppr", league_id=None)
+    assert [w["week"] for w in log["weeks"]] == [1, 2, 4, 5]
+    assert log["weeks"][0]["targets"] == 3
+    assert log["total"] == round(sum(w + w for w in (1, 2, 4, 5)), 2)
+
+
+@pytest.mark.parametrize("offset", [-3, -30, 1])
+def test_seasons_outside_the_window_are_rejected_without_fetching(weeks, monkeypatch, offset):
+    calls = []
+    monkeypatch.setattr(routes, "_fetch_many", lambda urls, *a, **k: calls.append(urls) or [None] * len(urls))
+    with pytest.raises(routes.HTTPException) as e:
+        routes.player_gamelog("4046", season=weeks.season + offset, scoring="ppr", league_id=None)
+    assert e.value.status_code == 400
+    assert calls == []
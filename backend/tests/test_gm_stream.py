@@ -0,0 +1,96 @@
+"""/gm/chat/stream against a local stub of the OpenAI chat completions API."""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import routes
+
+_TOKENS = ["Start ", "Puka", " this week."]
+
+
+def _chunk(content=None, usage=None):
+    choices = [] if content is None else [{"index": 0, "delta": {"content": content}, "finish_reason": None}]
+    body = {"id": "c1", "object": "chat.completion.chunk", "created": 0, "model": "stub", "choices": choices}
+    if usage:
+        body["usage"] = usage
+    return f"data: {json.dumps(body)}\n\n".encode()
+
+
+class _StubOpenAI(BaseHTTPRequestHandler):
+    requests = 0
+
+    def do_POST(self):
+        type(self).requests += 1
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        for token in _TOKENS:
+            self.wfile.write(_chunk(token))
+        self.wfile.write(_chunk(usage={"prompt_tokens": 10, "completion_tokens": 3, "total_tokens": 13}))
+        self.wfile.write(b"data: [DONE]\n\n")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def client(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubOpenAI)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    _StubOpenAI.requests = 0
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}/v1")
+    monkeypatch.setattr(routes, "_openai_clients", {})
+    monkeypatch.setattr(routes, "_gm_answer_cache", None)
+    monkeypatch.setattr(routes, "_build_gm_context", lambda req: "")
+    app = FastAPI()
+    app.include_router(routes.router)
+    yield TestClient(app)
+    server.shutdown()
+
+
+def _events(body: str):
+    """[(event name or None, data)] from an SSE body."""
+    out = []
+    for block in body.strip().split("\n\n"):
+        event = None
+        for line in block.splitlines():
+            if line.startswith("event: "):
+                event = line[len("event: "):]
+            elif line.startswith("data: "):
+                out.append((event, json.loads(line[len("data: "):])))
+    return out
+
+
+def test_stream_sends_deltas_then_done(client):
+    res = client.post("/gm/chat/stream", json={"question": "who do I start?"})
+    assert res.status_code == 200
+    events = _events(res.text)
+    assert "".join(d["delta"] for e, d in events if e is None) == "".join(_TOKENS)
+    assert events[-1][0] == "done"
+    assert events[-1][1]["cache_hit"] is None
+    assert events[-1][1]["ttft_ms"] is not None
+
+
+def test_repeat_question_is_served_from_cache(client):
+    client.post("/gm/chat/stream", json={"question": "who do I start?"})
+    events = _events(client.post("/gm/chat/stream", json={"question": "who do I start?"}).text)
+    assert _StubOpenAI.requests == 1
+    assert events[-1] == ("done", {**events[-1][1], "cache_hit": "exact"})
+
+
+def test_context_failure_emits_error_event(client, monkeypatch):
+    def boom(req):
+        raise RuntimeError("sleeper down")
+
+    monkeypatch.setattr(routes, "_build_gm_context", boom)
+    res = client.post("/gm/chat/stream", json={"question": "who do I start?", "league_id": "1"})
+    assert res.status_code == 200
+    events = _events(res.text)
+    assert events == [("error", {"detail": "Could not load league context: sleeper down"})]
+    assert _StubOpenAI.requests == 0
@@ -0,0 +1,115 @@
+import threading
+
+from app.api import routes
+from app.services import league_analytics
+
+
+def _fail_matchups(monkeypatch, week):
+    real = routes._safe_get_json
+
+    def flaky(url, timeout=30.0, raw=False):
+        if url.endswith(f"/matchups/{week}"):
+            return None
+        return real(url, timeout, raw)
+
+    monkeypatch.setattr(routes, "_safe_get_json", flaky)
+    return real
+
+
+def _expire_check(league_id):
+    entry = routes._analytics_cache.get(league_id)
+    routes._analytics_cache[league_id] = {**entry, "checked": 0}
+
+
+def test_failed_week_is_reported_and_retried(installed, monkeypatch):
+    league_id = installed.league_ids[0]
+    real = _fail_matchups(monkeypatch, 2)
+    data = routes.league_analytics_summary(league_id)
+    assert data["missing_weeks"] == [2]
+    assert routes._analytics_cache.get(league_id)["completed"] is None
+
+    monkeypatch.setattr(routes, "_safe_get_json", real)
+    _expire_check(league_id)
+    data = routes.league_analytics_summary(league_id)
+    assert data["missing_weeks"] == []
+    assert routes._analytics_cache.get(league_id)["completed"] == data["completed_weeks"]
+
+
+def test_complete_build_is_reused_until_a_week_finalizes(installed, monkeypatch):
+    league_id = installed.league_ids[0]
+    first = routes.league_analytics_summary(league_id)
+    _expire_check(league_id)
+    calls = []
+    real = routes._safe_get_json
+    monkeypatch.setattr(routes, "_safe_get_json", lambda url, *a, **k: calls.append(url) or real(url, *a, **k))
+    assert routes.league_analytics_summary(league_id) == first
+    assert all(u.endswith("/rosters") for u in calls)
+
+
+def test_build_locks_do_not_accumulate(installed):
+    threads = [threading.Thread(target=routes.league_analytics_summary, args=(lid,)) for lid in installed.league_ids]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert routes._analytics_locks == {}
+
+
+def _roster(rid, wins, losses, ties, fpts):
+    return {"roster_id": rid, "owner_id": f"u{rid}", "settings": {"wins": wins, "losses": losses, "ties": ties, "fpts": fpts}}
+
+
+def _week(*games):
+    out = []
+    for matchup_id, ((a, pa), (b, pb)) in enumerate(games, start=1):
+        out += [{"roster_id": a, "matchup_id": matchup_id, "points": pa}, {"roster_id": b, "matchup_id": matchup_id, "points": pb}]
+    return out
+
+
+def test_standings_tiebreaks_and_all_play():
+    rosters = [_roster(1, 1, 1, 0, 170), _roster(2, 0, 1, 1, 185), _roster(3, 1, 1, 0, 151), _roster(4, 1, 0, 1, 215)]
+    weekly = {
+        1: _week(((1, 100), (2, 90)), ((3, 80), (4, 120))),
+        2: _week(((1, 70), (3, 71)), ((2, 95), (4, 95))),
+    }
+    rows = league_analytics.standings(rosters, {1: "Alpha"}, weekly)
+    # 1 and 3 are level at .500: 3 won their meeting, so it ranks ahead despite fewer points
+    assert [r["roster_id"] for r in rows] == [4, 3, 1, 2]
+    by_id = {r["roster_id"]: r for r in rows}
+    assert by_id[1]["name"] == "Alpha" and by_id[2]["name"] == "Team 2"
+    assert {rid: (r["all_play"]["wins"], r["all_play"]["losses"], r["all_play"]["ties"]) for rid, r in by_id.items()} == {
+        1: (2, 4, 0),
+        2: (3, 2, 1),
+        3: (1, 5, 0),
+        4: (5, 0, 1),
+    }
+    assert by_id[1]["all_play"]["pct"] == 0.333
+    assert by_id[1]["expected_wins"] == 0.67
+    assert by_id[1]["luck"] == 0.33
+    assert {rid: r["streak"] for rid, r in by_id.items()} == {1: "L1", 2: "T1", 3: "W1", 4: "T1"}
+
+
+def test_standings_fall_back_to_points_then_roster_id():
+    rosters = [_roster(1, 1, 0, 0, 100), _roster(2, 1, 0, 0, 120), _roster(3, 1, 0, 0, 100)]
+    rows = league_analytics.standings(rosters, {}, {})
+    assert [r["roster_id"] for r in rows] == [2, 1, 3]
+    assert [r["rank"] for r in rows] == [1, 2, 3]
+
+
+def test_depth_grades_split_flex_slots_fractionally():
+    slots = ["QB", "RB", "RB", "WR", "TE", "FLEX"]  # RB 2.45, WR 1.4, TE 1.15 starters per team
+    values = {"qb1": 25, "qb2": 14, "rb1": 20, "rb2": 15, "rb3": 10, "rb4": 8, "rb5": 4, "wr1": 18, "wr2": 12, "wr3": 6, "te1": 10, "b_rb": 30}
+    positions = {pid: pid.split("_")[-1][:2].upper() for pid in values}
+    rosters = [
+        {"roster_id": 1, "players": [p for p in values if not p.startswith("b_")]},
+        {"roster_id": 2, "players": ["b_rb"]},
+    ]
+    grades = league_analytics.depth_grades(rosters, positions, values, slots)
+    team = grades[1]
+    assert team["RB"]["points"] == 42.5  # 20 + 15 + 0.45 * 10, plus 0.25 * (8 + 4)
+    assert team["WR"]["points"] == 24.3  # 18 + 0.4 * 12, plus 0.25 * 6
+    assert team["TE"]["points"] == 10.0  # no second TE for the 0.15 share
+    assert team["QB"]["points"] == 28.5  # 25, plus 0.25 * 14
+    assert team["overall"]["points"] == 105.3
+    assert (team["RB"]["rank"], team["RB"]["grade"]) == (1, "A")
+    assert grades[2]["RB"] == {"points": 30.0, "rank": 2, "grade": "C"}
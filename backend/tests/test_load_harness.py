@@ -0,0 +1,34 @@
+import json
+
+import pytest
+
+from benchmarks import load
+
+
+def test_percentiles_of_seconds_in_ms():
+    out = load._percentiles([0.001 * i for i in range(1, 101)])
+    assert out == {"count": 100, "p50_ms": 51.0, "p95_ms": 95.0, "p99_ms": 99.0, "max_ms": 100.0}
+
+
+def test_percentiles_empty():
+    assert load._percentiles([])["count"] == 0
+    assert load._percentiles([])["p50_ms"] is None
+
+
+def test_short_run_against_the_fixture_backend(tmp_path):
+    pytest.importorskip("aiohttp")
+    out = tmp_path / "load.json"
+    code = load.main([
+        "--drafts", "2", "--clients", "3", "--duration", "2", "--pick-interval", "0.2",
+        "--rest-interval", "0.5", "--drain", "1", "--out", str(out),
+    ])
+    assert code == 0
+    report = json.loads(out.read_text())
+    events = report["events"]
+    assert events["connect_errors"] == 0
+    assert events["expected"] > 0
+    assert events["dropped"] == 0
+    assert events["suggestion_pushes"] >= 6  # one per client on join
+    assert report["rest"]["put_picks"]["errors"] == 0
+    assert report["rest"]["get_players"]["errors"] == 0
+    assert report["fanout"]["count"] == events["received"]
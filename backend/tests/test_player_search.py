@@ -0,0 +1,83 @@
+import pytest
+
+from app.api import routes
+from app.services import player_search
+
+FEED = {
+    "4046": {"first_name": "Patrick", "last_name": "Mahomes", "position": "QB", "team": "KC", "search_rank": 5},
+    "7564": {"first_name": "Ja'Marr", "last_name": "Chase", "position": "WR", "team": "CIN", "search_rank": 2},
+    "6794": {"first_name": "Justin", "last_name": "Jefferson", "position": "WR", "team": "MIN", "search_rank": 3},
+    "4866": {"first_name": "Saquon", "last_name": "Barkley", "position": "RB", "team": "PHI", "search_rank": 4},
+    "9001": {"first_name": "Chase", "last_name": "Brown", "position": "RB", "team": "CIN", "search_rank": 40},
+    "9002": {"first_name": "Chase", "last_name": "Claypool", "position": "WR", "team": None, "search_rank": 400},
+    "9003": {"first_name": "Justin", "last_name": "Jeffers", "position": "TE", "team": "NYJ", "search_rank": 900},
+    "OL1": {"first_name": "Big", "last_name": "Lineman", "position": "OT", "team": "KC", "search_rank": 1},
+    "KC": {"first_name": "Kansas City", "last_name": "Chiefs", "position": "DEF", "team": "KC", "search_rank": 100},
+}
+
+
+@pytest.fixture(scope="module")
+def index():
+    return player_search.PlayerIndex(FEED)
+
+
+def _ids(results):
+    return [r["id"] for r in results]
+
+
+def test_only_fantasy_positions_are_indexed(index):
+    assert "OL1" not in index.ids
+    assert len(index) == len(FEED) - 1
+
+
+def test_exact_beats_prefix_beats_fuzzy(index):
+    # "justin jeffers" is Jeffers' full name and a prefix of Jefferson's; Jefferson's better search_rank loses
+    results = index.search("justin jeffers")
+    assert _ids(results)[:2] == ["9003", "6794"]
+    assert results[0]["score"] == 3.0
+    assert 2.0 <= results[1]["score"] < 3.0
+    # A prefix match ("chase") outranks a typo match of another player
+    prefix = index.search("chase")
+    assert set(_ids(prefix)[:3]) == {"7564", "9001", "9002"}
+    assert all(r["score"] >= 2.0 for r in prefix[:3])
+    assert all(r["score"] < 2.0 for r in prefix[3:])
+
+
+def test_prefix_ties_break_on_search_rank(index):
+    assert _ids(index.search("chase"))[:3] == ["9001", "9002", "7564"]  # first-name "chase" starts the name
+    assert _ids(index.search("ja cha"))[0] == "7564"
+    assert _ids(index.search("chiefs"))[:2] == ["4046", "KC"]
+
+
+def test_two_word_typo_resolves(index):
+    assert index.resolve("patrik mahomse")["id"] == "4046"
+    assert _ids(index.search("patrik mahomse"))[0] == "4046"
+
+
+def test_one_word_surname_typo_resolves(index):
+    assert index.resolve("mahomse")["id"] == "4046"
+    assert index.resolve("barkly")["id"] == "4866"
+    assert index.resolve("zzzzqx") is None
+
+
+def test_position_filter(index):
+    assert _ids(index.search("chase", position="RB")) == ["9001"]
+    assert _ids(index.search("justin", position="TE")) == ["9003"]
+    assert index.search("mahomes", position="WR") == []
+
+
+def test_mentions_keep_text_order(index):
+    text = "Should I trade Saquon Barkley and patrik mahomse for Ja'Marr Chase?"
+    assert _ids(index.mentions(text)) == ["4866", "4046", "7564"]
+    assert _ids(index.mentions("ja'marr chase or saquon barkley")) == ["7564", "4866"]
+    assert _ids(index.mentions("Barkley vs Chase", limit=5)) == []  # single surnames are too ambiguous
+    assert _ids(index.mentions("start chase or jefferson?")) == []
+    assert len(index.mentions(text, limit=2)) == 2
+
+
+def test_mentioned_players_context_line(monkeypatch, index):
+    monkeypatch.setattr(routes, "_get_player_index", lambda: index)
+    line = routes._mentioned_players("start Ja'Marr Chase or Chase Claypool?")
+    assert line == "Players mentioned: Ja'Marr Chase (WR CIN, id 7564), Chase Claypool (WR FA, id 9002)"
+    assert routes._mentioned_players("who should I start this week?") == ""
+    assert routes._mentioned_players("") == ""
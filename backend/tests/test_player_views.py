@@ -0,0 +1,88 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import routes
+
+
+@pytest.fixture
+def client(installed):
+    app = FastAPI()
+    app.include_router(routes.router)
+    routes._player_views.clear()
+    yield TestClient(app)
+    routes._player_views.clear()
+
+
+@pytest.fixture
+def get(client, installed):
+    def get(**params):
+        r = client.get("/players", params={"season": installed.season, **params})
+        assert r.status_code == 200, r.text
+        return r
+
+    return get
+
+
+def test_fields_trim_rows_and_keep_id(get, client, installed):
+    rows = get(fields="name,adp").json()
+    assert rows and all(list(row)[0] == "id" and set(row) <= {"id", "name", "adp"} for row in rows)
+    assert rows[0]["name"] and set(rows[0]) == {"id", "name", "adp"}
+    r = client.get("/players", params={"season": installed.season, "fields": "name,salary"})
+    assert r.status_code == 400 and "salary" in r.json()["detail"]
+
+
+def test_sort_puts_missing_values_last(get):
+    by_attempts = get(sort="pass_att", fields="pass_att").json()
+    attempts = [row["pass_att"] for row in by_attempts if row.get("pass_att") is not None]
+    assert 0 < len(attempts) < len(by_attempts)
+    assert attempts == sorted(attempts, reverse=True)  # stats default to descending
+    assert all(row.get("pass_att") is None for row in by_attempts[len(attempts):])
+    ascending = get(sort="pass_att", order="asc", fields="pass_att").json()
+    assert [row["pass_att"] for row in ascending[: len(attempts)]] == attempts[::-1]
+    assert all(row.get("pass_att") is None for row in ascending[len(attempts):])
+
+
+def test_adp_and_rank_default_to_ascending(get):
+    adps = [row["adp"] for row in get(sort="adp", fields="adp").json()]
+    assert adps == sorted(adps)
+    ranks = [row["rank"] for row in get(sort="rank", fields="rank").json()]
+    assert ranks == sorted(ranks)
+    assert [row["adp"] for row in get(sort="adp", order="desc", fields="adp").json()] == adps[::-1]
+
+
+def test_pages_and_total_count(get):
+    full = get(position="WR", sort="fantasyPoints").json()
+    assert {row["position"] for row in full} == {"WR"}
+    r = get(position="WR", sort="fantasyPoints", limit=10, offset=5)
+    assert r.headers["X-Total-Count"] == str(len(full))
+    assert r.json() == full[5:15]
+    assert get(position="WR", offset=len(full)).json() == []
+    assert "X-Total-Count" not in get(position="WR").headers  # the plain list is not a view
+
+
+@pytest.mark.parametrize(
+    "params, status",
+    [
+        ({"limit": 0}, 422),
+        ({"limit": routes._PLAYERS_MAX_PAGE + 1}, 422),
+        ({"offset": -1}, 422),
+        ({"order": "up"}, 400),
+        ({"sort": "name"}, 400),
+    ],
+)
+def test_bad_view_parameters_are_rejected(client, installed, params, status):
+    r = client.get("/players", params={"season": installed.season, **params})
+    assert r.status_code == status
+
+
+def test_views_are_rebuilt_with_the_rows():
+    routes._player_views.clear()
+    old = [{"id": "a", "position": "WR", "adp": 2.0}, {"id": "b", "position": "WR", "adp": 1.0}]
+    new = [{"id": "c", "position": "WR", "adp": 3.0}, {"id": "d", "position": "WR"}]
+    first = routes._player_view("2025:ppr:1", 1.0, old, "ALL", "adp", False)
+    assert [p["id"] for p in first] == ["b", "a"]
+    assert routes._player_view("2025:ppr:1", 1.0, new, "ALL", "adp", False) is first
+    assert [p["id"] for p in routes._player_view("2025:ppr:1", 2.0, new, "ALL", "adp", False)] == ["c", "d"]
+    assert routes._player_views.get("2025:ppr:1")["built"] == 2.0
+    routes._player_views.clear()
@@ -0,0 +1,87 @@
+import json
+import os
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import routes
+from app.services import profiling
+
+TOKEN = "s3cret"
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    monkeypatch.setenv("PROFILE_TOKEN", TOKEN)
+    monkeypatch.setattr(routes, "_DATA_DIR", str(tmp_path))
+    app = FastAPI()
+
+    @app.get("/work")
+    def work():
+        with profiling.span("build"):
+            with profiling.span("fetch"):
+                time.sleep(0.02)
+            sum(i * i for i in range(20000))
+        return {"ok": True}
+
+    app.include_router(routes.router)
+    app.add_middleware(profiling.ProfilingMiddleware, data_dir=str(tmp_path), interval=0.001)
+    return TestClient(app)
+
+
+def test_authorized_needs_a_configured_matching_token(monkeypatch):
+    monkeypatch.delenv("PROFILE_TOKEN", raising=False)
+    assert not profiling.authorized("")
+    assert not profiling.authorized("anything")
+    monkeypatch.setenv("PROFILE_TOKEN", TOKEN)
+    assert profiling.authorized(TOKEN)
+    assert not profiling.authorized("")
+    assert not profiling.authorized(None)
+    assert not profiling.authorized(TOKEN + "x")
+
+
+def test_unprofiled_requests_pass_through(client):
+    response = client.get("/work", headers={"X-Profile": "wrong"})
+    assert response.status_code == 200
+    assert "x-profile-id" not in response.headers
+    assert not os.path.exists(os.path.join(routes._DATA_DIR, "profiles"))
+
+
+def test_profiled_request_writes_speedscope(client):
+    response = client.get("/work", params={"profile": TOKEN})
+    profile_id = response.headers["x-profile-id"]
+    timing = dict(part.split(";dur=") for part in response.headers["server-timing"].split(", "))
+    assert set(timing) == {"fetch", "parse", "build", "serialize", "total"}
+    assert float(timing["fetch"]) >= 15
+
+    body = client.get(f"/profiles/{profile_id}", params={"token": TOKEN}).json()
+    assert body["$schema"] == "https://www.speedscope.app/file-format-schema.json"
+    assert body["name"] == "GET /work"
+    kinds = {p["type"] for p in body["profiles"]}
+    assert kinds == {"sampled", "evented"}
+    frames = body["shared"]["frames"]
+    spans = next(p for p in body["profiles"] if p["type"] == "evented")
+    opened = [frames[e["frame"]]["name"] for e in spans["events"] if e["type"] == "O"]
+    assert opened == ["span:build", "span:fetch"]
+    sampled = next(p for p in body["profiles"] if p["type"] == "sampled")
+    assert len(sampled["samples"]) == len(sampled["weights"]) > 0
+
+
+@pytest.mark.parametrize("token", ["", "wrong"])
+def test_profile_download_needs_the_token(client, token):
+    profile_id = client.get("/work", params={"profile": TOKEN}).headers["x-profile-id"]
+    assert client.get(f"/profiles/{profile_id}", params={"token": token}).status_code == 403
+
+
+def test_profile_id_cannot_escape_the_profiles_dir(client, tmp_path):
+    (tmp_path / "secret.speedscope.json").write_text(json.dumps({"leak": True}))
+    folder = os.path.join(str(tmp_path), "profiles")
+    for profile_id in ("../secret", "../../secret", "/etc/passwd", "..%2Fsecret"):
+        path = profiling.profile_path(str(tmp_path), profile_id)
+        assert os.path.dirname(os.path.abspath(path)) == folder
+    with pytest.raises(routes.HTTPException) as e:
+        routes.get_profile("../secret", token=TOKEN)
+    assert e.value.status_code == 404
+    assert client.get("/profiles/..%2Fsecret", params={"token": TOKEN}).status_code == 404
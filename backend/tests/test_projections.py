@@ -0,0 +1,100 @@
+import threading
+
+import pytest
+
+from app.api import routes
+from app.services import projections
+
+WEIGHTS = {"rec": 1.0, "rec_yd": 0.1}
+
+
+class Upstream:
+    """fetch_many stand-in: week N projects N receptions for player "1"; `down` weeks fail."""
+
+    def __init__(self, store=None):
+        self.calls = []
+        self.down = set()
+        self.store = store
+
+    def __call__(self, urls):
+        if self.store is not None:
+            # Readers must not wait on the upstream fetch
+            assert self.store.lock.acquire(blocking=False)
+            self.store.lock.release()
+        self.calls.append(list(urls))
+        out = []
+        for url in urls:
+            week = int(url.split("?")[0].rsplit("/", 1)[1])
+            out.append(None if week in self.down else {"1": {"rec": week, "rec_yd": 10.0 * week}, "2": {"pass_yd": 250}})
+        return out
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(projections.time, "time", lambda: now[0])
+    return now
+
+
+def _weeks(calls):
+    return [int(u.split("?")[0].rsplit("/", 1)[1]) for u in calls]
+
+
+def test_refresh_fetches_stale_weeks_only(tmp_path, clock):
+    store = projections.ProjectionStore(2025, str(tmp_path))
+    upstream = Upstream(store)
+    assert store.refresh(upstream, current_week=5) == list(range(1, 19))
+    assert store.totals(WEIGHTS, from_week=2, to_week=3) == {"1": 10.0}
+    assert store.refresh(upstream, current_week=5) == []
+
+    clock[0] += projections._OPEN_WEEK_TTL + 1
+    store.refresh(upstream, current_week=5)
+    assert _weeks(upstream.calls[-1]) == list(range(5, 19))  # completed weeks are kept
+
+
+def test_failed_weeks_back_off(tmp_path, clock):
+    store = projections.ProjectionStore(2025, str(tmp_path))
+    upstream = Upstream()
+    upstream.down = {3}
+    assert 3 not in store.refresh(upstream, current_week=1)
+    assert store.refresh(upstream, current_week=1) == []
+    assert len(upstream.calls) == 1
+
+    clock[0] += projections._RETRY_FIRST + 1
+    store.refresh(upstream, current_week=1)
+    assert _weeks(upstream.calls[-1]) == [3]
+    # Second failure doubles the wait
+    clock[0] += projections._RETRY_FIRST + 1
+    assert store.refresh(upstream, current_week=1) == []
+    upstream.down = set()
+    clock[0] += projections._RETRY_FIRST
+    assert store.refresh(upstream, current_week=1) == [3]
+    assert store.player_weeks("1", WEIGHTS)[2] == 6.0
+
+
+def test_store_round_trips_through_disk(tmp_path, clock):
+    store = projections.ProjectionStore(2025, str(tmp_path))
+    store.refresh(Upstream(), current_week=1)
+    loaded = projections.ProjectionStore(2025, str(tmp_path))
+    assert loaded.player_ids == store.player_ids
+    assert loaded.totals(WEIGHTS) == store.totals(WEIGHTS)
+    assert loaded.stale_weeks(current_week=1) == []
+
+
+def test_concurrent_refreshes_fetch_once(tmp_path, clock):
+    store = projections.ProjectionStore(2025, str(tmp_path))
+    upstream = Upstream()
+    threads = [threading.Thread(target=store.refresh, args=(upstream, 1)) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(upstream.calls) == 1
+
+
+@pytest.mark.parametrize("offset", [2, -100])
+def test_routes_reject_seasons_out_of_range(installed, offset):
+    with pytest.raises(routes.HTTPException) as e:
+        routes.projections_player_weeks(installed.season + offset, "1", scoring="ppr", league_id=None)
+    assert e.value.status_code == 400
+    assert installed.season + offset not in projections._stores
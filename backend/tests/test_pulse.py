@@ -0,0 +1,70 @@
+import collections
+import json
+
+import pytest
+
+from app.api import routes
+from benchmarks.fixtures import BENCH_WEEK, SLEEPER
+
+LEAGUE = "bench-12"
+USER = f"{LEAGUE}-u1"
+
+
+@pytest.fixture
+def fetched(installed, monkeypatch):
+    """Upstream URL -> number of fetches."""
+    counts = collections.Counter()
+    get = installed.get
+
+    def counting_get(url):
+        counts[url] += 1
+        return get(url)
+
+    monkeypatch.setattr(installed, "get", counting_get)
+    routes._dashboard_cache.clear()
+    yield counts
+    routes._dashboard_cache.clear()
+
+
+def _pulse(limit, weeks_back=2):
+    return routes.league_pulse(LEAGUE, week=BENCH_WEEK, weeks_back=weeks_back, limit=limit)
+
+
+def test_feed_is_newest_first_and_cut_to_limit(fetched):
+    full = _pulse(200)
+    ts = [item["ts"] for item in full["items"]]
+    assert ts == sorted(ts, reverse=True)
+    assert {item["kind"] for item in full["items"]} >= {"trending", "injury"}
+    txn_weeks = {item["week"] for item in full["items"] if item["kind"] not in ("trending", "injury")}
+    assert txn_weeks <= {BENCH_WEEK - 1, BENCH_WEEK}
+    assert _pulse(5)["items"] == full["items"][:5]
+
+
+def test_limits_share_one_cache_entry(fetched):
+    short = _pulse(5)
+    calls = sum(fetched.values())
+    long = _pulse(50)
+    assert sum(fetched.values()) == calls
+    assert len(short["items"]) == 5 and len(long["items"]) == 50
+    assert long["items"][:5] == short["items"]
+    # A different look-back is its own feed
+    _pulse(5, weeks_back=1)
+    assert sum(fetched.values()) > calls
+
+
+def test_dashboard_reuses_the_home_page_feed(fetched, installed, monkeypatch):
+    league = json.loads(installed.get(f"{SLEEPER}/v1/league/{LEAGUE}"))
+    monkeypatch.setitem(
+        installed.bodies,
+        f"{SLEEPER}/v1/user/{USER}/leagues/nfl/{installed.season}",
+        json.dumps([league]).encode(),
+    )
+    dashboard = routes.sleeper_user_dashboard(USER, installed.season, week=BENCH_WEEK)
+    (summary,) = dashboard["leagues"]
+    assert summary["roster_id"] == 1 and len(summary["pulse"]) == 5
+    assert fetched[f"{SLEEPER}/v1/league/{LEAGUE}/rosters"] == 1
+
+    calls = sum(fetched.values())
+    home = _pulse(50)
+    assert sum(fetched.values()) == calls
+    assert summary["pulse"] == home["items"][:5]
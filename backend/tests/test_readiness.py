@@ -0,0 +1,68 @@
+import threading
+import time
+
+from app.api import routes
+
+
+def test_teams_store_loads_once_under_concurrency(monkeypatch):
+    loads = []
+
+    def slow_load():
+        loads.append(1)
+        time.sleep(0.05)
+        return {"list": [], "active_id": None}
+
+    monkeypatch.setattr(routes, "_teams_store", None)
+    monkeypatch.setattr(routes, "_load_teams", slow_load)
+    seen = []
+    threads = [threading.Thread(target=lambda: seen.append(routes._teams())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(loads) == 1
+    assert all(store is seen[0] for store in seen)
+
+
+def test_warmup_retries_with_backoff_until_ready(monkeypatch):
+    outcomes = [RuntimeError("upstream down"), {"nfl_state": True, "sleeper_players": False}, {"nfl_state": True, "sleeper_players": True}]
+    attempts = []
+    release = threading.Event()
+
+    def warm():
+        release.wait(5)
+        attempts.append(1)
+        outcome = outcomes[len(attempts) - 1]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(routes, "_WARM_CACHES", True)
+    monkeypatch.setattr(routes, "_WARM_RETRY_FIRST", 5.0)
+    monkeypatch.setattr(routes, "_WARM_RETRY_MAX", 8.0)
+    sleeps = []
+    monkeypatch.setattr(routes.time, "sleep", sleeps.append)
+    monkeypatch.setattr(routes, "warm_caches", warm)
+    monkeypatch.setattr(routes, "_warmup_thread", None)
+    assert routes.start_warmup()
+    assert not routes.start_warmup()  # one warmup at a time
+    release.set()
+    routes._warmup_thread.join(5)
+    assert len(attempts) == 3
+    assert sleeps == [5.0, 8.0]
+
+
+def test_warmup_disabled(monkeypatch):
+    monkeypatch.setattr(routes, "_WARM_CACHES", False)
+    monkeypatch.setattr(routes, "_warmup_thread", None)
+    assert not routes.start_warmup()
+
+
+def test_readyz_restarts_warmup_when_not_ready(monkeypatch):
+    started = []
+    monkeypatch.setattr(routes, "start_warmup", lambda: started.append(1) or True)
+    monkeypatch.setattr(routes, "_readiness", lambda: {"nfl_state": True, "sleeper_players": False})
+    assert routes.readyz().status_code == 503
+    monkeypatch.setattr(routes, "_readiness", lambda: {"nfl_state": True, "sleeper_players": True})
+    assert routes.readyz().status_code == 200
+    assert started == [1]
@@ -0,0 +1,70 @@
+import json
+import random
+
+import pytest
+
+from app.services import stat_schema
+from benchmarks.normalize import _rekey, legacy
+
+_OPTIONAL_VALUES = (None, 0, 3, 7.0, 12.9, "5", " 8 ", "4.0", "NA", "-", "", True)
+_COUNT_VALUES = (None, 0, 1, 14, 96.0, 250.7)
+
+
+def _random_row(rng):
+    """A row carrying a random subset of every declared path, flat and nested."""
+    row = {}
+    for f in stat_schema.STAT_FIELDS:
+        for path in f.sleeper + f.legacy:
+            if rng.random() < 0.35:
+                value = rng.choice(_OPTIONAL_VALUES if f.kind == stat_schema.OPTIONAL else _COUNT_VALUES)
+                head, _, tail = path.partition(".")
+                if tail:
+                    row.setdefault(head, {})[tail] = value
+                else:
+                    row[head] = value
+    return row
+
+
+def _sleeper_rows(fx):
+    body = fx.get(f"https://api.sleeper.app/v1/stats/nfl/regular/{fx.season - 1}")
+    return [r for r in json.loads(body).values() if isinstance(r, dict)]
+
+
+@pytest.mark.parametrize("layout", ["sleeper", "legacy"])
+def test_matches_probe_chains_on_feed_layouts(fx, layout):
+    rows = _sleeper_rows(fx)
+    if layout == "legacy":
+        rows = _rekey(rows, "legacy")
+    extract = stat_schema.compile_extractor(rows)
+    assert [extract(r) for r in rows] == [legacy(r) for r in rows]
+
+
+def test_matches_probe_chains_on_mixed_rows():
+    rng = random.Random(5)
+    rows = [_random_row(rng) for _ in range(2000)] + [{}, {"passing": None}, {"receiving": {}}]
+    extract = stat_schema.compile_extractor(rows)
+    for row in rows:
+        assert extract(row) == legacy(row), row
+
+
+def test_every_legacy_alternative_is_read():
+    for f in stat_schema.STAT_FIELDS:
+        for path in f.legacy:
+            head, _, tail = path.partition(".")
+            row = {head: {tail: 9}} if tail else {head: 9}
+            assert stat_schema.compile_extractor([row])(row)[f.name] == 9 == legacy(row)[f.name], path
+
+
+def test_espn_ids_map_to_sleeper_values(fx):
+    rows = _sleeper_rows(fx)
+    espn = _rekey(rows, "espn")
+    from_sleeper = stat_schema.compile_extractor(rows)
+    from_espn = stat_schema.compile_extractor(espn)
+    assert [from_espn(r) for r in espn] == [from_sleeper(r) for r in rows]
+
+
+def test_unused_paths_are_dropped():
+    extract = stat_schema.compile_extractor([{"pass_att": 30, "rec": 4}])
+    assert extract.paths["pass_att"] == ["pass_att"]
+    assert extract.paths["targets"] == []
+    assert extract({"pass_att": 30, "rec": 4})["targets"] is None
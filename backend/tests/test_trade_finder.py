@@ -0,0 +1,55 @@
+import random
+from itertools import product
+
+import pytest
+
+from app.services import trade_finder
+
+SLOTS = ["QB", "RB", "RB", "WR", "WR", "TE", "FLEX", "SUPER_FLEX", "BN", "BN", "BN"]
+
+
+def _roster(rng, prefix, size=16):
+    positions = ["QB", "QB", "RB", "RB", "RB", "RB", "WR", "WR", "WR", "WR", "WR", "TE", "TE", "K", "DEF", "RB"]
+    return {f"{prefix}{i}": (positions[i % len(positions)], round(rng.uniform(1, 25), 3)) for i in range(size)}
+
+
+def _brute_force(mine, theirs, slots, top_k, max_size, min_gain):
+    """Every give/get combination scored in full, no bounds."""
+    plan = trade_finder._slot_plan(slots)
+    my_pos, their_pos = trade_finder._by_position(mine), trade_finder._by_position(theirs)
+    my_base, their_base = trade_finder.lineup_value(my_pos, plan), trade_finder.lineup_value(their_pos, plan)
+    trades = []
+    gives = trade_finder._groups(trade_finder._candidates(mine), max_size)
+    gets = trade_finder._groups(trade_finder._candidates(theirs), max_size)
+    for give, get in product(gives, gets):
+        give_players, get_players = [mine[p] for p in give], [theirs[p] for p in get]
+        my_gain = trade_finder.lineup_value(trade_finder._apply(my_pos, give_players, get_players), plan) - my_base
+        their_gain = trade_finder.lineup_value(trade_finder._apply(their_pos, get_players, give_players), plan) - their_base
+        score = min(my_gain, their_gain)
+        if score > min_gain:
+            trades.append((score, my_gain, their_gain, give, get))
+    return sorted(trades, reverse=True)[:top_k]
+
+
+@pytest.mark.parametrize("seed", range(8))
+@pytest.mark.parametrize("top_k,min_gain", [(5, 0.0), (20, 1.5)])
+def test_search_pair_matches_brute_force(seed, top_k, min_gain):
+    rng = random.Random(seed)
+    mine, theirs = _roster(rng, "a"), _roster(rng, "b")
+    found = trade_finder.search_pair(mine, theirs, SLOTS, top_k=top_k, min_gain=min_gain)
+    expected = _brute_force(mine, theirs, SLOTS, top_k, 2, min_gain)
+    assert [round(t[0], 6) for t in found] == [round(t[0], 6) for t in expected]
+    assert all(t[1] > min_gain and t[2] > min_gain for t in found)
+
+
+def test_find_trades_merges_best_across_rosters():
+    rng = random.Random(11)
+    mine = _roster(rng, "a")
+    others = {rid: _roster(rng, f"r{rid}_") for rid in range(2, 6)}
+    merged = trade_finder.find_trades(mine, others, SLOTS, top_k=6, parallel=False)
+    expected = sorted(
+        ((rid, t) for rid, theirs in others.items() for t in _brute_force(mine, theirs, SLOTS, 6, 2, 0.0)),
+        key=lambda x: (x[1][0], x[1][1]),
+        reverse=True,
+    )[:6]
+    assert [round(t[0], 6) for _, t in merged] == [round(t[0], 6) for _, t in expected]
@@ -0,0 +1,92 @@
+import threading
+import time
+
+import pytest
+
+from app.services import trending
+
+QUARTER_HOUR = 900.0
+START = 1_700_000_000.0
+
+
+def _record(series, counts, start=START):
+    """One poll per entry of `counts` (player "a"), 15 minutes apart."""
+    for i, count in enumerate(counts):
+        series.record([{"player_id": "a", "count": count}, {"player_id": "b", "count": 5}], now=start + i * QUARTER_HOUR)
+
+
+def test_ring_buffer_wraps_at_96_samples():
+    series = trending.TrendingSeries()
+    _record(series, range(100))
+    assert series.filled == 96
+    assert series.head == 100 % 96
+    history = series.history("a")
+    assert [h["count"] for h in history] == list(range(4, 100))
+    assert [h["ts"] for h in history] == [START + i * QUARTER_HOUR for i in range(4, 100)]
+    assert [h["count"] for h in series.history("unknown")] == [0] * 96
+
+
+def test_new_players_grow_the_buffer_after_wrapping():
+    series = trending.TrendingSeries(samples=4)
+    _record(series, [1, 2, 3, 4, 5])
+    series.record([{"player_id": "c", "count": 9}], now=START + 5 * QUARTER_HOUR)
+    assert [h["count"] for h in series.history("c")] == [0, 0, 0, 9]
+    assert [h["count"] for h in series.history("a")] == [3, 4, 5, 0]
+
+
+def test_movers_velocity_and_acceleration():
+    series = trending.TrendingSeries()
+    # Player "a" adds 10 per poll, then 20 per poll over the last hour
+    _record(series, [0, 10, 20, 30, 40, 60, 80, 100, 120])
+    movers = series.movers(window_seconds=3600)
+    assert [m["player_id"] for m in movers] == ["a"]  # "b" is flat
+    assert movers[0]["count"] == 120
+    assert movers[0]["velocity"] == 80.0  # (120 - 40) per hour
+    assert movers[0]["acceleration"] == 40.0  # 80/h now vs 40/h the hour before, over one hour
+
+
+def test_movers_need_two_samples():
+    series = trending.TrendingSeries()
+    assert series.movers() == []
+    _record(series, [5])
+    assert series.movers() == []
+
+
+@pytest.fixture
+def poller():
+    calls = []
+    entered = threading.Event()
+
+    def fetch(url):
+        calls.append(url)
+        entered.set()
+        time.sleep(0.05)
+        return [{"player_id": "a", "count": len(calls)}]
+
+    p = trending.TrendingPoller(fetch, interval=3600)
+    p.calls = calls
+    yield p
+    p.stop()
+
+
+def test_stale_poller_refreshes_once_under_concurrent_callers(poller):
+    threads = [threading.Thread(target=poller.ensure_fresh) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(poller.calls) == len(trending.KINDS)
+    assert poller.top("add", 10) == [{"player_id": "a", "count": 1}]
+
+    poller.last_poll = time.time() - poller.interval * 3  # overdue again
+    poller.ensure_fresh()
+    poller.ensure_fresh()
+    assert len(poller.calls) == 2 * len(trending.KINDS)
+
+
+def test_failed_fetch_keeps_the_previous_sample(poller):
+    poller.ensure_fresh()
+    poller.fetch = lambda url: None
+    poller.poll()
+    assert poller.series["add"].filled == 1
+    assert poller.top("drop", 5) == [{"player_id": "a", "count": 2}]
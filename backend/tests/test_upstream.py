@@ -0,0 +1,191 @@
+import threading
+import time
+
+import httpx
+import pytest
+
+from app.api import routes
+from app.services import upstream
+from app.services.upstream import HIGH, LOW, CircuitBreaker, HostGuard, TokenBucket
+
+
+# ---- TokenBucket ----
+
+def test_bucket_allows_burst_then_throttles():
+    bucket = TokenBucket(rate=1.0, burst=3)
+    assert all(bucket.acquire(timeout=0) for _ in range(3))
+    assert not bucket.acquire(timeout=0)
+
+
+def test_bucket_refills_at_rate():
+    bucket = TokenBucket(rate=50.0, burst=1)
+    assert bucket.acquire(timeout=0)
+    started = time.monotonic()
+    assert bucket.acquire(timeout=1.0)
+    assert 0.01 <= time.monotonic() - started < 0.5
+
+
+def _wait_until(cond, timeout=1.0):
+    deadline = time.monotonic() + timeout
+    while not cond() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_bucket_low_lane_yields_to_waiting_high():
+    bucket = TokenBucket(rate=5.0, burst=1)
+    assert bucket.acquire(timeout=0)
+    order = []
+
+    def take(priority):
+        if bucket.acquire(priority, timeout=2.0):
+            order.append(priority)
+
+    low = threading.Thread(target=take, args=(LOW,))
+    high = threading.Thread(target=take, args=(HIGH,))
+    low.start()
+    _wait_until(lambda: bucket.waiting[LOW] == 1)
+    high.start()
+    low.join()
+    high.join()
+    assert order == [HIGH, LOW]
+
+
+# ---- CircuitBreaker ----
+
+def _opened(cooldown=0.05):
+    breaker = CircuitBreaker(window=4, min_calls=4, failure_ratio=0.5, cooldown=cooldown)
+    for ok in (True, True, False, False):
+        breaker.record(ok)
+    assert breaker.state == CircuitBreaker.OPEN
+    return breaker
+
+
+def test_breaker_stays_closed_below_min_calls():
+    breaker = CircuitBreaker(window=4, min_calls=4, failure_ratio=0.5)
+    for _ in range(3):
+        breaker.record(False)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+
+def test_breaker_rejects_while_open():
+    breaker = _opened(cooldown=60)
+    assert not breaker.allow()
+
+
+def test_half_open_lets_one_probe_through():
+    breaker = _opened()
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+
+
+def test_probe_success_closes_and_failure_reopens():
+    breaker = _opened()
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record(True)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker = _opened()
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record(False)
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+
+def test_released_probe_can_be_taken_again():
+    breaker = _opened()
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.release_probe()
+    assert breaker.allow()
+
+
+def test_unreported_probe_expires_after_cooldown():
+    breaker = _opened()
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert not breaker.allow()
+    time.sleep(0.06)
+    assert breaker.allow()
+
+
+# ---- HostGuard stale store ----
+
+def test_stale_store_bounded_by_bytes():
+    guard = HostGuard("example.test", rate=1, burst=1, stale_bytes=10_000)
+    for i in range(10):
+        guard.remember(f"u{i}", b"x" * 3_000)
+    assert guard.snapshot()["stale_bytes"] <= 10_000
+    assert guard.stale("u9") is not None
+    assert guard.stale("u0") is None
+
+
+def test_stale_store_skips_payloads_over_the_cap():
+    guard = HostGuard("example.test", rate=1, burst=1, stale_bytes=1_000)
+    guard.remember("small", b"x" * 10)
+    guard.remember("big", b"x" * 5_000)
+    assert guard.stale("big") is None
+    assert guard.stale("small") == b"x" * 10
+
+
+def test_stale_store_replaces_without_double_counting():
+    guard = HostGuard("example.test", rate=1, burst=1, stale_bytes=10_000)
+    for _ in range(5):
+        guard.remember("u", b"x" * 1_000)
+    assert guard.snapshot()["stale_bytes"] == 1_000
+
+
+# ---- _safe_get_json: breaker + limiter ----
+
+@pytest.fixture
+def guarded(monkeypatch):
+    host = "stub.test"
+    guard = HostGuard(host, rate=0.001, burst=1)
+    guard.breaker = CircuitBreaker(window=2, min_calls=2, failure_ratio=0.5, cooldown=0.05)
+    monkeypatch.setitem(upstream._guards, host, guard)
+    monkeypatch.setitem(routes._UPSTREAM_WAIT, HIGH, 0.01)
+    status = {"code": 500, "calls": 0}
+
+    def handler(request):
+        status["calls"] += 1
+        return httpx.Response(status["code"], json={"ok": True})
+
+    monkeypatch.setattr(routes, "_http", httpx.Client(transport=httpx.MockTransport(handler)))
+    return guard, status, f"https://{host}/v1/thing"
+
+
+def test_throttled_half_open_probe_does_not_wedge_the_breaker(guarded):
+    guard, status, url = guarded
+    guard.breaker.record(False)
+    guard.breaker.record(False)
+    assert guard.breaker.state == CircuitBreaker.OPEN
+    time.sleep(0.06)
+
+    # Half-open, but the bucket is empty: the probe slot must be handed back
+    guard.limiter.tokens = 0
+    assert routes._safe_get_json(url) is None
+    assert guard.counters["throttled"] == 1
+    assert status["calls"] == 0
+
+    # Once a token is available the next caller probes and closes the breaker
+    status["code"] = 200
+    guard.limiter.tokens = 1
+    assert routes._safe_get_json(url) == {"ok": True}
+    assert guard.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_open_breaker_serves_last_good_response(guarded):
+    guard, status, url = guarded
+    status["code"] = 200
+    assert routes._safe_get_json(url) == {"ok": True}
+    status["code"] = 500
+    guard.limiter.tokens = guard.limiter.burst = 5
+    guard.limiter.rate = 1000
+    assert routes._safe_get_json(url) == {"ok": True}  # failed call -> stale
+    assert routes._safe_get_json(url) == {"ok": True}  # breaker open -> stale, no call
+    assert guard.breaker.state == CircuitBreaker.OPEN
+    assert status["calls"] == 2
@@ -0,0 +1,119 @@
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from app.api import routes
+from app.core.config import settings
+from app.services import warehouse
+from benchmarks.fixtures import SLEEPER
+
+
+@pytest.fixture
+def store(installed, monkeypatch):
+    monkeypatch.setattr(settings, "DB_URL", None)
+    monkeypatch.setattr(warehouse, "_warehouse", None)
+    yield routes._warehouse()
+    _join_ingest()
+
+
+def _join_ingest():
+    for t in threading.enumerate():
+        if t.name == "warehouse-ingest":
+            t.join(timeout=30)
+
+
+def test_sqlite_path_defaults_to_data_dir(tmp_path):
+    fallback = str(tmp_path / "warehouse.db")
+    assert warehouse.sqlite_path(None, fallback) == fallback
+    assert warehouse.sqlite_path("", fallback) == fallback
+    assert warehouse.sqlite_path("postgres://db/stats", fallback) == fallback
+    assert warehouse.sqlite_path("sqlite:///elsewhere/stats.db", fallback) == "elsewhere/stats.db"
+
+
+def test_unset_database_url_uses_data_dir(store, tmp_path):
+    assert store.path == os.path.join(str(tmp_path), "warehouse.db")
+
+
+def test_refresh_skips_final_weeks(tmp_path):
+    store = warehouse.StatsWarehouse(str(tmp_path / "w.db"))
+    meta = {"1": {"position": "WR", "team": "KC"}}
+    fetched = []
+
+    def fetch_many(urls):
+        fetched.extend(urls)
+        return [{"1": {"rec": 5, "rec_yd": 60, "gp": 1}} for _ in urls]
+
+    # Week 4 of 2025: weeks 1-2 are final, week 3 waits a week for stat corrections
+    store.refresh(fetch_many, [2025], 2025, 4, meta)
+    assert len(fetched) == 4  # totals + weeks 1-3
+    fetched.clear()
+    store.refresh(fetch_many, [2025], 2025, 4, meta)
+    assert fetched == [warehouse._STATS_URL.format(season=2025), warehouse._WEEK_STATS_URL.format(season=2025, week=3)]
+    trend = store.player_trend("1")
+    assert trend["seasons"][0]["weekly"][:3] == [11.0, 11.0, 11.0]
+
+
+def test_unseen_season_loads_in_background(store, installed):
+    season = installed.season - 1
+    stats = json.loads(installed.get(f"{SLEEPER}/v1/stats/nfl/regular/{season}"))
+    pid = next(iter(stats))
+
+    first = routes.warehouse_player_trend(pid, seasons=str(season), scoring="ppr")
+    assert first.status_code == 202
+    assert json.loads(first.body)["seasons"] == [season]
+    _join_ingest()
+
+    trend = routes.warehouse_player_trend(pid, seasons=str(season), scoring="ppr")
+    assert trend["seasons"][0]["season"] == season
+    assert routes.warehouse_positional("WR", season=season, week=0, scoring="ppr", stat=None, min_gp=0, limit=24)["players"] > 0
+
+
+def test_future_season_is_not_loaded(store, installed):
+    with pytest.raises(routes.HTTPException) as e:
+        routes.warehouse_player_trend("1", seasons=str(installed.season + 1), scoring="ppr")
+    assert e.value.status_code == 404
+    assert not any(t.name == "warehouse-ingest" for t in threading.enumerate())
+
+
+def test_seasons_before_sleeper_are_rejected(store):
+    with pytest.raises(routes.HTTPException) as e:
+        routes.warehouse_player_trend("1", seasons="1990-2009", scoring="ppr")
+    assert e.value.status_code == 400
+    with pytest.raises(routes.HTTPException):
+        routes.warehouse_ingest(seasons="2016,2018", wait=False)
+    assert not any(t.name == "warehouse-ingest" for t in threading.enumerate())
+
+
+def test_failed_season_backs_off_instead_of_restarting(store, installed, monkeypatch):
+    season = installed.season - 2
+    calls = []
+
+    def fetch_many(urls):
+        calls.append(len(urls))
+        return [None] * len(urls)
+
+    monkeypatch.setattr(routes, "_fetch_many", fetch_many)
+    assert routes.warehouse_player_trend("1", seasons=str(season), scoring="ppr").status_code == 202
+    _join_ingest()
+    assert calls == [warehouse.REGULAR_SEASON_WEEKS + 1]
+    assert store.seasons() == []
+
+    # Every week is backing off: no new ingest, and the client is told when to come back
+    with pytest.raises(routes.HTTPException) as e:
+        routes.warehouse_player_trend("1", seasons=str(season), scoring="ppr")
+    assert e.value.status_code == 503
+    assert 55 <= int(e.value.headers["Retry-After"]) <= 61
+    assert not any(t.name == "warehouse-ingest" for t in threading.enumerate())
+    assert calls == [warehouse.REGULAR_SEASON_WEEKS + 1]
+
+    # Once due, the weeks are fetched again and the delay doubles
+    store._failed = {key: (attempts, 0.0) for key, (attempts, _) in store._failed.items()}
+    started = time.time()
+    store.refresh(fetch_many, [season], installed.season, 6, {})
+    assert calls == [warehouse.REGULAR_SEASON_WEEKS + 1] * 2
+    attempts, retry_at = store._failed[(season, warehouse.SEASON_TOTALS)]
+    assert attempts == 2
+    assert 119 <= retry_at - started <= 121
@@ -0,0 +1,48 @@
+import numpy as np
+
+from app.api import routes
+from app.services import win_prob
+
+
+def _full(sim, lineups, points, projections, positions):
+    """Team totals recomputed from scratch off the simulation's fixed draws."""
+    out = {}
+    for rid, starters in lineups.items():
+        total = np.zeros(sim.sims, dtype=np.float32)
+        for pid in starters:
+            current = points.get(pid, 0.0)
+            mean, sd = win_prob._params(projections.get(pid, 0.0), current, positions.get(pid, ""))
+            total += current + np.maximum(mean + sd * sim.z[sim._row[pid]], win_prob._MIN_REMAINING)
+        out[rid] = total
+    return out
+
+
+def test_incremental_update_matches_full_recomputation():
+    lineups = {r: [f"p{r}_{i}" for i in range(9)] for r in range(1, 5)}
+    projections = {pid: 5.0 + i for starters in lineups.values() for i, pid in enumerate(starters)}
+    positions = {pid: "WR" for pid in projections}
+    points = {}
+    sim = win_prob.LeagueWeekSimulation(sims=2000, seed=3)
+    assert sim.update(lineups, points, projections, positions) == 36
+
+    # Games under way: some players score, one team swaps in a bench player
+    points = {"p1_0": 12.0, "p2_3": 4.5, "p3_8": 20.0}
+    lineups[4] = lineups[4][:-1] + ["bench_4"]
+    projections["bench_4"] = 9.0
+    assert sim.update(lineups, points, projections, positions) == 4
+    points["p1_0"] = 18.0
+    assert sim.update(lineups, points, projections, positions) == 1
+    assert sim.update(lineups, points, projections, positions) == 0
+
+    expected = _full(sim, lineups, points, projections, positions)
+    for rid, total in expected.items():
+        assert np.allclose(sim.totals[rid], total, atol=1e-3)
+
+
+def test_cached_simulation_is_measured_after_update(installed):
+    league_id = installed.league_ids[0]
+    data = routes.league_win_probability(league_id, week=None, sims=5000)
+    assert data["matchups"]
+    sim = routes._win_prob_sims.get(f"{league_id}:{data['week']}:5000")
+    assert sim.finals.size
+    assert routes._win_prob_sims.bytes >= sim.z.nbytes + sim.finals.nbytes
@@ -5,6 +5,7 @@ import { motion, AnimatePresence } from "framer-motion"
 import Image from "next/image"
 import type { Player } from "@/types"
 import { X } from "lucide-react"
+import { getGameLog, type GameLogWeek } from "@/lib/api"
 
 type ExtendedPlayer = Player & {
   fantasyPoints?: number
@@ -25,6 +26,8 @@ type ExtendedPlayer = Player & {
 
 interface PlayerDetailModalProps {
   player: ExtendedPlayer | null
+  // Season the player's stats are from; the game log shows the same season
+  season: number
   onClose: () => void
   onDraft?: (player: ExtendedPlayer) => void
   isDrafted?: boolean
@@ -54,14 +57,26 @@ function StatRow({ label, value }: { label: string; value: string | number | und
   )
 }
 
-export default function PlayerDetailModal({ player, onClose, onDraft, isDrafted }: PlayerDetailModalProps) {
+export default function PlayerDetailModal({ player, season, onClose, onDraft, isDrafted }: PlayerDetailModalProps) {
   const [imgError, setImgError] = useState(false)
+  const [gameLog, setGameLog] = useState<GameLogWeek[] | null>(null)
 
   // Reset image error when player changes
   useEffect(() => {
     setImgError(false)
   }, [player?.id])
 
+  // Weekly splits (one cached lookup on the backend)
+  useEffect(() => {
+    setGameLog(null)
+    if (!player?.id) return
+    let cancelled = false
+    getGameLog(player.id, season)
+      .then((log) => { if (!cancelled) setGameLog(log.weeks) })
+      .catch(() => { if (!cancelled) setGameLog([]) })
+    return () => { cancelled = true }
+  }, [player?.id, season])
+
   // Escape key handler
   useEffect(() => {
     if (!player) return
@@ -226,7 +241,7 @@ export default function PlayerDetailModal({ player, onClose, onDraft, isDrafted
 
               {/* Season stats */}
               <div className="mb-6">
-                <h3 className="text-xs uppercase text-slate-500 mb-2">2025 season stats</h3>
+                <h3 className="text-xs uppercase text-slate-500 mb-2">{season} season stats</h3>
                 <div className="bg-slate-800 rounded-lg p-4">
                   {/* Fantasy points highlight */}
                   <div className="flex justify-between py-2 mb-2 border-b border-slate-700">
@@ -241,6 +256,39 @@ export default function PlayerDetailModal({ player, onClose, onDraft, isDrafted
                 </div>
               </div>
 
+              {/* Weekly splits */}
+              {gameLog && gameLog.length > 0 && (
+                <div className="mb-6">
+                  <h3 className="text-xs uppercase text-slate-500 mb-2">game log</h3>
+                  <div className="bg-slate-800 rounded-lg p-4">
+                    <table className="w-full text-sm tabular-nums">
+                      <thead>
+                        <tr className="text-[10px] uppercase text-slate-500">
+                          <th className="text-left font-normal pb-1">wk</th>
+                          <th className="text-right font-normal pb-1">pts</th>
+                          <th className="text-right font-normal pb-1">{player.position?.toUpperCase() === "QB" ? "pass" : "rec"}</th>
+                          <th className="text-right font-normal pb-1">rush</th>
+                          <th className="text-right font-normal pb-1">td</th>
+                        </tr>
+                      </thead>
+                      <tbody>
+                        {gameLog.map((w) => (
+                          <tr key={w.week} className="border-t border-slate-700/60">
+                            <td className="py-1 text-slate-400">{w.week}</td>
+                            <td className="py-1 text-right text-cyan-400 font-medium">{w.points.toFixed(1)}</td>
+                            <td className="py-1 text-right text-white">
+                              {player.position?.toUpperCase() === "QB" ? w.passYds : `${w.receptions}-${w.recYds}`}
+                            </td>
+                            <td className="py-1 text-right text-white">{w.rushYds}</td>
+                            <td className="py-1 text-right text-white">{w.passTD + w.rushTD + w.recTD}</td>
+                          </tr>
+                        ))}
+                      </tbody>
+                    </table>
+                  </div>
+                </div>
+              )}
+
               {/* Draft button */}
               {onDraft && (
                 <button
@@ -76,4 +76,37 @@ export function getAdp(season: number = new Date().getFullYear()): Promise<AdpEn
   return fetch(`${API_BASE_URL}/adp/${season}`, {
     cache: "no-store",
   }).then((r) => expectJSON<AdpEntry[]>(r));
-}
\ No newline at end of file
+}
+// ---------------- Player game log helpers ----------------
+export type GameLogWeek = {
+  week: number;
+  points: number;
+  passYds: number;
+  passTD: number;
+  rushYds: number;
+  rushTD: number;
+  recYds: number;
+  recTD: number;
+  receptions: number;
+  targets: number | null;
+  fumbles: number;
+  interceptions: number;
+  sacks: number;
+  rushAtt: number;
+  pass_att: number | null;
+  pass_cmp: number | null;
+};
+
+export type GameLog = {
+  player_id: string;
+  season: number;
+  weeks: GameLogWeek[];
+  total: number;
+};
+
+export function getGameLog(playerId: string, season: number, scoring: string = "ppr"): Promise<GameLog> {
+  const params = new URLSearchParams({ season: String(season), scoring });
+  return fetch(`${API_BASE_URL}/players/${encodeURIComponent(playerId)}/gamelog?${params}`).then((r) =>
+    expectJSON<GameLog>(r)
+  );
+}